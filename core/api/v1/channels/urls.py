@@ -7,6 +7,7 @@ from rest_framework.routers import DefaultRouter
 from core.api.v1.channels.views.channel_upload_views import (
     CompleteUploadAvatarView,
     DeleteChannelAvatarView,
+    GenerateDownloadAvatarsUrlsView,
     GenerateDownloadAvatarUrlView,
     GenerateUploadAvatarUrlView,
 )
@@ -41,6 +42,11 @@ urlpatterns = [
         GenerateDownloadAvatarUrlView.as_view(),
         name='channel-avatar-download-url',
     ),
+    path(
+        'channel/avatars_download_urls/',
+        GenerateDownloadAvatarsUrlsView.as_view(),
+        name='channel-avatars-download-urls',
+    ),
     path(
         'channel/avatar_delete/',
         DeleteChannelAvatarView.as_view(),
@@ -21,11 +21,13 @@ from rest_framework.response import Response
 from core.api.v1.common.serializers.serializers import (
     DetailOutSerializer,
     UrlSerializer,
+    UrlsSerializer,
 )
 from core.api.v1.common.serializers.upload_serializers import (
     FilenameSerializer,
     GenerateUploadUrlOutSerializer,
     KeySerializer,
+    KeysSerializer,
 )
 from core.api.v1.schema.response_examples.common import (
     build_example_response_from_error,
@@ -41,6 +43,7 @@ from core.apps.channels.exceptions.upload import AvatarFilenameNotSupportedForma
 from core.apps.channels.use_cases.avatar_upload.complete_upload_avatar import CompleteUploadAvatarUseCase
 from core.apps.channels.use_cases.avatar_upload.delete_avatar import DeleteChannelAvatarUseCase
 from core.apps.channels.use_cases.avatar_upload.download_avatar_url import GenerateUrlForAvatarDownloadUseCase
+from core.apps.channels.use_cases.avatar_upload.download_avatars_urls import GenerateUrlsForAvatarsDownloadUseCase
 from core.apps.channels.use_cases.avatar_upload.upload_avatar_url import GenerateUploadAvatarUrlUseCase
 from core.apps.common.exceptions.exceptions import (
     S3FileWithKeyNotExistError,
@@ -164,6 +167,49 @@ class GenerateDownloadAvatarUrlView(generics.GenericAPIView):
         return Response(result, status=status.HTTP_201_CREATED)
 
 
+@extend_schema(
+    responses={
+        201: OpenApiResponse(response=UrlsSerializer, description='Download URLs have been generated'),
+        500: OpenApiResponse(response=DetailOutSerializer, description='S3 500 error'),
+    },
+    examples=[
+        s3_error_response_example(code=status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ],
+    summary='Generate presigned urls to download up to 100 avatar files from S3',
+)
+class GenerateDownloadAvatarsUrlsView(generics.GenericAPIView):
+    serializer_class = KeysSerializer
+
+    def post(self, request):
+        container: punq.Container = get_container()
+        use_case: GenerateUrlsForAvatarsDownloadUseCase = container.resolve(GenerateUrlsForAvatarsDownloadUseCase)
+        logger: Logger = container.resolve(Logger)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = use_case.execute(
+                keys=serializer.validated_data.get('keys'),
+            )
+
+        # Urls are signed locally, so only botocore errors are expected
+        except BotoCoreError as error:
+            logger.error(
+                'BotoCoreError in generate presigned urls for avatars download',
+                extra={'log_meta': orjson.dumps(str(error)).decode()},
+            )
+            return Response(
+                {'detail': str(error)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except ServiceException as error:
+            logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
+            raise
+
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
 @extend_schema(
     responses={
         200: OpenApiResponse(response=DetailOutSerializer, description='Avatar has been deleted'),
@@ -2,8 +2,6 @@ from logging import Logger
 
 import orjson
 import punq
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from drf_spectacular.utils import (
     OpenApiResponse,
     extend_schema,
@@ -50,11 +48,18 @@ from core.apps.channels.services.channels import (
     BaseSubscriptionService,
 )
 from core.apps.channels.use_cases.channels.delete_channel import DeleteChannelUseCase
-from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    CACHE_TAGS,
+)
 from core.apps.common.exceptions.exceptions import ServiceException
-from core.apps.common.mixins import CustomViewMixin
+from core.apps.common.mixins import (
+    ConditionalResponseMixin,
+    CustomViewMixin,
+)
 from core.apps.common.pagination import CustomCursorPagination
 from core.apps.common.services.cache import BaseCacheService
+from core.apps.common.services.content_versions import BaseContentVersionService
 from core.apps.payments.exceptions import StripeSubStillActiveError
 from core.apps.users.converters.users import user_to_entity
 from core.project.containers import get_container
@@ -112,22 +117,29 @@ class ChannelRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     def retrieve(self, request, *args, **kwargs):
         user = user_to_entity(request.user)
         cache_key = f'{CACHE_KEYS.get("retrieve_channel")}{user.id}'
+        timeout, stale_timeout = 60 * 15, 60
 
-        cached_data = self.cache_service.get(cache_key)
-
-        if cached_data:
-            return Response(cached_data, status.HTTP_200_OK)
+        def serialize_channel() -> dict:
+            channel = self.channel_service.get_channel_by_user_or_404(user)
+            self.cache_service.add_tags(
+                key=cache_key,
+                tags=[f'{CACHE_TAGS["channel"]}{channel.id}'],
+                timeout=timeout + stale_timeout,
+            )
+            return self.get_serializer(channel).data
 
         try:
-            channel = self.channel_service.get_channel_by_user_or_404(user)
+            data = self.cache_service.get_or_compute(
+                key=cache_key,
+                compute=serialize_channel,
+                timeout=timeout,
+                stale_timeout=stale_timeout,
+            )
         except ServiceException as error:
             self.logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
             raise
 
-        serializer = self.get_serializer(channel)
-        self.cache_service.set(cache_key, serializer.data, 60 * 15)
-
-        return Response(serializer.data, status.HTTP_200_OK)
+        return Response(data, status.HTTP_200_OK)
 
 
 @extend_schema(summary='Get list of subscribers')
@@ -148,20 +160,17 @@ class ChannelSubscribersView(generics.ListAPIView, CustomViewMixin):
         channel = self.channel_service.get_channel_by_user_or_404(user_to_entity(request.user))
 
         cache_key = f'{CACHE_KEYS.get("subs_list")}{channel.id}_{request.query_params.get("c", "1")}'
-        cached_data = self.cache_service.get(cache_key)
-
-        if cached_data:
-            return Response(cached_data, status.HTTP_200_OK)
 
         return self.mixin_cache_and_response(
             queryset=self.sub_service.get_subscriber_list(channel=channel),
             cache_key=cache_key,
             timeout=60 * 15,
+            tags=[f'{CACHE_TAGS["channel_subs"]}{channel.id}'],
         )
 
 
 @extend_schema(summary='Get channel main page: channel info and last 5 public videos')
-class ChannelMainView(generics.RetrieveAPIView):
+class ChannelMainView(ConditionalResponseMixin, generics.RetrieveAPIView):
     """Main page includes info about channel and last 5 public videos."""
 
     serializer_class = ChannelAndVideosSerializer
@@ -173,10 +182,17 @@ class ChannelMainView(generics.RetrieveAPIView):
         super().__init__(**kwargs)
         container: punq.Container = get_container()
         self.service: BaseChannelMainService = container.resolve(BaseChannelMainService)
+        self.content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
 
     def get_queryset(self):
         return self.service.get_channel_main_page_list()
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.mixin_conditional_response(
+            scopes=self.service.get_channel_main_page_content_scopes(slug=kwargs['slug']),
+            get_response=lambda: super(ChannelMainView, self).retrieve(request, *args, **kwargs),
+        )
+
 
 @extend_schema(summary='Get detailed info about channel')
 class ChannelAboutView(generics.RetrieveAPIView):
@@ -188,13 +204,24 @@ class ChannelAboutView(generics.RetrieveAPIView):
         super().__init__(**kwargs)
         container: punq.Container = get_container()
         self.service: BaseChannelAboutService = container.resolve(BaseChannelAboutService)
+        self.cache_service: BaseCacheService = container.resolve(BaseCacheService)
 
     def get_queryset(self):
         return self.service.get_channel_about_list()
 
-    @method_decorator(cache_page(60 * 15, key_prefix='channel_about'))
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        cache_key = f'{CACHE_KEYS.get("channel_about")}{kwargs["slug"]}'
+        timeout = 60 * 15
+
+        def serialize_channel() -> dict:
+            channel = self.get_object()
+            # The channel is deleted from the cache when it or its subscribers and videos are changed
+            self.cache_service.add_tags(key=cache_key, tags=[f'{CACHE_TAGS["channel"]}{channel.id}'], timeout=timeout)
+            return self.get_serializer(channel).data
+
+        data = self.cache_service.get_or_compute(key=cache_key, compute=serialize_channel, timeout=timeout)
+
+        return Response(data, status.HTTP_200_OK)
 
 
 @extend_schema_view(
@@ -24,6 +24,10 @@ class UrlSerializer(serializers.Serializer):
     url = serializers.CharField(help_text='URL')
 
 
+class UrlsSerializer(serializers.Serializer):
+    urls = serializers.DictField(child=serializers.CharField(), help_text='URLs mapped by file keys')
+
+
 class SParameterSerializer(serializers.Serializer):
     s = serializers.CharField(
         max_length=40,
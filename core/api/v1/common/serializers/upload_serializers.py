@@ -1,10 +1,21 @@
 from rest_framework import serializers
 
+from core.apps.common.constants import MAX_UPLOAD_PART_URLS_BATCH_SIZE
+
 
 class KeySerializer(serializers.Serializer):
     key = serializers.CharField(max_length=256, help_text='Key associated with the file')
 
 
+class KeysSerializer(serializers.Serializer):
+    keys = serializers.ListField(
+        child=serializers.CharField(max_length=256),
+        min_length=1,
+        max_length=100,
+        help_text='Keys associated with the files',
+    )
+
+
 class FilenameSerializer(serializers.Serializer):
     filename = serializers.CharField(max_length=256, help_text='File name to upload')
 
@@ -25,13 +36,79 @@ class GenerateMultipartUploadPartUrlInSerializer(BaseMultipartUploadInSerializer
     )
 
 
+class GenerateMultipartUploadPartsUrlsInSerializer(BaseMultipartUploadInSerializer, serializers.Serializer):
+    first_part_number = serializers.IntegerField(
+        min_value=1,
+        max_value=10000,
+        help_text='First part number of the range',
+    )
+    last_part_number = serializers.IntegerField(
+        min_value=1,
+        max_value=10000,
+        help_text='Last part number of the range, inclusive',
+    )
+
+    def validate(self, attrs):
+        parts_count = attrs['last_part_number'] - attrs['first_part_number'] + 1
+
+        if parts_count < 1:
+            raise serializers.ValidationError('last_part_number must not be less than first_part_number')
+        if parts_count > MAX_UPLOAD_PART_URLS_BATCH_SIZE:
+            raise serializers.ValidationError(f'No more than {MAX_UPLOAD_PART_URLS_BATCH_SIZE} parts per request')
+
+        return attrs
+
+
+class UploadPartUrlSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(help_text='Part number associated with a multipart upload')
+    upload_url = serializers.CharField(help_text='URL to upload the part')
+
+
+class UploadPartsUrlsOutSerializer(serializers.Serializer):
+    expires_in = serializers.IntegerField(help_text='Number of seconds the URLs are valid for')
+    upload_urls = UploadPartUrlSerializer(many=True)
+
+
+class MultipartUploadPartSerializer(serializers.Serializer):
+    PartNumber = serializers.IntegerField(min_value=1, max_value=10000, help_text='Part number')
+    ETag = serializers.CharField(max_length=256, help_text='ETag returned by S3 for the uploaded part')
+
+
+class MultipartUploadPartsInSerializer(BaseMultipartUploadInSerializer, serializers.Serializer):
+    parts_count = serializers.IntegerField(
+        min_value=1,
+        max_value=10000,
+        help_text='Total number of parts in a multipart upload',
+    )
+
+
+class MissingUploadPartsOutSerializer(serializers.Serializer):
+    missing_parts = serializers.ListField(
+        child=serializers.IntegerField(),
+        help_text='Numbers of parts that have not been uploaded yet',
+    )
+
+
 class CompleteMultipartUploadInSerializer(BaseMultipartUploadInSerializer, serializers.Serializer):
-    parts = serializers.ListField(
-        min_length=1,
+    parts_count = serializers.IntegerField(
+        min_value=1,
+        max_value=10000,
+        required=False,
+        help_text='Total number of parts, uploaded parts are listed in S3',
+    )
+    parts = MultipartUploadPartSerializer(
+        many=True,
+        required=False,
         max_length=10000,
-        help_text='List of upload parts associated with a multipart upload',
+        help_text='Deprecated: list of upload parts associated with a multipart upload, use parts_count instead',
     )
 
+    def validate(self, attrs):
+        if not attrs.get('parts_count') and not attrs.get('parts'):
+            raise serializers.ValidationError('Either parts_count or parts must be provided')
+
+        return attrs
+
 
 class GenerateUploadUrlOutSerializer(UploadUrlSerializer, KeySerializer):
     pass
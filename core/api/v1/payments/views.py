@@ -2,7 +2,6 @@ from logging import Logger
 
 import orjson
 import punq
-import stripe
 from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import status
@@ -19,6 +18,7 @@ from core.api.v1.schema.response_examples.payments import (
     stripe_error_response_example,
 )
 from core.apps.common.exceptions.exceptions import ServiceException
+from core.apps.common.utils import lazy_import
 from core.apps.payments.exceptions import StripeSubAlreadyExistsError, StripeSubDoesNotExistError
 from core.apps.payments.throttles import CheckoutSessionThrottle
 from core.apps.payments.use_cases.create_checkout_session import CreateCheckoutSessionUseCase
@@ -27,6 +27,8 @@ from core.apps.payments.use_cases.webhook import StripeWebhookUseCase
 from core.apps.users.converters.users import user_to_entity
 from core.project.containers import get_container
 
+stripe = lazy_import('stripe')
+
 
 @extend_schema(
     responses={
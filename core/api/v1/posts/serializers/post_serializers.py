@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from core.api.v1.common.serializers.serializers import SParameterSerializer
 from core.apps.posts.models import Post
 
 
@@ -63,3 +64,13 @@ class PostDetailedSerializer(PostSerializer):
 
 class PostUIDSerializer(serializers.Serializer):
     p = serializers.UUIDField(help_text='Parameter identifying post id')
+
+
+class PostsTimelineInSerializer(SParameterSerializer):
+    c = serializers.RegexField(regex=r'^\d+_[0-9a-f-]+$', required=False, help_text='Cursor of the page')
+    page_size = serializers.IntegerField(default=10, min_value=1, max_value=50, help_text='Number of posts per page')
+
+
+class PostsTimelineOutSerializer(serializers.Serializer):
+    next = serializers.URLField(allow_null=True, help_text='Link to the next page')
+    results = PostDetailedSerializer(many=True)
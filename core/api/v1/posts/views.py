@@ -2,6 +2,7 @@ from logging import Logger
 
 import orjson
 import punq
+from django.urls import reverse
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiParameter,
@@ -15,6 +16,7 @@ from rest_framework import (
 )
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import ModelViewSet
 
 from core.api.v1.common.serializers.comments import (
@@ -26,7 +28,6 @@ from core.api.v1.common.serializers.serializers import (
     DetailOutSerializer,
     LikeCreateInSerializer,
     LikeCreateOutSerializer,
-    SParameterSerializer,
 )
 from core.api.v1.posts.serializers.post_comment_serializers import (
     CommentCreateSerializer,
@@ -38,6 +39,8 @@ from core.api.v1.posts.serializers.post_serializers import (
     PostInSerializer,
     PostOutSerializer,
     PostSerializer,
+    PostsTimelineInSerializer,
+    PostsTimelineOutSerializer,
     PostUIDSerializer,
 )
 from core.api.v1.schema.response_examples.common import (
@@ -47,20 +50,31 @@ from core.api.v1.schema.response_examples.common import (
     like_created_response_example,
 )
 from core.api.v1.videos.serializers.video_serializers import CommentCreatedSerializer
-from core.apps.channels.exceptions.channels import ChannelNotFoundError
-from core.apps.common.constants import CACHE_KEYS
+from core.apps.channels.exceptions.channels import (
+    ChannelNotFoundError,
+    ChannelWithSlugNotFoundError,
+)
 from core.apps.common.exceptions.comments import (
     CommentLikeNotFoundError,
     CommentNotFoundError,
 )
 from core.apps.common.exceptions.exceptions import ServiceException
-from core.apps.common.mixins import CustomViewMixin
+from core.apps.common.mixins import (
+    ConditionalResponseMixin,
+    CustomViewMixin,
+)
 from core.apps.common.pagination import CustomCursorPagination
 from core.apps.common.permissions.permissions import (
     IsAuthenticatedOrAuthorOrAdminOrReadOnly,
     IsAuthenticatedOrAuthorOrReadOnly,
 )
+from core.apps.common.responses import (
+    RawJSONResponse,
+    render_json,
+)
 from core.apps.common.services.cache import BaseCacheService
+from core.apps.common.services.content_versions import BaseContentVersionService
+from core.apps.posts.converters.comments import post_comment_to_entity
 from core.apps.posts.converters.posts import post_to_entity
 from core.apps.posts.exceptions import (
     PostLikeNotFoundError,
@@ -69,10 +83,11 @@ from core.apps.posts.exceptions import (
 )
 from core.apps.posts.services.comments import BasePostCommentService
 from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.services.timeline import BasePostTimelineService
 from core.apps.posts.use_cases.posts.create_post import PostCreateUseCase
 from core.apps.posts.use_cases.posts.create_post_like import PostLikeCreateUseCase
 from core.apps.posts.use_cases.posts.delete_post_like import PostLikeDeleteUseCase
-from core.apps.posts.use_cases.posts.get_channel_posts import GetChannelPostsUseCase
+from core.apps.posts.use_cases.posts.get_channel_posts_timeline import GetChannelPostsTimelineUseCase
 from core.apps.posts.use_cases.posts_comments.create_comment import CreatePostCommentUseCase
 from core.apps.posts.use_cases.posts_comments.get_list_comments import GetPostCommentsUseCase
 from core.apps.posts.use_cases.posts_comments.get_replies_list_comments import GetPostCommentRepliesUseCase
@@ -120,7 +135,39 @@ from core.project.containers import get_container
                     ),
                 ],
             ),
+            OpenApiParameter(
+                name='c',
+                description='Cursor of the page, taken from the "next" link of the previous page',
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name='page_size',
+                description='Number of posts per page',
+                required=False,
+                type=int,
+            ),
         ],
+        responses={
+            200: OpenApiResponse(
+                response=PostsTimelineOutSerializer,
+                description="Channel's posts have been retrieved",
+            ),
+            404: OpenApiResponse(
+                response=DetailOutSerializer,
+                description='Channel with this slug is not found',
+            ),
+        },
+        examples=[
+            build_example_response_from_error(error=ChannelWithSlugNotFoundError),
+        ],
+        description=(
+            'Channel\'s posts from the newest to the oldest. The response contains the "results" of the page and '
+            'the "next" link to the following page, which is null on the last page.\n\n'
+            'Breaking change: the "previous" link has been removed, and the "c" cursor is an opaque '
+            '"<score>_<post_id>" value taken from the "next" link. Cursors of the former paginated response are '
+            'rejected with 400.'
+        ),
         summary="Get channel's posts",
     ),
     like_create=extend_schema(
@@ -166,7 +213,7 @@ from core.project.containers import get_container
     partial_update=extend_schema(summary='Update post PATCH'),
     destroy=extend_schema(summary='Delete post'),
 )
-class PostAPIViewset(ModelViewSet, CustomViewMixin):
+class PostAPIViewset(ModelViewSet, CustomViewMixin, ConditionalResponseMixin):
     lookup_field = 'post_id'
     lookup_url_kwarg = 'post_id'
     permission_classes = [IsAuthenticatedOrAuthorOrAdminOrReadOnly]
@@ -177,6 +224,7 @@ class PostAPIViewset(ModelViewSet, CustomViewMixin):
         self.logger: Logger = self.container.resolve(Logger)
         self.post_service: BasePostService = self.container.resolve(BasePostService)
         self.cache_service: BaseCacheService = self.container.resolve(BaseCacheService)
+        self.content_version_service: BaseContentVersionService = self.container.resolve(BaseContentVersionService)
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -207,33 +255,52 @@ class PostAPIViewset(ModelViewSet, CustomViewMixin):
 
         return Response(PostOutSerializer(result).data, status=status.HTTP_201_CREATED)
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.mixin_conditional_response(
+            scopes=self.post_service.get_post_content_scopes(post_id=kwargs['post_id']),
+            get_response=lambda: super(PostAPIViewset, self).retrieve(request, *args, **kwargs),
+        )
+
     def list(self, request, *args, **kwargs):
-        use_case: GetChannelPostsUseCase = self.container.resolve(GetChannelPostsUseCase)
-        # TODO: refactor
+        use_case: GetChannelPostsTimelineUseCase = self.container.resolve(GetChannelPostsTimelineUseCase)
 
-        serializer = SParameterSerializer(data=request.query_params)
+        serializer = PostsTimelineInSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
-        slug = serializer.validated_data.get('s')
-        cache_key = f'{CACHE_KEYS.get("related_posts")}{slug}_{request.query_params.get("c", "1")}'
-
-        cached_data = self.cache_service.get(cache_key)
-        if cached_data:
-            return Response(cached_data, status=status.HTTP_200_OK)
-
         try:
-            qs = use_case.execute(slug=slug)
+            channel, posts, next_cursor = use_case.execute(
+                slug=serializer.validated_data.get('s'),
+                cursor=serializer.validated_data.get('c'),
+                page_size=serializer.validated_data.get('page_size'),
+            )
 
         except ServiceException as error:
             self.logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
             raise
 
-        return self.mixin_cache_and_response(
-            cache_key=cache_key,
-            timeout=60 * 2,
-            queryset=qs,
+        # Author fields are the same for every post on the page
+        author_data = {
+            'author_name': channel.name,
+            'author_avatar_s3_key': channel.avatar_s3_key,
+            'author_link': request.build_absolute_uri(
+                reverse('v1:channels:channels-show', kwargs={'slug': channel.slug}),
+            ),
+        }
+
+        # The page is already plain data, so it's rendered without DRF serializers and renderers
+        body, etag = render_json(
+            {
+                'next': (
+                    replace_query_param(request.build_absolute_uri(), 'c', next_cursor)
+                    if next_cursor is not None
+                    else None
+                ),
+                'results': [{**post, **author_data} for post in posts],
+            },
         )
 
+        return RawJSONResponse(body=body, etag=etag)
+
     @action(methods=['post'], detail=True, url_path='like')
     def like_create(self, request, post_id):
         use_case: PostLikeCreateUseCase = self.container.resolve(PostLikeCreateUseCase)
@@ -421,6 +488,17 @@ class CommentPostAPIView(
         self.post_service.change_updated_status(comment_id=kwargs.get('pk'), is_updated=True)
         return response
 
+    def perform_destroy(self, instance):
+        post_id = instance.post_id
+        # The whole thread of replies is deleted together with the comment
+        deleted_comments = self.post_service.delete_comment_thread(comment=post_comment_to_entity(instance))
+
+        post_service: BasePostService = self.container.resolve(BasePostService)
+        post_service.update_comments_count(post_id=post_id, delta=-deleted_comments)
+
+        timeline_service: BasePostTimelineService = self.container.resolve(BasePostTimelineService)
+        timeline_service.invalidate_post(post_id=post_id)
+
     def list(self, request, *args, **kwargs):
         use_case: GetPostCommentsUseCase = self.container.resolve(GetPostCommentsUseCase)
 
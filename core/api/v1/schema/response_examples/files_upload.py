@@ -21,6 +21,30 @@ def multipart_upload_part_url_response_example() -> OpenApiExample:
     )
 
 
+def multipart_upload_parts_urls_response_example() -> OpenApiExample:
+    return OpenApiExample(
+        name='Created',
+        value={
+            'expires_in': 150,
+            'upload_urls': [
+                {'part_number': 1, 'upload_url': 'test_upload_url_1'},
+                {'part_number': 2, 'upload_url': 'test_upload_url_2'},
+            ],
+        },
+        response_only=True,
+        status_codes=[201],
+    )
+
+
+def missing_upload_parts_response_example() -> OpenApiExample:
+    return OpenApiExample(
+        name='Missing parts',
+        value={'missing_parts': [2, 5]},
+        response_only=True,
+        status_codes=[200],
+    )
+
+
 def s3_error_response_example(code: int) -> OpenApiExample:
     return detail_response_example(name=f'S3 {code} error', value='string', status_code=code)
 
@@ -31,20 +55,7 @@ def multipart_upload_complete_request_example() -> OpenApiExample:
         value={
             'key': 'string',
             'upload_id': 'string',
-            'parts': [
-                {
-                    'ETag': 'string',
-                    'PartNumber': 1,
-                },
-                {
-                    'ETag': 'string',
-                    'PartNumber': 2,
-                },
-                {
-                    'ETag': 'string',
-                    'PartNumber': 3,
-                },
-            ],
+            'parts_count': 3,
         },
         request_only=True,
     )
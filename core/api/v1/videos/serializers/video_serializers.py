@@ -222,3 +222,14 @@ class UpdatePlaylistSerializer(PlaylistSerializer):
             'channel_link',
             'videos_count',
         ]
+
+
+class VideoDownloadUrlsOutSerializer(serializers.Serializer):
+    url = serializers.CharField(help_text='URL of the original video file')
+    hls_url = serializers.CharField(
+        allow_null=True,
+        help_text=(
+            'URL of the HLS master playlist, null until the video has been transcoded. Renditions and segments '
+            'are authorized by CloudFront signed cookies set with the response'
+        ),
+    )
@@ -35,6 +35,11 @@ urlpatterns = [
         video_upload_views.CreateMultipartUploadView.as_view(),
         name='videos-upload-create',
     ),
+    path(
+        'videos/upload_missing_parts/',
+        video_upload_views.MissingUploadPartsView.as_view(),
+        name='videos-upload-missing-parts',
+    ),
     path(
         'videos/upload_complete/',
         video_upload_views.CompleteMultipartUploadView.as_view(),
@@ -50,12 +55,22 @@ urlpatterns = [
         video_upload_views.GenerateUploadPartUrlView.as_view(),
         name='videos-upload-url',
     ),
+    path(
+        'videos/upload_urls/',
+        video_upload_views.GenerateUploadPartsUrlsView.as_view(),
+        name='videos-upload-urls',
+    ),
     # endpoints for video download
     path(
         'videos/download_url/',
         video_upload_views.GenerateDownloadVideoUrlView.as_view(),
         name='videos-download-url',
     ),
+    path(
+        'videos/download_urls/',
+        video_upload_views.GenerateDownloadVideosUrlsView.as_view(),
+        name='videos-download-urls',
+    ),
     # router urls
     path('', include(router.urls)),
 ]
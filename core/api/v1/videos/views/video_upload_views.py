@@ -6,6 +6,7 @@ from botocore.exceptions import (
     BotoCoreError,
     ClientError,
 )
+from django.conf import settings
 from drf_spectacular.utils import (
     OpenApiResponse,
     extend_schema,
@@ -19,14 +20,19 @@ from rest_framework.response import Response
 
 from core.api.v1.common.serializers.serializers import (
     DetailOutSerializer,
-    UrlSerializer,
+    UrlsSerializer,
 )
 from core.api.v1.common.serializers.upload_serializers import (
     BaseMultipartUploadInSerializer,
     CompleteMultipartUploadInSerializer,
     CreateMultipartUploadOutSerializer,
+    GenerateMultipartUploadPartsUrlsInSerializer,
     GenerateMultipartUploadPartUrlInSerializer,
     KeySerializer,
+    KeysSerializer,
+    MissingUploadPartsOutSerializer,
+    MultipartUploadPartsInSerializer,
+    UploadPartsUrlsOutSerializer,
     UploadUrlSerializer,
 )
 from core.api.v1.schema.response_examples.common import (
@@ -35,15 +41,18 @@ from core.api.v1.schema.response_examples.common import (
     detail_response_example,
 )
 from core.api.v1.schema.response_examples.files_upload import (
+    missing_upload_parts_response_example,
     multipart_upload_complete_request_example,
     multipart_upload_created_response_example,
     multipart_upload_part_url_response_example,
+    multipart_upload_parts_urls_response_example,
     s3_error_response_example,
 )
 from core.api.v1.videos.serializers import video_serializers
 from core.apps.channels.exceptions.channels import ChannelNotFoundError
 from core.apps.common.exceptions.exceptions import (
     MultipartUploadDoesNotExistError,
+    MultipartUploadPartsMissingError,
     S3FileWithKeyNotExistError,
     ServiceException,
 )
@@ -62,7 +71,10 @@ from core.apps.videos.use_cases.videos_upload.abort_upload_video import AbortVid
 from core.apps.videos.use_cases.videos_upload.complete_upload_video import CompleteVideoMultipartUploadUseCase
 from core.apps.videos.use_cases.videos_upload.create_upload_video import CreateVideoMultipartUploadUseCase
 from core.apps.videos.use_cases.videos_upload.download_video_url import GenerateUrlForVideoDownloadUseCase
+from core.apps.videos.use_cases.videos_upload.download_videos_urls import GenerateUrlsForVideosDownloadUseCase
+from core.apps.videos.use_cases.videos_upload.missing_video_parts import GetVideoMissingPartsUseCase
 from core.apps.videos.use_cases.videos_upload.upload_video_url import GenerateUrlForVideoPartUploadUseCase
+from core.apps.videos.use_cases.videos_upload.upload_video_urls import GenerateUrlsForVideoPartsUploadUseCase
 from core.project.containers import get_container
 
 
@@ -199,7 +211,67 @@ class GenerateUploadPartUrlView(generics.GenericAPIView):
 
 @extend_schema(
     responses={
-        201: OpenApiResponse(response=UrlSerializer, description='Download URL has been generated'),
+        201: OpenApiResponse(
+            response=UploadPartsUrlsOutSerializer,
+            description='Upload URLs for the range of parts have been generated',
+        ),
+        400: OpenApiResponse(response=DetailOutSerializer, description='Video author does not match'),
+        404: OpenApiResponse(response=DetailOutSerializer, description='Channel or video was not found'),
+        500: OpenApiResponse(response=DetailOutSerializer, description='S3 500 error'),
+    },
+    examples=[
+        multipart_upload_parts_urls_response_example(),
+        build_example_response_from_error(error=VideoAuthorNotMatchError),
+        build_example_response_from_error(error=ChannelNotFoundError),
+        build_example_response_from_error(error=VideoNotFoundByUploadIdError),
+        s3_error_response_example(code=status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ],
+    summary='Generate upload URLs for a range of video parts',
+)
+class GenerateUploadPartsUrlsView(generics.GenericAPIView):
+    serializer_class = GenerateMultipartUploadPartsUrlsInSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        container: punq.Container = get_container()
+        use_case: GenerateUrlsForVideoPartsUploadUseCase = container.resolve(GenerateUrlsForVideoPartsUploadUseCase)
+        logger: Logger = container.resolve(Logger)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = use_case.execute(
+                user=user_to_entity(request.user),
+                key=serializer.validated_data.get('key'),
+                upload_id=serializer.validated_data.get('upload_id'),
+                first_part_number=serializer.validated_data.get('first_part_number'),
+                last_part_number=serializer.validated_data.get('last_part_number'),
+            )
+
+        # Urls are signed locally, so only botocore errors are expected
+        except BotoCoreError as error:
+            logger.error(
+                'BotoCoreError in generate presigned urls for video parts upload',
+                extra={'log_meta': orjson.dumps(str(error)).decode()},
+            )
+            return Response(
+                {'detail': str(error)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except ServiceException as error:
+            logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
+            raise
+
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+@extend_schema(
+    responses={
+        201: OpenApiResponse(
+            response=video_serializers.VideoDownloadUrlsOutSerializer,
+            description='Download URL and HLS master playlist URL have been generated',
+        ),
         403: OpenApiResponse(response=DetailOutSerializer, description='Video permission denied'),
         404: OpenApiResponse(
             response=DetailOutSerializer,
@@ -256,6 +328,66 @@ class GenerateDownloadVideoUrlView(generics.GenericAPIView):
             logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
             raise
 
+        hls_cookies, hls_cookie_path = result.pop('hls_cookies'), result.pop('hls_cookie_path')
+        response = Response(result, status=status.HTTP_201_CREATED)
+
+        # Cookies are sent by players to CloudFront, so they're shared with its domain and cross-site requests
+        for name, value in (hls_cookies or {}).items():
+            response.set_cookie(
+                key=name,
+                value=value,
+                max_age=3600,
+                path=hls_cookie_path,
+                domain=settings.AWS_CLOUDFRONT_COOKIE_DOMAIN,
+                secure=True,
+                httponly=True,
+                samesite='None',
+            )
+
+        return response
+
+
+@extend_schema(
+    responses={
+        201: OpenApiResponse(response=UrlsSerializer, description='Download URLs have been generated'),
+        500: OpenApiResponse(response=DetailOutSerializer, description='S3 500 error'),
+    },
+    examples=[
+        s3_error_response_example(code=status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ],
+    summary='Generate presigned URLs for up to 100 videos download',
+)
+class GenerateDownloadVideosUrlsView(generics.GenericAPIView):
+    serializer_class = KeysSerializer
+
+    def post(self, request):
+        container: punq.Container = get_container()
+        use_case: GenerateUrlsForVideosDownloadUseCase = container.resolve(GenerateUrlsForVideosDownloadUseCase)
+        logger: Logger = container.resolve(Logger)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = use_case.execute(
+                user=user_to_entity(request.user),
+                keys=serializer.validated_data.get('keys'),
+            )
+
+        # Urls are signed locally, so only botocore errors are expected
+        except BotoCoreError as error:
+            logger.error(
+                'BotoCoreError in generate presigned urls for videos download',
+                extra={'log_meta': orjson.dumps(str(error)).decode()},
+            )
+            return Response(
+                {'detail': str(error)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except ServiceException as error:
+            logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
+            raise
+
         return Response(result, status=status.HTTP_201_CREATED)
 
 
@@ -323,9 +455,76 @@ class AbortMultipartUploadView(generics.GenericAPIView):
 
 @extend_schema(
     responses={
-        200: OpenApiResponse(response=DetailOutSerializer, description='Multipart upload has been completed'),
+        200: OpenApiResponse(
+            response=MissingUploadPartsOutSerializer,
+            description='Numbers of parts that have to be uploaded before completion',
+        ),
         400: OpenApiResponse(response=DetailOutSerializer, description='Video author does not match'),
         404: OpenApiResponse(response=DetailOutSerializer, description='Video or channel was not found'),
+        502: OpenApiResponse(response=DetailOutSerializer, description='S3 502 error'),
+    },
+    examples=[
+        missing_upload_parts_response_example(),
+        s3_error_response_example(code=status.HTTP_502_BAD_GATEWAY),
+        build_example_response_from_error(error=VideoAuthorNotMatchError),
+        build_example_response_from_error(error=VideoNotFoundByUploadIdError),
+        build_example_response_from_error(error=ChannelNotFoundError),
+    ],
+    summary='Get missing parts of multipart upload',
+)
+class MissingUploadPartsView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = MultipartUploadPartsInSerializer
+
+    def post(self, request):
+        container: punq.Container = get_container()
+        use_case: GetVideoMissingPartsUseCase = container.resolve(GetVideoMissingPartsUseCase)
+        logger: Logger = container.resolve(Logger)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = use_case.execute(
+                user=user_to_entity(request.user),
+                key=serializer.validated_data.get('key'),
+                upload_id=serializer.validated_data.get('upload_id'),
+                parts_count=serializer.validated_data.get('parts_count'),
+            )
+
+        except ClientError as error:
+            logger.error(
+                'S3 client cannot list parts of multipart upload',
+                extra={'log_meta': orjson.dumps(str(error)).decode()},
+            )
+            return Response(
+                {'detail': error.response.get('Error', {}).get('Message')},
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
+        except BotoCoreError as error:
+            logger.error(
+                'BotoCoreError in list parts of multipart upload',
+                extra={'log_meta': orjson.dumps(str(error)).decode()},
+            )
+            return Response(
+                {'detail': str(error)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        except ServiceException as error:
+            logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
+            raise
+
+        return Response(result, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    responses={
+        200: OpenApiResponse(response=DetailOutSerializer, description='Multipart upload has been completed'),
+        400: OpenApiResponse(
+            response=DetailOutSerializer,
+            description='Video author does not match or some parts have not been uploaded',
+        ),
+        404: OpenApiResponse(response=DetailOutSerializer, description='Video or channel was not found'),
         500: OpenApiResponse(response=DetailOutSerializer, description='S3 500 error'),
         502: OpenApiResponse(response=DetailOutSerializer, description='S3 502 error'),
     },
@@ -341,6 +540,7 @@ class AbortMultipartUploadView(generics.GenericAPIView):
         s3_error_response_example(code=status.HTTP_500_INTERNAL_SERVER_ERROR),
         s3_error_response_example(code=status.HTTP_502_BAD_GATEWAY),
         build_example_response_from_error(error=VideoAuthorNotMatchError),
+        build_example_response_from_error(error=MultipartUploadPartsMissingError),
         build_example_response_from_error(error=VideoNotFoundByUploadIdError),
         build_example_response_from_error(error=ChannelNotFoundError),
     ],
@@ -363,6 +563,7 @@ class CompleteMultipartUploadView(generics.GenericAPIView):
                 user=user_to_entity(request.user),
                 key=serializer.validated_data.get('key'),
                 upload_id=serializer.validated_data.get('upload_id'),
+                parts_count=serializer.validated_data.get('parts_count'),
                 parts=serializer.validated_data.get('parts'),
             )
 
@@ -55,18 +55,24 @@ from core.api.v1.videos.serializers.video_serializers import (
     VideoSerializer,
 )
 from core.apps.channels.exceptions.channels import ChannelNotFoundError
+from core.apps.common.constants import CONTENT_VERSION_SCOPES
 from core.apps.common.exceptions.comments import (
     CommentLikeNotFoundError,
     CommentNotFoundError,
 )
 from core.apps.common.exceptions.exceptions import ServiceException
-from core.apps.common.mixins import CustomViewMixin
+from core.apps.common.mixins import (
+    ConditionalResponseMixin,
+    CustomViewMixin,
+)
 from core.apps.common.pagination import (
     CustomCursorPagination,
     CustomPageNumberPagination,
 )
 from core.apps.common.permissions.permissions import IsAuthenticatedOrAuthorOrReadOnly
+from core.apps.common.services.content_versions import BaseContentVersionService
 from core.apps.users.converters.users import user_to_entity
+from core.apps.videos.converters.comments import video_comment_to_entity
 from core.apps.videos.converters.videos import video_to_entity
 from core.apps.videos.exceptions.playlists import (
     PlaylistIdNotProvidedError,
@@ -106,6 +112,17 @@ from core.apps.videos.use_cases.playlists.playlist_videos import GetPlaylistVide
 from core.project.containers import get_container
 
 
+def _get_videos_page_scopes(videos: list[dict]) -> list[str]:
+    """Return content version scopes of the videos on a page and their
+    authors."""
+
+    author_ids = dict.fromkeys(video['author_id'] for video in videos)
+    return [
+        *(CONTENT_VERSION_SCOPES['video'] + video['video_id'] for video in videos),
+        *(CONTENT_VERSION_SCOPES['channel'] + str(author_id) for author_id in author_ids),
+    ]
+
+
 @extend_schema_view(
     like_create=extend_schema(
         request=LikeCreateInSerializer,
@@ -179,6 +196,7 @@ from core.project.containers import get_container
     partial_update=extend_schema(summary='Update video PATCH'),
 )
 class VideoViewSet(
+    ConditionalResponseMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
@@ -203,6 +221,7 @@ class VideoViewSet(
         super().__init__(**kwargs)
         container: punq.Container = get_container()
         self.service: BaseVideoService = container.resolve(BaseVideoService)
+        self.content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
         self.logger: Logger = container.resolve(Logger)
 
     @action(url_path='like', methods=['post'], detail=True)
@@ -273,13 +292,27 @@ class VideoViewSet(
 
         return self.service.get_all_videos()
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.mixin_conditional_response(
+            scopes=self.service.get_video_content_scopes(video_id=kwargs['video_id']),
+            get_response=lambda: super(VideoViewSet, self).retrieve(request, *args, **kwargs),
+        )
+
     def list(self, request, *args, **kwargs):
         if not request.query_params.get('search'):
             return Response(
                 data={'detail': 'No results found. Try different keywords or remove search filters'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        return super().list(request, *args, **kwargs)
+        #  Views and likes change only the versions of their videos, so the page's videos are read first
+        videos = self.mixin_page_values(
+            queryset=self.service.get_public_videos(),
+            fields=['video_id', 'author_id', 'created_at'],
+        )
+        return self.mixin_conditional_response(
+            scopes=_get_videos_page_scopes(videos),
+            get_response=lambda: super(VideoViewSet, self).list(request, *args, **kwargs),
+        )
 
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -433,6 +466,9 @@ class CommentVideoAPIView(viewsets.ModelViewSet, CustomViewMixin):
         self.service.change_updated_status(comment_id=kwargs.get('pk'), is_updated=True)
         return response
 
+    def perform_destroy(self, instance):
+        self.service.delete_comment_thread(comment=video_comment_to_entity(instance))
+
     @action(url_path='replies', url_name='replies', detail=True)
     def get_replies_list(self, request, pk):
         serializer = PkParameterSerializer(data={'pk': pk})
@@ -645,7 +681,7 @@ class MyVideoView(generics.ListAPIView):
     ],
     summary="Get playlist's videos",
 )
-class PlaylistVideosView(generics.ListAPIView, CustomViewMixin):
+class PlaylistVideosView(generics.ListAPIView, CustomViewMixin, ConditionalResponseMixin):
     serializer_class = VideoPreviewSerializer
     pagination_class = CustomCursorPagination
 
@@ -653,6 +689,7 @@ class PlaylistVideosView(generics.ListAPIView, CustomViewMixin):
         container: punq.Container = get_container()
         logger: Logger = container.resolve(Logger)
         use_case: GetPlaylistVideosUseCase = container.resolve(GetPlaylistVideosUseCase)
+        self.content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
 
         serializer = PlaylistIdParameterSerializer(data={'id': id})
         serializer.is_valid(raise_exception=True)
@@ -663,7 +700,12 @@ class PlaylistVideosView(generics.ListAPIView, CustomViewMixin):
             logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
             raise
 
-        return self.mixin_filtration_and_pagination(result)
+        videos = self.mixin_page_values(queryset=result, fields=['video_id', 'author_id', 'created_at'])
+
+        return self.mixin_conditional_response(
+            scopes=[CONTENT_VERSION_SCOPES['playlist'] + str(id), *_get_videos_page_scopes(videos)],
+            get_response=lambda: self.mixin_filtration_and_pagination(result),
+        )
 
 
 @extend_schema_view(
@@ -739,7 +781,7 @@ class PlaylistVideosView(generics.ListAPIView, CustomViewMixin):
     retrieve=extend_schema(summary='Retrieve playlist'),
     list=extend_schema(summary='Get all personal channel playlists'),
 )
-class PlaylistAPIView(viewsets.ModelViewSet):
+class PlaylistAPIView(ConditionalResponseMixin, viewsets.ModelViewSet):
     lookup_field = 'id'
     lookup_url_kwarg = 'id'
     permission_classes = [IsAuthorOrReadOnlyPlaylist]
@@ -749,6 +791,7 @@ class PlaylistAPIView(viewsets.ModelViewSet):
         super().__init__(**kwargs)
         container: punq.Container = get_container()
         self.service: BaseVideoPlaylistService = container.resolve(BaseVideoPlaylistService)
+        self.content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
         self.logger: Logger = container.resolve(Logger)
 
     def get_serializer_class(self):
@@ -763,6 +806,24 @@ class PlaylistAPIView(viewsets.ModelViewSet):
             return self.service.get_playlists_for_listing(user_to_entity(self.request.user))
         return self.service.get_playlists_for_retrieving()
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.mixin_conditional_response(
+            scopes=self.service.get_playlist_content_scopes(playlist_id=kwargs['id']),
+            get_response=lambda: super(PlaylistAPIView, self).retrieve(request, *args, **kwargs),
+        )
+
+    def list(self, request, *args, **kwargs):
+        playlists = self.mixin_page_values(queryset=self.get_queryset(), fields=['id', 'channel_id'])
+        channel_ids = dict.fromkeys(playlist['channel_id'] for playlist in playlists)
+
+        return self.mixin_conditional_response(
+            scopes=[
+                *(CONTENT_VERSION_SCOPES['playlist'] + str(playlist['id']) for playlist in playlists),
+                *(CONTENT_VERSION_SCOPES['channel'] + str(channel_id) for channel_id in channel_ids),
+            ],
+            get_response=lambda: super(PlaylistAPIView, self).list(request, *args, **kwargs),
+        )
+
     @action(
         methods=['post'],
         url_name='add-video',
@@ -37,6 +37,7 @@ from core.apps.channels.services.s3_channels import (
 from core.apps.channels.use_cases.avatar_upload.complete_upload_avatar import CompleteUploadAvatarUseCase
 from core.apps.channels.use_cases.avatar_upload.delete_avatar import DeleteChannelAvatarUseCase
 from core.apps.channels.use_cases.avatar_upload.download_avatar_url import GenerateUrlForAvatarDownloadUseCase
+from core.apps.channels.use_cases.avatar_upload.download_avatars_urls import GenerateUrlsForAvatarsDownloadUseCase
 from core.apps.channels.use_cases.avatar_upload.upload_avatar_url import GenerateUploadAvatarUrlUseCase
 from core.apps.channels.use_cases.channels.delete_channel import DeleteChannelUseCase
 
@@ -51,32 +52,37 @@ def init_channels(container: punq.Container) -> None:
         )
 
     # repositories
-    container.register(BaseChannelRepository, ORMChannelRepository)
-    container.register(BaseChannelSubsRepository, ORMChannelSubsRepository)
-    container.register(BaseChannelMainRepository, ORMChannelMainRepository)
-    container.register(BaseChannelAboutRepository, ORMChannelAboutRepository)
-    container.register(BaseSubscriptionRepository, ORMSubscriptionRepository)
+    container.register(BaseChannelRepository, ORMChannelRepository, scope=punq.Scope.singleton)
+    container.register(BaseChannelSubsRepository, ORMChannelSubsRepository, scope=punq.Scope.singleton)
+    container.register(BaseChannelMainRepository, ORMChannelMainRepository, scope=punq.Scope.singleton)
+    container.register(BaseChannelAboutRepository, ORMChannelAboutRepository, scope=punq.Scope.singleton)
+    container.register(BaseSubscriptionRepository, ORMSubscriptionRepository, scope=punq.Scope.singleton)
 
     # services
-    container.register(BaseChannelSlugValidatorService, ChannelSlugValidatorService)
+    container.register(BaseChannelSlugValidatorService, ChannelSlugValidatorService, scope=punq.Scope.singleton)
 
-    container.register(BaseChannelService, ORMChannelService)
-    container.register(BaseChannelSubsService, ORMChannelSubsService)
-    container.register(BaseChannelMainService, ORMChannelMainService)
-    container.register(BaseChannelAboutService, ORMChannelAboutService)
+    container.register(BaseChannelService, ORMChannelService, scope=punq.Scope.singleton)
+    container.register(BaseChannelSubsService, ORMChannelSubsService, scope=punq.Scope.singleton)
+    container.register(BaseChannelMainService, ORMChannelMainService, scope=punq.Scope.singleton)
+    container.register(BaseChannelAboutService, ORMChannelAboutService, scope=punq.Scope.singleton)
 
-    container.register(BaseSubscriptionService, ORMSubscriptionService)
+    container.register(BaseSubscriptionService, ORMSubscriptionService, scope=punq.Scope.singleton)
 
     # validator services
-    container.register(BaseAvatarValidatorService, AvatarExistsValidatorService)
-    container.register(AvatarFilenameExistsValidatorService)
-    container.register(AvatarFilenameFormatValidatorService)
-    container.register(BaseAvatarFilenameValidatorService, factory=build_avatar_filename_validators)
+    container.register(BaseAvatarValidatorService, AvatarExistsValidatorService, scope=punq.Scope.singleton)
+    container.register(AvatarFilenameExistsValidatorService, scope=punq.Scope.singleton)
+    container.register(AvatarFilenameFormatValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BaseAvatarFilenameValidatorService,
+        factory=build_avatar_filename_validators,
+        scope=punq.Scope.singleton,
+    )
 
     # use cases
-    container.register(GenerateUploadAvatarUrlUseCase)
-    container.register(DeleteChannelAvatarUseCase)
-    container.register(GenerateUrlForAvatarDownloadUseCase)
-    container.register(CompleteUploadAvatarUseCase)
+    container.register(GenerateUploadAvatarUrlUseCase, scope=punq.Scope.singleton)
+    container.register(DeleteChannelAvatarUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlForAvatarDownloadUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlsForAvatarsDownloadUseCase, scope=punq.Scope.singleton)
+    container.register(CompleteUploadAvatarUseCase, scope=punq.Scope.singleton)
 
-    container.register(DeleteChannelUseCase)
+    container.register(DeleteChannelUseCase, scope=punq.Scope.singleton)
@@ -23,6 +23,7 @@ from core.apps.channels.models import (
     Channel,
     SubscriptionItem,
 )
+from core.apps.common.instrumentation import instrument
 from core.apps.users.converters.users import user_from_entity
 from core.apps.users.entities import UserEntity
 from core.apps.videos.models import Video
@@ -56,7 +57,11 @@ class BaseChannelRepository(ABC):
     @abstractmethod
     def set_avatar_s3_key(self, channel: ChannelEntity, avatar_s3_key: str | None) -> None: ...
 
+    @abstractmethod
+    def get_existing_avatar_keys(self, keys: list[str]) -> list[str]: ...
+
 
+@instrument
 class ORMChannelRepository(BaseChannelRepository):
     def channel_exists(self, id: int) -> bool:
         return Channel.objects.filter(pk=id).exists()
@@ -92,12 +97,16 @@ class ORMChannelRepository(BaseChannelRepository):
         channel_dto.avatar_s3_key = avatar_s3_key
         channel_dto.save()
 
+    def get_existing_avatar_keys(self, keys: list[str]) -> list[str]:
+        return list(Channel.objects.filter(avatar_s3_key__in=keys).values_list('avatar_s3_key', flat=True))
+
 
 class BaseChannelSubsRepository(ABC):
     @abstractmethod
     def get_subscriber_list(self, channel: ChannelEntity) -> Iterable[SubscriptionItem]: ...
 
 
+@instrument
 class ORMChannelSubsRepository(BaseChannelSubsRepository):
     def get_subscriber_list(self, channel: ChannelEntity) -> Iterable[SubscriptionItem]:
         return SubscriptionItem.objects.filter(subscribed_to_id=channel.id)
@@ -107,7 +116,11 @@ class BaseChannelMainRepository(ABC):
     @abstractmethod
     def get_channel_main_page_list(self) -> Iterable[Channel]: ...
 
+    @abstractmethod
+    def get_channel_main_page_ids(self, slug: str) -> tuple[int, list[str]] | None: ...
 
+
+@instrument
 class ORMChannelMainRepository(BaseChannelMainRepository):
     def get_channel_main_page_list(self) -> Iterable[Channel]:
         second_qs = (
@@ -134,12 +147,30 @@ class ORMChannelMainRepository(BaseChannelMainRepository):
         )
         return qs
 
+    def get_channel_main_page_ids(self, slug: str) -> tuple[int, list[str]] | None:
+        channel_id = Channel.objects.filter(slug=slug).values_list('pk', flat=True).first()
+
+        if channel_id is None:
+            return None
+
+        video_ids = (
+            Video.objects.filter(
+                author_id=channel_id,
+                status=Video.VideoStatus.PUBLIC,
+                upload_status=Video.UploadStatus.FINISHED,
+            )
+            .order_by('-created_at')
+            .values_list('pk', flat=True)[:5]
+        )
+        return channel_id, list(video_ids)
+
 
 class BaseChannelAboutRepository(ABC):
     @abstractmethod
     def get_channel_about_list(self) -> Iterable[Channel]: ...
 
 
+@instrument
 class ORMChannelAboutRepository(BaseChannelAboutRepository):
     def get_channel_about_list(self) -> Iterable[Channel]:
         qs = (
@@ -173,6 +204,7 @@ class BaseSubscriptionRepository(ABC):
     def delete_sub(self, subscriber: ChannelEntity, subscribed_to: ChannelEntity) -> bool: ...
 
 
+@instrument
 class ORMSubscriptionRepository(BaseSubscriptionRepository):
     def get_or_create_sub(
         self,
@@ -32,6 +32,7 @@ from core.apps.channels.repositories.channels import (
     BaseChannelSubsRepository,
     BaseSubscriptionRepository,
 )
+from core.apps.common.constants import CONTENT_VERSION_SCOPES
 from core.apps.users.entities import (
     AnonymousUserEntity,
     UserEntity,
@@ -66,12 +67,18 @@ class BaseChannelService(ABC):
     @abstractmethod
     def get_channel_by_user_or_none(self, user: UserEntity) -> ChannelEntity | None: ...
 
+    @abstractmethod
+    def get_channel_by_slug_or_404(self, slug: str) -> ChannelEntity: ...
+
     @abstractmethod
     def delete_channel_by_user(self, user: UserEntity) -> None: ...
 
     @abstractmethod
     def set_avatar_s3_key(self, channel: ChannelEntity, avatar_s3_key: str | None) -> None: ...
 
+    @abstractmethod
+    def get_existing_avatar_keys(self, keys: list[str]) -> list[str]: ...
+
 
 @dataclass
 class ORMChannelService(BaseChannelService):
@@ -149,12 +156,22 @@ class ORMChannelService(BaseChannelService):
             return None
         return self.repository.get_channel_by_user_or_none(user)
 
+    def get_channel_by_slug_or_404(self, slug: str) -> ChannelEntity:
+        channel = self.repository.get_channel_by_slug(slug=slug)
+
+        if channel is None:
+            raise ChannelWithSlugNotFoundError(channel_slug=slug)
+        return channel
+
     def delete_channel_by_user(self, user: UserEntity) -> None:
         self.repository.delete_channel_by_user(user)
 
     def set_avatar_s3_key(self, channel: ChannelEntity, avatar_s3_key: str | None) -> None:
         self.repository.set_avatar_s3_key(channel=channel, avatar_s3_key=avatar_s3_key)
 
+    def get_existing_avatar_keys(self, keys: list[str]) -> list[str]:
+        return self.repository.get_existing_avatar_keys(keys=keys)
+
 
 @dataclass(eq=False)
 class BaseChannelSubsService(ABC):
@@ -176,11 +193,29 @@ class BaseChannelMainService(ABC):
     @abstractmethod
     def get_channel_main_page_list(self) -> Iterable[Channel]: ...
 
+    @abstractmethod
+    def get_channel_main_page_content_scopes(self, slug: str) -> list[str]: ...
+
 
 class ORMChannelMainService(BaseChannelMainService):
     def get_channel_main_page_list(self) -> Iterable[Channel]:
         return self.repository.get_channel_main_page_list()
 
+    def get_channel_main_page_content_scopes(self, slug: str) -> list[str]:
+        """Return content version scopes of the channel and its videos shown
+        on the main page."""
+
+        ids = self.repository.get_channel_main_page_ids(slug=slug)
+
+        if ids is None:
+            return []
+
+        channel_id, video_ids = ids
+        return [
+            CONTENT_VERSION_SCOPES['channel'] + str(channel_id),
+            *(CONTENT_VERSION_SCOPES['video'] + video_id for video_id in video_ids),
+        ]
+
 
 @dataclass(eq=False)
 class BaseChannelAboutService(ABC):
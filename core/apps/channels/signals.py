@@ -2,6 +2,7 @@ from logging import Logger
 
 import orjson
 import punq
+from django.db import transaction
 from django.db.models.signals import (
     post_delete,
     post_save,
@@ -13,61 +14,78 @@ from core.apps.channels.models import (
     Channel,
     SubscriptionItem,
 )
-from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    CACHE_TAGS,
+    CONTENT_VERSION_SCOPES,
+)
 from core.apps.common.providers.cache import BaseCacheProvider
 from core.apps.common.providers.files import BaseCeleryFileProvider
-from core.apps.posts.models import Post
+from core.apps.common.services.content_versions import BaseContentVersionService
 from core.apps.videos.models import Video
+from core.apps.videos.services.transcoding import get_hls_prefix
 from core.project.containers import get_container
 
 
-@receiver(signal=[post_save], sender=Channel)
-def invalidate_channel_cache(instance, created, **kwargs):
-    """This signal will delete channel's cache if channel instance has been
-    updated."""
+@receiver(signal=[post_save, post_delete], sender=Channel)
+def invalidate_channel_cache(instance, **kwargs):
+    """This signal will delete all cached data of the channel if channel
+    instance has been updated or deleted."""
 
     container: punq.Container = get_container()
     logger: Logger = container.resolve(Logger)
     cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
 
-    if not created:
-        cache_provider.delete(f'{CACHE_KEYS.get("retrieve_channel")}{instance.user.pk}')
+    if kwargs.get('created', False):
+        return
+
+    def invalidate() -> None:
+        keys = cache_provider.invalidate_tags(tags=[f'{CACHE_TAGS["channel"]}{instance.pk}'])
         logger.info(
             'Cache for Channel deleted',
-            extra={'log_meta': orjson.dumps({'user_id': instance.user.pk}).decode()},
+            extra={'log_meta': orjson.dumps({'user_id': instance.user_id, 'keys': keys}).decode()},
         )
 
+    # Cache is deleted after the transaction, so no one caches the data again before the change is committed
+    transaction.on_commit(invalidate)
 
-@receiver(signal=[post_save, post_delete], sender=Post)
-def invalidate_posts_cache(instance, **kwargs):
-    """This signal will delete Posts cache by Channel's slug if Post instance
-    has been updated or created."""
+
+@receiver(signal=[post_save, post_delete], sender=SubscriptionItem)
+def invalidate_subs_cache(instance, **kwargs):
+    """This signal will delete cached subscribers and about page of the
+    channel if SubscriptionItem instance has been created or deleted."""
 
     container: punq.Container = get_container()
     logger: Logger = container.resolve(Logger)
     cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
 
-    cache_provider.delete_pattern(f'{CACHE_KEYS.get("related_posts")}{instance.author.slug}*')
-    logger.info(
-        'Posts cache for listing deleted',
-        extra={'log_meta': orjson.dumps({'channel_slug': instance.author.slug}).decode()},
-    )
+    def invalidate() -> None:
+        keys = cache_provider.invalidate_tags(
+            tags=[
+                f'{CACHE_TAGS["channel_subs"]}{instance.subscribed_to_id}',
+                f'{CACHE_TAGS["channel"]}{instance.subscribed_to_id}',
+            ],
+        )
+        logger.info(
+            'Subs cache for listing deleted',
+            extra={'log_meta': orjson.dumps({'channel_pk': instance.subscribed_to_id, 'keys': keys}).decode()},
+        )
+
+    transaction.on_commit(invalidate)
 
 
+@receiver(signal=[post_save, post_delete], sender=Channel)
 @receiver(signal=[post_save, post_delete], sender=SubscriptionItem)
-def invalidate_subs_cache(instance, **kwargs):
-    """This signal will delete Subs cache by Channel's id if Post instance has
-    been updated or created."""
+def bump_channel_content_version(instance, **kwargs):
+    """This signal will change the version of the channel if its data or
+    subscribers count have been changed, so ETags of content showing the
+    channel, e.g. videos of its author, don't match anymore."""
 
     container: punq.Container = get_container()
-    logger: Logger = container.resolve(Logger)
-    cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
+    content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
 
-    cache_provider.delete_pattern(f'{CACHE_KEYS.get("subs_list")}{instance.subscribed_to.pk}*')
-    logger.info(
-        'Subs cache for listing deleted',
-        extra={'log_meta': orjson.dumps({'channel_pk': instance.subscribed_to.slug}).decode()},
-    )
+    channel_id = instance.pk if isinstance(instance, Channel) else instance.subscribed_to_id
+    content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['channel'] + str(channel_id)])
 
 
 # FIXME: fix number of requests when deleting channel because of CASCADE field in model
@@ -82,12 +100,14 @@ def delete_channel_files_signal(instance, **kwargs):
     # Define empty 'files' and 'cache_keys' lists
     files = []
     cache_keys = []
+    hls_prefixes = []
 
     # Iterate all related videos and add their keys in 'files' and 'cache_keys' lists
     for v in instance.videos.all():
         if v.s3_key is not None and v.upload_status == Video.UploadStatus.FINISHED:
             files.append({'Key': v.s3_key})
             cache_keys.append(CACHE_KEYS['s3_video_url'] + v.s3_key)
+            hls_prefixes.append(get_hls_prefix(video_id=v.pk))
 
     # If avatar_s3_key exists it'll append to 'files' list and 'cache_keys' list
     if instance.avatar_s3_key is not None:
@@ -96,3 +116,6 @@ def delete_channel_files_signal(instance, **kwargs):
 
     if files:
         celery_provider.delete_objects(objects=files, cache_keys=cache_keys)
+
+    if hls_prefixes:
+        celery_provider.delete_objects_by_prefixes(prefixes=hls_prefixes)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import (
     BaseFileExistsInS3ValidatorService,
     BaseS3FileService,
@@ -8,6 +10,7 @@ from core.apps.common.services.files import (
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class CompleteUploadAvatarUseCase:
     files_service: BaseS3FileService
@@ -23,5 +26,13 @@ class CompleteUploadAvatarUseCase:
             channel=channel,
             avatar_s3_key=key,
         )
+        self.files_service.mark_object_exists(key=key)
+
+        # The replaced avatar is not used anymore, it's deleted with its url and existence index entry
+        if channel.avatar_s3_key and channel.avatar_s3_key != key:
+            self.files_service.delete_object_by_key(
+                key=channel.avatar_s3_key,
+                cache_key=CACHE_KEYS['s3_avatar_url'] + channel.avatar_s3_key,
+            )
 
         return {'detail': 'Success'}
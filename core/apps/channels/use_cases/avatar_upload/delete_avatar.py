@@ -3,10 +3,12 @@ from dataclasses import dataclass
 from core.apps.channels.services.channels import BaseChannelService
 from core.apps.channels.services.s3_channels import BaseAvatarValidatorService
 from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class DeleteChannelAvatarUseCase:
     files_service: BaseS3FileService
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
 from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 
 
+@instrument
 @dataclass
 class GenerateUrlForAvatarDownloadUseCase:
     files_service: BaseS3FileService
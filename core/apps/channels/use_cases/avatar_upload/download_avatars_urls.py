@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
+from core.apps.common.services.files import BaseS3FileService
+
+
+@instrument
+@dataclass
+class GenerateUrlsForAvatarsDownloadUseCase:
+    channel_service: BaseChannelService
+    files_service: BaseS3FileService
+
+    def execute(self, keys: list[str]) -> dict:
+        """Return download urls for avatars with given keys, keys not set as
+        an avatar of any channel are skipped."""
+
+        urls = self.files_service.generate_download_urls(
+            keys=self.channel_service.get_existing_avatar_keys(keys=keys),
+            expires_in=3600,
+            cache_key_prefix=CACHE_KEYS['s3_avatar_url'],
+        )
+
+        return {'urls': urls}
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.s3_channels import BaseAvatarFilenameValidatorService
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 
 
+@instrument
 @dataclass
 class GenerateUploadAvatarUrlUseCase:
     files_service: BaseS3FileService
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.payments.services.stripe_service import BaseStripeSubStillActiveValidatorService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class DeleteChannelUseCase:
     channel_service: BaseChannelService
@@ -1,12 +1,11 @@
 from dataclasses import dataclass
 
-from botocore.signers import CloudFrontSigner
-from django.db.utils import settings
-from django.utils import timezone
-
 from core.apps.common.clients.boto_client import BotoClient
-from core.apps.common.cloudfront_rsa_signer import rsa_signer
-from core.apps.common.providers.files import BaseBotoFileProvider
+from core.apps.common.clients.cloudfront_signer import cloudfront_url_signer
+from core.apps.common.providers.files import (
+    BaseBotoFileProvider,
+    BasePrefixSigningFileProvider,
+)
 
 
 @dataclass
@@ -67,6 +66,29 @@ class BotoFileProvider(BaseBotoFileProvider):
         )
         return url
 
+    def generate_upload_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_numbers: range,
+        expires_in: int,
+    ) -> dict[int, str]:
+        client, bucket = self._get_client_and_bucket()
+
+        return {
+            part_number: client.generate_presigned_url(
+                ClientMethod='upload_part',
+                Params={
+                    'Bucket': bucket,
+                    'Key': key,
+                    'UploadId': upload_id,
+                    'PartNumber': part_number,
+                },
+                ExpiresIn=expires_in,
+            )
+            for part_number in part_numbers
+        }
+
     def generate_download_url(
         self,
         key: str,
@@ -85,6 +107,25 @@ class BotoFileProvider(BaseBotoFileProvider):
 
         return url
 
+    def generate_download_urls(
+        self,
+        keys: list[str],
+        expires_in: int,
+    ) -> dict[str, str]:
+        client, bucket = self._get_client_and_bucket()
+
+        return {
+            key: client.generate_presigned_url(
+                ClientMethod='get_object',
+                Params={
+                    'Bucket': bucket,
+                    'Key': key,
+                },
+                ExpiresIn=expires_in,
+            )
+            for key in keys
+        }
+
     def complete_multipart_upload(
         self,
         key: str,
@@ -160,24 +201,74 @@ class BotoFileProvider(BaseBotoFileProvider):
 
         client.head_object(Bucket=bucket, Key=key)
 
-    def list_parts(self, key: str, upload_id: str) -> None:
+    def download_file(self, key: str, path: str) -> None:
         client, bucket = self._get_client_and_bucket()
 
-        client.list_parts(Bucket=bucket, Key=key, UploadId=upload_id)
+        # Large objects are downloaded in concurrent ranged requests
+        client.download_file(Bucket=bucket, Key=key, Filename=path)
+
+    def upload_file(self, path: str, key: str, content_type: str) -> None:
+        client, bucket = self._get_client_and_bucket()
+
+        client.upload_file(Filename=path, Bucket=bucket, Key=key, ExtraArgs={'ContentType': content_type})
+
+    def list_object_keys(self, prefix: str) -> list[str]:
+        client, bucket = self._get_client_and_bucket()
 
+        # S3 returns up to 1000 objects per page
+        pages = client.get_paginator('list_objects_v2').paginate(Bucket=bucket, Prefix=prefix)
 
-class BotoCloudfrontFileProvider(BotoFileProvider):
+        return [obj['Key'] for page in pages for obj in page.get('Contents', [])]
+
+    def list_multipart_uploads(self, prefix: str) -> list[dict]:
+        client, bucket = self._get_client_and_bucket()
+
+        # S3 returns up to 1000 uploads per page
+        pages = client.get_paginator('list_multipart_uploads').paginate(Bucket=bucket, Prefix=prefix)
+
+        return [
+            {'Key': upload['Key'], 'UploadId': upload['UploadId'], 'Initiated': upload['Initiated']}
+            for page in pages
+            for upload in page.get('Uploads', [])
+        ]
+
+    def list_parts(self, key: str, upload_id: str, max_parts: int | None = None) -> list[dict]:
+        client, bucket = self._get_client_and_bucket()
+
+        # S3 returns up to 1000 parts per page
+        pages = client.get_paginator('list_parts').paginate(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PaginationConfig={'MaxItems': max_parts},
+        )
+
+        return [
+            {'PartNumber': part['PartNumber'], 'ETag': part['ETag']} for page in pages for part in page.get('Parts', [])
+        ]
+
+
+class BotoCloudfrontFileProvider(BotoFileProvider, BasePrefixSigningFileProvider):
     def generate_download_url(self, key: str, expires_in: int) -> str:
-        key_id = settings.AWS_CLOUDFRONT_KEY_ID
-        url = f'https://{settings.AWS_CLOUDFRONT_DOMAIN}/{key}'
-        expire_date = timezone.now() + timezone.timedelta(seconds=expires_in)
+        return cloudfront_url_signer.sign(
+            key=key,
+            expires=cloudfront_url_signer.get_expiration_date(expires_in=expires_in),
+        )
 
-        cloudfront_signer = CloudFrontSigner(key_id, rsa_signer)
+    def generate_download_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        return cloudfront_url_signer.sign_many(
+            keys=keys,
+            expires=cloudfront_url_signer.get_expiration_date(expires_in=expires_in),
+        )
 
-        # Create signed url
-        signed_url = cloudfront_signer.generate_presigned_url(
-            url,
-            date_less_than=expire_date,
+    def generate_prefix_signature(self, prefix: str, expires_in: int) -> str:
+        return cloudfront_url_signer.sign_prefix(
+            prefix=prefix,
+            expires=cloudfront_url_signer.get_expiration_date(expires_in=expires_in),
         )
 
-        return signed_url
+    def build_download_url(self, key: str, signature: str) -> str:
+        return cloudfront_url_signer.build_signed_url(key=key, signed_query=signature)
+
+    def build_signed_cookies(self, signature: str) -> dict[str, str]:
+        return cloudfront_url_signer.build_signed_cookies(signed_query=signature)
@@ -17,9 +17,17 @@ class CeleryFileProvider(BaseCeleryFileProvider):
             queue='media-queue',
         )
 
-    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+    def abort_multipart_upload(self, key: str, upload_id: str, countdown: int | None = None) -> None:
         app.send_task(
             'core.apps.common.tasks.abort_multipart_upload_task',
             args=(key, upload_id),
             queue='media-queue',
+            countdown=countdown,
+        )
+
+    def delete_objects_by_prefixes(self, prefixes: list[str]) -> None:
+        app.send_task(
+            'core.apps.common.tasks.delete_s3_prefixes_task',
+            args=(prefixes,),
+            queue='media-queue',
         )
@@ -5,9 +5,10 @@ from dataclasses import (
 )
 from typing import Any
 
-from boto3 import client
 from django.conf import settings
 
+from core.apps.common.clients.registry import boto_client_registry
+
 
 @dataclass
 class BotoClient:
@@ -19,12 +20,7 @@ class BotoClient:
     )
 
     def get_s3_client(self) -> Any:
-        return client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
+        return boto_client_registry.get_client('s3')
 
     def get_bucket_name(self) -> str:
         return settings.AWS_STORAGE_BUCKET_NAME
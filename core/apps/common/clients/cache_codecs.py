@@ -0,0 +1,109 @@
+import pickle
+import zlib
+from typing import Any
+
+import orjson
+from django.core.exceptions import ImproperlyConfigured
+from django_redis.compressors.base import BaseCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.base import BaseSerializer
+
+# Pickle protocols 2+ start every payload with the PROTO opcode, JSON never does
+_PICKLE_PROTO = 0x80
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_LZ4_MAGIC = b'\x04\x22\x4d\x18'
+
+# Types orjson would silently turn into strings are pickled instead
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class OrjsonCacheSerializer(BaseSerializer):
+    """Serializes cached values to JSON with orjson.
+
+    Values orjson can't serialize, e.g. model instances, sets or datetimes,
+    are pickled, and pickled payloads, including keys written before the
+    serializer has been enabled, are read back with pickle. Tuples are read
+    back as lists.
+
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, value: bytes) -> Any:
+        if value[:1] == bytes((_PICKLE_PROTO,)):
+            return pickle.loads(value)
+
+        return orjson.loads(value)
+
+
+def _is_zlib(value: bytes) -> bool:
+    return len(value) > 1 and value[0] == 0x78 and (value[0] << 8 | value[1]) % 31 == 0
+
+
+class ThresholdCompressor(BaseCompressor):
+    """Compresses payloads longer than 'COMPRESS_MIN_LENGTH' with the
+    algorithm set in 'COMPRESS_ALGORITHM' - 'none', 'zlib', 'zstd' or 'lz4'.
+
+    Compressed payloads are recognized by their frame header, so payloads
+    compressed with another algorithm or not compressed at all are still
+    read after the algorithm has been changed.
+
+    """
+
+    def __init__(self, options: dict) -> None:
+        super().__init__(options)
+        self.algorithm = options.get('COMPRESS_ALGORITHM', 'none')
+        self.min_length = options.get('COMPRESS_MIN_LENGTH', 1024)
+
+        if self.algorithm not in ('none', 'zlib', 'zstd', 'lz4'):
+            raise ImproperlyConfigured(f'Unknown cache compression algorithm: {self.algorithm}')
+
+        if self.algorithm != 'none':
+            # zstd and lz4 are optional dependencies, a missing one is reported on startup
+            self._get_codec(self.algorithm)
+
+    @staticmethod
+    def _get_codec(algorithm: str) -> Any:
+        if algorithm == 'zlib':
+            return zlib
+
+        try:
+            if algorithm == 'zstd':
+                import zstandard
+
+                return zstandard
+
+            import lz4.frame
+
+            return lz4.frame
+        except ImportError as error:
+            raise ImproperlyConfigured(f'Cache compression algorithm "{algorithm}" is not installed') from error
+
+    def compress(self, value: bytes) -> bytes:
+        if self.algorithm == 'none' or len(value) <= self.min_length:
+            return value
+
+        return self._get_codec(self.algorithm).compress(value)
+
+    def decompress(self, value: bytes) -> bytes:
+        if value.startswith(_ZSTD_MAGIC):
+            algorithm = 'zstd'
+        elif value.startswith(_LZ4_MAGIC):
+            algorithm = 'lz4'
+        elif _is_zlib(value):
+            algorithm = 'zlib'
+        else:
+            # The payload has not been compressed
+            raise CompressorError('Payload is not compressed')
+
+        codec = self._get_codec(algorithm)
+
+        try:
+            return codec.decompress(value)
+        except Exception as error:
+            raise CompressorError(error) from error
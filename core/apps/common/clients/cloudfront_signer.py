@@ -0,0 +1,112 @@
+import os
+import threading
+from datetime import datetime
+from typing import Any
+from urllib.parse import parse_qsl
+
+from cryptography.hazmat.primitives import (
+    hashes,
+    serialization,
+)
+from cryptography.hazmat.primitives.asymmetric import padding
+from django.conf import settings
+from django.utils import timezone
+
+
+class CloudfrontUrlSigner:
+    """Signs CloudFront download urls with the RSA key from settings.
+
+    The PEM key is parsed and the signer is built once per process. Both
+    are rebuilt when 'AWS_CLOUDFRONT_KEY_ID' or 'AWS_CLOUDFRONT_KEY' are
+    changed in settings, so keys can be rotated without a restart.
+
+    """
+
+    def __init__(self) -> None:
+        # Credentials and the signer built from them are swapped together
+        self._state: tuple[tuple[str, bytes], Any] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_signer(key_id: str, private_key_pem: bytes) -> Any:
+        from botocore.signers import CloudFrontSigner
+
+        private_key = serialization.load_pem_private_key(data=private_key_pem, password=None)
+
+        def rsa_signer(message: bytes) -> bytes:
+            return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())  # noqa
+
+        return CloudFrontSigner(key_id, rsa_signer)
+
+    def _get_signer(self) -> Any:
+        credentials = (settings.AWS_CLOUDFRONT_KEY_ID, settings.AWS_CLOUDFRONT_KEY)
+        state = self._state
+
+        if state is None or state[0] != credentials:
+            with self._lock:
+                state = self._state
+
+                if state is None or state[0] != credentials:
+                    state = (credentials, self._build_signer(*credentials))
+                    self._state = state
+
+        return state[1]
+
+    @staticmethod
+    def _build_url(key: str) -> str:
+        return f'https://{settings.AWS_CLOUDFRONT_DOMAIN}/{key}'
+
+    def sign(self, key: str, expires: datetime) -> str:
+        return self._get_signer().generate_presigned_url(self._build_url(key), date_less_than=expires)
+
+    def sign_many(self, keys: list[str], expires: datetime) -> dict[str, str]:
+        """Sign urls for all 'keys' with the same expiration date and return
+        them mapped by key."""
+
+        signer = self._get_signer()
+        return {key: signer.generate_presigned_url(self._build_url(key), date_less_than=expires) for key in keys}
+
+    def sign_prefix(self, prefix: str, expires: datetime) -> str:
+        """Sign a custom policy with a wildcard resource for all objects
+        under 'prefix' and return the signed query string.
+
+        The query string is valid for any key under the prefix, so it can be
+        signed once and reused with 'build_signed_url'.
+
+        """
+
+        signer = self._get_signer()
+        resource = self._build_url(f'{prefix}*')
+
+        signed_url = signer.generate_presigned_url(resource, policy=signer.build_policy(resource, expires))
+        return signed_url.split('?', 1)[1]
+
+    def build_signed_url(self, key: str, signed_query: str) -> str:
+        return f'{self._build_url(key)}?{signed_query}'
+
+    @staticmethod
+    def build_signed_cookies(signed_query: str) -> dict[str, str]:
+        """Return CloudFront signed cookies with the policy and signature of
+        the signed query string.
+
+        Browsers send the cookies with every request under the prefix, e.g.
+        with HLS playlists and segments referenced by relative URIs.
+
+        """
+
+        return {f'CloudFront-{name}': value for name, value in parse_qsl(signed_query)}
+
+    @staticmethod
+    def get_expiration_date(expires_in: int) -> datetime:
+        return timezone.now() + timezone.timedelta(seconds=expires_in)
+
+    def reset_lock(self) -> None:
+        """Replace the lock, which could be held by another thread at the
+        moment of fork. The signer holds no connections, so it's kept."""
+
+        self._lock = threading.Lock()
+
+
+cloudfront_url_signer = CloudfrontUrlSigner()
+
+os.register_at_fork(after_in_child=cloudfront_url_signer.reset_lock)
@@ -0,0 +1,162 @@
+import fnmatch
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from core.apps.common.constants import CACHE_INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """Process-wide bounded LRU cache with a timeout for every entry.
+
+    Every invalidation bumps the generation of the cache, so a value read
+    from Redis before an invalidation is not stored after it.
+
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key: str) -> Any:
+        """Return the value or None if the key does not exist or has
+        expired."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set_many(self, data: dict[str, Any], timeout: float, generation: int | None = None) -> None:
+        """Store values, unless the cache has been invalidated since
+        'generation'."""
+
+        expires_at = time.monotonic() + timeout
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+
+            for key, value in data.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > settings.CACHE_LOCAL_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def delete_keys(self, keys: list[str]) -> None:
+        with self._lock:
+            self.generation += 1
+
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        with self._lock:
+            self.generation += 1
+
+            for key in [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def reset(self) -> None:
+        """Drop all entries and the lock, as a forked child must not reuse a
+        lock held by another thread at the moment of fork."""
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation += 1
+
+
+class CacheInvalidationListener:
+    """Applies invalidations published by other processes to the local
+    cache.
+
+    The listener runs in a daemon thread subscribed to the Redis
+    invalidation channel. Invalidations published while the subscription
+    is down are lost, so the local cache is cleared on every subscribe.
+
+    """
+
+    def __init__(self, local_cache: LocalCache) -> None:
+        self.local_cache = local_cache
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        # The thread is started lazily in every process, it does not survive a fork
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid != os.getpid():
+                threading.Thread(target=self._listen, name='cache-invalidation-listener', daemon=True).start()
+                self._pid = os.getpid()
+
+    def reset(self) -> None:
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def publish(self, keys: list[str] | None = None, pattern: str | None = None) -> None:
+        get_redis_connection('default').publish(
+            CACHE_INVALIDATION_CHANNEL,
+            orjson.dumps({'keys': keys or [], 'pattern': pattern}),
+        )
+
+    def handle_message(self, data: bytes) -> None:
+        message = orjson.loads(data)
+
+        if message.get('keys'):
+            self.local_cache.delete_keys(message['keys'])
+        if message.get('pattern'):
+            self.local_cache.delete_pattern(message['pattern'])
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                self.local_cache.clear()
+
+                for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self.handle_message(message['data'])
+
+            except Exception:
+                logger.exception('Cache invalidation listener has been disconnected from Redis')
+                self.local_cache.clear()
+                time.sleep(1)
+
+
+local_cache = LocalCache()
+cache_invalidation_listener = CacheInvalidationListener(local_cache=local_cache)
+
+
+def _reset_after_fork() -> None:
+    local_cache.reset()
+    cache_invalidation_listener.reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,74 @@
+import os
+import threading
+from typing import Any
+
+from django.conf import settings
+
+
+class BotoClientRegistry:
+    """Process-wide registry of boto3 clients.
+
+    Building a client loads botocore service models, so every client is
+    created once per process and shared between threads: botocore clients
+    are thread-safe, only their creation is not. The registry is reset
+    in a forked child, because connection pools must not be shared
+    between gunicorn or celery worker processes.
+
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _build_config(self) -> Any:
+        from botocore.config import Config
+
+        return Config(
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            retries={'total_max_attempts': settings.AWS_S3_MAX_ATTEMPTS, 'mode': 'standard'},
+            tcp_keepalive=True,
+            # S3-compatible storages like MinIO do not support virtual-hosted buckets
+            s3={'addressing_style': 'path'} if settings.AWS_S3_ENDPOINT_URL else None,
+        )
+
+    def _create_client(self, service_name: str) -> Any:
+        # boto3 is imported with the first client, so processes not using S3 load only 'botocore.exceptions'
+        from boto3.session import Session
+
+        session = Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_S3_REGION_NAME,
+        )
+        return session.client(
+            service_name,
+            config=self._build_config(),
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL if service_name == 's3' else None,
+        )
+
+    def get_client(self, service_name: str) -> Any:
+        client = self._clients.get(service_name)
+
+        if client is None:
+            with self._lock:
+                # Another thread could create the client while this one was waiting for the lock
+                client = self._clients.get(service_name)
+
+                if client is None:
+                    client = self._create_client(service_name=service_name)
+                    self._clients[service_name] = client
+
+        return client
+
+    def reset(self) -> None:
+        """Drop all clients, they will be created again on the next
+        access."""
+
+        self._clients = {}
+        self._lock = threading.Lock()
+
+
+boto_client_registry = BotoClientRegistry()
+
+# A forked child must not reuse parent's connection pools or a lock held by another thread at the moment of fork
+os.register_at_fork(after_in_child=boto_client_registry.reset)
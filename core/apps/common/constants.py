@@ -24,9 +24,19 @@ V3_MIN_GOOGLE_RECAPTCHA_SCORE = 0.5
 CACHE_KEYS = {
     's3_video_url': 's3:video_url:',
     's3_avatar_url': 's3:avatar_url:',
-    'related_posts': 'channel:posts:',
-    'subs_list': 'channel:subs:',
+    's3_prefix_signature': 's3:prefix_signature:',
+    's3_prefix_url': 's3:prefix_url:',
+    's3_existing_object': 's3:existing_object:',
+    's3_upload_parts': 's3:upload_parts:',
+    'posts_timeline': 'channel:posts_timeline:',
+    'posts_timeline_rebuild': 'channel:posts_timeline_rebuild:',
+    'posts_timeline_added': 'channel:posts_timeline_added:',
+    'posts_timeline_removed': 'channel:posts_timeline_removed:',
+    'post_data': 'post:data:',
+    'channel_posts_count': 'channel:posts_count:',
+    'subs_list': 'channel:subs_json:',
     'retrieve_channel': 'channel:retrieve:',
+    'channel_about': 'channel:about:',
     'otp_email': 'email:otp_code:',
     'set_email': 'email:set_email_code:',
     'password_reset': 'email:user_password_reset:',
@@ -34,8 +44,55 @@ CACHE_KEYS = {
     'stripe_customer_id': 'stripe:user:',
     'stripe_sub_state': 'stripe:customer:',
     'stripe_customer_portal': 'stripe:customer_portal:',
+    'compute_lock': 'lock:compute:',
+    'content_version': 'version:',
+    'cache_tag': 'tag:',
 }
 
+# Tags of cached entries, prefixes are followed by an object id
+CACHE_TAGS = {
+    'channel': 'channel:',
+    'channel_subs': 'channel_subs:',
+}
+
+# Values computed with CacheService.get_or_compute
+CACHE_COMPUTE_LOCK_TIMEOUT = 10
+# Requests wait for a value computed by another process before computing it themselves
+CACHE_COMPUTE_WAIT_TIMEOUT = 2
+CACHE_COMPUTE_WAIT_INTERVAL = 0.05
+# Greater values refresh values earlier before their expiration, see XFetch
+CACHE_EARLY_REFRESH_BETA = 1.0
+
+# Channel of invalidations of local in-process caches
+CACHE_INVALIDATION_CHANNEL = 'cache:invalidation'
+
+# Scopes of content versions used as ETags, prefixes are followed by an object id.
+# Responses use the scopes of the objects they show, lists use the scopes of the objects on the page.
+CONTENT_VERSION_SCOPES = {
+    'channel': 'channel:',
+    'video': 'video:',
+    'post': 'post:',
+    'playlist': 'playlist:',
+}
+# Versions are regenerated after expiration, so clients download the content once more
+CONTENT_VERSION_TIMEOUT = 24 * 60 * 60
+
+
+# Multipart upload
+
+# Uploaded parts of not completed uploads are kept for a week
+MULTIPART_UPLOAD_STATE_TIMEOUT = 7 * 24 * 60 * 60
+# Maximum number of part upload urls generated in one request
+MAX_UPLOAD_PART_URLS_BATCH_SIZE = 500
+
+
+# S3
+
+# Maximum number of keys in one DeleteObjects request
+S3_DELETE_OBJECTS_BATCH_SIZE = 1000
+# Objects are checked in S3 again after their existence index entries have expired
+S3_OBJECTS_INDEX_TIMEOUT = 7 * 24 * 60 * 60
+
 
 # Email SMTP templates
 
@@ -1,4 +1,5 @@
 import punq
+from django.conf import settings
 
 from core.apps.common.adapters.boto_file_provider import BotoCloudfrontFileProvider
 from core.apps.common.adapters.celery_file_provider import CeleryFileProvider
@@ -7,6 +8,7 @@ from core.apps.common.clients.email_client import EmailClient
 from core.apps.common.providers.cache import (
     BaseCacheProvider,
     RedisCacheProvider,
+    TieredCacheProvider,
 )
 from core.apps.common.providers.captcha import (
     BaseCaptchaProvider,
@@ -16,10 +18,18 @@ from core.apps.common.providers.files import (
     BaseBotoFileProvider,
     BaseCeleryFileProvider,
 )
+from core.apps.common.providers.objects_index import (
+    BaseS3ObjectsIndexProvider,
+    RedisS3ObjectsIndexProvider,
+)
 from core.apps.common.providers.senders import (
     BaseSenderProvider,
     EmailSenderProvider,
 )
+from core.apps.common.providers.uploads import (
+    BaseMultipartUploadStateProvider,
+    RedisMultipartUploadStateProvider,
+)
 from core.apps.common.services.cache import (
     BaseCacheService,
     CacheService,
@@ -28,6 +38,10 @@ from core.apps.common.services.captcha import (
     GoogleV2CaptchaService,
     GoogleV3CaptchaService,
 )
+from core.apps.common.services.content_versions import (
+    BaseContentVersionService,
+    ContentVersionService,
+)
 from core.apps.common.services.encoding import (
     BaseEncodingService,
     EncodingService,
@@ -48,25 +62,36 @@ from core.apps.common.services.smtp_email import (
 
 def init_common(container: punq.Container):
     # providers
-    container.register(BaseCacheProvider, RedisCacheProvider)
-    container.register(BaseBotoFileProvider, BotoCloudfrontFileProvider)
-    container.register(BaseCeleryFileProvider, CeleryFileProvider)
-    container.register(BaseCaptchaProvider, GoogleCaptchaProvider)
+    container.register(
+        BaseCacheProvider,
+        TieredCacheProvider if settings.CACHE_LOCAL_ENABLED else RedisCacheProvider,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BaseBotoFileProvider, BotoCloudfrontFileProvider, scope=punq.Scope.singleton)
+    container.register(BaseCeleryFileProvider, CeleryFileProvider, scope=punq.Scope.singleton)
+    container.register(BaseCaptchaProvider, GoogleCaptchaProvider, scope=punq.Scope.singleton)
+    container.register(BaseS3ObjectsIndexProvider, RedisS3ObjectsIndexProvider, scope=punq.Scope.singleton)
+    container.register(BaseMultipartUploadStateProvider, RedisMultipartUploadStateProvider, scope=punq.Scope.singleton)
 
     #  senders
-    container.register(BaseSenderProvider, EmailSenderProvider)
+    container.register(BaseSenderProvider, EmailSenderProvider, scope=punq.Scope.singleton)
 
     # services
-    container.register(BaseEmailService, EmailService)
-    container.register(BaseCacheService, CacheService)
-    container.register(BaseS3FileService, S3FileService)
-    container.register(BaseFileExistsInS3ValidatorService, FileExistsInS3ValidatorService)
-    container.register(BaseMultipartUploadExistsInS3ValidatorService, MultipartUploadExistsInS3ValidatorService)
-    container.register(BaseEncodingService, EncodingService)
+    container.register(BaseEmailService, EmailService, scope=punq.Scope.singleton)
+    container.register(BaseCacheService, CacheService, scope=punq.Scope.singleton)
+    container.register(BaseContentVersionService, ContentVersionService, scope=punq.Scope.singleton)
+    container.register(BaseS3FileService, S3FileService, scope=punq.Scope.singleton)
+    container.register(BaseFileExistsInS3ValidatorService, FileExistsInS3ValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BaseMultipartUploadExistsInS3ValidatorService,
+        MultipartUploadExistsInS3ValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BaseEncodingService, EncodingService, scope=punq.Scope.singleton)
 
-    container.register('GoogleV2CaptchaService', GoogleV2CaptchaService)
-    container.register('GoogleV3CaptchaService', GoogleV3CaptchaService)
+    container.register('GoogleV2CaptchaService', GoogleV2CaptchaService, scope=punq.Scope.singleton)
+    container.register('GoogleV3CaptchaService', GoogleV3CaptchaService, scope=punq.Scope.singleton)
 
     # clients
-    container.register(BotoClient)
-    container.register(EmailClient)
+    container.register(BotoClient, scope=punq.Scope.singleton)
+    container.register(EmailClient, scope=punq.Scope.singleton)
@@ -32,3 +32,13 @@ class MultipartUploadDoesNotExistError(ServiceException):
 
     key: str
     upload_id: str
+
+
+@dataclass
+class MultipartUploadPartsMissingError(ServiceException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = {'detail': 'Some parts of the multipart upload have not been uploaded'}
+
+    key: str
+    upload_id: str
+    missing_parts: list[int]
@@ -0,0 +1,129 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.db import connection
+from prometheus_client import (
+    Counter,
+    Histogram,
+)
+
+CALL_DURATION = Histogram(
+    'app_call_duration_seconds',
+    'Duration of use case and repository calls',
+    ['site'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+CALL_DB_QUERIES = Histogram(
+    'app_call_db_queries',
+    'Number of database queries executed by use case and repository calls',
+    ['site'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+CALL_DB_DURATION = Histogram(
+    'app_call_db_duration_seconds',
+    'Time spent in database queries by use case and repository calls',
+    ['site'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+CALL_CACHE_LOOKUPS = Counter(
+    'app_call_cache_lookups',
+    'Cache lookups of use case and repository calls by result',
+    ['site', 'result'],
+)
+
+
+@dataclass(slots=True)
+class _CallStats:
+    queries: int = 0
+    db_duration: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+# Stats of the instrumented calls in progress, from the outermost to the innermost one
+_active_calls: ContextVar[tuple[_CallStats, ...]] = ContextVar('active_calls', default=())
+
+
+def _count_queries(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    started = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+
+        for stats in _active_calls.get():
+            stats.queries += 1
+            stats.db_duration += duration
+
+
+def record_cache_lookup(hits: int, misses: int) -> None:
+    """Count cache hits and misses for all instrumented calls in progress."""
+
+    for stats in _active_calls.get():
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+def _instrument_method(method: Callable, site: str) -> Callable:
+    # Metric children are looked up once, so a call only observes the values
+    duration_metric = CALL_DURATION.labels(site)
+    queries_metric = CALL_DB_QUERIES.labels(site)
+    db_duration_metric = CALL_DB_DURATION.labels(site)
+    cache_hits_metric = CALL_CACHE_LOOKUPS.labels(site, 'hit')
+    cache_misses_metric = CALL_CACHE_LOOKUPS.labels(site, 'miss')
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        stats = _CallStats()
+        active_calls = _active_calls.get()
+        token = _active_calls.set((*active_calls, stats))
+        started = time.perf_counter()
+
+        try:
+            # Only the outermost call wraps the connection, nested calls are counted by the same wrapper
+            if active_calls:
+                return method(*args, **kwargs)
+
+            with connection.execute_wrapper(_count_queries):
+                return method(*args, **kwargs)
+        finally:
+            duration_metric.observe(time.perf_counter() - started)
+            _active_calls.reset(token)
+
+            queries_metric.observe(stats.queries)
+            db_duration_metric.observe(stats.db_duration)
+
+            if stats.cache_hits:
+                cache_hits_metric.inc(stats.cache_hits)
+            if stats.cache_misses:
+                cache_misses_metric.inc(stats.cache_misses)
+
+    return wrapper
+
+
+def instrument(cls: type) -> type:
+    """Export latency, database queries and cache lookups of all public
+    methods defined in the class to Prometheus, labelled with
+    '<class>.<method>'.
+
+    Values of nested instrumented calls are also included in the values of
+    the calls they are made from. The class is returned unchanged when
+    INSTRUMENTATION_ENABLED is off.
+
+    """
+
+    if not settings.INSTRUMENTATION_ENABLED:
+        return cls
+
+    for name, value in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(value):
+            setattr(cls, name, _instrument_method(method=value, site=f'{cls.__name__}.{name}'))
+
+    return cls
@@ -0,0 +1,121 @@
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.pickle import PickleSerializer
+from rest_framework.utils.serializer_helpers import ReturnList
+
+from core.apps.common.clients.cache_codecs import (
+    OrjsonCacheSerializer,
+    ThresholdCompressor,
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and encode/decode time of cache serializers on posts and subscribers list responses'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=2000, help='Number of encodes and decodes per run')
+        parser.add_argument('--page-size', type=int, default=50, help='Number of items in a cached page')
+        parser.add_argument('--min-length', type=int, default=1024, help='Compression threshold in bytes')
+
+    @staticmethod
+    def _build_page(items: list[OrderedDict]) -> tuple:
+        # Same shape as a cursor paginated response cached by 'get_or_compute'
+        data = OrderedDict(
+            [
+                ('next', 'https://example.com/api/v1/posts/?c=cD0yMDI1LTAxLTAxKzAwJTNBMDAlM0EwMC4wMDAwMDA%3D'),
+                ('previous', None),
+                ('results', ReturnList(items, serializer=None)),
+            ],
+        )
+        return data, 0.012, time.time() + 600
+
+    def _build_payloads(self, page_size: int) -> dict[str, tuple]:
+        created_at = timezone.now().isoformat()
+
+        posts = [
+            OrderedDict(
+                [
+                    ('text', f'Post number {number} with a text of an average length for the channel community tab'),
+                    ('post_id', str(uuid.uuid4())),
+                    ('created_at', created_at),
+                    ('likes_count', number * 3),
+                    ('comments_count', number),
+                    ('author_name', 'Channel name'),
+                    ('author_avatar_s3_key', f'channel_avatars/{uuid.uuid4()}.png'),
+                    ('author_link', 'https://example.com/api/v1/channels/channel-slug/'),
+                ],
+            )
+            for number in range(page_size)
+        ]
+        subscribers = [
+            OrderedDict(
+                [
+                    ('sub_slug', f'subscriber-{number}'),
+                    ('sub_link', f'https://example.com/api/v1/channels/subscriber-{number}/'),
+                    ('created_at', created_at),
+                ],
+            )
+            for number in range(page_size)
+        ]
+
+        return {'posts': self._build_page(items=posts), 'subscribers': self._build_page(items=subscribers)}
+
+    def _run(self, label: str, payload: tuple, serializer, compressor: ThresholdCompressor, iterations: int) -> None:
+        def encode(value) -> bytes:
+            return compressor.compress(serializer.dumps(value))
+
+        def decode(value: bytes):
+            try:
+                value = compressor.decompress(value)
+            except CompressorError:
+                pass
+            return serializer.loads(value)
+
+        encoded = encode(payload)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            encode(payload)
+        encode_time = (time.perf_counter() - started) * 1_000_000 / iterations
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            decode(encoded)
+        decode_time = (time.perf_counter() - started) * 1_000_000 / iterations
+
+        self.stdout.write(
+            f'{label:<32} {len(encoded):>8} bytes  encode {encode_time:>8.1f} us  decode {decode_time:>8.1f} us',
+        )
+
+    def handle(self, *args, **options):
+        serializers = {
+            'pickle': PickleSerializer(options={}),
+            'orjson': OrjsonCacheSerializer(options={}),
+        }
+
+        for name, payload in self._build_payloads(page_size=options['page_size']).items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({options["page_size"]} items per page)'))
+
+            for algorithm in ('none', 'zlib', 'zstd', 'lz4'):
+                try:
+                    compressor = ThresholdCompressor(
+                        options={'COMPRESS_ALGORITHM': algorithm, 'COMPRESS_MIN_LENGTH': options['min_length']},
+                    )
+                except ImproperlyConfigured as error:
+                    self.stdout.write(f'Skipped: {error}')
+                    continue
+
+                for serializer_name, serializer in serializers.items():
+                    self._run(
+                        label=f'{serializer_name} + {algorithm}',
+                        payload=payload,
+                        serializer=serializer,
+                        compressor=compressor,
+                        iterations=options['iterations'],
+                    )
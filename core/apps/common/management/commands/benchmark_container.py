@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from logging import Logger
+
+from django.core.management.base import BaseCommand
+
+from core.apps.common.services.cache import BaseCacheService
+from core.apps.common.services.content_versions import BaseContentVersionService
+from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.use_cases.posts.get_channel_posts_timeline import GetChannelPostsTimelineUseCase
+from core.apps.videos.services.comments import BaseVideoCommentService
+from core.apps.videos.services.videos import BaseVideoService
+from core.apps.videos.use_cases.comments.comment_create import CreateVideoCommentUseCase
+from core.apps.videos.use_cases.playlists.playlist_videos import GetPlaylistVideosUseCase
+from core.project.containers import _initialize_container
+
+# Services resolved by views when they are instantiated for a request
+_VIEW_DEPENDENCIES = {
+    'Video detail': [BaseVideoService, BaseContentVersionService, Logger],
+    'Video comments': [BaseVideoCommentService, Logger, CreateVideoCommentUseCase],
+    'Playlist videos': [Logger, GetPlaylistVideosUseCase, BaseContentVersionService],
+    'Posts': [Logger, BasePostService, BaseCacheService, BaseContentVersionService, GetChannelPostsTimelineUseCase],
+}
+
+_IMPORT_SCRIPT = 'import django; django.setup(); from core.project.containers import get_container; get_container()'
+
+
+class Command(BaseCommand):
+    help = 'Measure container initialization, per request resolution of view dependencies and import time of the app'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=1000, help='Number of resolutions per view')
+        parser.add_argument('--top', type=int, default=15, help='Number of the slowest packages in the import report')
+
+    def _run(self, label: str, dependencies: list, iterations: int) -> None:
+        # A new container resolves dependencies like a container with transient registrations
+        containers = [_initialize_container() for _ in range(iterations)]
+
+        started = time.perf_counter()
+        for container in containers:
+            for dependency in dependencies:
+                container.resolve(dependency)
+        cold_time = (time.perf_counter() - started) * 1_000_000 / iterations
+
+        container = containers[0]
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for dependency in dependencies:
+                container.resolve(dependency)
+        warm_time = (time.perf_counter() - started) * 1_000_000 / iterations
+
+        self.stdout.write(f'{label:<20} first resolution {cold_time:>8.1f} us  singletons {warm_time:>8.1f} us')
+
+    def _report_import_time(self, top: int) -> None:
+        """Run a new interpreter with '-X importtime' and sum the self time
+        of imported modules by top-level package."""
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+            check=False,
+        )
+
+        if result.returncode != 0:
+            self.stderr.write(result.stderr.splitlines()[-1] if result.stderr else 'Import failed')
+            return
+
+        packages = defaultdict(int)
+
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+
+            self_time, _, module = line.removeprefix('import time:').split('|')
+            packages[module.strip().split('.')[0]] += int(self_time)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Import time ({sum(packages.values()) / 1000:.0f} ms total)'))
+
+        for package, self_time in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            self.stdout.write(f'{package:<32} {self_time / 1000:>8.1f} ms')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            _initialize_container()
+        init_time = (time.perf_counter() - started) * 1_000_000 / iterations
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Container initialization {init_time:.1f} us'))
+
+        for label, dependencies in _VIEW_DEPENDENCIES.items():
+            self._run(label=label, dependencies=dependencies, iterations=iterations)
+
+        self._report_import_time(top=options['top'])
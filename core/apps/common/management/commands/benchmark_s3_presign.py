@@ -0,0 +1,48 @@
+import time
+
+from boto3 import client
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.apps.common.clients.registry import BotoClientRegistry
+
+
+class Command(BaseCommand):
+    help = 'Compare S3 presigned urls throughput of a client created per call and a shared client from the registry'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=500, help='Number of presigned urls per run')
+
+    @staticmethod
+    def _presign(s3_client, number: int) -> str:
+        return s3_client.generate_presigned_url(
+            ClientMethod='get_object',
+            Params={'Bucket': settings.AWS_STORAGE_BUCKET_NAME or 'benchmark', 'Key': f'benchmark/{number}'},
+            ExpiresIn=60,
+        )
+
+    def _run(self, label: str, get_client, iterations: int) -> None:
+        started = time.perf_counter()
+
+        for number in range(iterations):
+            self._presign(get_client(), number)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'{label}: {iterations / elapsed:.0f} urls/s ({elapsed * 1000 / iterations:.3f} ms per url)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        registry = BotoClientRegistry()
+
+        # Presigning is done locally, so no requests are sent to S3
+        self._run(
+            label='Client per call',
+            get_client=lambda: client(
+                's3',
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_S3_REGION_NAME,
+            ),
+            iterations=iterations,
+        )
+        self._run(label='Shared client', get_client=lambda: registry.get_client('s3'), iterations=iterations)
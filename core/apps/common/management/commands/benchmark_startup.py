@@ -0,0 +1,81 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+# Every script prints the time from the start of the interpreter to the moment the process is ready
+_WEB_SCRIPT = """
+import time
+started = time.perf_counter()
+from core.project.wsgi import application
+print(time.perf_counter() - started)
+"""
+
+_CELERY_SCRIPT = """
+import time
+started = time.perf_counter()
+import django
+django.setup()
+from core.project.celery import app
+app.loader.import_default_modules()
+from core.project.containers import get_container
+get_container()
+print(time.perf_counter() - started)
+"""
+
+# The parent loads the app like a gunicorn master with 'preload_app' and measures a forked worker
+_PRELOADED_WEB_SCRIPT = """
+import os
+import time
+from core.project.wsgi import application
+from core.project.containers import get_container
+from core.apps.videos.services.videos import BaseVideoService
+started = time.perf_counter()
+pid = os.fork()
+if pid == 0:
+    get_container().resolve(BaseVideoService)
+    os._exit(0)
+os.waitpid(pid, 0)
+print(time.perf_counter() - started)
+"""
+
+
+class Command(BaseCommand):
+    help = 'Measure the time until a new web or celery worker process is ready to handle requests and tasks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Number of started processes per worker type')
+
+    def _run(self, label: str, script: str, runs: int) -> None:
+        ready_times = []
+        process_times = []
+
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, '-c', script],
+                capture_output=True,
+                text=True,
+                env=os.environ.copy(),
+                check=False,
+            )
+            process_times.append(time.perf_counter() - started)
+
+            if result.returncode != 0:
+                self.stderr.write(f'{label}: {result.stderr.splitlines()[-1] if result.stderr else "failed"}')
+                return
+
+            ready_times.append(float(result.stdout.splitlines()[-1]))
+
+        self.stdout.write(
+            f'{label:<28} ready {statistics.median(ready_times) * 1000:>8.1f} ms  '
+            f'process {statistics.median(process_times) * 1000:>8.1f} ms  (median of {runs})',
+        )
+
+    def handle(self, *args, **options):
+        self._run(label='Web worker', script=_WEB_SCRIPT, runs=options['runs'])
+        self._run(label='Celery worker', script=_CELERY_SCRIPT, runs=options['runs'])
+        self._run(label='Web worker forked (preload)', script=_PRELOADED_WEB_SCRIPT, runs=options['runs'])
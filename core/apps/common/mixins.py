@@ -1,7 +1,19 @@
+from collections.abc import Callable
+
 from django.db.models.query import QuerySet
-from rest_framework import generics
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from rest_framework import (
+    generics,
+    status,
+)
 from rest_framework.response import Response
 
+from core.apps.common.responses import (
+    RawJSONResponse,
+    render_json,
+)
+
 
 class CustomViewMixin(generics.GenericAPIView):
     def _mixin_pagination(self, queryset: QuerySet) -> Response | None:
@@ -36,21 +48,86 @@ class CustomViewMixin(generics.GenericAPIView):
         #  Return Response based on 'filtered_queryset' without pagination
         return Response(self.get_serializer(filtered_queryset, many=True).data)
 
-    def mixin_cache_and_response(self, cache_key: str, timeout: int, queryset: QuerySet) -> Response:
+    def mixin_cache_and_response(
+        self,
+        cache_key: str,
+        timeout: int,
+        queryset: QuerySet,
+        tags: list[str] | None = None,
+    ) -> RawJSONResponse:
         """
         Note: This method depends on `cache_service`, which must be resolved via `punq.Container`
         in the main view method before calling this.
 
-        Uses the 'mixin_filtration_and_pagination' method, caches the response, and returns it.
+        Returns the cached response body or uses the 'mixin_filtration_and_pagination' method,
+        renders and caches the response body with its ETag, and returns it. Only one request
+        computes an expired response, cache hits are returned without serializers and renderers.
+        The cached body is deleted when any of 'tags' is invalidated.
         """
         if not hasattr(self, 'cache_service'):
             raise AttributeError("Expected 'cache_service' to be injected before calling this method.")
 
-        #  Retrieve the response after applying filtration and pagination
-        response = self.mixin_filtration_and_pagination(queryset=queryset)
+        #  Retrieve the cached response body or render it after applying filtration and pagination
+        body, etag = self.cache_service.get_or_compute(
+            key=cache_key,
+            compute=lambda: render_json(self.mixin_filtration_and_pagination(queryset=queryset).data),
+            timeout=timeout,
+            tags=tags,
+        )
+
+        #  Return the rendered response
+        return RawJSONResponse(body=body, etag=etag)
+
+
+class ConditionalResponseMixin:
+    def mixin_page_values(self, queryset: QuerySet, fields: list[str]) -> list[dict]:
+        """
+        Returns 'fields' of the objects on the requested page after applying filtration and pagination,
+        so the scopes of a list response are known without serializing the page.
+
+        Note: 'fields' must include the ordering fields of cursor pagination.
+        """
+        values = self.filter_queryset(queryset).values(*fields)
+
+        if self.pagination_class is None:
+            return list(values)
+
+        #  A separate paginator, so the paginator of the response is not changed
+        page = self.pagination_class().paginate_queryset(values, self.request, view=self)
+        return list(page) if page is not None else list(values)
+
+    def mixin_conditional_response(
+        self,
+        scopes: list[str],
+        get_response: Callable[[], HttpResponseBase],
+    ) -> HttpResponseBase:
+        """
+        Note: This method depends on `content_version_service`, which must be resolved via `punq.Container`
+        in the main view method before calling this.
+
+        Returns '304 Not Modified' if the request ETag matches the versions of 'scopes' without calling
+        'get_response', so expensive querysets are never evaluated for unchanged content. Otherwise returns
+        the response of 'get_response' with the ETag.
+        """
+        if not hasattr(self, 'content_version_service'):
+            raise AttributeError("Expected 'content_version_service' to be injected before calling this method.")
+
+        #  The response depends on the URL and the user, e.g. private videos
+        etag = self.content_version_service.get_etag(
+            scopes=scopes,
+            variant=f'{self.request.build_absolute_uri()}|{self.request.user.pk}',
+        )
+
+        #  Return 304 response if the client has the current content
+        not_modified_response = get_conditional_response(self.request, etag=etag)
+
+        if not_modified_response is not None:
+            not_modified_response['ETag'] = etag
+            return not_modified_response
+
+        response = get_response()
 
-        #  Cache the serialized response data
-        self.cache_service.set(cache_key, response.data, timeout)
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
 
-        #  Return the response
         return response
@@ -26,9 +26,19 @@ class Comment(models.Model):
         db_index=True,
         help_text=_('Level of reply'),
     )
+    path = models.TextField(
+        default='',
+        blank=True,
+        editable=False,
+        help_text=_('Materialized path of the comment ancestors'),
+    )
 
     class Meta:
         abstract = True
+        indexes = [
+            # 'text_pattern_ops' makes 'path LIKE prefix%' lookups use the index
+            models.Index(fields=['path'], name='%(app_label)s_%(class)s_path_idx', opclasses=['text_pattern_ops']),
+        ]
 
     def __str__(self):
         return f'Comment #{id}'
@@ -1,19 +1,89 @@
+import pickle
 from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from contextlib import (
+    AbstractContextManager,
+    contextmanager,
+)
 from typing import Any
 
+from django.conf import settings
 from django.core.cache import cache
+from redis.exceptions import LockError
+
+from core.apps.common.clients.local_cache import (
+    cache_invalidation_listener,
+    local_cache,
+)
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import record_cache_lookup
+
+
+class BaseCachePipeline(ABC):
+    """Commands queued to be sent in one round trip.
+
+    Results of all commands are available in 'results' in the order the
+    commands were queued, after the pipeline has been executed.
+
+    """
+
+    results: list[Any]
+
+    @abstractmethod
+    def get(self, key: str) -> None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, timeout: int | None = None) -> None: ...
+
+    @abstractmethod
+    def incr(self, key: str, delta: int = 1) -> None:
+        """Queue an increment of the counter, its result is None if the key
+        does not exist."""
+        ...
+
+    @abstractmethod
+    def decr(self, key: str, delta: int = 1) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def execute(self) -> list[Any]: ...
 
 
 class BaseCacheProvider(ABC):
     @abstractmethod
     def get(self, key: str) -> Any: ...
 
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, Any]: ...
+
     @abstractmethod
     def set(self, key: str, value: Any, timeout: int | None = None) -> bool: ...
 
+    @abstractmethod
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+        timeouts: dict[str, int | None] | None = None,
+    ) -> None:
+        """Set all values in one round trip, 'timeouts' overrides 'timeout'
+        for its keys."""
+        ...
+
+    @abstractmethod
+    def incr(self, key: str, delta: int = 1) -> int: ...
+
+    @abstractmethod
+    def decr(self, key: str, delta: int = 1) -> int: ...
+
     @abstractmethod
     def delete(self, key: str) -> bool: ...
 
@@ -23,14 +93,107 @@ class BaseCacheProvider(ABC):
     @abstractmethod
     def delete_pattern(self, pattern: str) -> None: ...
 
+    @abstractmethod
+    def add_tags(self, key: str, tags: list[str], timeout: int | None = None) -> None:
+        """Register the key in the registries of 'tags', which live as long
+        as their longest living key."""
+        ...
+
+    @abstractmethod
+    def invalidate_tags(self, tags: list[str]) -> list[str]:
+        """Delete all keys registered in 'tags' with the registries and
+        return the deleted keys."""
+        ...
+
+    @abstractmethod
+    def acquire_lock(self, key: str, timeout: int) -> Any | None:
+        """Return the lock if it has been acquired without waiting, otherwise
+        None."""
+        ...
+
+    @abstractmethod
+    def release_lock(self, lock: Any) -> None: ...
+
+    @abstractmethod
+    def pipeline(self) -> AbstractContextManager[BaseCachePipeline]:
+        """Context manager queuing commands, which are sent in one round trip
+        on exit."""
+        ...
+
+
+class RedisCachePipeline(BaseCachePipeline):
+    def __init__(self) -> None:
+        self._pipeline = cache.client.get_client(write=True).pipeline(transaction=False)
+        self._decoders: list[Callable[[Any], Any]] = []
+        self.results = []
+
+    @staticmethod
+    def _decode(value: bytes | None) -> Any:
+        return cache.client.decode(value) if value is not None else None
+
+    def get(self, key: str) -> None:
+        self._pipeline.get(cache.client.make_key(key))
+        self._decoders.append(self._decode)
+
+    def set(self, key: str, value: Any, timeout: int | None = None) -> None:
+        cache.set(key, value, timeout, client=self._pipeline)
+        self._decoders.append(bool)
+
+    def incr(self, key: str, delta: int = 1) -> None:
+        # Counters are incremented only if they exist, like in 'BaseCacheProvider.incr'
+        cache.incr(key, delta, client=self._pipeline)
+        self._decoders.append(lambda value: value)
+
+    def decr(self, key: str, delta: int = 1) -> None:
+        self.incr(key, -delta)
+
+    def delete(self, key: str) -> None:
+        cache.delete(key, client=self._pipeline)
+        self._decoders.append(bool)
+
+    def execute(self) -> list[Any]:
+        values = self._pipeline.execute() if self._decoders else []
+        self.results = [decode(value) for decode, value in zip(self._decoders, values, strict=True)]
+        return self.results
+
 
 class RedisCacheProvider(BaseCacheProvider):
     def get(self, key: str) -> Any:
-        return cache.get(key)
+        value = cache.get(key)
+        record_cache_lookup(hits=int(value is not None), misses=int(value is None))
+        return value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        values = cache.get_many(keys)
+        record_cache_lookup(hits=len(values), misses=len(keys) - len(values))
+        return values
 
     def set(self, key: str, value: Any, timeout: int | None = None) -> bool:
         return cache.set(key, value, timeout)
 
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+        timeouts: dict[str, int | None] | None = None,
+    ) -> None:
+        if not timeouts:
+            cache.set_many(data, timeout)
+            return
+
+        pipeline = RedisCachePipeline()
+
+        for key, value in data.items():
+            pipeline.set(key, value, timeouts.get(key, timeout))
+
+        pipeline.execute()
+
+    def incr(self, key: str, delta: int = 1) -> int:
+        return cache.incr(key, delta)
+
+    def decr(self, key: str, delta: int = 1) -> int:
+        return cache.decr(key, delta)
+
     def delete(self, key: str) -> bool:
         return cache.delete(key)
 
@@ -39,3 +202,196 @@ class RedisCacheProvider(BaseCacheProvider):
 
     def delete_pattern(self, pattern: str) -> None:
         cache.delete_pattern(pattern)
+
+    @staticmethod
+    def _make_tag_key(tag: str) -> str:
+        return cache.client.make_key(CACHE_KEYS['cache_tag'] + tag)
+
+    def add_tags(self, key: str, tags: list[str], timeout: int | None = None) -> None:
+        pipeline = cache.client.get_client(write=True).pipeline(transaction=False)
+
+        for tag in tags:
+            tag_key = self._make_tag_key(tag)
+            pipeline.sadd(tag_key, key)
+
+            if timeout is None:
+                pipeline.persist(tag_key)
+            else:
+                # Sets the timeout of a new registry, then extends the timeout of an existing one
+                pipeline.expire(tag_key, timeout, nx=True)
+                pipeline.expire(tag_key, timeout, gt=True)
+
+        pipeline.execute()
+
+    def invalidate_tags(self, tags: list[str]) -> list[str]:
+        tag_keys = [self._make_tag_key(tag) for tag in tags]
+
+        # Registries are read and deleted atomically, so keys registered meanwhile are not lost
+        pipeline = cache.client.get_client(write=True).pipeline(transaction=True)
+        pipeline.sunion(tag_keys)
+        pipeline.delete(*tag_keys)
+        members, _ = pipeline.execute()
+
+        keys = sorted(member.decode() for member in members)
+
+        if keys:
+            self.delete_keys(keys)
+
+        return keys
+
+    def acquire_lock(self, key: str, timeout: int) -> Any | None:
+        lock = cache.lock(key, timeout=timeout)
+        return lock if lock.acquire(blocking=False) else None
+
+    def release_lock(self, lock: Any) -> None:
+        try:
+            lock.release()
+        except LockError:
+            # The lock has expired and could be acquired by another process
+            pass
+
+    @contextmanager
+    def pipeline(self) -> Iterator[BaseCachePipeline]:
+        pipeline = RedisCachePipeline()
+        yield pipeline
+        pipeline.execute()
+
+
+def _dumps(data: dict[str, Any]) -> dict[str, bytes]:
+    return {key: pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for key, value in data.items()}
+
+
+def _get_local_timeout(timeout: int | None) -> int:
+    return min(timeout, settings.CACHE_LOCAL_TIMEOUT) if timeout is not None else settings.CACHE_LOCAL_TIMEOUT
+
+
+class TieredCachePipeline(RedisCachePipeline):
+    """Applies written values to the local cache and publishes deleted keys
+    in one message once the pipeline has been executed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._written_values: dict[str, tuple[Any, int | None]] = {}
+        self._deleted_keys: list[str] = []
+
+    def set(self, key: str, value: Any, timeout: int | None = None) -> None:
+        super().set(key, value, timeout)
+        self._written_values[key] = (value, timeout)
+
+    def incr(self, key: str, delta: int = 1) -> None:
+        local_cache.delete_keys([key])
+        super().incr(key, delta)
+
+    def delete(self, key: str) -> None:
+        local_cache.delete_keys([key])
+        super().delete(key)
+        self._written_values.pop(key, None)
+        self._deleted_keys.append(key)
+
+    def execute(self) -> list[Any]:
+        results = super().execute()
+
+        for key, (value, timeout) in self._written_values.items():
+            local_cache.set_many(_dumps({key: value}), timeout=_get_local_timeout(timeout))
+
+        if self._deleted_keys:
+            cache_invalidation_listener.publish(keys=self._deleted_keys)
+
+        return results
+
+
+class TieredCacheProvider(RedisCacheProvider):
+    """Redis cache with a bounded in-process LRU layer in front of it.
+
+    Values read from Redis are kept in the process for at most
+    CACHE_LOCAL_TIMEOUT seconds. Deletes are published to other processes
+    through Redis pub/sub, while overwritten values and counters are only
+    refreshed in other processes when their local entries expire.
+
+    Values are kept pickled like in Redis, so callers mutating a returned
+    value never change the cached one.
+
+    """
+
+    def get(self, key: str) -> Any:
+        cache_invalidation_listener.ensure_started()
+
+        local_value = local_cache.get(key)
+
+        if local_value is not None:
+            record_cache_lookup(hits=1, misses=0)
+            return pickle.loads(local_value)
+
+        generation = local_cache.generation
+        value = super().get(key)
+
+        if value is not None:
+            local_cache.set_many(_dumps({key: value}), timeout=settings.CACHE_LOCAL_TIMEOUT, generation=generation)
+
+        return value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        cache_invalidation_listener.ensure_started()
+
+        values = {key: pickle.loads(value) for key in keys if (value := local_cache.get(key)) is not None}
+        missing_keys = [key for key in keys if key not in values]
+        record_cache_lookup(hits=len(values), misses=0)
+
+        if missing_keys:
+            generation = local_cache.generation
+            missing_values = super().get_many(missing_keys)
+
+            local_cache.set_many(_dumps(missing_values), timeout=settings.CACHE_LOCAL_TIMEOUT, generation=generation)
+            values.update(missing_values)
+
+        return values
+
+    def set(self, key: str, value: Any, timeout: int | None = None) -> bool:
+        result = super().set(key, value, timeout)
+        local_cache.set_many(_dumps({key: value}), timeout=_get_local_timeout(timeout))
+        return result
+
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+        timeouts: dict[str, int | None] | None = None,
+    ) -> None:
+        super().set_many(data, timeout, timeouts)
+
+        if not timeouts:
+            local_cache.set_many(_dumps(data), timeout=_get_local_timeout(timeout))
+            return
+
+        for key, value in _dumps(data).items():
+            local_cache.set_many({key: value}, timeout=_get_local_timeout(timeouts.get(key, timeout)))
+
+    def incr(self, key: str, delta: int = 1) -> int:
+        local_cache.delete_keys([key])
+        return super().incr(key, delta)
+
+    def decr(self, key: str, delta: int = 1) -> int:
+        local_cache.delete_keys([key])
+        return super().decr(key, delta)
+
+    def delete(self, key: str) -> bool:
+        local_cache.delete_keys([key])
+        result = super().delete(key)
+        cache_invalidation_listener.publish(keys=[key])
+        return result
+
+    def delete_keys(self, keys: list):
+        local_cache.delete_keys(keys)
+        super().delete_keys(keys)
+        cache_invalidation_listener.publish(keys=keys)
+
+    def delete_pattern(self, pattern: str) -> None:
+        local_cache.delete_pattern(pattern)
+        super().delete_pattern(pattern)
+        cache_invalidation_listener.publish(pattern=pattern)
+
+    @contextmanager
+    def pipeline(self) -> Iterator[BaseCachePipeline]:
+        pipeline = TieredCachePipeline()
+        yield pipeline
+        pipeline.execute()
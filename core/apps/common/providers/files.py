@@ -13,7 +13,10 @@ class BaseCeleryFileProvider(ABC):
     def delete_objects(self, objects: list[dict], cache_keys: list | None) -> None: ...
 
     @abstractmethod
-    def abort_multipart_upload(self, key: str, upload_id: str) -> None: ...
+    def abort_multipart_upload(self, key: str, upload_id: str, countdown: int | None = None) -> None: ...
+
+    @abstractmethod
+    def delete_objects_by_prefixes(self, prefixes: list[str]) -> None: ...
 
 
 @dataclass
@@ -41,6 +44,15 @@ class BaseBotoFileProvider(ABC):
         expires_in: int,
     ) -> str: ...
 
+    @abstractmethod
+    def generate_upload_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_numbers: range,
+        expires_in: int,
+    ) -> dict[int, str]: ...
+
     @abstractmethod
     def generate_download_url(
         self,
@@ -48,6 +60,13 @@ class BaseBotoFileProvider(ABC):
         expires_in: int,
     ) -> str: ...
 
+    @abstractmethod
+    def generate_download_urls(
+        self,
+        keys: list[str],
+        expires_in: int,
+    ) -> dict[str, str]: ...
+
     @abstractmethod
     def complete_multipart_upload(
         self,
@@ -93,6 +112,55 @@ class BaseBotoFileProvider(ABC):
         ...
 
     @abstractmethod
-    def list_parts(self, key: str, upload_id: str) -> None:
-        """Check if the Multipart Upload has parts and exists is S3."""
+    def download_file(self, key: str, path: str) -> None: ...
+
+    @abstractmethod
+    def upload_file(self, path: str, key: str, content_type: str) -> None: ...
+
+    @abstractmethod
+    def list_object_keys(self, prefix: str) -> list[str]:
+        """Return keys of all objects under 'prefix'."""
+        ...
+
+    @abstractmethod
+    def list_multipart_uploads(self, prefix: str) -> list[dict]:
+        """Return not completed Multipart Uploads under 'prefix' with their
+        keys and initiation dates."""
+        ...
+
+    @abstractmethod
+    def list_parts(self, key: str, upload_id: str, max_parts: int | None = None) -> list[dict]:
+        """Return uploaded parts of the Multipart Upload with their ETags.
+
+        Raises:
+            ClientError: If the Multipart Upload does not exist in S3
+
+        """
         ...
+
+
+class BasePrefixSigningFileProvider(BaseBotoFileProvider):
+    """File provider which signs one query string for all keys under a prefix,
+    e.g. with a CloudFront wildcard policy.
+
+    S3 presigned urls are signed for a single key, so plain S3 providers
+    don't implement it.
+
+    """
+
+    @abstractmethod
+    def generate_prefix_signature(
+        self,
+        prefix: str,
+        expires_in: int,
+    ) -> str: ...
+
+    @abstractmethod
+    def build_download_url(
+        self,
+        key: str,
+        signature: str,
+    ) -> str: ...
+
+    @abstractmethod
+    def build_signed_cookies(self, signature: str) -> dict[str, str]: ...
@@ -0,0 +1,57 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from django_redis import get_redis_connection
+
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    S3_OBJECTS_INDEX_TIMEOUT,
+)
+
+
+class BaseS3ObjectsIndexProvider(ABC):
+    @abstractmethod
+    def add(self, keys: list[str]) -> None: ...
+
+    @abstractmethod
+    def remove(self, keys: list[str]) -> None: ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool: ...
+
+
+class RedisS3ObjectsIndexProvider(BaseS3ObjectsIndexProvider):
+    """Keeps keys of objects known to exist in S3 as Redis keys expiring
+    after 'S3_OBJECTS_INDEX_TIMEOUT', so keys of objects which are never
+    requested again don't grow the index.
+
+    The index is only a shortcut for S3 HEAD requests: a key missing from
+    the index is still checked in S3.
+
+    """
+
+    @property
+    def _connection(self):
+        return get_redis_connection('default')
+
+    @staticmethod
+    def _index_key(key: str) -> str:
+        return f'{CACHE_KEYS["s3_existing_object"]}{key}'
+
+    def add(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        pipe = self._connection.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(self._index_key(key), 1, ex=S3_OBJECTS_INDEX_TIMEOUT)
+        pipe.execute()
+
+    def remove(self, keys: list[str]) -> None:
+        if keys:
+            self._connection.delete(*[self._index_key(key) for key in keys])
+
+    def exists(self, key: str) -> bool:
+        return bool(self._connection.exists(self._index_key(key)))
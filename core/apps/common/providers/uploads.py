@@ -0,0 +1,54 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from django_redis import get_redis_connection
+
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    MULTIPART_UPLOAD_STATE_TIMEOUT,
+)
+
+
+class BaseMultipartUploadStateProvider(ABC):
+    @abstractmethod
+    def add_parts(self, upload_id: str, parts: dict[int, str]) -> None: ...
+
+    @abstractmethod
+    def get_parts(self, upload_id: str) -> dict[int, str]: ...
+
+    @abstractmethod
+    def delete(self, upload_id: str) -> None: ...
+
+
+class RedisMultipartUploadStateProvider(BaseMultipartUploadStateProvider):
+    """Keeps ETags of uploaded parts of a multipart upload in a Redis hash
+    mapped by part number.
+
+    The hash expires if the upload is not completed or aborted for a long
+    time, then it is rebuilt from S3 on the next access.
+
+    """
+
+    @property
+    def _connection(self):
+        return get_redis_connection('default')
+
+    def add_parts(self, upload_id: str, parts: dict[int, str]) -> None:
+        if not parts:
+            return
+
+        cache_key = CACHE_KEYS['s3_upload_parts'] + upload_id
+
+        pipeline = self._connection.pipeline()
+        pipeline.hset(cache_key, mapping=parts)
+        pipeline.expire(cache_key, MULTIPART_UPLOAD_STATE_TIMEOUT)
+        pipeline.execute()
+
+    def get_parts(self, upload_id: str) -> dict[int, str]:
+        parts = self._connection.hgetall(CACHE_KEYS['s3_upload_parts'] + upload_id)
+        return {int(part_number): etag.decode() for part_number, etag in parts.items()}
+
+    def delete(self, upload_id: str) -> None:
+        self._connection.delete(CACHE_KEYS['s3_upload_parts'] + upload_id)
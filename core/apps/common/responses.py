@@ -0,0 +1,27 @@
+import hashlib
+from typing import Any
+
+import orjson
+from django.http import HttpResponse
+from django.utils.http import quote_etag
+
+
+def render_json(data: Any) -> tuple[bytes, str]:
+    """Render data to a JSON body and return it with its strong ETag.
+
+    The body matches the output of DRF 'JSONRenderer' with the project
+    settings: compact, UTF-8 and UTC datetimes ending with 'Z'.
+
+    """
+
+    body = orjson.dumps(data, option=orjson.OPT_UTC_Z)
+    return body, quote_etag(hashlib.md5(body, usedforsecurity=False).hexdigest())
+
+
+class RawJSONResponse(HttpResponse):
+    """Response with an already rendered JSON body, returned without DRF
+    serializers and renderers."""
+
+    def __init__(self, body: bytes, etag: str, status: int = 200) -> None:
+        super().__init__(body, content_type='application/json', status=status)
+        self['ETag'] = etag
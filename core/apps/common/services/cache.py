@@ -1,11 +1,26 @@
+import math
+import random
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from typing import Any
 
-from core.apps.common.providers.cache import BaseCacheProvider
+from core.apps.common.constants import (
+    CACHE_COMPUTE_LOCK_TIMEOUT,
+    CACHE_COMPUTE_WAIT_INTERVAL,
+    CACHE_COMPUTE_WAIT_TIMEOUT,
+    CACHE_EARLY_REFRESH_BETA,
+    CACHE_KEYS,
+)
+from core.apps.common.providers.cache import (
+    BaseCachePipeline,
+    BaseCacheProvider,
+)
 
 
 @dataclass
@@ -15,20 +30,266 @@ class BaseCacheService(ABC):
     @abstractmethod
     def get(self, key: str) -> Any: ...
 
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, Any]: ...
+
     @abstractmethod
     def set(self, key: str, data: Any, timeout: int | None = None) -> bool: ...
 
+    @abstractmethod
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+        timeouts: dict[str, int | None] | None = None,
+    ) -> None: ...
+
+    @abstractmethod
+    def incr(self, key: str, delta: int = 1) -> int | None: ...
+
+    @abstractmethod
+    def decr(self, key: str, delta: int = 1) -> int | None: ...
+
     @abstractmethod
     def delete(self, key: str) -> bool: ...
 
+    @abstractmethod
+    def pipeline(self) -> AbstractContextManager[BaseCachePipeline]: ...
+
+    @abstractmethod
+    def add_tags(self, key: str, tags: list[str], timeout: int | None = None) -> None: ...
+
+    @abstractmethod
+    def invalidate_tags(self, tags: list[str]) -> list[str]: ...
+
+    @abstractmethod
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        timeout: int,
+        stale_timeout: int = 0,
+        tags: list[str] | None = None,
+    ) -> Any: ...
+
+    @abstractmethod
+    def get_many_or_compute(
+        self,
+        keys: list[str],
+        compute: Callable[[list[str]], dict[str, Any]],
+        timeout: int,
+        stale_timeout: int = 0,
+    ) -> dict[str, Any]: ...
+
 
 @dataclass
 class CacheService(BaseCacheService):
     def get(self, key: str) -> Any:
         return self.cache_provider.get(key)
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Return values of existing keys in one round trip."""
+
+        return self.cache_provider.get_many(keys)
+
     def set(self, key: str, data: Any, timeout: int | None = None) -> bool:
         return self.cache_provider.set(key, data, timeout)
 
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+        timeouts: dict[str, int | None] | None = None,
+    ) -> None:
+        """Set all values in one pipelined round trip, 'timeouts' overrides
+        'timeout' for its keys."""
+
+        self.cache_provider.set_many(data, timeout, timeouts)
+
+    def incr(self, key: str, delta: int = 1) -> int | None:
+        """Increment the counter, return None if the key does not exist."""
+
+        try:
+            return self.cache_provider.incr(key, delta)
+        except ValueError:
+            return None
+
+    def decr(self, key: str, delta: int = 1) -> int | None:
+        """Decrement the counter, return None if the key does not exist."""
+
+        try:
+            return self.cache_provider.decr(key, delta)
+        except ValueError:
+            return None
+
     def delete(self, key: str) -> bool:
         return self.cache_provider.delete(key)
+
+    def pipeline(self) -> AbstractContextManager[BaseCachePipeline]:
+        """Queue commands to send them in one round trip on exit.
+
+        Results are available in 'results' of the pipeline after exit.
+
+        """
+
+        return self.cache_provider.pipeline()
+
+    def add_tags(self, key: str, tags: list[str], timeout: int | None = None) -> None:
+        """Register the key in 'tags', so it's deleted when any of them is
+        invalidated.
+
+        'timeout' must not be shorter than the timeout of the key.
+
+        """
+
+        self.cache_provider.add_tags(key, tags, timeout)
+
+    def invalidate_tags(self, tags: list[str]) -> list[str]:
+        """Delete all keys registered in 'tags' in two round trips, without
+        scanning the keyspace, and return them."""
+
+        return self.cache_provider.invalidate_tags(tags)
+
+    @staticmethod
+    def _unpack(entry: Any) -> tuple[Any, float, float] | None:
+        """Return the value with its computation time and expiration time.
+
+        Values cached without 'get_or_compute' are treated as missing. Entries
+        are read back as lists by the orjson cache serializer.
+
+        """
+
+        return tuple(entry) if isinstance(entry, (tuple, list)) and len(entry) == 3 else None
+
+    @staticmethod
+    def _is_fresh(entry: tuple[Any, float, float]) -> bool:
+        _, delta, expires_at = entry
+
+        # XFetch: the closer the expiration and the longer the computation, the more likely an early refresh
+        return time.time() - delta * CACHE_EARLY_REFRESH_BETA * math.log(1.0 - random.random()) < expires_at
+
+    def _compute_and_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        timeout: int,
+        stale_timeout: int,
+        tags: list[str] | None,
+    ) -> Any:
+        started_at = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - started_at
+
+        if tags:
+            # Tags are registered first, so the key is never cached without them
+            self.cache_provider.add_tags(key, tags, timeout + stale_timeout)
+
+        self.cache_provider.set(key, (value, delta, time.time() + timeout), timeout + stale_timeout)
+        return value
+
+    def _wait_for_entry(self, key: str) -> tuple[Any, float, float] | None:
+        deadline = time.monotonic() + CACHE_COMPUTE_WAIT_TIMEOUT
+
+        while time.monotonic() < deadline:
+            time.sleep(CACHE_COMPUTE_WAIT_INTERVAL)
+            entry = self._unpack(self.cache_provider.get(key))
+
+            if entry is not None:
+                return entry
+
+        return None
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        timeout: int,
+        stale_timeout: int = 0,
+        tags: list[str] | None = None,
+    ) -> Any:
+        """Return the cached value, compute and cache it if it is missing or
+        expiring.
+
+        Only the process holding the compute lock calls 'compute'. Others
+        return the stale value for up to 'stale_timeout' seconds after the
+        expiration or wait for the missing value. The value is refreshed
+        a bit before its expiration with a probability growing with its
+        computation time (XFetch), so hot keys are never missing. Computed
+        values are registered in 'tags'.
+
+        """
+
+        entry = self._unpack(self.cache_provider.get(key))
+
+        if entry is not None and self._is_fresh(entry):
+            return entry[0]
+
+        lock = self.cache_provider.acquire_lock(CACHE_KEYS['compute_lock'] + key, timeout=CACHE_COMPUTE_LOCK_TIMEOUT)
+
+        if lock is None:
+            # Another process is computing the value
+            if entry is None:
+                entry = self._wait_for_entry(key)
+
+            if entry is not None:
+                return entry[0]
+
+            # The value is computed without the lock rather than failing the request
+            return self._compute_and_set(
+                key=key,
+                compute=compute,
+                timeout=timeout,
+                stale_timeout=stale_timeout,
+                tags=tags,
+            )
+
+        try:
+            # The value could be computed by another process before the lock was acquired
+            latest_entry = self._unpack(self.cache_provider.get(key))
+
+            if latest_entry is not None and (entry is None or latest_entry[2] != entry[2]):
+                return latest_entry[0]
+
+            return self._compute_and_set(
+                key=key,
+                compute=compute,
+                timeout=timeout,
+                stale_timeout=stale_timeout,
+                tags=tags,
+            )
+        finally:
+            self.cache_provider.release_lock(lock)
+
+    def get_many_or_compute(
+        self,
+        keys: list[str],
+        compute: Callable[[list[str]], dict[str, Any]],
+        timeout: int,
+        stale_timeout: int = 0,
+    ) -> dict[str, Any]:
+        """Return cached values mapped by key, missing and expiring values are
+        computed with one 'compute' call and cached in one round trip.
+
+        Values are cached in the 'get_or_compute' format, so both methods
+        can be used for the same keys. Batches are not locked.
+
+        """
+
+        entries = {key: self._unpack(entry) for key, entry in self.cache_provider.get_many(keys).items()}
+        values = {key: entry[0] for key, entry in entries.items() if entry is not None and self._is_fresh(entry)}
+
+        missing_keys = [key for key in keys if key not in values]
+
+        if missing_keys:
+            started_at = time.monotonic()
+            computed_values = compute(missing_keys)
+            delta = time.monotonic() - started_at
+            expires_at = time.time() + timeout
+
+            self.cache_provider.set_many(
+                {key: (value, delta, expires_at) for key, value in computed_values.items()},
+                timeout + stale_timeout,
+            )
+            values.update(computed_values)
+
+        return values
@@ -0,0 +1,66 @@
+import hashlib
+import uuid
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+
+from django.db import transaction
+
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    CONTENT_VERSION_TIMEOUT,
+)
+from core.apps.common.providers.cache import BaseCacheProvider
+
+
+@dataclass
+class BaseContentVersionService(ABC):
+    cache_provider: BaseCacheProvider
+
+    @abstractmethod
+    def get_etag(self, scopes: list[str], variant: str) -> str: ...
+
+    @abstractmethod
+    def bump(self, scopes: list[str]) -> None: ...
+
+
+class ContentVersionService(BaseContentVersionService):
+    """Keeps a random version of every content scope in Redis, so ETags are
+    computed without querying the content itself.
+
+    A bump deletes versions and the next read generates new ones. Versions
+    are generated before the content is read, so content changed after that
+    is never returned with a version generated before the change.
+
+    """
+
+    @staticmethod
+    def _get_keys(scopes: list[str]) -> list[str]:
+        return [CACHE_KEYS['content_version'] + scope for scope in scopes]
+
+    def _get_versions(self, scopes: list[str]) -> list[str]:
+        keys = self._get_keys(scopes)
+        versions = self.cache_provider.get_many(keys)
+
+        missing = {key: uuid.uuid4().hex for key in keys if versions.get(key) is None}
+
+        if missing:
+            self.cache_provider.set_many(missing, timeout=CONTENT_VERSION_TIMEOUT)
+            versions.update(missing)
+
+        return [versions[key] for key in keys]
+
+    def get_etag(self, scopes: list[str], variant: str) -> str:
+        """Return a weak ETag of the versions of 'scopes' and 'variant', e.g.
+        URL and user the response depends on."""
+
+        digest = hashlib.md5('|'.join([variant, *self._get_versions(scopes)]).encode(), usedforsecurity=False)
+        return f'W/"{digest.hexdigest()}"'
+
+    def bump(self, scopes: list[str]) -> None:
+        keys = self._get_keys(scopes)
+
+        # Versions are changed after the transaction, so no one reads the content before it's committed
+        transaction.on_commit(lambda: self.cache_provider.delete_keys(keys))
@@ -3,17 +3,23 @@ from abc import (
     abstractmethod,
 )
 from dataclasses import dataclass
+from datetime import datetime
 
 from botocore.exceptions import ClientError
 
+from core.apps.common.constants import CACHE_KEYS
 from core.apps.common.exceptions.exceptions import (
     MultipartUploadDoesNotExistError,
+    MultipartUploadPartsMissingError,
     S3FileWithKeyNotExistError,
 )
 from core.apps.common.providers.files import (
     BaseBotoFileProvider,
     BaseCeleryFileProvider,
+    BasePrefixSigningFileProvider,
 )
+from core.apps.common.providers.objects_index import BaseS3ObjectsIndexProvider
+from core.apps.common.providers.uploads import BaseMultipartUploadStateProvider
 from core.apps.common.services.cache import BaseCacheService
 
 
@@ -44,7 +50,8 @@ class MultipartUploadExistsInS3ValidatorService(BaseMultipartUploadExistsInS3Val
 
     def validate(self, key: str, upload_id: str) -> None:
         try:
-            self.boto_provider.list_parts(key=key, upload_id=upload_id)
+            # One part is enough to check the upload, so only the first page is requested
+            self.boto_provider.list_parts(key=key, upload_id=upload_id, max_parts=1)
         except ClientError:
             raise MultipartUploadDoesNotExistError(key=key, upload_id=upload_id)
 
@@ -63,8 +70,16 @@ class BaseS3FileService(ABC):
         self,
         key: str,
         upload_id: str,
+        countdown: int | None = None,
     ) -> None: ...
 
+    @abstractmethod
+    def get_stale_multipart_uploads(
+        self,
+        prefix: str,
+        initiated_before: datetime,
+    ) -> dict[str, str]: ...
+
     @abstractmethod
     def generate_upload_part_url(
         self,
@@ -74,6 +89,15 @@ class BaseS3FileService(ABC):
         expires_in: int,
     ) -> str: ...
 
+    @abstractmethod
+    def generate_upload_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_numbers: range,
+        expires_in: int,
+    ) -> dict[int, str]: ...
+
     @abstractmethod
     def generate_download_url(
         self,
@@ -82,12 +106,44 @@ class BaseS3FileService(ABC):
         cache_key: str,
     ) -> str: ...
 
+    @abstractmethod
+    def generate_download_urls(
+        self,
+        keys: list[str],
+        expires_in: int,
+        cache_key_prefix: str,
+    ) -> dict[str, str]: ...
+
+    @abstractmethod
+    def generate_prefix_download_urls(
+        self,
+        prefix: str,
+        keys: list[str],
+        expires_in: int,
+    ) -> dict[str, str]: ...
+
+    @abstractmethod
+    def generate_prefix_signed_cookies(
+        self,
+        prefix: str,
+        expires_in: int,
+    ) -> dict[str, str] | None: ...
+
+    @abstractmethod
+    def get_missing_upload_parts(
+        self,
+        key: str,
+        upload_id: str,
+        parts_count: int,
+    ) -> list[int]: ...
+
     @abstractmethod
     def complete_multipart_upload(
         self,
         key: str,
         upload_id: str,
-        parts: list,
+        parts_count: int | None = None,
+        part_numbers: list[int] | None = None,
     ) -> dict: ...
 
     @abstractmethod
@@ -97,6 +153,9 @@ class BaseS3FileService(ABC):
         cache_key: str | None = None,
     ) -> None: ...
 
+    @abstractmethod
+    def mark_object_exists(self, key: str) -> None: ...
+
     @abstractmethod
     def generate_upload_url(
         self,
@@ -112,6 +171,8 @@ class S3FileService(BaseS3FileService):
     celery_provider: BaseCeleryFileProvider
     cache_service: BaseCacheService
     file_exists_validator: BaseFileExistsInS3ValidatorService
+    objects_index_provider: BaseS3ObjectsIndexProvider
+    upload_state_provider: BaseMultipartUploadStateProvider
 
     def create_multipart_upload(
         self,
@@ -129,11 +190,28 @@ class S3FileService(BaseS3FileService):
         self,
         key: str,
         upload_id: str,
+        countdown: int | None = None,
     ) -> None:
         self.celery_provider.abort_multipart_upload(
             key=key,
             upload_id=upload_id,
+            countdown=countdown,
         )
+        self.upload_state_provider.delete(upload_id=upload_id)
+
+    def get_stale_multipart_uploads(
+        self,
+        prefix: str,
+        initiated_before: datetime,
+    ) -> dict[str, str]:
+        """Return keys of Multipart Uploads initiated before
+        'initiated_before' mapped by upload id."""
+
+        return {
+            upload['UploadId']: upload['Key']
+            for upload in self.boto_provider.list_multipart_uploads(prefix=prefix)
+            if upload['Initiated'] < initiated_before
+        }
 
     def generate_upload_part_url(
         self,
@@ -150,43 +228,214 @@ class S3FileService(BaseS3FileService):
         )
         return url
 
+    def generate_upload_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_numbers: range,
+        expires_in: int,
+    ) -> dict[int, str]:
+        return self.boto_provider.generate_upload_part_urls(
+            key=key,
+            upload_id=upload_id,
+            part_numbers=part_numbers,
+            expires_in=expires_in,
+        )
+
     def generate_download_url(
         self,
         key: str,
         expires_in: int,
         cache_key: str,
     ) -> str:
-        cached_url = self.cache_service.get(key=cache_key)
-        if cached_url:
-            return cached_url
+        def sign_url() -> str:
+            # S3 is asked only about objects which are not in the existence index yet
+            if not self.objects_index_provider.exists(key=key):
+                self.file_exists_validator.validate(key=key)
+                self.mark_object_exists(key=key)
+
+            return self.boto_provider.generate_download_url(
+                key=key,
+                expires_in=expires_in,
+            )
+
+        # Urls are served for at most three quarters of their lifetime, so returned urls stay valid for a while
+        return self.cache_service.get_or_compute(
+            key=cache_key,
+            compute=sign_url,
+            timeout=expires_in // 2,
+            stale_timeout=expires_in // 4,
+        )
+
+    def generate_download_urls(
+        self,
+        keys: list[str],
+        expires_in: int,
+        cache_key_prefix: str,
+    ) -> dict[str, str]:
+        """Return download urls mapped by key.
+
+        Cached urls are read with one MGET, missing ones are signed in
+        bulk and written back with one pipelined SET. Keys are not checked
+        in S3, so callers must pass only keys of existing objects.
+
+        """
+
+        def sign_urls(cache_keys: list[str]) -> dict[str, str]:
+            signed_urls = self.boto_provider.generate_download_urls(
+                keys=[cache_key.removeprefix(cache_key_prefix) for cache_key in cache_keys],
+                expires_in=expires_in,
+            )
+            return {cache_key_prefix + key: url for key, url in signed_urls.items()}
+
+        urls = self.cache_service.get_many_or_compute(
+            keys=[cache_key_prefix + key for key in keys],
+            compute=sign_urls,
+            timeout=expires_in // 2,
+            stale_timeout=expires_in // 4,
+        )
 
-        self.file_exists_validator.validate(key=key)
+        return {key: urls[cache_key_prefix + key] for key in keys}
 
-        url = self.boto_provider.generate_download_url(
-            key=key,
-            expires_in=expires_in,
+    def generate_prefix_download_urls(
+        self,
+        prefix: str,
+        keys: list[str],
+        expires_in: int,
+    ) -> dict[str, str]:
+        """Return download urls for keys under 'prefix' mapped by key.
+
+        All urls share one wildcard signature, which is cached per prefix,
+        so new keys under the prefix are served without signing. Providers
+        which can't sign a prefix, like plain S3, sign every key on its own.
+
+        """
+
+        if not isinstance(self.boto_provider, BasePrefixSigningFileProvider):
+            return self.generate_download_urls(
+                keys=keys,
+                expires_in=expires_in,
+                cache_key_prefix=CACHE_KEYS['s3_prefix_url'],
+            )
+
+        signature = self._get_prefix_signature(prefix=prefix, expires_in=expires_in)
+        return {key: self.boto_provider.build_download_url(key=key, signature=signature) for key in keys}
+
+    def generate_prefix_signed_cookies(
+        self,
+        prefix: str,
+        expires_in: int,
+    ) -> dict[str, str] | None:
+        """Return signed cookies valid for all keys under 'prefix' from the
+        cached prefix signature, or None if the provider can't sign a
+        prefix."""
+
+        if not isinstance(self.boto_provider, BasePrefixSigningFileProvider):
+            return None
+
+        signature = self._get_prefix_signature(prefix=prefix, expires_in=expires_in)
+        return self.boto_provider.build_signed_cookies(signature=signature)
+
+    def _get_prefix_signature(self, prefix: str, expires_in: int) -> str:
+        # The signature is served for at most three quarters of its lifetime, so returned urls stay valid for a while
+        return self.cache_service.get_or_compute(
+            key=CACHE_KEYS['s3_prefix_signature'] + prefix,
+            compute=lambda: self.boto_provider.generate_prefix_signature(prefix=prefix, expires_in=expires_in),
+            timeout=expires_in // 2,
+            stale_timeout=expires_in // 4,
         )
 
-        self.cache_service.set(key=cache_key, data=url, timeout=expires_in)
+    def _get_uploaded_parts(
+        self,
+        key: str,
+        upload_id: str,
+        part_numbers: list[int],
+    ) -> dict[int, str]:
+        """Return ETags of uploaded parts mapped by part number.
+
+        Parts are taken from the Redis record, S3 is listed only if some of
+        'part_numbers' are not recorded yet, and the record is updated with
+        listed parts.
 
-        return url
+        """
+
+        parts = self.upload_state_provider.get_parts(upload_id=upload_id)
+
+        if all(part_number in parts for part_number in part_numbers):
+            return parts
+
+        listed_parts = {
+            part['PartNumber']: part['ETag'] for part in self.boto_provider.list_parts(key=key, upload_id=upload_id)
+        }
+        self.upload_state_provider.add_parts(upload_id=upload_id, parts=listed_parts)
+
+        return parts | listed_parts
+
+    def get_missing_upload_parts(
+        self,
+        key: str,
+        upload_id: str,
+        parts_count: int,
+    ) -> list[int]:
+        part_numbers = list(range(1, parts_count + 1))
+        parts = self._get_uploaded_parts(key=key, upload_id=upload_id, part_numbers=part_numbers)
+        return [part_number for part_number in part_numbers if part_number not in parts]
 
     def complete_multipart_upload(
         self,
         key: str,
         upload_id: str,
-        parts: list,
+        parts_count: int | None = None,
+        part_numbers: list[int] | None = None,
     ) -> dict:
-        response = self.boto_provider.complete_multipart_upload(
+        """Complete the upload with ETags of uploaded parts listed in S3,
+        which are cached until the upload is completed.
+
+        The upload consists of parts from 1 to 'parts_count', or of
+        'part_numbers' if they are passed instead, which may be not
+        contiguous. If a cached ETag is outdated because the part has been
+        uploaded again, the parts are listed once more and the upload is
+        completed again.
+
+        Raises:
+            MultipartUploadPartsMissingError: If some of the parts have not
+                been uploaded, so only them can be uploaded again
+
+        """
+
+        part_numbers = sorted(part_numbers) if part_numbers else list(range(1, parts_count + 1))
+
+        try:
+            response = self._complete_with_uploaded_parts(key=key, upload_id=upload_id, part_numbers=part_numbers)
+        except ClientError as error:
+            if error.response.get('Error', {}).get('Code') != 'InvalidPart':
+                raise
+
+            self.upload_state_provider.delete(upload_id=upload_id)
+            response = self._complete_with_uploaded_parts(key=key, upload_id=upload_id, part_numbers=part_numbers)
+
+        self.upload_state_provider.delete(upload_id=upload_id)
+        return response
+
+    def _complete_with_uploaded_parts(self, key: str, upload_id: str, part_numbers: list[int]) -> dict:
+        parts = self._get_uploaded_parts(key=key, upload_id=upload_id, part_numbers=part_numbers)
+        missing_parts = [part_number for part_number in part_numbers if part_number not in parts]
+
+        if missing_parts:
+            raise MultipartUploadPartsMissingError(key=key, upload_id=upload_id, missing_parts=missing_parts)
+
+        return self.boto_provider.complete_multipart_upload(
             key=key,
             upload_id=upload_id,
-            parts=parts,
+            parts=[{'PartNumber': part_number, 'ETag': parts[part_number]} for part_number in part_numbers],
         )
-        return response
 
     def delete_object_by_key(self, key: str, cache_key: str | None = None) -> None:
         self.celery_provider.delete_object_by_key(key=key, cache_key=cache_key)
 
+    def mark_object_exists(self, key: str) -> None:
+        self.objects_index_provider.add(keys=[key])
+
     def generate_upload_url(
         self,
         filename: str,
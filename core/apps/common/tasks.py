@@ -6,8 +6,13 @@ from botocore.exceptions import ClientError
 from celery import shared_task
 
 from core.apps.common.clients.email_client import EmailClient
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    S3_DELETE_OBJECTS_BATCH_SIZE,
+)
 from core.apps.common.providers.cache import BaseCacheProvider
 from core.apps.common.providers.files import BaseBotoFileProvider
+from core.apps.common.providers.objects_index import BaseS3ObjectsIndexProvider
 from core.project.containers import get_container
 
 
@@ -64,6 +69,7 @@ def delete_s3_objects_task(self, objects: list[dict], cache_keys: list | None) -
     container: punq.Container = get_container()
     boto_provider: BaseBotoFileProvider = container.resolve(BaseBotoFileProvider)
     cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
+    objects_index_provider: BaseS3ObjectsIndexProvider = container.resolve(BaseS3ObjectsIndexProvider)
     logger: Logger = container.resolve(Logger)
 
     try:
@@ -75,6 +81,7 @@ def delete_s3_objects_task(self, objects: list[dict], cache_keys: list | None) -
         response = boto_provider.delete_objects(
             objects=objects,
         )
+        objects_index_provider.remove(keys=[obj['Key'] for obj in objects])
 
         #  delete cache keys if exists
         if cache_keys:
@@ -107,6 +114,7 @@ def delete_s3_object_task(self, key: str, cache_key: str | None = None) -> str:
     container: punq.Container = get_container()
     boto_provider: BaseBotoFileProvider = container.resolve(BaseBotoFileProvider)
     cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
+    objects_index_provider: BaseS3ObjectsIndexProvider = container.resolve(BaseS3ObjectsIndexProvider)
     logger: Logger = container.resolve(Logger)
 
     try:
@@ -114,6 +122,7 @@ def delete_s3_object_task(self, key: str, cache_key: str | None = None) -> str:
         boto_provider.delete_object_by_key(
             key=key,
         )
+        objects_index_provider.remove(keys=[key])
 
         if cache_key:
             cache_provider.delete(key=cache_key)
@@ -134,6 +143,45 @@ def delete_s3_object_task(self, key: str, cache_key: str | None = None) -> str:
     return f'Object successfully deleted from AWS S3. Key: {key}'
 
 
+@shared_task(bind=True, max_retries=10)
+def delete_s3_prefixes_task(self, prefixes: list[str]) -> str:
+    """Delete all objects under 'prefixes', e.g. HLS playlists and segments
+    of deleted videos."""
+
+    container: punq.Container = get_container()
+    boto_provider: BaseBotoFileProvider = container.resolve(BaseBotoFileProvider)
+    cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
+    objects_index_provider: BaseS3ObjectsIndexProvider = container.resolve(BaseS3ObjectsIndexProvider)
+    logger: Logger = container.resolve(Logger)
+
+    deleted = 0
+
+    try:
+        for prefix in prefixes:
+            keys = boto_provider.list_object_keys(prefix=prefix)
+
+            for start in range(0, len(keys), S3_DELETE_OBJECTS_BATCH_SIZE):
+                batch = keys[start : start + S3_DELETE_OBJECTS_BATCH_SIZE]
+                response = boto_provider.delete_objects(objects=[{'Key': key} for key in batch])
+                objects_index_provider.remove(keys=batch)
+                deleted += len(response.get('Deleted', []))
+
+        cache_provider.delete_keys(keys=[CACHE_KEYS['s3_prefix_signature'] + prefix for prefix in prefixes])
+
+    except ClientError as error:
+        logger.error(
+            'AWS S3 cannot delete objects by prefixes',
+            extra={'log_meta': orjson.dumps({'prefixes': prefixes, 'detail': str(error)}).decode()},
+        )
+        raise self.retry(countdown=60)
+
+    logger.info(
+        'Objects successfully deleted from AWS S3 by prefixes',
+        extra={'log_meta': orjson.dumps({'prefixes': prefixes, 'number_of_files': deleted}).decode()},
+    )
+    return f'{deleted} objects successfully deleted from AWS S3'
+
+
 @shared_task(bind=True, max_retries=10)
 def abort_multipart_upload_task(self, key: str, upload_id: str) -> str:
     container: punq.Container = get_container()
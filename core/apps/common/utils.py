@@ -1,3 +1,5 @@
+import importlib
+from types import ModuleType
 from urllib.parse import urlencode
 
 from django.db.utils import settings
@@ -12,3 +14,23 @@ def build_frontend_url(uri: str | None = None, query_params: dict | None = None)
         base_url += f'?{urlencode(query_params)}'
 
     return base_url
+
+
+class _LazyModule(ModuleType):
+    def __getattr__(self, name: str):
+        # Import locks make the first import thread-safe, later ones are a lookup in 'sys.modules'
+        return getattr(importlib.import_module(self.__name__), name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module proxy, which imports the module on the first access
+    to its attributes instead of the import.
+
+    Heavy packages used by a few endpoints or tasks are imported this way,
+    so they don't slow down the startup of celery workers and management
+    commands. The web process imports them in advance through
+    'PRELOADED_MODULES' in wsgi.
+
+    """
+
+    return _LazyModule(name)
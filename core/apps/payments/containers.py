@@ -25,17 +25,29 @@ from core.apps.payments.use_cases.webhook import StripeWebhookUseCase
 
 def init_payments(container: punq.Container) -> None:
     # use cases
-    container.register(CreateCheckoutSessionUseCase)
-    container.register(GetStripeSubStateUseCase)
-    container.register(StripeWebhookUseCase)
+    container.register(CreateCheckoutSessionUseCase, scope=punq.Scope.singleton)
+    container.register(GetStripeSubStateUseCase, scope=punq.Scope.singleton)
+    container.register(StripeWebhookUseCase, scope=punq.Scope.singleton)
 
     # services
-    container.register(BaseStripeService, StripeService)
-    container.register(BaseStripeEventValidatorService, StripeEventValidatorService)
-    container.register(BaseCustomerIdValidatorService, CustomerIdValidatorService)
-    container.register(BaseStripeSubAlreadyExistsValidatorService, StripeSubAlreadyExistsValidatorService)
-    container.register(BaseStripeSubDoesNotExistValidatorService, StripeSubDoesNotExistValidatorService)
-    container.register(BaseStripeSubStillActiveValidatorService, StripeSubStillActiveValidatorService)
+    container.register(BaseStripeService, StripeService, scope=punq.Scope.singleton)
+    container.register(BaseStripeEventValidatorService, StripeEventValidatorService, scope=punq.Scope.singleton)
+    container.register(BaseCustomerIdValidatorService, CustomerIdValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BaseStripeSubAlreadyExistsValidatorService,
+        StripeSubAlreadyExistsValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(
+        BaseStripeSubDoesNotExistValidatorService,
+        StripeSubDoesNotExistValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(
+        BaseStripeSubStillActiveValidatorService,
+        StripeSubStillActiveValidatorService,
+        scope=punq.Scope.singleton,
+    )
 
     # providers
-    container.register(BaseStripeProvider, StripeProvider)
+    container.register(BaseStripeProvider, StripeProvider, scope=punq.Scope.singleton)
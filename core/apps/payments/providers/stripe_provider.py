@@ -4,16 +4,21 @@ from abc import (
 )
 from typing import Literal
 
-import stripe
 from django.db.utils import settings
 
-from core.apps.common.utils import build_frontend_url
+from core.apps.common.utils import (
+    build_frontend_url,
+    lazy_import,
+)
 from core.apps.payments.exceptions import StripeSignatureVerificationError
 
+# Stripe takes most of the app import time, it's imported on the first request to Stripe
+stripe = lazy_import('stripe')
+
 
 class BaseStripeProvider(ABC):
     @abstractmethod
-    def create_customer(self, email: str, user_id: int, idempotency_key: str | None = None) -> stripe.Customer: ...
+    def create_customer(self, email: str, user_id: int, idempotency_key: str | None = None) -> 'stripe.Customer': ...
 
     @abstractmethod
     def create_checkout_session(
@@ -23,10 +28,10 @@ class BaseStripeProvider(ABC):
         sub_price: str,
         trial_days: int | None = None,
         billing_address_collection: Literal['auto', 'required'] = 'auto',
-    ) -> stripe.checkout.Session: ...
+    ) -> 'stripe.checkout.Session': ...
 
     @abstractmethod
-    def construct_event(self, payload: bytes, signature: str) -> stripe.Event: ...
+    def construct_event(self, payload: bytes, signature: str) -> 'stripe.Event': ...
 
     @abstractmethod
     def get_subs_list(
@@ -35,7 +40,7 @@ class BaseStripeProvider(ABC):
         customer_id: str | None = None,
         limit: int = 10,
         expand: list | None = None,
-    ) -> list[stripe.Subscription]: ...
+    ) -> list['stripe.Subscription']: ...
 
     @abstractmethod
     def get_customer_portal_session_url(self, customer_id: str) -> str: ...
@@ -45,7 +50,7 @@ class StripeProvider(BaseStripeProvider):
     _STRIPE_SECRET_KEY = settings.STRIPE_SECRET_KEY
     _STRIPE_WEBHOOK_KEY = settings.STRIPE_WEBHOOK_KEY
 
-    def create_customer(self, email: str, user_id: int, idempotency_key: str | None = None) -> stripe.Customer:
+    def create_customer(self, email: str, user_id: int, idempotency_key: str | None = None) -> 'stripe.Customer':
         return stripe.Customer.create(
             api_key=self._STRIPE_SECRET_KEY,
             email=email,
@@ -62,7 +67,7 @@ class StripeProvider(BaseStripeProvider):
         sub_price: str,
         trial_days: int | None = None,
         billing_address_collection: Literal['auto', 'required'] = 'required',
-    ) -> stripe.checkout.Session:
+    ) -> 'stripe.checkout.Session':
         return stripe.checkout.Session.create(
             api_key=self._STRIPE_SECRET_KEY,
             mode='subscription',
@@ -89,7 +94,7 @@ class StripeProvider(BaseStripeProvider):
             tax_id_collection={'enabled': True},
         )
 
-    def construct_event(self, payload: bytes, signature: str) -> stripe.Event:
+    def construct_event(self, payload: bytes, signature: str) -> 'stripe.Event':
         try:
             return stripe.Webhook.construct_event(
                 payload,
@@ -105,7 +110,7 @@ class StripeProvider(BaseStripeProvider):
         customer_id: str | None = None,
         limit: int = 10,
         expand: list | None = None,
-    ) -> list[stripe.Subscription]:
+    ) -> list['stripe.Subscription']:
         return stripe.Subscription.list(
             api_key=self._STRIPE_SECRET_KEY,
             customer=customer_id,
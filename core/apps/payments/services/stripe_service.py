@@ -6,10 +6,10 @@ from dataclasses import dataclass
 from logging import Logger
 
 import orjson
-import stripe
 
 from core.apps.common.constants import CACHE_KEYS
 from core.apps.common.services.cache import BaseCacheService
+from core.apps.common.utils import lazy_import
 from core.apps.payments.constants import (
     STRIPE_ALLOWED_EVENTS,
     STRIPE_SUBSCRIPTION_TIER_PRICES,
@@ -28,14 +28,16 @@ from core.apps.payments.exceptions import (
 from core.apps.payments.providers.stripe_provider import BaseStripeProvider
 from core.apps.users.entities import AnonymousUserEntity, UserEntity
 
+stripe = lazy_import('stripe')
+
 
 class BaseStripeEventValidatorService(ABC):
     @abstractmethod
-    def validate(self, event: stripe.Event) -> None: ...
+    def validate(self, event: 'stripe.Event') -> None: ...
 
 
 class StripeEventValidatorService(BaseStripeEventValidatorService):
-    def validate(self, event: stripe.Event) -> None:
+    def validate(self, event: 'stripe.Event') -> None:
         allowed_events = STRIPE_ALLOWED_EVENTS
         if event['type'] not in allowed_events:
             raise StripeNotAllowedEventTypeError(event_type=event['type'])
@@ -79,6 +81,9 @@ class BaseStripeService(ABC):
     stripe_provider: BaseStripeProvider
     cache_service: BaseCacheService
 
+    @abstractmethod
+    def get_customer_id_cache_key(self, user_id: int) -> str: ...
+
     @abstractmethod
     def save_customer_id(self, user_id: int, customer_id: str) -> bool: ...
 
@@ -98,18 +103,21 @@ class BaseStripeService(ABC):
     def delete_sub_state_by_customer_id(self, customer_id: str) -> bool: ...
 
     @abstractmethod
-    def extract_sub_payment_method_info(self, pm: stripe.PaymentMethod | str) -> dict | None: ...
+    def delete_customer_cache(self, user_id: int, customer_id: str) -> None: ...
 
     @abstractmethod
-    def build_sub_state(self, customer_id: str, sub: stripe.Subscription) -> dict: ...
+    def extract_sub_payment_method_info(self, pm: 'stripe.PaymentMethod | str') -> dict | None: ...
+
+    @abstractmethod
+    def build_sub_state(self, customer_id: str, sub: 'stripe.Subscription') -> dict: ...
 
     @abstractmethod
     def create_checkout_session(
         self, customer_id: str, user_id: int, sub_tier: str, trial_days: int | None = None
-    ) -> stripe.checkout.Session: ...
+    ) -> 'stripe.checkout.Session': ...
 
     @abstractmethod
-    def create_customer(self, email: str, user_id: int) -> stripe.Customer: ...
+    def create_customer(self, email: str, user_id: int) -> 'stripe.Customer': ...
 
     @abstractmethod
     def get_sub_price_by_sub_tier(self, sub_tier: str) -> str: ...
@@ -121,13 +129,16 @@ class BaseStripeService(ABC):
     def get_sub_tier_by_user(self, user: UserEntity | AnonymousUserEntity) -> str: ...
 
     @abstractmethod
-    def get_subs_list_by_customer_id(self, customer_id: str) -> list[stripe.Subscription]: ...
+    def get_sub_tier_by_customer_id(self, customer_id: str | None) -> str: ...
+
+    @abstractmethod
+    def get_subs_list_by_customer_id(self, customer_id: str) -> list['stripe.Subscription']: ...
 
     @abstractmethod
     def get_customer_portal_session_url(self, customer_id: str) -> str: ...
 
     @abstractmethod
-    def construct_event(self, payload: bytes, signature: str) -> stripe.Event: ...
+    def construct_event(self, payload: bytes, signature: str) -> 'stripe.Event': ...
 
     @abstractmethod
     def get_sub_trial_days(self, sub_state: dict | None = None) -> int | None: ...
@@ -142,16 +153,19 @@ class StripeService(BaseStripeService):
     _STRIPE_SUBSCRIPTION_TIER_PRICES = STRIPE_SUBSCRIPTION_TIER_PRICES
     _STRIPE_SUBSCRIPTION_TIER_PRICES_INVERTED = {v: k for k, v in _STRIPE_SUBSCRIPTION_TIER_PRICES.items()}
 
+    def get_customer_id_cache_key(self, user_id: int) -> str:
+        return f'{self._STRIPE_CUSTOMER_ID_CACHE_KEY_PREFIX}{user_id}'
+
     def save_customer_id(self, user_id: int, customer_id: str) -> bool:
-        customer_id_cache_key = f'{self._STRIPE_CUSTOMER_ID_CACHE_KEY_PREFIX}{user_id}'
+        customer_id_cache_key = self.get_customer_id_cache_key(user_id=user_id)
         return self.cache_service.set(key=customer_id_cache_key, data=customer_id)
 
     def get_customer_id(self, user_id: int) -> str | None:
-        customer_id_cache_key = f'{self._STRIPE_CUSTOMER_ID_CACHE_KEY_PREFIX}{user_id}'
+        customer_id_cache_key = self.get_customer_id_cache_key(user_id=user_id)
         return self.cache_service.get(key=customer_id_cache_key)
 
     def delete_customer_id(self, user_id: int) -> bool:
-        customer_id_cache_key = f'{self._STRIPE_CUSTOMER_ID_CACHE_KEY_PREFIX}{user_id}'
+        customer_id_cache_key = self.get_customer_id_cache_key(user_id=user_id)
         return self.cache_service.delete(key=customer_id_cache_key)
 
     def save_sub_state_by_customer_id(self, customer_id: str, state: dict) -> bool:
@@ -169,7 +183,15 @@ class StripeService(BaseStripeService):
         sub_state_cache_key = f'{self._STRIPE_SUB_STATE_CACHE_KEY_PREFIX}{customer_id}'
         return self.cache_service.delete(key=sub_state_cache_key)
 
-    def extract_sub_payment_method_info(self, pm: stripe.PaymentMethod | str) -> dict | None:
+    def delete_customer_cache(self, user_id: int, customer_id: str) -> None:
+        """Delete customer's subscription state and customer id in one round
+        trip."""
+
+        with self.cache_service.pipeline() as pipeline:
+            pipeline.delete(f'{self._STRIPE_SUB_STATE_CACHE_KEY_PREFIX}{customer_id}')
+            pipeline.delete(self.get_customer_id_cache_key(user_id=user_id))
+
+    def extract_sub_payment_method_info(self, pm: 'stripe.PaymentMethod | str') -> dict | None:
         if not pm or not isinstance(pm, stripe.PaymentMethod):
             return None
 
@@ -185,7 +207,7 @@ class StripeService(BaseStripeService):
             'email': pm_data.get('email'),
         }
 
-    def build_sub_state(self, customer_id: str, sub: stripe.Subscription) -> dict:
+    def build_sub_state(self, customer_id: str, sub: 'stripe.Subscription') -> dict:
         sub_item_data = sub['items']['data'][0]
         sub_price_id = sub_item_data['price']['id']
 
@@ -203,7 +225,7 @@ class StripeService(BaseStripeService):
 
     def create_checkout_session(
         self, customer_id: str, user_id: int, sub_tier: str, trial_days: int | None = None
-    ) -> stripe.checkout.Session:
+    ) -> 'stripe.checkout.Session':
         session = self.stripe_provider.create_checkout_session(
             customer_id=customer_id,
             user_id=user_id,
@@ -220,7 +242,7 @@ class StripeService(BaseStripeService):
         )
         return session
 
-    def create_customer(self, email: str, user_id: int) -> stripe.Customer:
+    def create_customer(self, email: str, user_id: int) -> 'stripe.Customer':
         new_customer = self.stripe_provider.create_customer(
             email=email,
             user_id=user_id,
@@ -246,7 +268,10 @@ class StripeService(BaseStripeService):
         if user.is_anonymous:
             return StripeSubscriptionAllTiersEnum.FREE
 
-        sub_state = self.get_sub_state_by_customer_id(customer_id=self.get_customer_id(user_id=user.id))
+        return self.get_sub_tier_by_customer_id(customer_id=self.get_customer_id(user_id=user.id))
+
+    def get_sub_tier_by_customer_id(self, customer_id: str | None) -> str:
+        sub_state = self.get_sub_state_by_customer_id(customer_id=customer_id)
 
         if not sub_state or sub_state['status'] not in [
             StripeSubscriptionStatusesEnum.ACTIVE,
@@ -256,7 +281,7 @@ class StripeService(BaseStripeService):
         else:
             return sub_state['tier']
 
-    def get_subs_list_by_customer_id(self, customer_id: str) -> list[stripe.Subscription]:
+    def get_subs_list_by_customer_id(self, customer_id: str) -> list['stripe.Subscription']:
         return self.stripe_provider.get_subs_list(
             status='all',
             customer_id=customer_id,
@@ -266,15 +291,13 @@ class StripeService(BaseStripeService):
 
     def get_customer_portal_session_url(self, customer_id: str) -> str:
         cache_key = f'{self._STRIPE_CUSTOMER_PORTAL_CACHE_KEY_PREFIX}{customer_id}'
-        customer_portal_url = self.cache_service.get(key=cache_key)
-
-        if customer_portal_url is None:
-            customer_portal_url = self.stripe_provider.get_customer_portal_session_url(customer_id=customer_id)
-            self.cache_service.set(key=cache_key, data=customer_portal_url, timeout=60 * 5)
-
-        return customer_portal_url
+        return self.cache_service.get_or_compute(
+            key=cache_key,
+            compute=lambda: self.stripe_provider.get_customer_portal_session_url(customer_id=customer_id),
+            timeout=60 * 5,
+        )
 
-    def construct_event(self, payload: bytes, signature: str) -> stripe.Event:
+    def construct_event(self, payload: bytes, signature: str) -> 'stripe.Event':
         return self.stripe_provider.construct_event(payload=payload, signature=signature)
 
     def get_sub_trial_days(self, sub_state: dict | None = None) -> int | None:
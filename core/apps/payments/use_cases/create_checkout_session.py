@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.payments.services.stripe_service import (
     BaseStripeService,
     BaseStripeSubAlreadyExistsValidatorService,
@@ -7,6 +8,7 @@ from core.apps.payments.services.stripe_service import (
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class CreateCheckoutSessionUseCase:
     stripe_service: BaseStripeService
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.payments.services.stripe_service import BaseStripeService, BaseStripeSubDoesNotExistValidatorService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class GetStripeSubStateUseCase:
     stripe_service: BaseStripeService
@@ -3,6 +3,7 @@ from logging import Logger
 
 import orjson
 
+from core.apps.common.instrumentation import instrument
 from core.apps.payments.enums import StripeSubscriptionStatusesEnum
 from core.apps.payments.services.stripe_service import (
     BaseCustomerIdValidatorService,
@@ -11,6 +12,7 @@ from core.apps.payments.services.stripe_service import (
 )
 
 
+@instrument
 @dataclass
 class StripeWebhookUseCase:
     stripe_service: BaseStripeService
@@ -5,3 +5,17 @@ POSTS_LIMITS_BY_SUBSCRIPTION_TIER = {
     StripeSubscriptionAllTiersEnum.PREMIUM: 30,
     StripeSubscriptionAllTiersEnum.PRO: 100,
 }
+
+# Every tier allows at least this number of posts, so the tier lookup can be skipped below it
+MIN_POSTS_LIMIT = min(POSTS_LIMITS_BY_SUBSCRIPTION_TIER.values())
+
+POSTS_COUNT_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Posts timeline
+
+POSTS_TIMELINE_CACHE_TIMEOUT = 60 * 60 * 24
+# Only the newest posts are cached in a timeline, older pages are read from the database
+POSTS_TIMELINE_MAX_SIZE = 1000
+# Posts created and deleted while a timeline is rebuilt are kept aside for this number of seconds
+POSTS_TIMELINE_REBUILD_TIMEOUT = 60
+POST_DATA_CACHE_TIMEOUT = 60 * 60
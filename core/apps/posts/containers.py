@@ -1,5 +1,9 @@
 import punq
 
+from core.apps.posts.providers.timeline import (
+    BasePostTimelineProvider,
+    RedisPostTimelineProvider,
+)
 from core.apps.posts.repositories.comments import (
     BasePostCommentRepository,
     PostCommentRepository,
@@ -15,15 +19,21 @@ from core.apps.posts.services.comments import (
 from core.apps.posts.services.posts import (
     BaseCreatePostSubscriptionLimitValidatorService,
     BasePostAuthorSlugValidatorService,
+    BasePostsCountService,
     BasePostService,
     CreatePostSubscriptionLimitValidatorService,
     PostAuthorSlugValidatorService,
+    PostsCountService,
     PostService,
 )
+from core.apps.posts.services.timeline import (
+    BasePostTimelineService,
+    PostTimelineService,
+)
 from core.apps.posts.use_cases.posts.create_post import PostCreateUseCase
 from core.apps.posts.use_cases.posts.create_post_like import PostLikeCreateUseCase
 from core.apps.posts.use_cases.posts.delete_post_like import PostLikeDeleteUseCase
-from core.apps.posts.use_cases.posts.get_channel_posts import GetChannelPostsUseCase
+from core.apps.posts.use_cases.posts.get_channel_posts_timeline import GetChannelPostsTimelineUseCase
 from core.apps.posts.use_cases.posts_comments.create_comment import CreatePostCommentUseCase
 from core.apps.posts.use_cases.posts_comments.get_list_comments import GetPostCommentsUseCase
 from core.apps.posts.use_cases.posts_comments.get_replies_list_comments import GetPostCommentRepliesUseCase
@@ -33,24 +43,33 @@ from core.apps.posts.use_cases.posts_comments.like_delete import PostCommentLike
 
 def init_posts(container: punq.Container) -> None:
     # use cases
-    container.register(PostCreateUseCase)
-    container.register(GetChannelPostsUseCase)
+    container.register(PostCreateUseCase, scope=punq.Scope.singleton)
+    container.register(GetChannelPostsTimelineUseCase, scope=punq.Scope.singleton)
 
-    container.register(PostLikeCreateUseCase)
-    container.register(PostLikeDeleteUseCase)
+    container.register(PostLikeCreateUseCase, scope=punq.Scope.singleton)
+    container.register(PostLikeDeleteUseCase, scope=punq.Scope.singleton)
 
-    container.register(CreatePostCommentUseCase)
-    container.register(GetPostCommentsUseCase)
-    container.register(GetPostCommentRepliesUseCase)
-    container.register(PostCommentLikeCreateUseCase)
-    container.register(PostCommentLikeDeleteUseCase)
+    container.register(CreatePostCommentUseCase, scope=punq.Scope.singleton)
+    container.register(GetPostCommentsUseCase, scope=punq.Scope.singleton)
+    container.register(GetPostCommentRepliesUseCase, scope=punq.Scope.singleton)
+    container.register(PostCommentLikeCreateUseCase, scope=punq.Scope.singleton)
+    container.register(PostCommentLikeDeleteUseCase, scope=punq.Scope.singleton)
 
     # services
-    container.register(BaseCreatePostSubscriptionLimitValidatorService, CreatePostSubscriptionLimitValidatorService)
-    container.register(BasePostService, PostService)
-    container.register(BasePostAuthorSlugValidatorService, PostAuthorSlugValidatorService)
-    container.register(BasePostCommentService, PostCommentService)
+    container.register(
+        BaseCreatePostSubscriptionLimitValidatorService,
+        CreatePostSubscriptionLimitValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BasePostService, PostService, scope=punq.Scope.singleton)
+    container.register(BasePostsCountService, PostsCountService, scope=punq.Scope.singleton)
+    container.register(BasePostAuthorSlugValidatorService, PostAuthorSlugValidatorService, scope=punq.Scope.singleton)
+    container.register(BasePostCommentService, PostCommentService, scope=punq.Scope.singleton)
+    container.register(BasePostTimelineService, PostTimelineService, scope=punq.Scope.singleton)
 
     # repos
-    container.register(BasePostRepository, PostRepository)
-    container.register(BasePostCommentRepository, PostCommentRepository)
+    container.register(BasePostRepository, PostRepository, scope=punq.Scope.singleton)
+    container.register(BasePostCommentRepository, PostCommentRepository, scope=punq.Scope.singleton)
+
+    # providers
+    container.register(BasePostTimelineProvider, RedisPostTimelineProvider, scope=punq.Scope.singleton)
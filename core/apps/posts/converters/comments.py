@@ -12,6 +12,7 @@ def post_comment_from_entity(post_comment: PostCommentEntity) -> PostCommentItem
         post_id=post_comment.post_id,
         reply_comment_id=post_comment.reply_comment_id,
         reply_level=post_comment.reply_level,
+        path=post_comment.path,
     )
 
 
@@ -25,6 +26,7 @@ def post_comment_to_entity(post_comment: PostCommentItem) -> PostCommentEntity:
         post_id=post_comment.post_id,
         reply_comment_id=post_comment.reply_comment_id,
         reply_level=post_comment.reply_level,
+        path=post_comment.path,
     )
 
 
@@ -0,0 +1,54 @@
+from logging import Logger
+
+import orjson
+import punq
+from django.core.management.base import BaseCommand
+
+from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.services.timeline import BasePostTimelineService
+from core.project.containers import get_container
+
+
+class Command(BaseCommand):
+    help = "Recalculate posts' 'likes_count' and 'comments_count' counters and fix drifted ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of posts processed per batch')
+
+    def _process_batch(self, post_ids: list[str]) -> int:
+        drifted_ids = self.post_service.recalculate_counters(post_ids=post_ids)
+
+        for post_id in drifted_ids:
+            self.timeline_service.invalidate_post(post_id=post_id)
+
+        return len(drifted_ids)
+
+    def handle(self, *args, **options):
+        container: punq.Container = get_container()
+        logger: Logger = container.resolve(Logger)
+        self.post_service: BasePostService = container.resolve(BasePostService)
+        self.timeline_service: BasePostTimelineService = container.resolve(BasePostTimelineService)
+
+        batch_size = options['batch_size']
+        batch, checked, fixed = [], 0, 0
+
+        # Post ids are streamed from the database, so the whole table is never loaded into memory
+        post_ids = self.post_service.get_all_posts().values_list('pk', flat=True).iterator(chunk_size=batch_size)
+
+        for post_id in post_ids:
+            batch.append(post_id)
+
+            if len(batch) >= batch_size:
+                fixed += self._process_batch(post_ids=batch)
+                checked += len(batch)
+                batch = []
+
+        if batch:
+            fixed += self._process_batch(post_ids=batch)
+            checked += len(batch)
+
+        logger.info(
+            'Posts counters recalculated',
+            extra={'log_meta': orjson.dumps({'checked': checked, 'fixed': fixed}).decode()},
+        )
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} posts, fixed {fixed} posts'))
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.6 on 2026-10-19 17:55
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Set the counters of existing posts with the subqueries of
+    'recalculate_counters' in one UPDATE."""
+
+    Post = apps.get_model('posts', 'Post')
+    PostLikeItem = apps.get_model('posts', 'PostLikeItem')
+    PostCommentItem = apps.get_model('posts', 'PostCommentItem')
+
+    actual_likes_count = (
+        PostLikeItem.objects.filter(post_id=OuterRef('pk'), is_like=True)
+        .values('post_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    actual_comments_count = (
+        PostCommentItem.objects.filter(post_id=OuterRef('pk'))
+        .values('post_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+
+    Post.objects.update(
+        likes_count=Coalesce(Subquery(actual_likes_count), 0),
+        comments_count=Coalesce(Subquery(actual_comments_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0006_alter_post_author_alter_post_text_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, help_text='Total number of comments'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, help_text='Total number of likes'),
+        ),
+        migrations.RunPython(code=backfill_counters, reverse_code=migrations.RunPython.noop),
+    ]
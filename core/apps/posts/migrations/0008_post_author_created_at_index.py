@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0007_alter_channel_avatar_s3_key_alter_channel_country_and_more'),
+        ('posts', '0007_post_likes_count_comments_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-created_at'], name='posts_post_author_created_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:03
+
+from django.db import migrations, models
+
+# Fill the 'path' of existing replies with the zero-padded ids of their ancestors
+BACKFILL_PATH_SQL = """
+WITH RECURSIVE thread (id, path) AS (
+    SELECT id, ''::text FROM posts_postcommentitem WHERE reply_comment_id IS NULL
+    UNION ALL
+    SELECT reply.id, thread.path || lpad(reply.reply_comment_id::text, 19, '0') || '.'
+    FROM posts_postcommentitem reply
+    JOIN thread ON reply.reply_comment_id = thread.id
+)
+UPDATE posts_postcommentitem SET path = thread.path
+FROM thread
+WHERE posts_postcommentitem.id = thread.id AND thread.path <> ''
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0007_alter_channel_avatar_s3_key_alter_channel_country_and_more'),
+        ('posts', '0008_post_author_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postcommentitem',
+            name='path',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Materialized path of the comment ancestors'),
+        ),
+        migrations.RunSQL(sql=BACKFILL_PATH_SQL, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='postcommentitem',
+            index=models.Index(fields=['path'], name='posts_postcommentitem_path_idx', opclasses=['text_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0007_alter_channel_avatar_s3_key_alter_channel_country_and_more'),
+        ('posts', '0009_postcommentitem_path'),
+    ]
+
+    # The new index is created before the old one is removed, so listings are never left without an index
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-created_at', '-post_id'], name='posts_post_author_created_pk'),
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='posts_post_author_created_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0010_post_author_created_at_pk_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, help_text='Date when the post was created'),
+        ),
+    ]
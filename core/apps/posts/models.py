@@ -21,6 +21,13 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, help_text='Date when the post was created')
     likes = models.ManyToManyField(Channel, through='PostLikeItem', related_name='liked_posts', blank=True)
     comments = models.ManyToManyField(Channel, through='PostCommentItem', related_name='posts_comments', blank=True)
+    likes_count = models.PositiveIntegerField(default=0, help_text=_('Total number of likes'))
+    comments_count = models.PositiveIntegerField(default=0, help_text=_('Total number of comments'))
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['author', '-created_at', '-post_id'], name='posts_post_author_created_pk'),
+        ]
 
     def __str__(self):
         return f'Post № {self.post_id} by channel with id {self.author_id}'
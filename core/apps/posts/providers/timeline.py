@@ -0,0 +1,241 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import Iterable
+
+import orjson
+from django_redis import get_redis_connection
+
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.posts.constants import (
+    POST_DATA_CACHE_TIMEOUT,
+    POSTS_TIMELINE_CACHE_TIMEOUT,
+    POSTS_TIMELINE_REBUILD_TIMEOUT,
+)
+
+
+class BasePostTimelineProvider(ABC):
+    @abstractmethod
+    def get_page(
+        self,
+        author_id: int,
+        cursor: tuple[int, str] | None,
+        limit: int,
+    ) -> tuple[bool, bool, list[tuple[str, int]]]: ...
+
+    @abstractmethod
+    def get_posts_data(self, post_ids: list[str]) -> list[dict | None]: ...
+
+    @abstractmethod
+    def set_posts_data(self, posts: list[dict]) -> None: ...
+
+    @abstractmethod
+    def start_rebuild(self, author_id: int) -> None: ...
+
+    @abstractmethod
+    def fill_timeline(self, author_id: int, items: Iterable[tuple[str, int]], truncated: bool) -> None: ...
+
+    @abstractmethod
+    def add_post(self, author_id: int, post_id: str, score: int, data: dict) -> None: ...
+
+    @abstractmethod
+    def remove_post(self, author_id: int, post_id: str) -> None: ...
+
+    @abstractmethod
+    def delete_posts_data(self, post_ids: list[str]) -> None: ...
+
+
+class RedisPostTimelineProvider(BasePostTimelineProvider):
+    """Keeps channel's post ids in a sorted set scored by 'created_at' (in
+    microseconds) and each post's body under its own key.
+
+    The sorted set always contains an '_' member with score 0, so an empty
+    timeline can be told apart from a missing (expired) one. A timeline
+    holding only the newest posts of the channel also contains a
+    '_truncated' member with score 0.
+
+    A missing timeline is rebuilt from the database. Posts created or
+    deleted after the database has been read are recorded aside while the
+    rebuild is in progress and applied when the timeline is filled, so
+    none of them is lost or kept.
+
+    """
+
+    _EMPTY_MEMBER = '_'
+    _TRUNCATED_MEMBER = '_truncated'
+
+    # Add a member only if the timeline is already cached, otherwise it would become a partial timeline that looks
+    # like a complete one. While the timeline is rebuilt the member is kept aside to be added by the rebuild
+    _ADD_SCRIPT = """
+        if redis.call('EXISTS', KEYS[1]) == 1 then
+            return redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+        end
+        if redis.call('EXISTS', KEYS[2]) == 1 then
+            redis.call('ZADD', KEYS[3], ARGV[1], ARGV[2])
+            redis.call('EXPIRE', KEYS[3], ARGV[3])
+        end
+        return 0
+    """
+
+    _REMOVE_SCRIPT = """
+        redis.call('ZREM', KEYS[1], ARGV[1])
+        redis.call('ZREM', KEYS[3], ARGV[1])
+        if redis.call('EXISTS', KEYS[2]) == 1 then
+            redis.call('SADD', KEYS[4], ARGV[1])
+            redis.call('EXPIRE', KEYS[4], ARGV[2])
+        end
+        return 0
+    """
+
+    # Members read from the database are added in batches, then members added and removed during the rebuild
+    _FILL_SCRIPT = """
+        for i = 2, #ARGV, 1000 do
+            redis.call('ZADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+        end
+        local added = redis.call('ZRANGE', KEYS[3], 0, -1, 'WITHSCORES')
+        for i = 1, #added, 2 do
+            redis.call('ZADD', KEYS[1], added[i + 1], added[i])
+        end
+        for _, member in ipairs(redis.call('SMEMBERS', KEYS[4])) do
+            redis.call('ZREM', KEYS[1], member)
+        end
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+        redis.call('DEL', KEYS[2], KEYS[3], KEYS[4])
+        return 0
+    """
+
+    @property
+    def _connection(self):
+        return get_redis_connection('default')
+
+    @staticmethod
+    def _timeline_key(author_id: int) -> str:
+        return f'{CACHE_KEYS["posts_timeline"]}{author_id}'
+
+    @classmethod
+    def _rebuild_keys(cls, author_id: int) -> list[str]:
+        """Return keys of the timeline, its rebuild marker and members added
+        and removed during the rebuild."""
+
+        return [
+            cls._timeline_key(author_id),
+            f'{CACHE_KEYS["posts_timeline_rebuild"]}{author_id}',
+            f'{CACHE_KEYS["posts_timeline_added"]}{author_id}',
+            f'{CACHE_KEYS["posts_timeline_removed"]}{author_id}',
+        ]
+
+    @staticmethod
+    def _post_data_key(post_id: str) -> str:
+        return f'{CACHE_KEYS["post_data"]}{post_id}'
+
+    def get_page(
+        self,
+        author_id: int,
+        cursor: tuple[int, str] | None,
+        limit: int,
+    ) -> tuple[bool, bool, list[tuple[str, int]]]:
+        """Return flags whether the timeline is cached and truncated, and up
+        to 'limit' (post_id, score) pairs after the (score, post_id) 'cursor'.
+
+        Members with equal scores are ordered by post id, so posts created
+        at the same microsecond are neither skipped nor repeated.
+
+        """
+
+        key = self._timeline_key(author_id)
+
+        pipe = self._connection.pipeline(transaction=False)
+        pipe.exists(key)
+        pipe.zscore(key, self._TRUNCATED_MEMBER)
+
+        if cursor is None:
+            pipe.zrevrangebyscore(key, '+inf', '(0', start=0, num=limit, withscores=True, score_cast_func=int)
+            exists, truncated, items = pipe.execute()
+            return bool(exists), truncated is not None, [(post_id.decode(), score) for post_id, score in items]
+
+        score, cursor_post_id = cursor
+        # Posts sharing the cursor score are few, so they are all read and filtered by post id
+        pipe.zrevrangebyscore(key, score, score, withscores=True, score_cast_func=int)
+        pipe.zrevrangebyscore(key, f'({score}', '(0', start=0, num=limit, withscores=True, score_cast_func=int)
+        exists, truncated, same_score_items, older_items = pipe.execute()
+
+        items = [
+            (post_id.decode(), item_score)
+            for post_id, item_score in same_score_items
+            if post_id.decode() < cursor_post_id
+        ]
+        items.extend((post_id.decode(), item_score) for post_id, item_score in older_items)
+
+        return bool(exists), truncated is not None, items[:limit]
+
+    def get_posts_data(self, post_ids: list[str]) -> list[dict | None]:
+        if not post_ids:
+            return []
+
+        values = self._connection.mget([self._post_data_key(post_id) for post_id in post_ids])
+        return [orjson.loads(value) if value is not None else None for value in values]
+
+    def set_posts_data(self, posts: list[dict]) -> None:
+        if not posts:
+            return
+
+        pipe = self._connection.pipeline(transaction=False)
+        for data in posts:
+            pipe.set(
+                self._post_data_key(data['post_id']),
+                orjson.dumps(data, option=orjson.OPT_UTC_Z),
+                ex=POST_DATA_CACHE_TIMEOUT,
+            )
+        pipe.execute()
+
+    def start_rebuild(self, author_id: int) -> None:
+        """Mark the timeline as rebuilt, must be called before the database
+        is read."""
+
+        _, marker_key, _, _ = self._rebuild_keys(author_id)
+        self._connection.set(marker_key, 1, ex=POSTS_TIMELINE_REBUILD_TIMEOUT)
+
+    def fill_timeline(self, author_id: int, items: Iterable[tuple[str, int]], truncated: bool) -> None:
+        connection = self._connection
+        fill = connection.register_script(self._FILL_SCRIPT)
+
+        args = [POSTS_TIMELINE_CACHE_TIMEOUT, 0, self._EMPTY_MEMBER]
+        if truncated:
+            args.extend([0, self._TRUNCATED_MEMBER])
+
+        for post_id, score in items:
+            args.extend([score, post_id])
+
+        fill(keys=self._rebuild_keys(author_id), args=args)
+
+    def add_post(self, author_id: int, post_id: str, score: int, data: dict) -> None:
+        connection = self._connection
+        add = connection.register_script(self._ADD_SCRIPT)
+        timeline_key, marker_key, added_key, _ = self._rebuild_keys(author_id)
+
+        pipe = connection.pipeline(transaction=False)
+        add(
+            keys=[timeline_key, marker_key, added_key],
+            args=[score, post_id, POSTS_TIMELINE_REBUILD_TIMEOUT],
+            client=pipe,
+        )
+        pipe.set(
+            self._post_data_key(post_id),
+            orjson.dumps(data, option=orjson.OPT_UTC_Z),
+            ex=POST_DATA_CACHE_TIMEOUT,
+        )
+        pipe.execute()
+
+    def remove_post(self, author_id: int, post_id: str) -> None:
+        connection = self._connection
+        remove = connection.register_script(self._REMOVE_SCRIPT)
+
+        pipe = connection.pipeline(transaction=False)
+        remove(keys=self._rebuild_keys(author_id), args=[post_id, POSTS_TIMELINE_REBUILD_TIMEOUT], client=pipe)
+        pipe.delete(self._post_data_key(post_id))
+        pipe.execute()
+
+    def delete_posts_data(self, post_ids: list[str]) -> None:
+        if post_ids:
+            self._connection.delete(*[self._post_data_key(post_id) for post_id in post_ids])
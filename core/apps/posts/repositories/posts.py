@@ -3,14 +3,26 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import Iterable
+from datetime import datetime
+
+from django.db.models import (
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
 
 from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.converters.likes import post_like_to_entity
 from core.apps.posts.converters.posts import post_to_entity
 from core.apps.posts.entities.likes import PostLikeEntity
 from core.apps.posts.entities.posts import PostEntity
 from core.apps.posts.models import (
     Post,
+    PostCommentItem,
     PostLikeItem,
 )
 
@@ -26,7 +38,23 @@ class BasePostRepository(ABC):
     def get_post_by_id(self, post_id: str) -> PostEntity | None: ...
 
     @abstractmethod
-    def get_posts_count_by_user_id(self, user_id: int) -> int: ...
+    def get_posts_count_by_author_id(self, author_id: int) -> int: ...
+
+    @abstractmethod
+    def get_posts_timeline_by_author_id(
+        self,
+        author_id: int,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, datetime]]: ...
+
+    @abstractmethod
+    def get_posts_by_author_id(
+        self,
+        author_id: int,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Post]: ...
 
     @abstractmethod
     def like_get_or_create(
@@ -37,12 +65,22 @@ class BasePostRepository(ABC):
     ) -> tuple[PostLikeEntity, bool]: ...
 
     @abstractmethod
-    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> bool: ...
+    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> PostLikeEntity | None: ...
 
     @abstractmethod
     def update_is_like_field(like: PostLikeEntity, is_like: bool) -> None: ...
 
+    @abstractmethod
+    def update_likes_count(self, post_id: str, delta: int) -> None: ...
+
+    @abstractmethod
+    def update_comments_count(self, post_id: str, delta: int) -> None: ...
+
+    @abstractmethod
+    def recalculate_counters(self, post_ids: list[str]) -> list[str]: ...
+
 
+@instrument
 class PostRepository(BasePostRepository):
     def create_post(self, post_entity: PostEntity) -> PostEntity:
         post_dto = Post.objects.create(**post_entity.__dict__)
@@ -55,8 +93,37 @@ class PostRepository(BasePostRepository):
         post_dto = Post.objects.filter(pk=post_id).first()
         return post_to_entity(post=post_dto) if post_dto else None
 
-    def get_posts_count_by_user_id(self, user_id: int) -> int:
-        return Post.objects.filter(author__user_id=user_id).count()
+    def get_posts_count_by_author_id(self, author_id: int) -> int:
+        return Post.objects.filter(author_id=author_id).count()
+
+    def get_posts_timeline_by_author_id(
+        self,
+        author_id: int,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, datetime]]:
+        qs = self.get_posts_by_author_id(author_id=author_id, cursor=cursor, limit=limit)
+        return [(str(post_id), created_at) for post_id, created_at in qs.values_list('pk', 'created_at')]
+
+    def get_posts_by_author_id(
+        self,
+        author_id: int,
+        cursor: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Post]:
+        """Keyset pagination over the (author_id, created_at, post_id) index,
+        the next page starts after the (created_at, post_id) 'cursor' of the
+        last retrieved post."""
+
+        qs = Post.objects.filter(author_id=author_id)
+
+        if cursor is not None:
+            created_at, post_id = cursor
+            # Posts created at the same time are told apart by their ids, so none of them is skipped
+            qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=post_id))
+
+        qs = qs.order_by('-created_at', '-pk')
+        return qs[:limit] if limit is not None else qs
 
     def like_get_or_create(
         self,
@@ -71,9 +138,59 @@ class PostRepository(BasePostRepository):
         )
         return post_like_to_entity(like), created
 
-    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> bool:
-        deleted, _ = PostLikeItem.objects.filter(channel_id=channel.id, post_id=post.pk).delete()
-        return True if deleted else False
+    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> PostLikeEntity | None:
+        like_dto = PostLikeItem.objects.filter(channel_id=channel.id, post_id=post.pk).first()
+
+        if like_dto is None:
+            return None
+
+        like = post_like_to_entity(like_dto)
+        like_dto.delete()
+        return like
 
     def update_is_like_field(self, like: PostLikeEntity, is_like: bool) -> None:
         PostLikeItem.objects.filter(pk=like.id).update(is_like=is_like)
+
+    def _update_counter(self, post_id: str, field: str, delta: int) -> None:
+        updated = Post.objects.filter(pk=post_id, **{f'{field}__gte': -delta}).update(**{field: F(field) + delta})
+
+        # The counter would become negative only if it has drifted, so it's recalculated instead of losing 'delta'
+        if not updated:
+            self.recalculate_counters(post_ids=[post_id])
+
+    def update_likes_count(self, post_id: str, delta: int) -> None:
+        self._update_counter(post_id=post_id, field='likes_count', delta=delta)
+
+    def update_comments_count(self, post_id: str, delta: int) -> None:
+        self._update_counter(post_id=post_id, field='comments_count', delta=delta)
+
+    def recalculate_counters(self, post_ids: list[str]) -> list[str]:
+        actual_likes_count = (
+            PostLikeItem.objects.filter(post_id=OuterRef('pk'), is_like=True)
+            .values('post_id')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        actual_comments_count = (
+            PostCommentItem.objects.filter(post_id=OuterRef('pk'))
+            .values('post_id')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+
+        drifted_posts = list(
+            Post.objects.filter(pk__in=post_ids)
+            .annotate(
+                actual_likes_count=Coalesce(Subquery(actual_likes_count), 0),
+                actual_comments_count=Coalesce(Subquery(actual_comments_count), 0),
+            )
+            .exclude(likes_count=F('actual_likes_count'), comments_count=F('actual_comments_count'))
+            .only('pk'),
+        )
+
+        for post in drifted_posts:
+            post.likes_count = post.actual_likes_count
+            post.comments_count = post.actual_comments_count
+
+        Post.objects.bulk_update(drifted_posts, fields=['likes_count', 'comments_count'])
+        return [str(post.pk) for post in drifted_posts]
@@ -5,6 +5,7 @@ from abc import (
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from django.conf import settings
 from django.db.models import (
     Count,
     Q,
@@ -57,6 +58,12 @@ class BasePostCommentService(ABC):
     @abstractmethod
     def get_comments_by_post_id(self, post_id: str) -> Iterable[PostCommentItem]: ...
 
+    @abstractmethod
+    def get_thread_by_comment_id(self, comment_id: int) -> Iterable[PostCommentItem]: ...
+
+    @abstractmethod
+    def delete_comment_thread(self, comment: PostCommentEntity) -> int: ...
+
 
 class PostCommentService(BasePostCommentService):
     def _build_query(self, qs: Iterable[PostCommentItem]) -> Iterable[PostCommentItem]:
@@ -67,6 +74,10 @@ class PostCommentService(BasePostCommentService):
 
     def create_comment(self, comment_entity: PostCommentEntity) -> PostCommentEntity:
         comment_entity.update_reply_level()
+
+        if comment_entity.reply_comment_id is not None:
+            comment_entity.update_path(reply_comment=self.get_by_id_or_404(id=comment_entity.reply_comment_id))
+
         return self.repository.create_comment(comment_entity=comment_entity)
 
     def get_by_id_or_404(self, id: int) -> PostCommentEntity:
@@ -108,6 +119,9 @@ class PostCommentService(BasePostCommentService):
         return self._build_query(qs=qs)
 
     def get_replies_by_comment_id(self, comment_id: int) -> Iterable[PostCommentItem]:
+        if settings.COMMENTS_THREADED_MODE:
+            return self.get_thread_by_comment_id(comment_id=comment_id)
+
         qs = self._build_query(qs=self.repository.get_all_comments())
         return qs.filter(reply_level=1, reply_comment_id=comment_id)
 
@@ -121,3 +135,14 @@ class PostCommentService(BasePostCommentService):
             reply_comment__isnull=True,
             reply_level=0,
         )
+
+    def get_thread_by_comment_id(self, comment_id: int) -> Iterable[PostCommentItem]:
+        """Return all replies in the comment's thread on any depth with a
+        single query over the 'path' index."""
+
+        comment = self.get_by_id_or_404(id=comment_id)
+        qs = self._build_query(qs=self.repository.get_all_comments())
+        return qs.filter(path__startswith=comment.get_thread_path())
+
+    def delete_comment_thread(self, comment: PostCommentEntity) -> int:
+        return self.repository.delete_comment_thread(comment=comment)
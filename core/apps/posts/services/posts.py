@@ -5,14 +5,22 @@ from abc import (
 from collections.abc import Iterable
 from dataclasses import dataclass
 
-from django.db.models import (
-    Count,
-    Q,
-)
+from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    CONTENT_VERSION_SCOPES,
+)
+from core.apps.common.services.cache import BaseCacheService
+from core.apps.common.services.content_versions import BaseContentVersionService
 from core.apps.payments.services.stripe_service import BaseStripeService
-from core.apps.posts.constants import POSTS_LIMITS_BY_SUBSCRIPTION_TIER
+from core.apps.posts.constants import (
+    MIN_POSTS_LIMIT,
+    POSTS_COUNT_CACHE_TIMEOUT,
+    POSTS_LIMITS_BY_SUBSCRIPTION_TIER,
+)
 from core.apps.posts.entities.likes import PostLikeEntity
 from core.apps.posts.entities.posts import PostEntity
 from core.apps.posts.exceptions import (
@@ -36,20 +44,98 @@ class PostAuthorSlugValidatorService(BasePostAuthorSlugValidatorService):
             raise PostAuthorSlugNotProvidedError()
 
 
+@dataclass
+class BasePostsCountService(ABC):
+    cache_service: BaseCacheService
+    post_repository: BasePostRepository
+
+    @abstractmethod
+    def get_cache_key(self, author_id: int) -> str: ...
+
+    @abstractmethod
+    def get_posts_count(self, author_id: int, cached_count: int | None = None) -> int: ...
+
+    @abstractmethod
+    def increment(self, author_id: int) -> None: ...
+
+    @abstractmethod
+    def decrement(self, author_id: int) -> None: ...
+
+
+class PostsCountService(BasePostsCountService):
+    def get_cache_key(self, author_id: int) -> str:
+        return f'{CACHE_KEYS["channel_posts_count"]}{author_id}'
+
+    def get_posts_count(self, author_id: int, cached_count: int | None = None) -> int:
+        """Return channel's posts counter.
+
+        If 'cached_count' was not fetched beforehand, it will be
+        retrieved from the cache. The counter is calculated from the
+        database and cached if it doesn't exist.
+
+        Posts committed between the count and the 'set' are not
+        incremented, as the counter doesn't exist yet. The posts are
+        counted again after the 'set', and a changed number deletes the
+        counter, so it's calculated again on the next read.
+
+        """
+
+        cache_key = self.get_cache_key(author_id=author_id)
+
+        if cached_count is None:
+            cached_count = self.cache_service.get(cache_key)
+
+        if cached_count is not None:
+            return cached_count
+
+        posts_count = self.post_repository.get_posts_count_by_author_id(author_id=author_id)
+        self.cache_service.set(cache_key, posts_count, POSTS_COUNT_CACHE_TIMEOUT)
+
+        latest_posts_count = self.post_repository.get_posts_count_by_author_id(author_id=author_id)
+
+        if latest_posts_count != posts_count:
+            self.cache_service.delete(cache_key)
+        return latest_posts_count
+
+    def increment(self, author_id: int) -> None:
+        """Increment the counter after the transaction is committed if it
+        exists, otherwise it will be calculated on the next read."""
+
+        transaction.on_commit(lambda: self.cache_service.incr(self.get_cache_key(author_id=author_id)))
+
+    def decrement(self, author_id: int) -> None:
+        transaction.on_commit(lambda: self.cache_service.decr(self.get_cache_key(author_id=author_id)))
+
+
 class BaseCreatePostSubscriptionLimitValidatorService(ABC):
     @abstractmethod
-    def validate(self, user: UserEntity) -> None: ...
+    def validate(self, user: UserEntity, channel: ChannelEntity) -> None: ...
 
 
 @dataclass
 class CreatePostSubscriptionLimitValidatorService(BaseCreatePostSubscriptionLimitValidatorService):
     stripe_service: BaseStripeService
-    post_repository: BasePostRepository
+    cache_service: BaseCacheService
+    posts_count_service: BasePostsCountService
 
-    def validate(self, user: UserEntity) -> None:
-        tier = self.stripe_service.get_sub_tier_by_user(user=user)
+    def validate(self, user: UserEntity, channel: ChannelEntity) -> None:
+        posts_count_cache_key = self.posts_count_service.get_cache_key(author_id=channel.id)
+        customer_id_cache_key = self.stripe_service.get_customer_id_cache_key(user_id=user.id)
+
+        # Posts counter and Stripe customer id are retrieved in one round trip
+        cached_data = self.cache_service.get_many([posts_count_cache_key, customer_id_cache_key])
+
+        current_posts_number = self.posts_count_service.get_posts_count(
+            author_id=channel.id,
+            cached_count=cached_data.get(posts_count_cache_key),
+        )
+
+        # Subscription tier is not needed until the smallest limit has been reached
+        if current_posts_number < MIN_POSTS_LIMIT:
+            return
+
+        tier = self.stripe_service.get_sub_tier_by_customer_id(customer_id=cached_data.get(customer_id_cache_key))
         limit = POSTS_LIMITS_BY_SUBSCRIPTION_TIER[tier]
-        current_posts_number = self.post_repository.get_posts_count_by_user_id(user_id=user.id)
 
         if current_posts_number >= limit:
             raise PostSubscriptionTierLimitError(
@@ -62,6 +148,7 @@ class CreatePostSubscriptionLimitValidatorService(BaseCreatePostSubscriptionLimi
 @dataclass
 class BasePostService(ABC):
     post_repository: BasePostRepository
+    content_version_service: BaseContentVersionService
 
     @abstractmethod
     def create_post(self, post_entity: PostEntity) -> PostEntity: ...
@@ -73,11 +160,14 @@ class BasePostService(ABC):
     def get_posts_for_retrieving(self) -> Iterable[Post]: ...
 
     @abstractmethod
-    def get_related_posts_by_author_slug(self, slug: str | None) -> Iterable[Post]: ...
+    def get_posts_for_retrieving_by_ids(self, post_ids: list[str]) -> Iterable[Post]: ...
 
     @abstractmethod
     def get_post_by_id_or_404(self, post_id: str) -> PostEntity: ...
 
+    @abstractmethod
+    def get_post_content_scopes(self, post_id: str) -> list[str]: ...
+
     @abstractmethod
     def like_get_or_create(
         self,
@@ -87,21 +177,30 @@ class BasePostService(ABC):
     ) -> tuple[PostLikeEntity, bool]: ...
 
     @abstractmethod
-    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> bool: ...
+    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> PostLikeEntity | None: ...
 
     @abstractmethod
     def update_is_like_field(self, like: PostLikeEntity, is_like: bool) -> None: ...
 
+    @abstractmethod
+    def update_likes_count(self, post_id: str, delta: int) -> None: ...
+
+    @abstractmethod
+    def update_comments_count(self, post_id: str, delta: int) -> None: ...
+
+    @abstractmethod
+    def recalculate_counters(self, post_ids: list[str]) -> list[str]: ...
+
 
 class PostService(BasePostService):
-    def _build_query_with_related_fields_and_annotations(self, query: Iterable[Post]) -> Iterable[Post]:
-        """Load the related 'author' field and add 'likes_count' and
-        'comments_count' as annotations."""
+    def _build_query_with_related_fields(self, query: Iterable[Post]) -> Iterable[Post]:
+        """Load the related 'author' field.
 
-        return query.select_related('author').annotate(
-            likes_count=Count('likes', distinct=True, filter=Q(likes_items__is_like=True)),
-            comments_count=Count('comments_items', distinct=True),
-        )
+        'likes_count' and 'comments_count' are stored as Post columns.
+
+        """
+
+        return query.select_related('author')
 
     def create_post(self, post_entity: PostEntity) -> PostEntity:
         """Create new Post instance."""
@@ -115,19 +214,17 @@ class PostService(BasePostService):
 
     def get_posts_for_retrieving(self) -> Iterable[Post]:
         """Return all Post instances for retrieving, using
-        '_build_query_with_related_fields_and_annotations' method."""
+        '_build_query_with_related_fields' method."""
 
         qs = self.post_repository.get_all_posts()
-        return self._build_query_with_related_fields_and_annotations(query=qs)
+        return self._build_query_with_related_fields(query=qs)
 
-    def get_related_posts_by_author_slug(self, slug: str | None) -> Iterable[Post]:
-        """Return instances sorted by author 'slug', using
-        '_build_query_with_related_fields_and_annotations' method."""
+    def get_posts_for_retrieving_by_ids(self, post_ids: list[str]) -> Iterable[Post]:
+        """Return Post instances with provided ids, using
+        '_build_query_with_related_fields' method."""
 
-        qs = self._build_query_with_related_fields_and_annotations(
-            query=self.post_repository.get_all_posts(),
-        )
-        return qs.filter(author__slug=slug)
+        qs = self.post_repository.get_all_posts().filter(pk__in=post_ids)
+        return self._build_query_with_related_fields(query=qs)
 
     def get_post_by_id_or_404(self, post_id: str) -> PostEntity:
         post = self.post_repository.get_post_by_id(post_id=post_id)
@@ -136,6 +233,21 @@ class PostService(BasePostService):
             raise PostNotFoundError(post_id=post_id)
         return post
 
+    def get_post_content_scopes(self, post_id: str) -> list[str]:
+        """Return content version scopes of the post and its author."""
+
+        try:
+            post = self.post_repository.get_post_by_id(post_id=post_id)
+        except ValidationError:
+            # Not a valid post id, the response is '404 Not Found'
+            post = None
+
+        scopes = [CONTENT_VERSION_SCOPES['post'] + str(post_id)]
+
+        if post is not None:
+            scopes.append(CONTENT_VERSION_SCOPES['channel'] + str(post.author_id))
+        return scopes
+
     def like_get_or_create(
         self,
         channel: ChannelEntity,
@@ -148,7 +260,7 @@ class PostService(BasePostService):
             is_like=is_like,
         )
 
-    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> bool:
+    def like_delete(self, channel: ChannelEntity, post: PostEntity) -> PostLikeEntity | None:
         return self.post_repository.like_delete(
             channel=channel,
             post=post,
@@ -159,3 +271,28 @@ class PostService(BasePostService):
             like=like,
             is_like=is_like,
         )
+
+    def update_likes_count(self, post_id: str, delta: int) -> None:
+        """Atomically change Post's 'likes_count' by 'delta'."""
+
+        self.post_repository.update_likes_count(post_id=post_id, delta=delta)
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['post'] + str(post_id)])
+
+    def update_comments_count(self, post_id: str, delta: int) -> None:
+        """Atomically change Post's 'comments_count' by 'delta'."""
+
+        self.post_repository.update_comments_count(post_id=post_id, delta=delta)
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['post'] + str(post_id)])
+
+    def recalculate_counters(self, post_ids: list[str]) -> list[str]:
+        """Recalculate counters of provided posts and return ids of posts
+        whose counters have drifted."""
+
+        drifted_post_ids = self.post_repository.recalculate_counters(post_ids=post_ids)
+
+        if drifted_post_ids:
+            self.content_version_service.bump(
+                scopes=[CONTENT_VERSION_SCOPES['post'] + str(post_id) for post_id in drifted_post_ids],
+            )
+
+        return drifted_post_ids
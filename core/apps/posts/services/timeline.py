@@ -0,0 +1,190 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+
+from django.db import transaction
+
+from core.apps.posts.constants import POSTS_TIMELINE_MAX_SIZE
+from core.apps.posts.entities.posts import PostEntity
+from core.apps.posts.models import Post
+from core.apps.posts.providers.timeline import BasePostTimelineProvider
+from core.apps.posts.repositories.posts import BasePostRepository
+from core.apps.posts.services.posts import BasePostService
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def created_at_to_score(created_at: datetime) -> int:
+    """Convert post's 'created_at' into an exact integer score (microseconds
+    since epoch) for the timeline sorted set."""
+
+    return (created_at - _EPOCH) // timedelta(microseconds=1)
+
+
+def score_to_created_at(score: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=score)
+
+
+def encode_timeline_cursor(score: int, post_id: str) -> str:
+    return f'{score}_{post_id}'
+
+
+def decode_timeline_cursor(cursor: str) -> tuple[int, str]:
+    """Return (score, post_id) of the last post of the previous page."""
+
+    score, post_id = cursor.split('_', 1)
+    return int(score), post_id
+
+
+@dataclass
+class BasePostTimelineService(ABC):
+    post_service: BasePostService
+    post_repository: BasePostRepository
+    timeline_provider: BasePostTimelineProvider
+
+    @abstractmethod
+    def get_page(self, author_id: int, cursor: str | None, limit: int) -> tuple[list[dict], str | None]: ...
+
+    @abstractmethod
+    def add_post(self, post: PostEntity) -> None: ...
+
+    @abstractmethod
+    def remove_post(self, post: PostEntity) -> None: ...
+
+    @abstractmethod
+    def invalidate_post(self, post_id: str) -> None: ...
+
+
+class PostTimelineService(BasePostTimelineService):
+    @staticmethod
+    def _post_to_data(post: Post) -> dict:
+        return {
+            'post_id': str(post.pk),
+            'text': post.text,
+            'created_at': post.created_at,
+            'likes_count': post.likes_count,
+            'comments_count': post.comments_count,
+        }
+
+    def _get_items_from_database(
+        self,
+        author_id: int,
+        cursor: tuple[int, str] | None,
+        limit: int,
+    ) -> list[tuple[str, int]]:
+        """Return up to 'limit' (post_id, score) pairs after the (score,
+        post_id) 'cursor' with a keyset query, ordered like the sorted set."""
+
+        posts = self.post_repository.get_posts_timeline_by_author_id(
+            author_id=author_id,
+            cursor=(score_to_created_at(cursor[0]), cursor[1]) if cursor is not None else None,
+            limit=limit,
+        )
+        return [(post_id, created_at_to_score(created_at)) for post_id, created_at in posts]
+
+    def _rebuild_timeline(
+        self,
+        author_id: int,
+        cursor: tuple[int, str] | None,
+        limit: int,
+    ) -> tuple[bool, list[tuple[str, int]]]:
+        """Load the newest channel's post ids from the database, cache them
+        as a sorted set and return a flag whether older posts were left out
+        and the requested page of the cached posts."""
+
+        # Posts committed after this point are added by the rebuild, even if the database is read without them
+        self.timeline_provider.start_rebuild(author_id=author_id)
+        items = self._get_items_from_database(author_id=author_id, cursor=None, limit=POSTS_TIMELINE_MAX_SIZE + 1)
+
+        truncated = len(items) > POSTS_TIMELINE_MAX_SIZE
+        items = items[:POSTS_TIMELINE_MAX_SIZE]
+        self.timeline_provider.fill_timeline(author_id=author_id, items=items, truncated=truncated)
+
+        # Items are already ordered like the sorted set, from the newest to the oldest and by post id within a score
+        return truncated, [item for item in items if cursor is None or (item[1], item[0]) < cursor][:limit]
+
+    def get_page(self, author_id: int, cursor: str | None, limit: int) -> tuple[list[dict], str | None]:
+        """Return up to 'limit' posts after 'cursor' and the cursor for the
+        next page.
+
+        The page is assembled with one ZRANGE and one MGET, only missing
+        post bodies are loaded from the database. Pages after the newest
+        'POSTS_TIMELINE_MAX_SIZE' posts are read with a keyset query.
+
+        """
+
+        decoded_cursor = decode_timeline_cursor(cursor) if cursor is not None else None
+        exists, truncated, items = self.timeline_provider.get_page(
+            author_id=author_id,
+            cursor=decoded_cursor,
+            limit=limit + 1,
+        )
+
+        if not exists:
+            truncated, items = self._rebuild_timeline(author_id=author_id, cursor=decoded_cursor, limit=limit + 1)
+
+        # The rest of a page after the oldest cached post is read from the database
+        if truncated and len(items) <= limit:
+            last_cursor = (items[-1][1], items[-1][0]) if items else decoded_cursor
+            items.extend(
+                self._get_items_from_database(author_id=author_id, cursor=last_cursor, limit=limit + 1 - len(items)),
+            )
+
+        next_cursor = None
+        if len(items) > limit:
+            last_post_id, last_score = items[limit - 1]
+            next_cursor = encode_timeline_cursor(score=last_score, post_id=last_post_id)
+        post_ids = [post_id for post_id, _ in items[:limit]]
+
+        posts_data = dict(zip(post_ids, self.timeline_provider.get_posts_data(post_ids=post_ids), strict=True))
+        missing_ids = [post_id for post_id, data in posts_data.items() if data is None]
+
+        if missing_ids:
+            loaded = [
+                self._post_to_data(post)
+                for post in self.post_service.get_posts_for_retrieving_by_ids(post_ids=missing_ids)
+            ]
+            self.timeline_provider.set_posts_data(posts=loaded)
+            posts_data.update({data['post_id']: data for data in loaded})
+
+        # Posts deleted between ZRANGE and MGET are skipped
+        return [posts_data[post_id] for post_id in post_ids if posts_data[post_id] is not None], next_cursor
+
+    def add_post(self, post: PostEntity) -> None:
+        """Add the post to its author's timeline after the transaction is
+        committed, so rolled back posts are never listed.
+
+        The same applies to 'remove_post' and 'invalidate_post'.
+
+        """
+
+        data = {
+            'post_id': str(post.pk),
+            'text': post.text,
+            'created_at': post.created_at,
+            'likes_count': 0,
+            'comments_count': 0,
+        }
+        transaction.on_commit(
+            lambda: self.timeline_provider.add_post(
+                author_id=post.author_id,
+                post_id=str(post.pk),
+                score=created_at_to_score(post.created_at),
+                data=data,
+            ),
+        )
+
+    def remove_post(self, post: PostEntity) -> None:
+        transaction.on_commit(
+            lambda: self.timeline_provider.remove_post(author_id=post.author_id, post_id=str(post.pk)),
+        )
+
+    def invalidate_post(self, post_id: str) -> None:
+        transaction.on_commit(lambda: self.timeline_provider.delete_posts_data(post_ids=[str(post_id)]))
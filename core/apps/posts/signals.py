@@ -0,0 +1,55 @@
+import punq
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+
+from core.apps.common.constants import CONTENT_VERSION_SCOPES
+from core.apps.common.services.content_versions import BaseContentVersionService
+from core.apps.posts.converters.posts import post_to_entity
+from core.apps.posts.models import Post
+from core.apps.posts.services.posts import BasePostsCountService
+from core.apps.posts.services.timeline import BasePostTimelineService
+from core.project.containers import get_container
+
+
+@receiver(signal=[post_save], sender=Post)
+def update_posts_timeline_on_save(instance, created, **kwargs):
+    """This signal will add a new Post to the author's timeline and increment
+    author's posts counter or delete the cached Post body if it has been
+    updated."""
+
+    container: punq.Container = get_container()
+    timeline_service: BasePostTimelineService = container.resolve(BasePostTimelineService)
+    posts_count_service: BasePostsCountService = container.resolve(BasePostsCountService)
+
+    if created:
+        timeline_service.add_post(post=post_to_entity(instance))
+        posts_count_service.increment(author_id=instance.author_id)
+    else:
+        timeline_service.invalidate_post(post_id=instance.pk)
+
+
+@receiver(signal=[post_delete], sender=Post)
+def update_posts_timeline_on_delete(instance, **kwargs):
+    """This signal will remove deleted Post from the author's timeline and
+    decrement author's posts counter."""
+
+    container: punq.Container = get_container()
+    timeline_service: BasePostTimelineService = container.resolve(BasePostTimelineService)
+    posts_count_service: BasePostsCountService = container.resolve(BasePostsCountService)
+
+    timeline_service.remove_post(post=post_to_entity(instance))
+    posts_count_service.decrement(author_id=instance.author_id)
+
+
+@receiver(signal=[post_save, post_delete], sender=Post)
+def bump_post_content_version(instance, **kwargs):
+    """This signal will change the version of the Post, so its ETag doesn't
+    match anymore."""
+
+    container: punq.Container = get_container()
+    content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
+
+    content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['post'] + str(instance.pk)])
@@ -1,12 +1,17 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.converters.posts import data_to_post_entity
 from core.apps.posts.entities.posts import PostEntity
-from core.apps.posts.services.posts import BaseCreatePostSubscriptionLimitValidatorService, BasePostService
+from core.apps.posts.services.posts import (
+    BaseCreatePostSubscriptionLimitValidatorService,
+    BasePostService,
+)
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class PostCreateUseCase:
     channel_service: BaseChannelService
@@ -14,10 +19,10 @@ class PostCreateUseCase:
     post_limits_validator_service: BaseCreatePostSubscriptionLimitValidatorService
 
     def execute(self, user: UserEntity, text: str) -> PostEntity:
-        self.post_limits_validator_service.validate(user=user)
-
         channel = self.channel_service.get_channel_by_user_or_404(user=user)
 
+        self.post_limits_validator_service.validate(user=user, channel=channel)
+
         post = self.post_service.create_post(
             post_entity=data_to_post_entity(
                 {
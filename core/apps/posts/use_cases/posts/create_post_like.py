@@ -1,14 +1,18 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.services.timeline import BasePostTimelineService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class PostLikeCreateUseCase:
     channel_service: BaseChannelService
     post_service: BasePostService
+    timeline_service: BasePostTimelineService
 
     def execute(self, user: UserEntity, post_id: str, is_like: bool) -> dict:
         channel = self.channel_service.get_channel_by_user_or_404(user=user)
@@ -19,4 +23,9 @@ class PostLikeCreateUseCase:
         if not created and like.is_like != is_like:
             self.post_service.update_is_like_field(like, is_like)
 
+        # 'likes_count' changes when a like is created or a reaction is switched
+        if (created and is_like) or (not created and like.is_like != is_like):
+            self.post_service.update_likes_count(post_id=post.pk, delta=1 if is_like else -1)
+            self.timeline_service.invalidate_post(post_id=post.pk)
+
         return {'detail': 'Success', 'is_like': is_like}
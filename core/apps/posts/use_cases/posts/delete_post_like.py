@@ -1,23 +1,31 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.exceptions import PostLikeNotFoundError
 from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.services.timeline import BasePostTimelineService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class PostLikeDeleteUseCase:
     channel_service: BaseChannelService
     post_service: BasePostService
+    timeline_service: BasePostTimelineService
 
     def execute(self, user: UserEntity, post_id: str) -> dict:
         channel = self.channel_service.get_channel_by_user_or_404(user=user)
         post = self.post_service.get_post_by_id_or_404(post_id=post_id)
 
-        deleted = self.post_service.like_delete(channel, post)
+        deleted_like = self.post_service.like_delete(channel, post)
 
-        if not deleted:
+        if deleted_like is None:
             raise PostLikeNotFoundError(channel_slug=channel.slug, post_id=post.pk)
 
+        if deleted_like.is_like:
+            self.post_service.update_likes_count(post_id=post.pk, delta=-1)
+            self.timeline_service.invalidate_post(post_id=post.pk)
+
         return {'detail': 'Success'}
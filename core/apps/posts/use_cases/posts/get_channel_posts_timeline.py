@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
+from core.apps.posts.services.timeline import BasePostTimelineService
+
+
+@instrument
+@dataclass
+class GetChannelPostsTimelineUseCase:
+    channel_service: BaseChannelService
+    timeline_service: BasePostTimelineService
+
+    def execute(self, slug: str, cursor: str | None, page_size: int) -> tuple[ChannelEntity, list[dict], str | None]:
+        channel = self.channel_service.get_channel_by_slug_or_404(slug=slug)
+
+        posts, next_cursor = self.timeline_service.get_page(
+            author_id=channel.id,
+            cursor=cursor,
+            limit=page_size,
+        )
+
+        return channel, posts, next_cursor
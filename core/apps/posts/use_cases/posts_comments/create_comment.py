@@ -1,17 +1,23 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.converters.comments import data_to_post_comment_entity
 from core.apps.posts.entities.comments import PostCommentEntity
 from core.apps.posts.entities.posts import PostEntity
 from core.apps.posts.services.comments import BasePostCommentService
+from core.apps.posts.services.posts import BasePostService
+from core.apps.posts.services.timeline import BasePostTimelineService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class CreatePostCommentUseCase:
     channel_service: BaseChannelService
     post_comment_service: BasePostCommentService
+    post_service: BasePostService
+    timeline_service: BasePostTimelineService
 
     def execute(self, user: UserEntity, post: PostEntity, text: str, reply_comment_id: int | None) -> PostCommentEntity:
         channel = self.channel_service.get_channel_by_user_or_404(user=user)
@@ -27,4 +33,7 @@ class CreatePostCommentUseCase:
             ),
         )
 
+        self.post_service.update_comments_count(post_id=post.pk, delta=1)
+        self.timeline_service.invalidate_post(post_id=post.pk)
+
         return comment
@@ -1,11 +1,13 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.models import PostCommentItem
 from core.apps.posts.services.comments import BasePostCommentService
 from core.apps.posts.services.posts import BasePostService
 
 
+@instrument
 @dataclass
 class GetPostCommentsUseCase:
     post_service: BasePostService
@@ -1,10 +1,12 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.models import PostCommentItem
 from core.apps.posts.services.comments import BasePostCommentService
 
 
+@instrument
 @dataclass
 class GetPostCommentRepliesUseCase:
     post_service: BasePostCommentService
@@ -2,10 +2,12 @@ from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
 from core.apps.common.exceptions.comments import CommentLikeNotFoundError
+from core.apps.common.instrumentation import instrument
 from core.apps.posts.services.comments import BasePostCommentService
 from core.apps.users.entities import UserEntity
 
 
+@instrument
 @dataclass
 class PostCommentLikeDeleteUseCase:
     comment_service: BasePostCommentService
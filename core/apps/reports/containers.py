@@ -15,14 +15,15 @@ from core.apps.reports.use_cases.create import CreateReportUseCase
 
 def init_reports(container: punq.Container) -> None:
     #  repositories
-    container.register(BaseVideoReportsRepository, ORMVideoReportRepository)
+    container.register(BaseVideoReportsRepository, ORMVideoReportRepository, scope=punq.Scope.singleton)
 
     #  services
-    container.register(BaseVideoReportsService, ORMVideoReportsService)
+    container.register(BaseVideoReportsService, ORMVideoReportsService, scope=punq.Scope.singleton)
     container.register(
         BaseReportLimitByOneUserValidatorService,
         ReportLimitByOneUserValidatorService,
+        scope=punq.Scope.singleton,
     )
 
     #  use cases
-    container.register(CreateReportUseCase)
+    container.register(CreateReportUseCase, scope=punq.Scope.singleton)
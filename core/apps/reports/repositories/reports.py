@@ -5,6 +5,7 @@ from abc import (
 from collections.abc import Iterable
 
 from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.common.instrumentation import instrument
 from core.apps.reports.converters.reports import report_to_entity
 from core.apps.reports.entities.reports import VideoReportEntity
 from core.apps.reports.models import VideoReport
@@ -28,6 +29,7 @@ class BaseVideoReportsRepository(ABC):
     def get_user_reports_count(self, video: VideoEntity, channel: ChannelEntity) -> int: ...
 
 
+@instrument
 class ORMVideoReportRepository(BaseVideoReportsRepository):
     def get_reports(self) -> Iterable[VideoReport]:
         return VideoReport.objects.all()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.reports.services.reports import (
     BaseReportLimitByOneUserValidatorService,
     BaseVideoReportsService,
@@ -12,6 +13,7 @@ from core.apps.videos.services.videos import (
 )
 
 
+@instrument
 @dataclass
 class CreateReportUseCase:
     video_service: BaseVideoService
@@ -50,39 +50,43 @@ from core.apps.users.use_cases.users.user_set_password import UserSetPasswordUse
 
 def init_users(container: punq.Container) -> None:
     #  services
-    container.register(BaseUserService, ORMUserService)
-    container.register(BaseUserValidatorService, UserExistsValidatorService)
-    container.register(BaseUserActivatedValidatorService, UserActivatedValidatorService)
-    container.register(BaseUserActivationRequiredValidatorService, UserActivationRequiredValidatorService)
-    container.register(BaseCodeService, EmailCodeService)
-    container.register(BaseOAuth2Service, OAuth2Service)
-    container.register(BaseOAuth2ProviderValidatorService, OAuth2ProviderValidatorService)
+    container.register(BaseUserService, ORMUserService, scope=punq.Scope.singleton)
+    container.register(BaseUserValidatorService, UserExistsValidatorService, scope=punq.Scope.singleton)
+    container.register(BaseUserActivatedValidatorService, UserActivatedValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BaseUserActivationRequiredValidatorService,
+        UserActivationRequiredValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BaseCodeService, EmailCodeService, scope=punq.Scope.singleton)
+    container.register(BaseOAuth2Service, OAuth2Service, scope=punq.Scope.singleton)
+    container.register(BaseOAuth2ProviderValidatorService, OAuth2ProviderValidatorService, scope=punq.Scope.singleton)
 
     #  repositories
-    container.register(BaseUserRepository, ORMUserRepository)
-    container.register(BaseOAuth2Repository, OAuth2Repository)
+    container.register(BaseUserRepository, ORMUserRepository, scope=punq.Scope.singleton)
+    container.register(BaseOAuth2Repository, OAuth2Repository, scope=punq.Scope.singleton)
 
     #  use cases
-    container.register(AuthorizeUserUseCase)
-    container.register(VerifyCodeUseCase)
+    container.register(AuthorizeUserUseCase, scope=punq.Scope.singleton)
+    container.register(VerifyCodeUseCase, scope=punq.Scope.singleton)
 
-    container.register(UserCreateUseCase)
-    container.register(UserSetPasswordUseCase)
-    container.register(UserSetEmailUseCase)
-    container.register(UserSetEmailConfirmUseCase)
-    container.register(UserResetPasswordUseCase)
-    container.register(UserResetPasswordConfirmUseCase)
-    container.register(UserResetUsernameUseCase)
-    container.register(UserResetUsernameConfirmUseCase)
-    container.register(UserActivationUseCase)
-    container.register(UserResendActivationUseCase)
+    container.register(UserCreateUseCase, scope=punq.Scope.singleton)
+    container.register(UserSetPasswordUseCase, scope=punq.Scope.singleton)
+    container.register(UserSetEmailUseCase, scope=punq.Scope.singleton)
+    container.register(UserSetEmailConfirmUseCase, scope=punq.Scope.singleton)
+    container.register(UserResetPasswordUseCase, scope=punq.Scope.singleton)
+    container.register(UserResetPasswordConfirmUseCase, scope=punq.Scope.singleton)
+    container.register(UserResetUsernameUseCase, scope=punq.Scope.singleton)
+    container.register(UserResetUsernameConfirmUseCase, scope=punq.Scope.singleton)
+    container.register(UserActivationUseCase, scope=punq.Scope.singleton)
+    container.register(UserResendActivationUseCase, scope=punq.Scope.singleton)
 
-    container.register(OAuth2GenerateURLUseCase)
-    container.register(OAuth2ConnectUseCase)
-    container.register(OAuth2DisconnectUseCase)
-    container.register(OAuth2ConnectedProvidersUseCase)
+    container.register(OAuth2GenerateURLUseCase, scope=punq.Scope.singleton)
+    container.register(OAuth2ConnectUseCase, scope=punq.Scope.singleton)
+    container.register(OAuth2DisconnectUseCase, scope=punq.Scope.singleton)
+    container.register(OAuth2ConnectedProvidersUseCase, scope=punq.Scope.singleton)
 
-    container.register(UserInvalidateStripeCacheUseCase)
+    container.register(UserInvalidateStripeCacheUseCase, scope=punq.Scope.singleton)
 
     #  clients
-    container.register(EmailClient)
+    container.register(EmailClient, scope=punq.Scope.singleton)
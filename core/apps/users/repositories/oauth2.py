@@ -7,6 +7,7 @@ from dataclasses import dataclass
 
 from social_django.models import UserSocialAuth
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.converters.users import user_from_entity
 from core.apps.users.entities import UserEntity
 
@@ -17,6 +18,7 @@ class BaseOAuth2Repository(ABC):
     def get_connected_providers(self, user: UserEntity) -> Iterable[UserSocialAuth]: ...
 
 
+@instrument
 class OAuth2Repository(BaseOAuth2Repository):
     def get_connected_providers(self, user: UserEntity) -> Iterable[UserSocialAuth]:
         return UserSocialAuth.objects.filter(user=user_from_entity(user=user))
@@ -5,6 +5,7 @@ from abc import (
 
 from django.contrib.auth import authenticate
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.converters.users import (
     user_from_entity,
     user_to_entity,
@@ -33,6 +34,7 @@ class BaseUserRepository(ABC):
     def update_by_data(self, user: UserEntity, data: dict) -> bool: ...
 
 
+@instrument
 class ORMUserRepository(BaseUserRepository):
     def authenticate(self, login: str, password: str) -> UserEntity | None:
         user_dto = authenticate(username=login, password=password)
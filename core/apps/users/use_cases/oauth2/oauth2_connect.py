@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 
-from social_core.backends.oauth import BaseOAuth2
 from social_django.strategy import DjangoStrategy
 from social_django.utils import load_backend
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.converters.users import user_to_entity
 from core.apps.users.models import CustomUser
 from core.apps.users.services.oauth2 import (
@@ -14,6 +14,7 @@ from core.apps.users.services.oauth2 import (
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class OAuth2ConnectUseCase:
     """Use case for OAuth2 connection.
@@ -35,8 +36,8 @@ class OAuth2ConnectUseCase:
         # Validate provider
         self.provider_validator_service.validate(provider)
 
-        # Load OAuth2 backend
-        backend: BaseOAuth2 = load_backend(
+        # Load OAuth2 backend, backends and their dependencies are imported on the first login
+        backend = load_backend(
             strategy=strategy,
             name=self.oauth2_service.get_provider_by_name(provider),
             redirect_uri=self.oauth2_service.get_redirect_uri(provider),
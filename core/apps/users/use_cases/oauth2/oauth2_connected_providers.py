@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.users.services.oauth2 import BaseOAuth2Service
 
 
+@instrument
 @dataclass
 class OAuth2ConnectedProvidersUseCase:
     oauth2_service: BaseOAuth2Service
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from social_django.strategy import DjangoStrategy
 from social_django.utils import load_backend
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.models import CustomUser
 from core.apps.users.services.oauth2 import (
     BaseOAuth2ProviderValidatorService,
@@ -10,6 +11,7 @@ from core.apps.users.services.oauth2 import (
 )
 
 
+@instrument
 @dataclass
 class OAuth2DisconnectUseCase:
     provider_validator_service: BaseOAuth2ProviderValidatorService
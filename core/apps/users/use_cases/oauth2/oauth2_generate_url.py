@@ -3,12 +3,14 @@ from dataclasses import dataclass
 from social_django.strategy import DjangoStrategy
 from social_django.utils import load_backend
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.services.oauth2 import (
     BaseOAuth2ProviderValidatorService,
     BaseOAuth2Service,
 )
 
 
+@instrument
 @dataclass
 class OAuth2GenerateURLUseCase:
     provider_validator_service: BaseOAuth2ProviderValidatorService
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 
 from core.apps.common.constants import EMAIL_SMTP_TEMPLATES
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.smtp_email import BaseEmailService
 from core.apps.users.services.codes import BaseCodeService
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class AuthorizeUserUseCase:
     user_service: BaseUserService
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from logging import Logger
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.services.codes import BaseCodeService
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class VerifyCodeUseCase:
     code_service: BaseCodeService
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.encoding import BaseEncodingService
 from core.apps.users.exceptions.users import InvalidUIDValueError
 from core.apps.users.services.codes import BaseCodeService
@@ -11,6 +12,7 @@ from core.apps.users.services.users import (
 )
 
 
+@instrument
 @dataclass
 class UserActivationUseCase:
     user_service: BaseUserService
@@ -3,9 +3,11 @@ from logging import Logger
 
 import orjson
 
+from core.apps.common.instrumentation import instrument
 from core.apps.payments.services.stripe_service import BaseStripeService
 
 
+@instrument
 @dataclass
 class UserInvalidateStripeCacheUseCase:
     stripe_service: BaseStripeService
@@ -20,8 +22,7 @@ class UserInvalidateStripeCacheUseCase:
             )
             return
 
-        self.stripe_service.delete_sub_state_by_customer_id(customer_id=customer_id)
-        self.stripe_service.delete_customer_id(user_id=user_id)
+        self.stripe_service.delete_customer_cache(user_id=user_id, customer_id=customer_id)
 
         self.logger.info(
             'Stripe cache invalidated for user',
@@ -6,6 +6,7 @@ from core.apps.common.constants import (
     CACHE_KEYS,
     EMAIL_SMTP_TEMPLATES,
 )
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.encoding import BaseEncodingService
 from core.apps.common.services.smtp_email import BaseEmailService
 from core.apps.common.utils import build_frontend_url
@@ -17,6 +18,7 @@ from core.apps.users.services.users import (
 )
 
 
+@instrument
 @dataclass
 class UserResendActivationUseCase:
     user_service: BaseUserService
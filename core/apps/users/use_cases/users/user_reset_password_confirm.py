@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 
 from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.encoding import BaseEncodingService
 from core.apps.users.exceptions.users import InvalidUIDValueError
 from core.apps.users.services.codes import BaseCodeService
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class UserResetPasswordConfirmUseCase:
     user_service: BaseUserService
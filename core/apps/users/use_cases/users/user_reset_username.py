@@ -6,6 +6,7 @@ from core.apps.common.constants import (
     CACHE_KEYS,
     EMAIL_SMTP_TEMPLATES,
 )
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.encoding import BaseEncodingService
 from core.apps.common.services.smtp_email import BaseEmailService
 from core.apps.common.utils import build_frontend_url
@@ -13,6 +14,7 @@ from core.apps.users.services.codes import BaseCodeService
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class UserResetUsernameUseCase:
     user_service: BaseUserService
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 
 from core.apps.common.constants import EMAIL_SMTP_TEMPLATES
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.smtp_email import BaseEmailService
 from core.apps.users.entities import UserEntity
 from core.apps.users.services.codes import BaseCodeService
 
 
+@instrument
 @dataclass
 class UserSetEmailUseCase:
     code_service: BaseCodeService
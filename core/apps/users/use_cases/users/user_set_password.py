@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.users.services.users import BaseUserService
 
 
+@instrument
 @dataclass
 class UserSetPasswordUseCase:
     user_service: BaseUserService
@@ -0,0 +1,26 @@
+# Multipart upload
+
+UPLOAD_PART_URL_EXPIRES_IN = 120
+UPLOAD_PART_URL_EXPIRES_IN_PER_PART = 30
+MAX_UPLOAD_PART_URLS_EXPIRES_IN = 6 * 60 * 60
+
+
+# HLS transcoding
+
+HLS_SEGMENT_DURATION = 6
+HLS_MASTER_PLAYLIST_NAME = 'master.m3u8'
+HLS_RENDITION_PLAYLIST_NAME = 'index.m3u8'
+
+# Bitrates are in kbit/s, renditions higher than the uploaded video are skipped
+HLS_RENDITIONS = (
+    {'name': '240p', 'height': 240, 'video_bitrate': 400, 'audio_bitrate': 64},
+    {'name': '360p', 'height': 360, 'video_bitrate': 800, 'audio_bitrate': 96},
+    {'name': '480p', 'height': 480, 'video_bitrate': 1400, 'audio_bitrate': 128},
+    {'name': '720p', 'height': 720, 'video_bitrate': 2800, 'audio_bitrate': 128},
+    {'name': '1080p', 'height': 1080, 'video_bitrate': 5000, 'audio_bitrate': 192},
+)
+
+HLS_CONTENT_TYPES = {
+    '.m3u8': 'application/vnd.apple.mpegurl',
+    '.ts': 'video/mp2t',
+}
@@ -1,5 +1,11 @@
 import punq
 
+from core.apps.videos.providers.transcoding import (
+    BaseVideoTranscoderProvider,
+    BaseVideoTranscodingTasksProvider,
+    CeleryVideoTranscodingTasksProvider,
+    FFmpegVideoTranscoderProvider,
+)
 from core.apps.videos.repositories.comments import (
     BaseVideoCommentRepository,
     ORMVideoCommentRepository,
@@ -22,6 +28,14 @@ from core.apps.videos.services.s3_videos import (
     VideoFilenameExistsValidatorService,
     VideoFilenameFormatValidatorService,
 )
+from core.apps.videos.services.transcoding import (
+    BaseVideoTranscodingService,
+    VideoTranscodingService,
+)
+from core.apps.videos.services.upload_reaper import (
+    BaseVideoUploadReaperService,
+    VideoUploadReaperService,
+)
 from core.apps.videos.services.videos import (
     BasePlaylistPrivatePermissionValidatorService,
     BasePrivateVideoPermissionValidatorService,
@@ -50,7 +64,10 @@ from core.apps.videos.use_cases.videos_upload.abort_upload_video import AbortVid
 from core.apps.videos.use_cases.videos_upload.complete_upload_video import CompleteVideoMultipartUploadUseCase
 from core.apps.videos.use_cases.videos_upload.create_upload_video import CreateVideoMultipartUploadUseCase
 from core.apps.videos.use_cases.videos_upload.download_video_url import GenerateUrlForVideoDownloadUseCase
+from core.apps.videos.use_cases.videos_upload.download_videos_urls import GenerateUrlsForVideosDownloadUseCase
+from core.apps.videos.use_cases.videos_upload.missing_video_parts import GetVideoMissingPartsUseCase
 from core.apps.videos.use_cases.videos_upload.upload_video_url import GenerateUrlForVideoPartUploadUseCase
+from core.apps.videos.use_cases.videos_upload.upload_video_urls import GenerateUrlsForVideoPartsUploadUseCase
 
 
 def init_videos(container: punq.Container) -> None:
@@ -63,38 +80,67 @@ def init_videos(container: punq.Container) -> None:
         )
 
     # init repositories
-    container.register(BaseVideoRepository, ORMVideoRepository)
-    container.register(BaseVideoHistoryRepository, ORMVideoHistoryRepository)
-    container.register(BasePlaylistRepository, ORMPlaylistRepository)
-    container.register(BaseVideoCommentRepository, ORMVideoCommentRepository)
+    container.register(BaseVideoRepository, ORMVideoRepository, scope=punq.Scope.singleton)
+    container.register(BaseVideoHistoryRepository, ORMVideoHistoryRepository, scope=punq.Scope.singleton)
+    container.register(BasePlaylistRepository, ORMPlaylistRepository, scope=punq.Scope.singleton)
+    container.register(BaseVideoCommentRepository, ORMVideoCommentRepository, scope=punq.Scope.singleton)
+
+    # init providers
+    container.register(BaseVideoTranscoderProvider, FFmpegVideoTranscoderProvider, scope=punq.Scope.singleton)
+    container.register(
+        BaseVideoTranscodingTasksProvider,
+        CeleryVideoTranscodingTasksProvider,
+        scope=punq.Scope.singleton,
+    )
 
     # init services
-    container.register(BaseVideoService, ORMVideoService)
-    container.register(BaseVideoPlaylistService, ORMVideoPlaylistService)
-    container.register(BasePlaylistPrivatePermissionValidatorService, PlaylistPrivatePermissionValidatorService)
-    container.register(BaseVideoHistoryService, ORMVideoHistoryService)
-    container.register(BaseVideoCommentService, ORMCommentService)
+    container.register(BaseVideoService, ORMVideoService, scope=punq.Scope.singleton)
+    container.register(BaseVideoPlaylistService, ORMVideoPlaylistService, scope=punq.Scope.singleton)
+    container.register(
+        BasePlaylistPrivatePermissionValidatorService,
+        PlaylistPrivatePermissionValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BaseVideoHistoryService, ORMVideoHistoryService, scope=punq.Scope.singleton)
+    container.register(BaseVideoCommentService, ORMCommentService, scope=punq.Scope.singleton)
+    container.register(BaseVideoUploadReaperService, VideoUploadReaperService, scope=punq.Scope.singleton)
+    container.register(BaseVideoTranscodingService, VideoTranscodingService, scope=punq.Scope.singleton)
 
-    container.register(BaseVideoValidatorService, VideoExistsValidatorService)
-    container.register(VideoFilenameExistsValidatorService)
-    container.register(VideoFilenameFormatValidatorService)
-    container.register(BaseVideoFilenameValidatorService, factory=build_video_filename_validators)
-    container.register(BaseVideoAuthorValidatorService, VideoMatchAuthorValidatorService)
-    container.register(BasePrivateVideoPermissionValidatorService, VideoPrivatePermissionValidatorService)
-    container.register(BaseVideoPrivateOrUploadingValidatorService, VideoPrivateOrUploadingValidatorService)
+    container.register(BaseVideoValidatorService, VideoExistsValidatorService, scope=punq.Scope.singleton)
+    container.register(VideoFilenameExistsValidatorService, scope=punq.Scope.singleton)
+    container.register(VideoFilenameFormatValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BaseVideoFilenameValidatorService,
+        factory=build_video_filename_validators,
+        scope=punq.Scope.singleton,
+    )
+    container.register(BaseVideoAuthorValidatorService, VideoMatchAuthorValidatorService, scope=punq.Scope.singleton)
+    container.register(
+        BasePrivateVideoPermissionValidatorService,
+        VideoPrivatePermissionValidatorService,
+        scope=punq.Scope.singleton,
+    )
+    container.register(
+        BaseVideoPrivateOrUploadingValidatorService,
+        VideoPrivateOrUploadingValidatorService,
+        scope=punq.Scope.singleton,
+    )
 
     # init use cases
-    container.register(VideoCommentLikeCreateUseCase)
-    container.register(VideoCommentLikeDeleteUseCase)
-    container.register(CreateVideoCommentUseCase)
-    container.register(GetVideoCommentsUseCase)
+    container.register(VideoCommentLikeCreateUseCase, scope=punq.Scope.singleton)
+    container.register(VideoCommentLikeDeleteUseCase, scope=punq.Scope.singleton)
+    container.register(CreateVideoCommentUseCase, scope=punq.Scope.singleton)
+    container.register(GetVideoCommentsUseCase, scope=punq.Scope.singleton)
 
-    container.register(CreateVideoMultipartUploadUseCase)
-    container.register(AbortVideoMultipartUploadUseCase)
-    container.register(CompleteVideoMultipartUploadUseCase)
-    container.register(GenerateUrlForVideoPartUploadUseCase)
-    container.register(GenerateUrlForVideoDownloadUseCase)
+    container.register(CreateVideoMultipartUploadUseCase, scope=punq.Scope.singleton)
+    container.register(AbortVideoMultipartUploadUseCase, scope=punq.Scope.singleton)
+    container.register(CompleteVideoMultipartUploadUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlForVideoPartUploadUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlsForVideoPartsUploadUseCase, scope=punq.Scope.singleton)
+    container.register(GetVideoMissingPartsUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlForVideoDownloadUseCase, scope=punq.Scope.singleton)
+    container.register(GenerateUrlsForVideosDownloadUseCase, scope=punq.Scope.singleton)
 
-    container.register(ClearVideoHistoryUseCase)
+    container.register(ClearVideoHistoryUseCase, scope=punq.Scope.singleton)
 
-    container.register(GetPlaylistVideosUseCase, GetPlaylistVideosUseCase)
+    container.register(GetPlaylistVideosUseCase, GetPlaylistVideosUseCase, scope=punq.Scope.singleton)
@@ -12,6 +12,7 @@ def video_comment_from_entity(video_comment: VideoCommentEntity) -> VideoComment
         video_id=video_comment.video_id,
         reply_comment_id=video_comment.reply_comment_id,
         reply_level=video_comment.reply_level,
+        path=video_comment.path,
     )
 
 
@@ -25,6 +26,7 @@ def video_comment_to_entity(video_comment: VideoComment) -> VideoCommentEntity:
         video_id=video_comment.video_id,
         reply_comment_id=video_comment.reply_comment_id,
         reply_level=video_comment.reply_level,
+        path=video_comment.path,
     )
 
 
@@ -1,5 +1,11 @@
-from core.apps.videos.entities.videos import VideoEntity
-from core.apps.videos.models import Video
+from core.apps.videos.entities.videos import (
+    VideoEntity,
+    VideoRenditionEntity,
+)
+from core.apps.videos.models import (
+    Video,
+    VideoRendition,
+)
 
 
 def video_from_entity(video: VideoEntity) -> Video:
@@ -35,3 +41,27 @@ def video_to_entity(video: Video) -> VideoEntity:
 
 def data_to_video_entity(data: dict) -> VideoEntity:
     return VideoEntity(**data)
+
+
+def video_rendition_from_entity(rendition: VideoRenditionEntity) -> VideoRendition:
+    return VideoRendition(
+        pk=rendition.id,
+        video_id=rendition.video_id,
+        name=rendition.name,
+        width=rendition.width,
+        height=rendition.height,
+        bandwidth=rendition.bandwidth,
+        playlist_key=rendition.playlist_key,
+    )
+
+
+def video_rendition_to_entity(rendition: VideoRendition) -> VideoRenditionEntity:
+    return VideoRenditionEntity(
+        id=rendition.pk,
+        video_id=rendition.video_id,
+        name=rendition.name,
+        width=rendition.width,
+        height=rendition.height,
+        bandwidth=rendition.bandwidth,
+        playlist_key=rendition.playlist_key,
+    )
@@ -17,6 +17,7 @@ class VideoCommentEntity:
     video_id: str
     reply_comment_id: int | None = field(default=None, kw_only=True)
     reply_level: int = field(default=0, kw_only=True)
+    path: str = field(default='', kw_only=True)
     # likes
 
     def update_reply_level(self) -> int:
@@ -27,3 +28,15 @@ class VideoCommentEntity:
             self.reply_level = 1
 
         return self.reply_level
+
+    def get_thread_path(self) -> str:
+        """Return the path prefix shared by all replies in the comment's
+        thread."""
+
+        return f'{self.path}{self.id:019d}.'
+
+    def update_path(self, reply_comment: 'VideoCommentEntity') -> str:
+        """Update the 'path' field based on the comment to reply."""
+
+        self.path = reply_comment.get_thread_path()
+        return self.path
@@ -23,3 +23,14 @@ class VideoEntity:
     is_reported: bool = field(default=False, kw_only=True)
 
     reports_count: int = field(default=0, kw_only=True)
+
+
+@dataclass
+class VideoRenditionEntity:
+    id: int | None = field(default=None, kw_only=True)
+    video_id: str
+    name: str
+    width: int
+    height: int
+    bandwidth: int
+    playlist_key: str
@@ -33,3 +33,12 @@ class VideoFilenameNotSupportedFormatError(ServiceException):
     default_detail = {'detail': 'Unsupported video file format'}
 
     filename: str
+
+
+@dataclass
+class VideoTranscodingError(ServiceException):
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    default_detail = {'detail': 'Video cannot be transcoded'}
+
+    video_id: str
+    error: str
@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+# Videos in the middle of an upload have only 'upload_id', uploaded videos have only 's3_key'
+SEED_SQL = """
+CREATE TEMPORARY TABLE benchmark_video AS
+SELECT
+    lpad(number::text, 11, '0') AS video_id,
+    CASE WHEN number %% 10 = 0 THEN md5(number::text) END AS upload_id,
+    CASE WHEN number %% 10 <> 0 THEN 'videos/' || md5(number::text) || '.mp4' END AS s3_key,
+    repeat('x', 200) AS description
+FROM generate_series(1, %s) AS number
+"""
+CREATE_INDEXES_SQL = [
+    'CREATE UNIQUE INDEX ON benchmark_video (upload_id) WHERE upload_id IS NOT NULL',
+    'CREATE UNIQUE INDEX ON benchmark_video (s3_key) WHERE s3_key IS NOT NULL',
+]
+
+
+class Command(BaseCommand):
+    help = "Compare lookups of videos by 'upload_id' and 's3_key' on a seeded table without and with partial indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5_000_000, help='Number of seeded videos')
+        parser.add_argument('--lookups', type=int, default=200, help='Number of lookups per column')
+
+    def _run(self, cursor, label: str, rows: int, lookups: int) -> None:
+        step = max(rows // lookups, 1)
+
+        for column, value_sql in (
+            ('upload_id', 'md5(%s::text)'),
+            ('s3_key', "'videos/' || md5(%s::text) || '.mp4'"),
+        ):
+            # Numbers with the matching value for the column are picked across the whole table
+            numbers = [number - number % 10 + (column == 's3_key') for number in range(10, rows, step)][:lookups]
+            started = time.perf_counter()
+
+            for number in numbers:
+                cursor.execute(f'SELECT video_id FROM benchmark_video WHERE {column} = {value_sql} LIMIT 1', [number])
+                cursor.fetchone()
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f'{label}, {column}: {elapsed * 1000 / len(numbers):.3f} ms per lookup')
+
+        cursor.execute("EXPLAIN SELECT video_id FROM benchmark_video WHERE s3_key = 'videos/test.mp4'")
+        self.stdout.write(f'{label}, plan: {cursor.fetchone()[0]}')
+
+    def handle(self, *args, **options):
+        rows, lookups = options['rows'], options['lookups']
+
+        # The temporary table is dropped with the connection, real videos are not touched
+        with connection.cursor() as cursor:
+            self.stdout.write(f'Seeding {rows} videos...')
+            cursor.execute(SEED_SQL, [rows])
+            cursor.execute('ANALYZE benchmark_video')
+
+            self._run(cursor=cursor, label='Without indexes', rows=rows, lookups=lookups)
+
+            for sql in CREATE_INDEXES_SQL:
+                cursor.execute(sql)
+            cursor.execute('ANALYZE benchmark_video')
+
+            self._run(cursor=cursor, label='With partial indexes', rows=rows, lookups=lookups)
+            cursor.execute('DROP TABLE benchmark_video')
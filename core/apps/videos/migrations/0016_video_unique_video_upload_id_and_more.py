@@ -0,0 +1,105 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:14
+
+from django.db import migrations, models
+
+INDEX_NAMES = ('unique_video_upload_id', 'unique_video_s3_key')
+
+# Duplicated values cannot be resolved automatically without losing data, so the migration
+# fails before the indexes are built and reports the values that have to be resolved first
+CHECK_DUPLICATE_UPLOAD_IDS_SQL = """
+DO $$
+DECLARE
+    duplicates text;
+BEGIN
+    SELECT string_agg(upload_id, ', ') INTO duplicates FROM (
+        SELECT upload_id FROM videos_video
+        WHERE upload_id IS NOT NULL GROUP BY upload_id HAVING count(*) > 1
+        ORDER BY upload_id LIMIT 100
+    ) AS duplicated;
+    IF duplicates IS NOT NULL THEN
+        RAISE EXCEPTION 'videos_video has duplicated upload_id values, resolve them before applying the migration: %', duplicates;
+    END IF;
+END
+$$
+"""
+CHECK_DUPLICATE_S3_KEYS_SQL = """
+DO $$
+DECLARE
+    duplicates text;
+BEGIN
+    SELECT string_agg(s3_key, ', ') INTO duplicates FROM (
+        SELECT s3_key FROM videos_video
+        WHERE s3_key IS NOT NULL GROUP BY s3_key HAVING count(*) > 1
+        ORDER BY s3_key LIMIT 100
+    ) AS duplicated;
+    IF duplicates IS NOT NULL THEN
+        RAISE EXCEPTION 'videos_video has duplicated s3_key values, resolve them before applying the migration: %', duplicates;
+    END IF;
+END
+$$
+"""
+
+# Partial unique constraints are unique indexes in PostgreSQL, so they are built
+# concurrently to not lock 'videos_video' for writes while the index is built
+CREATE_UPLOAD_ID_INDEX_SQL = """
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS unique_video_upload_id
+ON videos_video (upload_id) WHERE upload_id IS NOT NULL
+"""
+CREATE_S3_KEY_INDEX_SQL = """
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS unique_video_s3_key
+ON videos_video (s3_key) WHERE s3_key IS NOT NULL
+"""
+
+
+def drop_invalid_indexes(apps, schema_editor):
+    """Drop indexes left INVALID by a failed concurrent build, which
+    'IF NOT EXISTS' would otherwise keep."""
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+            'WHERE c.relname IN %s AND NOT i.indisvalid',
+            [INDEX_NAMES],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    for name in names:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('channels', '0007_alter_channel_avatar_s3_key_alter_channel_country_and_more'),
+        ('videos', '0015_videocomment_path'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(code=drop_invalid_indexes, reverse_code=migrations.RunPython.noop),
+                migrations.RunSQL(sql=CHECK_DUPLICATE_UPLOAD_IDS_SQL, reverse_sql=migrations.RunSQL.noop),
+                migrations.RunSQL(sql=CHECK_DUPLICATE_S3_KEYS_SQL, reverse_sql=migrations.RunSQL.noop),
+                migrations.RunSQL(
+                    sql=CREATE_UPLOAD_ID_INDEX_SQL,
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS unique_video_upload_id',
+                ),
+                migrations.RunSQL(
+                    sql=CREATE_S3_KEY_INDEX_SQL,
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS unique_video_s3_key',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='video',
+                    constraint=models.UniqueConstraint(condition=models.Q(('upload_id__isnull', False)), fields=('upload_id',), name='unique_video_upload_id'),
+                ),
+                migrations.AddConstraint(
+                    model_name='video',
+                    constraint=models.UniqueConstraint(condition=models.Q(('s3_key__isnull', False)), fields=('s3_key',), name='unique_video_s3_key'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('channels', '0007_alter_channel_avatar_s3_key_alter_channel_country_and_more'),
+        ('videos', '0016_video_unique_video_upload_id_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='video',
+            index=models.Index(condition=models.Q(('upload_status', 'UPLOADING')), fields=['created_at'], name='video_uploading_created_idx'),
+        ),
+    ]
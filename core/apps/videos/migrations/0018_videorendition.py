@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0017_video_video_uploading_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoRendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Rendition name, e.g. 720p', max_length=10)),
+                ('width', models.PositiveIntegerField(help_text='Rendition width in pixels')),
+                ('height', models.PositiveIntegerField(help_text='Rendition height in pixels')),
+                ('bandwidth', models.PositiveIntegerField(help_text='Rendition peak bandwidth in bits per second')),
+                ('playlist_key', models.CharField(help_text='S3 key of the rendition HLS playlist', verbose_name='Rendition playlist S3 key')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='videos.video')),
+            ],
+            options={
+                'ordering': ['height'],
+                'constraints': [models.UniqueConstraint(fields=('video', 'name'), name='unique_video_rendition_name')],
+            },
+        ),
+    ]
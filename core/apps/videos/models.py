@@ -93,11 +93,54 @@ class Video(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        constraints = [
+            # Partial indexes also serve upload and download lookups, NULLs are not indexed
+            models.UniqueConstraint(
+                fields=['upload_id'],
+                condition=models.Q(upload_id__isnull=False),
+                name='unique_video_upload_id',
+            ),
+            models.UniqueConstraint(
+                fields=['s3_key'],
+                condition=models.Q(s3_key__isnull=False),
+                name='unique_video_s3_key',
+            ),
+        ]
+        indexes = [
+            # Only videos that are still uploading are looked up by 'created_at' to reap abandoned uploads
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(upload_status='UPLOADING'),
+                name='video_uploading_created_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class VideoRendition(models.Model):
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='renditions', db_index=True)
+    name = models.CharField(max_length=10, help_text=_('Rendition name, e.g. 720p'))
+    width = models.PositiveIntegerField(help_text=_('Rendition width in pixels'))
+    height = models.PositiveIntegerField(help_text=_('Rendition height in pixels'))
+    bandwidth = models.PositiveIntegerField(help_text=_('Rendition peak bandwidth in bits per second'))
+    playlist_key = models.CharField(
+        verbose_name=_('Rendition playlist S3 key'),
+        help_text=_('S3 key of the rendition HLS playlist'),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['height']
+        constraints = [
+            models.UniqueConstraint(fields=['video', 'name'], name='unique_video_rendition_name'),
+        ]
+
+    def __str__(self):
+        return f'Rendition {self.name} of video: {self.video}'
+
+
 class VideoLike(models.Model):
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='liked_videos', db_index=True)
     video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='likes', db_index=True)
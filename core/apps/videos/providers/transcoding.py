@@ -0,0 +1,129 @@
+import os
+import subprocess
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+import orjson
+from django.conf import settings
+
+from core.apps.videos.constants import (
+    HLS_RENDITION_PLAYLIST_NAME,
+    HLS_SEGMENT_DURATION,
+)
+from core.project.celery import app
+
+
+class BaseVideoTranscoderProvider(ABC):
+    @abstractmethod
+    def probe(self, path: str) -> dict:
+        """Return 'width', 'height' and 'has_audio' of the video file."""
+        ...
+
+    @abstractmethod
+    def transcode_to_hls(self, source_path: str, output_dir: str, renditions: list[dict], has_audio: bool) -> None:
+        """Transcode the video file into HLS renditions.
+
+        Each rendition is written into '<output_dir>/<name>/' with its
+        playlist and segments.
+
+        """
+        ...
+
+
+class FFmpegVideoTranscoderProvider(BaseVideoTranscoderProvider):
+    def probe(self, path: str) -> dict:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type,width,height', '-of', 'json', path],
+            capture_output=True,
+            check=True,
+            timeout=60,
+        )
+        streams = orjson.loads(result.stdout).get('streams', [])
+        video_stream = next(stream for stream in streams if stream.get('codec_type') == 'video')
+
+        return {
+            'width': video_stream['width'],
+            'height': video_stream['height'],
+            'has_audio': any(stream.get('codec_type') == 'audio' for stream in streams),
+        }
+
+    @staticmethod
+    def build_hls_command(source_path: str, output_dir: str, renditions: list[dict], has_audio: bool) -> list[str]:
+        """Build a single ffmpeg command, so the source is decoded once for
+        all renditions."""
+
+        split = ''.join(f'[v{index}]' for index in range(len(renditions)))
+        scales = ';'.join(
+            f'[v{index}]scale=-2:{rendition["height"]}[v{index}out]' for index, rendition in enumerate(renditions)
+        )
+
+        command = [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
+            '-i', source_path,
+            '-threads', str(settings.VIDEO_TRANSCODING_THREADS),
+            '-filter_complex', f'[0:v]split={len(renditions)}{split};{scales}',
+        ]  # fmt: skip
+
+        for index, rendition in enumerate(renditions):
+            bitrate = rendition['video_bitrate']
+            command += [
+                '-map', f'[v{index}out]',
+                f'-c:v:{index}', 'libx264',
+                f'-b:v:{index}', f'{bitrate}k',
+                f'-maxrate:v:{index}', f'{int(bitrate * 1.07)}k',
+                f'-bufsize:v:{index}', f'{int(bitrate * 1.5)}k',
+            ]  # fmt: skip
+
+            if has_audio:
+                command += ['-map', 'a:0', f'-c:a:{index}', 'aac', f'-b:a:{index}', f'{rendition["audio_bitrate"]}k']
+
+        var_stream_map = ' '.join(
+            f'v:{index},a:{index},name:{rendition["name"]}' if has_audio else f'v:{index},name:{rendition["name"]}'
+            for index, rendition in enumerate(renditions)
+        )
+
+        command += [
+            '-preset', 'veryfast',
+            '-pix_fmt', 'yuv420p',
+            # Keyframes on segment boundaries, so segments of all renditions are aligned for switching
+            '-force_key_frames', f'expr:gte(t,n_forced*{HLS_SEGMENT_DURATION})',
+            '-sc_threshold', '0',
+            '-f', 'hls',
+            '-hls_time', str(HLS_SEGMENT_DURATION),
+            '-hls_playlist_type', 'vod',
+            '-hls_flags', 'independent_segments',
+            '-hls_segment_filename', os.path.join(output_dir, '%v', 'segment_%04d.ts'),
+            '-var_stream_map', var_stream_map,
+            os.path.join(output_dir, '%v', HLS_RENDITION_PLAYLIST_NAME),
+        ]  # fmt: skip
+
+        return command
+
+    def transcode_to_hls(self, source_path: str, output_dir: str, renditions: list[dict], has_audio: bool) -> None:
+        subprocess.run(
+            self.build_hls_command(
+                source_path=source_path,
+                output_dir=output_dir,
+                renditions=renditions,
+                has_audio=has_audio,
+            ),
+            capture_output=True,
+            check=True,
+            timeout=settings.VIDEO_TRANSCODING_TIMEOUT,
+        )
+
+
+class BaseVideoTranscodingTasksProvider(ABC):
+    @abstractmethod
+    def transcode_video(self, video_id: str) -> None: ...
+
+
+class CeleryVideoTranscodingTasksProvider(BaseVideoTranscodingTasksProvider):
+    def transcode_video(self, video_id: str) -> None:
+        app.send_task(
+            'core.apps.videos.tasks.transcode_video_task',
+            args=(video_id,),
+            queue='transcoding-queue',
+        )
@@ -4,7 +4,11 @@ from abc import (
 )
 from collections.abc import Iterable
 
+from django.db import transaction
+from django.db.models import Q
+
 from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.common.instrumentation import instrument
 from core.apps.videos.converters.comments import video_comment_to_entity
 from core.apps.videos.converters.likes import video_comment_like_item_to_entity
 from core.apps.videos.entities.comments import VideoCommentEntity
@@ -42,7 +46,11 @@ class BaseVideoCommentRepository(ABC):
     @abstractmethod
     def update_like_status(self, like_id: int, is_like: bool) -> None: ...
 
+    @abstractmethod
+    def delete_comment_thread(self, comment: VideoCommentEntity) -> int: ...
+
 
+@instrument
 class ORMVideoCommentRepository(BaseVideoCommentRepository):
     def create_comment(self, comment_entity: VideoCommentEntity) -> VideoCommentEntity:
         # comment_dto = video_comment_from_entity(comment_entity).save()
@@ -82,3 +90,24 @@ class ORMVideoCommentRepository(BaseVideoCommentRepository):
         ).delete()
 
         return True if deleted else False
+
+    def delete_comment_thread(self, comment: VideoCommentEntity) -> int:
+        """Delete the comment together with all replies in its thread and
+        return the number of deleted comments.
+
+        The thread is selected with a range query on the 'path' index instead
+        of walking each level of replies. Comments are deleted with the public
+        'QuerySet.delete()', so 'post_delete' receivers still run.
+
+        """
+
+        thread_path = comment.get_thread_path()
+
+        with transaction.atomic():
+            VideoCommentLikeItem.objects.filter(
+                Q(comment_id=comment.id) | Q(comment__path__startswith=thread_path),
+            ).delete()
+
+            _, deleted = VideoComment.objects.filter(Q(pk=comment.id) | Q(path__startswith=thread_path)).delete()
+
+        return deleted.get(VideoComment._meta.label, 0)
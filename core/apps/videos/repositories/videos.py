@@ -3,12 +3,17 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import Iterable
-from datetime import timedelta
+from datetime import (
+    datetime,
+    timedelta,
+)
 
+from django.db import transaction
 from django.db.models import Count
 from django.utils import timezone
 
 from core.apps.channels.entities.channels import ChannelEntity
+from core.apps.common.instrumentation import instrument
 from core.apps.videos.converters.likes import video_like_to_entity
 from core.apps.videos.converters.playlists import (
     playlist_item_to_entity,
@@ -20,6 +25,8 @@ from core.apps.videos.converters.video_history import (
 )
 from core.apps.videos.converters.videos import (
     video_from_entity,
+    video_rendition_from_entity,
+    video_rendition_to_entity,
     video_to_entity,
 )
 from core.apps.videos.entities.likes import VideoLikeEntity
@@ -28,13 +35,17 @@ from core.apps.videos.entities.playlists import (
     PlaylistItemEntity,
 )
 from core.apps.videos.entities.video_history import VideoHistoryEntity
-from core.apps.videos.entities.videos import VideoEntity
+from core.apps.videos.entities.videos import (
+    VideoEntity,
+    VideoRenditionEntity,
+)
 from core.apps.videos.models import (
     Playlist,
     PlaylistItem,
     Video,
     VideoHistory,
     VideoLike,
+    VideoRendition,
     VideoView,
 )
 
@@ -49,6 +60,9 @@ class BaseVideoRepository(ABC):
     @abstractmethod
     def get_video_by_key(self, key: str) -> VideoEntity | None: ...
 
+    @abstractmethod
+    def get_videos_by_keys(self, keys: list[str]) -> list[VideoEntity]: ...
+
     @abstractmethod
     def update_video_after_upload(
         self,
@@ -60,6 +74,25 @@ class BaseVideoRepository(ABC):
     @abstractmethod
     def delete_video_by_id(self, video_id: str) -> None: ...
 
+    @abstractmethod
+    def get_stale_uploading_videos(
+        self,
+        created_before: datetime,
+        chunk_size: int,
+    ) -> Iterable[tuple[str, str | None]]: ...
+
+    @abstractmethod
+    def delete_stale_uploading_videos(self, video_ids: list[str], created_before: datetime) -> int: ...
+
+    @abstractmethod
+    def get_video_renditions(self, video_id: str) -> list[VideoRenditionEntity]: ...
+
+    @abstractmethod
+    def replace_video_renditions(self, video_id: str, renditions: list[VideoRenditionEntity]) -> bool:
+        """Replace renditions of the video and return False without saving
+        them if the video has been deleted."""
+        ...
+
     @abstractmethod
     def get_video_by_id_or_none(self, video_id: str) -> VideoEntity | None: ...
 
@@ -93,6 +126,7 @@ class BaseVideoRepository(ABC):
     def get_videos_list(self) -> Iterable[Video]: ...
 
 
+@instrument
 class ORMVideoRepository(BaseVideoRepository):
     def video_create(self, video_entity: VideoEntity) -> None:
         video_from_entity(video_entity).save()
@@ -105,6 +139,9 @@ class ORMVideoRepository(BaseVideoRepository):
         video_dto = Video.objects.filter(s3_key=key).first()
         return video_to_entity(video_dto) if video_dto else None
 
+    def get_videos_by_keys(self, keys: list[str]) -> list[VideoEntity]:
+        return [video_to_entity(video_dto) for video_dto in Video.objects.filter(s3_key__in=keys)]
+
     def update_video_after_upload(self, video_id: str, upload_id: str, s3_key: str) -> None:
         Video.objects.filter(
             video_id=video_id,
@@ -118,6 +155,42 @@ class ORMVideoRepository(BaseVideoRepository):
     def delete_video_by_id(self, video_id: str) -> None:
         Video.objects.filter(video_id=video_id).delete()
 
+    def get_stale_uploading_videos(
+        self,
+        created_before: datetime,
+        chunk_size: int,
+    ) -> Iterable[tuple[str, str | None]]:
+        return (
+            Video.objects.filter(upload_status=Video.UploadStatus.UPLOADING, created_at__lt=created_before)
+            .order_by()
+            .values_list('video_id', 'upload_id')
+            .iterator(chunk_size=chunk_size)
+        )
+
+    def delete_stale_uploading_videos(self, video_ids: list[str], created_before: datetime) -> int:
+        # The status is checked again, so videos completed after they were read are kept
+        _, deleted = Video.objects.filter(
+            video_id__in=video_ids,
+            upload_status=Video.UploadStatus.UPLOADING,
+            created_at__lt=created_before,
+        ).delete()
+        return deleted.get(Video._meta.label, 0)
+
+    def get_video_renditions(self, video_id: str) -> list[VideoRenditionEntity]:
+        return [video_rendition_to_entity(rendition) for rendition in VideoRendition.objects.filter(video_id=video_id)]
+
+    def replace_video_renditions(self, video_id: str, renditions: list[VideoRenditionEntity]) -> bool:
+        # Renditions of a video transcoded again are replaced at once
+        with transaction.atomic():
+            # The row lock keeps the video from being deleted until its renditions are saved
+            if not Video.objects.select_for_update().filter(video_id=video_id).exists():
+                return False
+
+            VideoRendition.objects.filter(video_id=video_id).delete()
+            VideoRendition.objects.bulk_create([video_rendition_from_entity(rendition) for rendition in renditions])
+
+        return True
+
     def get_video_by_id_or_none(self, video_id: str) -> VideoEntity | None:
         video_dto = Video.objects.filter(video_id=video_id).first()
         return video_to_entity(video_dto) if video_dto else None
@@ -197,6 +270,7 @@ class BaseVideoHistoryRepository(ABC):
     def clear_history(self, channel: ChannelEntity) -> bool: ...
 
 
+@instrument
 class ORMVideoHistoryRepository(BaseVideoHistoryRepository):
     def get_or_create_history_item(self, video: VideoEntity, channel: ChannelEntity) -> tuple[VideoHistoryEntity, bool]:
         video_history_dto, created = VideoHistory.objects.get_or_create(channel_id=channel.id, video_id=video.id)
@@ -235,6 +309,7 @@ class BasePlaylistRepository(ABC):
     def playlist_item_delete(self, playlist: PlaylistEntity, video: VideoEntity) -> bool: ...
 
 
+@instrument
 class ORMPlaylistRepository(BasePlaylistRepository):
     def get_all_playlists(self) -> Iterable[Playlist]:
         return Playlist.objects.all()
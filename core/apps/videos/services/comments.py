@@ -5,6 +5,7 @@ from abc import (
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from django.conf import settings
 from django.db.models import (
     Count,
     Q,
@@ -54,6 +55,12 @@ class BaseVideoCommentService(ABC):
     @abstractmethod
     def like_delete(self, author: ChannelEntity, comment: VideoCommentEntity) -> bool: ...
 
+    @abstractmethod
+    def get_thread_by_comment_id(self, comment_id: str) -> Iterable[VideoComment]: ...
+
+    @abstractmethod
+    def delete_comment_thread(self, comment: VideoCommentEntity) -> int: ...
+
 
 class ORMCommentService(BaseVideoCommentService):
     def _build_query(self, queryset: Iterable[VideoComment]) -> Iterable[VideoComment]:
@@ -68,6 +75,10 @@ class ORMCommentService(BaseVideoCommentService):
 
     def create_comment(self, comment_entity: VideoCommentEntity) -> VideoCommentEntity:
         comment_entity.update_reply_level()
+
+        if comment_entity.reply_comment_id is not None:
+            comment_entity.update_path(reply_comment=self.get_by_id_or_404(id=comment_entity.reply_comment_id))
+
         return self.repository.create_comment(comment_entity=comment_entity)
 
     def get_related_queryset(self) -> Iterable[VideoComment]:
@@ -93,6 +104,9 @@ class ORMCommentService(BaseVideoCommentService):
         if not comment_id:
             raise CommentNotFoundError()
 
+        if settings.COMMENTS_THREADED_MODE:
+            return self.get_thread_by_comment_id(comment_id=comment_id)
+
         qs = self._build_query(queryset=self.repository.get_all_comments())
         return qs.filter(reply_comment_id=comment_id, reply_level=1)
 
@@ -129,3 +143,14 @@ class ORMCommentService(BaseVideoCommentService):
             comment=comment,
         )
         return deleted
+
+    def get_thread_by_comment_id(self, comment_id: str) -> Iterable[VideoComment]:
+        """Return all replies in the comment's thread on any depth with a
+        single query over the 'path' index."""
+
+        comment = self.get_by_id_or_404(id=comment_id)
+        qs = self._build_query(queryset=self.repository.get_all_comments())
+        return qs.filter(path__startswith=comment.get_thread_path())
+
+    def delete_comment_thread(self, comment: VideoCommentEntity) -> int:
+        return self.repository.delete_comment_thread(comment=comment)
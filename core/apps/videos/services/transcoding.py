@@ -0,0 +1,171 @@
+import os
+import subprocess
+import tempfile
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from core.apps.common.providers.files import (
+    BaseBotoFileProvider,
+    BaseCeleryFileProvider,
+)
+from core.apps.videos.constants import (
+    HLS_CONTENT_TYPES,
+    HLS_MASTER_PLAYLIST_NAME,
+    HLS_RENDITION_PLAYLIST_NAME,
+    HLS_RENDITIONS,
+)
+from core.apps.videos.entities.videos import VideoRenditionEntity
+from core.apps.videos.exceptions.upload import VideoTranscodingError
+from core.apps.videos.providers.transcoding import (
+    BaseVideoTranscoderProvider,
+    BaseVideoTranscodingTasksProvider,
+)
+from core.apps.videos.services.videos import BaseVideoService
+
+
+def get_hls_prefix(video_id: str) -> str:
+    """Return S3 prefix of all HLS playlists and segments of the video."""
+
+    return f'{settings.AWS_S3_VIDEO_BUCKET_PREFIX or ""}hls/{video_id}/'
+
+
+def select_hls_renditions(width: int, height: int) -> list[dict]:
+    """Return renditions of the HLS ladder not higher than the video with
+    their widths scaled by the video aspect ratio.
+
+    A video lower than the first rendition is transcoded into the first
+    rendition only.
+
+    """
+
+    renditions = [rendition for rendition in HLS_RENDITIONS if rendition['height'] <= height] or [HLS_RENDITIONS[0]]
+
+    # Widths are rounded to even numbers like ffmpeg 'scale=-2:<height>' does
+    return [{**rendition, 'width': int(width * rendition['height'] / height / 2 + 0.5) * 2} for rendition in renditions]
+
+
+def build_master_playlist(renditions: list[VideoRenditionEntity]) -> str:
+    lines = ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-INDEPENDENT-SEGMENTS']
+
+    for rendition in renditions:
+        lines += [
+            f'#EXT-X-STREAM-INF:BANDWIDTH={rendition.bandwidth},RESOLUTION={rendition.width}x{rendition.height}',
+            f'{rendition.name}/{HLS_RENDITION_PLAYLIST_NAME}',
+        ]
+
+    return '\n'.join(lines) + '\n'
+
+
+@dataclass
+class BaseVideoTranscodingService(ABC):
+    video_service: BaseVideoService
+    boto_provider: BaseBotoFileProvider
+    celery_file_provider: BaseCeleryFileProvider
+    transcoder_provider: BaseVideoTranscoderProvider
+    tasks_provider: BaseVideoTranscodingTasksProvider
+
+    @abstractmethod
+    def schedule_transcoding(self, video_id: str) -> None: ...
+
+    @abstractmethod
+    def transcode(self, video_id: str) -> list[VideoRenditionEntity]:
+        """Transcode the video and return its saved renditions, or an empty
+        list if the video has been deleted during transcoding."""
+        ...
+
+
+class VideoTranscodingService(BaseVideoTranscodingService):
+    """Transcodes uploaded videos into HLS renditions stored under the
+    video HLS prefix in S3."""
+
+    def schedule_transcoding(self, video_id: str) -> None:
+        if settings.VIDEO_TRANSCODING_ENABLED:
+            self.tasks_provider.transcode_video(video_id=video_id)
+
+    def _upload_files(self, paths: list[str], output_dir: str, prefix: str) -> None:
+        def upload(path: str) -> None:
+            self.boto_provider.upload_file(
+                path=path,
+                key=prefix + os.path.relpath(path, output_dir).replace(os.sep, '/'),
+                content_type=HLS_CONTENT_TYPES[os.path.splitext(path)[1]],
+            )
+
+        # The shared S3 client is thread-safe, so segments are uploaded concurrently
+        with ThreadPoolExecutor(max_workers=settings.VIDEO_TRANSCODING_UPLOAD_WORKERS) as executor:
+            list(executor.map(upload, paths))
+
+    def _upload_hls(self, output_dir: str, prefix: str) -> None:
+        """Upload segments before playlists, so a playlist never references a
+        segment missing in S3."""
+
+        paths = [
+            os.path.join(directory, filename)
+            for directory, _, filenames in os.walk(output_dir)
+            for filename in filenames
+        ]
+
+        self._upload_files(paths=[path for path in paths if path.endswith('.ts')], output_dir=output_dir, prefix=prefix)
+        self._upload_files(
+            paths=[path for path in paths if path.endswith('.m3u8') and not path.endswith(HLS_MASTER_PLAYLIST_NAME)],
+            output_dir=output_dir,
+            prefix=prefix,
+        )
+        self._upload_files(
+            paths=[os.path.join(output_dir, HLS_MASTER_PLAYLIST_NAME)],
+            output_dir=output_dir,
+            prefix=prefix,
+        )
+
+    def transcode(self, video_id: str) -> list[VideoRenditionEntity]:
+        video = self.video_service.get_video_by_id_or_404(video_id=video_id)
+        prefix = get_hls_prefix(video_id=video.id)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, 'source' + os.path.splitext(video.s3_key)[1])
+            output_dir = os.path.join(temp_dir, 'hls')
+
+            self.boto_provider.download_file(key=video.s3_key, path=source_path)
+
+            try:
+                probe = self.transcoder_provider.probe(path=source_path)
+                ladder = select_hls_renditions(width=probe['width'], height=probe['height'])
+
+                self.transcoder_provider.transcode_to_hls(
+                    source_path=source_path,
+                    output_dir=output_dir,
+                    renditions=ladder,
+                    has_audio=probe['has_audio'],
+                )
+            except (subprocess.SubprocessError, StopIteration, KeyError) as error:
+                stderr = getattr(error, 'stderr', None)
+                raise VideoTranscodingError(video_id=video.id, error=stderr.decode()[-1000:] if stderr else repr(error))
+
+            renditions = [
+                VideoRenditionEntity(
+                    video_id=video.id,
+                    name=rendition['name'],
+                    width=rendition['width'],
+                    height=rendition['height'],
+                    bandwidth=(rendition['video_bitrate'] + rendition['audio_bitrate'] * probe['has_audio']) * 1000,
+                    playlist_key=f'{prefix}{rendition["name"]}/{HLS_RENDITION_PLAYLIST_NAME}',
+                )
+                for rendition in ladder
+            ]
+
+            with open(os.path.join(output_dir, HLS_MASTER_PLAYLIST_NAME), 'w') as master_playlist:
+                master_playlist.write(build_master_playlist(renditions=renditions))
+
+            self._upload_hls(output_dir=output_dir, prefix=prefix)
+
+        if not self.video_service.replace_video_renditions(video_id=video.id, renditions=renditions):
+            # The video has been deleted while it was transcoded, so nothing references the uploaded files
+            self.celery_file_provider.delete_objects_by_prefixes(prefixes=[prefix])
+            return []
+
+        return renditions
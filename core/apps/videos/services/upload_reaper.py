@@ -0,0 +1,127 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.apps.common.services.files import BaseS3FileService
+from core.apps.videos.services.videos import BaseVideoService
+
+
+@dataclass
+class UploadReaperMetrics:
+    videos_checked: int = 0
+    videos_deleted: int = 0
+    uploads_aborted: int = 0
+    abort_batches: int = 0
+    # Stale uploads over the per-run limit are left for the next run
+    uploads_skipped: int = 0
+
+
+@dataclass
+class _ReaperRun:
+    stale_uploads: dict[str, str]
+    metrics: UploadReaperMetrics = field(default_factory=UploadReaperMetrics)
+
+
+@dataclass
+class BaseVideoUploadReaperService(ABC):
+    video_service: BaseVideoService
+    files_service: BaseS3FileService
+
+    @abstractmethod
+    def reap(self) -> UploadReaperMetrics: ...
+
+
+class VideoUploadReaperService(BaseVideoUploadReaperService):
+    """Aborts abandoned multipart uploads of videos and deletes videos that
+    have never been uploaded.
+
+    Aborts are sent to the media queue in batches with a growing countdown,
+    so a large backlog is spread over time instead of flooding the queue.
+
+    """
+
+    def _abort_batch(self, run: _ReaperRun, uploads: list[tuple[str, str]]) -> None:
+        countdown = run.metrics.abort_batches * settings.VIDEO_UPLOAD_REAPER_BATCH_INTERVAL
+
+        for key, upload_id in uploads:
+            self.files_service.abort_multipart_upload(key=key, upload_id=upload_id, countdown=countdown)
+
+        run.metrics.uploads_aborted += len(uploads)
+        run.metrics.abort_batches += 1
+
+    def _reap_videos_batch(
+        self, run: _ReaperRun, videos: list[tuple[str, str | None]], created_before: datetime
+    ) -> None:
+        aborts_left = settings.VIDEO_UPLOAD_REAPER_MAX_ABORTS - run.metrics.uploads_aborted
+        uploads, video_ids = [], []
+
+        for video_id, upload_id in videos:
+            if upload_id in run.stale_uploads:
+                key = run.stale_uploads.pop(upload_id)
+
+                if len(uploads) >= aborts_left:
+                    # The video is kept until its upload can be aborted
+                    run.metrics.uploads_skipped += 1
+                    continue
+
+                uploads.append((key, upload_id))
+
+            video_ids.append(video_id)
+
+        if uploads:
+            self._abort_batch(run=run, uploads=uploads)
+
+        run.metrics.videos_checked += len(videos)
+        run.metrics.videos_deleted += self.video_service.delete_stale_uploading_videos(
+            video_ids=video_ids,
+            created_before=created_before,
+        )
+
+    def reap(self) -> UploadReaperMetrics:
+        batch_size = settings.VIDEO_UPLOAD_REAPER_BATCH_SIZE
+        created_before = timezone.now() - timedelta(hours=settings.VIDEO_UPLOAD_REAPER_STALE_AFTER_HOURS)
+
+        run = _ReaperRun(
+            stale_uploads=self.files_service.get_stale_multipart_uploads(
+                prefix=settings.AWS_S3_VIDEO_BUCKET_PREFIX or '',
+                initiated_before=created_before,
+            ),
+        )
+
+        # Videos are streamed from the database, so the whole backlog is never loaded into memory
+        batch = []
+
+        for video in self.video_service.get_stale_uploading_videos(
+            created_before=created_before, chunk_size=batch_size
+        ):
+            batch.append(video)
+
+            if len(batch) >= batch_size:
+                self._reap_videos_batch(run=run, videos=batch, created_before=created_before)
+                batch = []
+
+        if batch:
+            self._reap_videos_batch(run=run, videos=batch, created_before=created_before)
+
+        # Uploads left in S3 without a video, e.g. the video has been deleted during the upload
+        orphaned_uploads = [(key, upload_id) for upload_id, key in run.stale_uploads.items()]
+        aborts_left = max(settings.VIDEO_UPLOAD_REAPER_MAX_ABORTS - run.metrics.uploads_aborted, 0)
+
+        for start in range(0, min(len(orphaned_uploads), aborts_left), batch_size):
+            self._abort_batch(run=run, uploads=orphaned_uploads[start : min(start + batch_size, aborts_left)])
+
+        run.metrics.uploads_skipped += max(len(orphaned_uploads) - aborts_left, 0)
+
+        return run.metrics
@@ -4,6 +4,7 @@ from abc import (
 )
 from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
 
 from django.db.models import (
     Count,
@@ -14,10 +15,15 @@ from core.apps.channels.entities.channels import ChannelEntity
 from core.apps.channels.models import Channel
 from core.apps.channels.repositories.channels import BaseChannelRepository
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.constants import CONTENT_VERSION_SCOPES
+from core.apps.common.services.content_versions import BaseContentVersionService
 from core.apps.users.entities import UserEntity
 from core.apps.videos.converters.playlists import playlist_to_entity
 from core.apps.videos.entities.playlists import PlaylistEntity
-from core.apps.videos.entities.videos import VideoEntity
+from core.apps.videos.entities.videos import (
+    VideoEntity,
+    VideoRenditionEntity,
+)
 from core.apps.videos.exceptions.playlists import (
     PlaylistIdNotProvidedError,
     PlaylistNotFoundError,
@@ -101,6 +107,7 @@ class BaseVideoService(ABC):
     channel_repository: BaseChannelRepository
     channel_service: BaseChannelService
     validator_service: BaseVideoValidatorService
+    content_version_service: BaseContentVersionService
 
     @abstractmethod
     def video_create(self, video_entity: VideoEntity) -> None: ...
@@ -111,12 +118,18 @@ class BaseVideoService(ABC):
     @abstractmethod
     def get_video_by_key(self, key: str) -> VideoEntity: ...
 
+    @abstractmethod
+    def get_videos_by_keys(self, keys: list[str]) -> list[VideoEntity]: ...
+
     @abstractmethod
     def get_video_by_id_with_reports_count(self, video_id: str) -> VideoEntity: ...
 
     @abstractmethod
     def get_video_by_id_or_404(self, video_id: str) -> VideoEntity: ...
 
+    @abstractmethod
+    def get_video_content_scopes(self, video_id: str) -> list[str]: ...
+
     @abstractmethod
     def update_is_reported_field(self, video: VideoEntity, is_reported: bool) -> None: ...
 
@@ -131,6 +144,22 @@ class BaseVideoService(ABC):
     @abstractmethod
     def delete_video_by_id(self, video_id: str) -> None: ...
 
+    @abstractmethod
+    def get_stale_uploading_videos(
+        self,
+        created_before: datetime,
+        chunk_size: int,
+    ) -> Iterable[tuple[str, str | None]]: ...
+
+    @abstractmethod
+    def delete_stale_uploading_videos(self, video_ids: list[str], created_before: datetime) -> int: ...
+
+    @abstractmethod
+    def get_video_renditions(self, video_id: str) -> list[VideoRenditionEntity]: ...
+
+    @abstractmethod
+    def replace_video_renditions(self, video_id: str, renditions: list[VideoRenditionEntity]) -> bool: ...
+
     @abstractmethod
     def like_create(self, user: UserEntity, video_id: str, is_like: bool) -> dict: ...
 
@@ -169,6 +198,9 @@ class ORMVideoService(BaseVideoService):
             raise VideoNotFoundByKeyError(key=key)
         return video
 
+    def get_videos_by_keys(self, keys: list[str]) -> list[VideoEntity]:
+        return self.video_repository.get_videos_by_keys(keys=keys)
+
     def get_video_by_id_with_reports_count(self, video_id: str) -> VideoEntity:
         video = self.video_repository.get_video_by_id_with_reports_count(video_id)
 
@@ -183,6 +215,16 @@ class ORMVideoService(BaseVideoService):
             raise VideoNotFoundByVideoIdError(video_id=video_id)
         return video
 
+    def get_video_content_scopes(self, video_id: str) -> list[str]:
+        """Return content version scopes of the video and its author."""
+
+        video = self.video_repository.get_video_by_id_or_none(video_id=video_id)
+        scopes = [CONTENT_VERSION_SCOPES['video'] + video_id]
+
+        if video is not None:
+            scopes.append(CONTENT_VERSION_SCOPES['channel'] + str(video.author_id))
+        return scopes
+
     def update_is_reported_field(self, video: VideoEntity, is_reported: bool) -> None:
         self.video_repository.update_is_reported_field(video, is_reported)
 
@@ -197,10 +239,28 @@ class ORMVideoService(BaseVideoService):
             upload_id=upload_id,
             s3_key=s3_key,
         )
+        # The video is updated without signals
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + video_id])
 
     def delete_video_by_id(self, video_id: str) -> None:
         self.video_repository.delete_video_by_id(video_id=video_id)
 
+    def get_stale_uploading_videos(
+        self,
+        created_before: datetime,
+        chunk_size: int,
+    ) -> Iterable[tuple[str, str | None]]:
+        return self.video_repository.get_stale_uploading_videos(created_before=created_before, chunk_size=chunk_size)
+
+    def delete_stale_uploading_videos(self, video_ids: list[str], created_before: datetime) -> int:
+        return self.video_repository.delete_stale_uploading_videos(video_ids=video_ids, created_before=created_before)
+
+    def get_video_renditions(self, video_id: str) -> list[VideoRenditionEntity]:
+        return self.video_repository.get_video_renditions(video_id=video_id)
+
+    def replace_video_renditions(self, video_id: str, renditions: list[VideoRenditionEntity]) -> bool:
+        return self.video_repository.replace_video_renditions(video_id=video_id, renditions=renditions)
+
     def like_create(self, user: UserEntity, video_id: str, is_like: bool) -> dict:
         channel, video = self._user_and_video_validate(user, video_id)
 
@@ -209,6 +269,7 @@ class ORMVideoService(BaseVideoService):
         if not created and like.is_like != is_like:
             self.video_repository.update_is_like_field(like, is_like)
 
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + video.id])
         return {'detail': 'Success', 'is_like': is_like}
 
     def like_delete(self, user: UserEntity, video_id: str) -> dict:
@@ -219,6 +280,7 @@ class ORMVideoService(BaseVideoService):
         if not deleted:
             raise VideoLikeNotFoundError(channel_slug=channel.slug, video_id=video.id)
 
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + video.id])
         return {'detail': 'Success'}
 
     def view_create(self, user: UserEntity, video_id: str, ip_address: str) -> dict:
@@ -233,16 +295,19 @@ class ORMVideoService(BaseVideoService):
             )
 
         self.video_repository.create_view(channel, video, ip_address)
+        # Only the video and the pages of listings showing it are invalidated
+        self.content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + video.id])
         return {'detail': 'Success'}
 
-    def get_videos_for_listing(self) -> Iterable[Video]:
-        return (
-            self.video_repository.get_videos_list()
-            .select_related('author')
-            .filter(status=Video.VideoStatus.PUBLIC, upload_status=Video.UploadStatus.FINISHED)
-            .annotate(views_count=Count('views', distinct=True))
+    def get_public_videos(self) -> Iterable[Video]:
+        return self.video_repository.get_videos_list().filter(
+            status=Video.VideoStatus.PUBLIC,
+            upload_status=Video.UploadStatus.FINISHED,
         )
 
+    def get_videos_for_listing(self) -> Iterable[Video]:
+        return self.get_public_videos().select_related('author').annotate(views_count=Count('views', distinct=True))
+
     def get_videos_for_retrieve(self) -> Iterable[Video]:
         return (
             self.video_repository.get_videos_list()
@@ -364,6 +429,9 @@ class BaseVideoPlaylistService(ABC):
     @abstractmethod
     def get_playlist_by_id_or_error(self, playlist_id: str) -> PlaylistEntity: ...
 
+    @abstractmethod
+    def get_playlist_content_scopes(self, playlist_id: str) -> list[str]: ...
+
 
 @dataclass
 class ORMVideoPlaylistService(BaseVideoPlaylistService):
@@ -457,3 +525,13 @@ class ORMVideoPlaylistService(BaseVideoPlaylistService):
         if playlist is not None:
             return playlist_to_entity(playlist)
         raise PlaylistNotFoundError(playlist_id=playlist_id)
+
+    def get_playlist_content_scopes(self, playlist_id: str) -> list[str]:
+        """Return content version scopes of the playlist and its channel."""
+
+        playlist = self.playlist_repository.get_playlist_by_id(playlist_id=playlist_id)
+        scopes = [CONTENT_VERSION_SCOPES['playlist'] + str(playlist_id)]
+
+        if playlist is not None:
+            scopes.append(CONTENT_VERSION_SCOPES['channel'] + str(playlist.channel_id))
+        return scopes
@@ -1,12 +1,29 @@
 import punq
+from django.db import transaction
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
 from django.dispatch import (
     Signal,
     receiver,
 )
 
-from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.constants import (
+    CACHE_KEYS,
+    CACHE_TAGS,
+    CONTENT_VERSION_SCOPES,
+)
+from core.apps.common.providers.cache import BaseCacheProvider
 from core.apps.common.providers.files import BaseCeleryFileProvider
-from core.apps.videos.models import Video
+from core.apps.common.services.content_versions import BaseContentVersionService
+from core.apps.videos.models import (
+    Playlist,
+    PlaylistItem,
+    Video,
+    VideoComment,
+)
+from core.apps.videos.services.transcoding import get_hls_prefix
 from core.project.containers import get_container
 
 video_pre_delete = Signal()
@@ -22,3 +39,57 @@ def delete_existing_s3_video_signal(instance, **kwargs):
             key=instance.s3_key,
             cache_key=CACHE_KEYS['s3_video_url'] + instance.s3_key,
         )
+        # HLS renditions are stored under their own prefix and are deleted together with the original file
+        celery_provider.delete_objects_by_prefixes(prefixes=[get_hls_prefix(video_id=instance.pk)])
+
+
+@receiver(signal=[post_save, post_delete], sender=Video)
+def invalidate_author_channel_cache(instance, **kwargs):
+    """This signal will delete cached data of the author's channel if video
+    has been created or deleted, as the channel's videos count has
+    changed."""
+
+    if not kwargs.get('created', True):
+        return
+
+    container: punq.Container = get_container()
+    cache_provider: BaseCacheProvider = container.resolve(BaseCacheProvider)
+
+    # Cache is deleted after the transaction, so no one caches the data again before the change is committed
+    transaction.on_commit(lambda: cache_provider.invalidate_tags(tags=[f'{CACHE_TAGS["channel"]}{instance.author_id}']))
+
+
+@receiver(signal=[post_save, post_delete], sender=Video)
+def bump_video_content_version(instance, **kwargs):
+    """This signal will change the version of the video, so ETags of the
+    video and of the lists showing it don't match anymore."""
+
+    container: punq.Container = get_container()
+    content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
+
+    content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + instance.pk])
+
+
+@receiver(signal=[post_save, post_delete], sender=VideoComment)
+def bump_video_comments_content_version(instance, **kwargs):
+    """This signal will change the version of the video, as its comments
+    count has changed."""
+
+    container: punq.Container = get_container()
+    content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
+
+    content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['video'] + instance.video_id])
+
+
+@receiver(signal=[post_save, post_delete], sender=Playlist)
+@receiver(signal=[post_save, post_delete], sender=PlaylistItem)
+def bump_playlist_content_version(instance, **kwargs):
+    """This signal will change the version of the playlist if the playlist
+    or its videos have been changed, so ETags of the playlist and of the
+    lists showing it don't match anymore."""
+
+    container: punq.Container = get_container()
+    content_version_service: BaseContentVersionService = container.resolve(BaseContentVersionService)
+
+    playlist_id = instance.pk if isinstance(instance, Playlist) else instance.playlist_id
+    content_version_service.bump(scopes=[CONTENT_VERSION_SCOPES['playlist'] + str(playlist_id)])
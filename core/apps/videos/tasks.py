@@ -0,0 +1,65 @@
+from dataclasses import asdict
+from logging import Logger
+
+import orjson
+import punq
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+)
+from celery import shared_task
+
+from core.apps.common.exceptions.exceptions import ServiceException
+from core.apps.videos.services.transcoding import BaseVideoTranscodingService
+from core.apps.videos.services.upload_reaper import BaseVideoUploadReaperService
+from core.project.containers import get_container
+
+
+@shared_task(bind=True)
+def reap_abandoned_video_uploads_task(self) -> dict:
+    container: punq.Container = get_container()
+    reaper_service: BaseVideoUploadReaperService = container.resolve(BaseVideoUploadReaperService)
+    logger: Logger = container.resolve(Logger)
+
+    logger.info('Start reaping abandoned video uploads')
+    metrics = asdict(reaper_service.reap())
+
+    logger.info(
+        'Abandoned video uploads reaped',
+        extra={'log_meta': orjson.dumps(metrics).decode()},
+    )
+
+    return metrics
+
+
+@shared_task(bind=True, max_retries=3)
+def transcode_video_task(self, video_id: str) -> None:
+    container: punq.Container = get_container()
+    transcoding_service: BaseVideoTranscodingService = container.resolve(BaseVideoTranscodingService)
+    logger: Logger = container.resolve(Logger)
+
+    try:
+        renditions = transcoding_service.transcode(video_id=video_id)
+
+    except (ClientError, BotoCoreError) as error:
+        logger.error(
+            'S3 error during video transcoding',
+            extra={'log_meta': orjson.dumps({'video_id': video_id, 'error': str(error)}).decode()},
+        )
+        raise self.retry(exc=error, countdown=60)
+    except ServiceException as error:
+        # Videos that cannot be transcoded or have been deleted are not retried
+        logger.error(error.message, extra={'log_meta': orjson.dumps(error).decode()})
+        return
+
+    if not renditions:
+        logger.info(
+            'Video has been deleted during transcoding, its HLS files are deleted',
+            extra={'log_meta': orjson.dumps({'video_id': video_id}).decode()},
+        )
+        return
+
+    logger.info(
+        'Video has been transcoded into HLS',
+        extra={'log_meta': orjson.dumps({'video_id': video_id, 'renditions': len(renditions)}).decode()},
+    )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.videos.converters.comments import data_to_video_comment_entity
 from core.apps.videos.entities.comments import VideoCommentEntity
@@ -9,6 +10,7 @@ from core.apps.videos.services.comments import BaseVideoCommentService
 from core.apps.videos.services.videos import BaseVideoPrivateOrUploadingValidatorService
 
 
+@instrument
 @dataclass
 class CreateVideoCommentUseCase:
     channel_service: BaseChannelService
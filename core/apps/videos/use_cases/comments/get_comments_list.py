@@ -2,6 +2,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.videos.models import VideoComment
 from core.apps.videos.services.comments import BaseVideoCommentService
@@ -11,6 +12,7 @@ from core.apps.videos.services.videos import (
 )
 
 
+@instrument
 @dataclass
 class GetVideoCommentsUseCase:
     channel_service: BaseChannelService
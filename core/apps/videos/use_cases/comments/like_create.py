@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.videos.services.comments import BaseVideoCommentService
 
 
+@instrument
 @dataclass
 class VideoCommentLikeCreateUseCase:
     comment_service: BaseVideoCommentService
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.videos.services.videos import BaseVideoHistoryService
 
 
+@instrument
 @dataclass
 class ClearVideoHistoryUseCase:
     channel_service: BaseChannelService
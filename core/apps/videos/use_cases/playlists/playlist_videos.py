@@ -2,6 +2,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.users.entities import UserEntity
 from core.apps.videos.models import Video
 from core.apps.videos.services.videos import (
@@ -10,6 +11,7 @@ from core.apps.videos.services.videos import (
 )
 
 
+@instrument
 @dataclass
 class GetPlaylistVideosUseCase:
     playlist_service: BaseVideoPlaylistService
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import (
     BaseMultipartUploadExistsInS3ValidatorService,
     BaseS3FileService,
@@ -12,6 +13,7 @@ from core.apps.videos.services.videos import (
 )
 
 
+@instrument
 @dataclass
 class AbortVideoMultipartUploadUseCase:
     video_service: BaseVideoService
@@ -1,22 +1,33 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 from core.apps.users.entities import UserEntity
+from core.apps.videos.services.transcoding import BaseVideoTranscodingService
 from core.apps.videos.services.videos import (
     BaseVideoAuthorValidatorService,
     BaseVideoService,
 )
 
 
+@instrument
 @dataclass
 class CompleteVideoMultipartUploadUseCase:
     video_service: BaseVideoService
     channel_service: BaseChannelService
     validator_service: BaseVideoAuthorValidatorService
     files_service: BaseS3FileService
-
-    def execute(self, user: UserEntity, key: str, upload_id: str, parts: list) -> None:
+    transcoding_service: BaseVideoTranscodingService
+
+    def execute(
+        self,
+        user: UserEntity,
+        key: str,
+        upload_id: str,
+        parts_count: int | None = None,
+        parts: list | None = None,
+    ) -> dict:
         author = self.channel_service.get_channel_by_user_or_404(user=user)
         video = self.video_service.get_video_by_upload_id(
             upload_id=upload_id,
@@ -24,10 +35,17 @@ class CompleteVideoMultipartUploadUseCase:
 
         self.validator_service.validate(video=video, author=author)
 
+        # Older clients send their parts, which may be not contiguous. Only the part numbers are used, the ETags
+        # are taken from S3 instead of the client
+        part_numbers = None
+        if parts and not parts_count:
+            part_numbers = [part['PartNumber'] for part in parts]
+
         response = self.files_service.complete_multipart_upload(
             key=key,
             upload_id=upload_id,
-            parts=parts,
+            parts_count=parts_count,
+            part_numbers=part_numbers,
         )
 
         self.video_service.update_video_after_upload(
@@ -35,5 +53,7 @@ class CompleteVideoMultipartUploadUseCase:
             upload_id=upload_id,
             s3_key=response.get('Key'),
         )
+        self.files_service.mark_object_exists(key=response.get('Key'))
+        self.transcoding_service.schedule_transcoding(video_id=video.id)
 
         return {'detail': 'Success'}
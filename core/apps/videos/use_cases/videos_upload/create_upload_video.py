@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 from core.apps.users.entities import UserEntity
 from core.apps.videos.converters.videos import data_to_video_entity
@@ -8,6 +9,7 @@ from core.apps.videos.services.s3_videos import BaseVideoFilenameValidatorServic
 from core.apps.videos.services.videos import BaseVideoService
 
 
+@instrument
 @dataclass
 class CreateVideoMultipartUploadUseCase:
     video_service: BaseVideoService
@@ -2,17 +2,21 @@ from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
 from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 from core.apps.users.entities import (
     AnonymousUserEntity,
     UserEntity,
 )
+from core.apps.videos.constants import HLS_MASTER_PLAYLIST_NAME
+from core.apps.videos.services.transcoding import get_hls_prefix
 from core.apps.videos.services.videos import (
     BasePrivateVideoPermissionValidatorService,
     BaseVideoService,
 )
 
 
+@instrument
 @dataclass
 class GenerateUrlForVideoDownloadUseCase:
     video_service: BaseVideoService
@@ -32,4 +36,21 @@ class GenerateUrlForVideoDownloadUseCase:
             cache_key=CACHE_KEYS['s3_video_url'] + key,
         )
 
-        return {'url': url}
+        hls_url, hls_cookies, hls_cookie_path = None, None, None
+
+        if self.video_service.get_video_renditions(video_id=video.id):
+            prefix = get_hls_prefix(video_id=video.id)
+            # Playlists reference renditions and segments by relative URIs, which players request
+            # without the signed query of the master playlist, so they're authorized by cookies
+            hls_cookies = self.files_service.generate_prefix_signed_cookies(prefix=prefix, expires_in=3600)
+
+            if hls_cookies is not None:
+                master_key = prefix + HLS_MASTER_PLAYLIST_NAME
+                hls_url = self.files_service.generate_prefix_download_urls(
+                    prefix=prefix,
+                    keys=[master_key],
+                    expires_in=3600,
+                )[master_key]
+                hls_cookie_path = f'/{prefix}'
+
+        return {'url': url, 'hls_url': hls_url, 'hls_cookies': hls_cookies, 'hls_cookie_path': hls_cookie_path}
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.instrumentation import instrument
+from core.apps.common.services.files import BaseS3FileService
+from core.apps.users.entities import (
+    AnonymousUserEntity,
+    UserEntity,
+)
+from core.apps.videos.exceptions.videos import PrivateVideoPermissionError
+from core.apps.videos.services.videos import (
+    BasePrivateVideoPermissionValidatorService,
+    BaseVideoService,
+)
+
+
+@instrument
+@dataclass
+class GenerateUrlsForVideosDownloadUseCase:
+    video_service: BaseVideoService
+    channel_service: BaseChannelService
+    files_service: BaseS3FileService
+    permission_validator: BasePrivateVideoPermissionValidatorService
+
+    def execute(self, user: UserEntity | AnonymousUserEntity, keys: list[str]) -> dict:
+        """Return download urls for videos with given keys.
+
+        Keys of not existing videos and private videos of other channels are
+        skipped.
+
+        """
+
+        channel = self.channel_service.get_channel_by_user_or_none(user=user)
+        allowed_keys = []
+
+        for video in self.video_service.get_videos_by_keys(keys=keys):
+            try:
+                self.permission_validator.validate(video=video, channel=channel)
+            except PrivateVideoPermissionError:
+                continue
+
+            allowed_keys.append(video.s3_key)
+
+        urls = self.files_service.generate_download_urls(
+            keys=allowed_keys,
+            expires_in=3600,
+            cache_key_prefix=CACHE_KEYS['s3_video_url'],
+        )
+
+        return {'urls': urls}
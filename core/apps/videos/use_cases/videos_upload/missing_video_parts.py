@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
+from core.apps.common.services.files import BaseS3FileService
+from core.apps.users.entities import UserEntity
+from core.apps.videos.services.videos import (
+    BaseVideoAuthorValidatorService,
+    BaseVideoService,
+)
+
+
+@instrument
+@dataclass
+class GetVideoMissingPartsUseCase:
+    video_service: BaseVideoService
+    channel_service: BaseChannelService
+    author_validator: BaseVideoAuthorValidatorService
+    files_service: BaseS3FileService
+
+    def execute(self, user: UserEntity, key: str, upload_id: str, parts_count: int) -> dict:
+        author = self.channel_service.get_channel_by_user_or_404(user=user)
+        video = self.video_service.get_video_by_upload_id(
+            upload_id=upload_id,
+        )
+        self.author_validator.validate(video=video, author=author)
+
+        missing_parts = self.files_service.get_missing_upload_parts(
+            key=key,
+            upload_id=upload_id,
+            parts_count=parts_count,
+        )
+
+        return {'missing_parts': missing_parts}
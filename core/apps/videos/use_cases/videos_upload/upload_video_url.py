@@ -1,14 +1,17 @@
 from dataclasses import dataclass
 
 from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
 from core.apps.common.services.files import BaseS3FileService
 from core.apps.users.entities import UserEntity
+from core.apps.videos.constants import UPLOAD_PART_URL_EXPIRES_IN
 from core.apps.videos.services.videos import (
     BaseVideoAuthorValidatorService,
     BaseVideoService,
 )
 
 
+@instrument
 @dataclass
 class GenerateUrlForVideoPartUploadUseCase:
     video_service: BaseVideoService
@@ -27,7 +30,7 @@ class GenerateUrlForVideoPartUploadUseCase:
             key=key,
             upload_id=upload_id,
             part_number=part_number,
-            expires_in=120,
+            expires_in=UPLOAD_PART_URL_EXPIRES_IN,
         )
 
         return {'upload_url': url}
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+from core.apps.channels.services.channels import BaseChannelService
+from core.apps.common.instrumentation import instrument
+from core.apps.common.services.files import BaseS3FileService
+from core.apps.users.entities import UserEntity
+from core.apps.videos.constants import (
+    MAX_UPLOAD_PART_URLS_EXPIRES_IN,
+    UPLOAD_PART_URL_EXPIRES_IN,
+    UPLOAD_PART_URL_EXPIRES_IN_PER_PART,
+)
+from core.apps.videos.services.videos import (
+    BaseVideoAuthorValidatorService,
+    BaseVideoService,
+)
+
+
+@instrument
+@dataclass
+class GenerateUrlsForVideoPartsUploadUseCase:
+    video_service: BaseVideoService
+    channel_service: BaseChannelService
+    author_validator: BaseVideoAuthorValidatorService
+    files_service: BaseS3FileService
+
+    @staticmethod
+    def _get_expires_in(parts_count: int) -> int:
+        """URLs of a larger range live longer, so all parts can be uploaded
+        before the first URL expires."""
+
+        expires_in = UPLOAD_PART_URL_EXPIRES_IN + UPLOAD_PART_URL_EXPIRES_IN_PER_PART * (parts_count - 1)
+        return min(expires_in, MAX_UPLOAD_PART_URLS_EXPIRES_IN)
+
+    def execute(
+        self,
+        user: UserEntity,
+        key: str,
+        upload_id: str,
+        first_part_number: int,
+        last_part_number: int,
+    ) -> dict:
+        author = self.channel_service.get_channel_by_user_or_404(user=user)
+        video = self.video_service.get_video_by_upload_id(
+            upload_id=upload_id,
+        )
+        self.author_validator.validate(video=video, author=author)
+
+        part_numbers = range(first_part_number, last_part_number + 1)
+        expires_in = self._get_expires_in(parts_count=len(part_numbers))
+
+        urls = self.files_service.generate_upload_part_urls(
+            key=key,
+            upload_id=upload_id,
+            part_numbers=part_numbers,
+            expires_in=expires_in,
+        )
+
+        return {
+            'expires_in': expires_in,
+            'upload_urls': [{'part_number': part_number, 'upload_url': url} for part_number, url in urls.items()],
+        }
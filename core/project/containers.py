@@ -32,6 +32,6 @@ def _initialize_container() -> punq.Container:
     init_payments(container)
 
     #  Logger
-    container.register(Logger, factory=getLogger, name='django.logger')
+    container.register(Logger, factory=getLogger, scope=punq.Scope.singleton, name='django.logger')
 
     return container
@@ -2,6 +2,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from celery.schedules import crontab
 from kombu import Queue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -96,13 +97,35 @@ DATABASES = {
     },
 }
 
+# Cached values are serialized with pickle or orjson and compressed over the length threshold
+CACHE_SERIALIZER = os.environ.get('CACHE_SERIALIZER', 'pickle')
+CACHE_COMPRESSOR = os.environ.get('CACHE_COMPRESSOR', 'none')
+CACHE_COMPRESS_MIN_LENGTH = int(os.environ.get('CACHE_COMPRESS_MIN_LENGTH', 1024))
+
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': 'redis://redis:6379/1',
+        'OPTIONS': {
+            'SERIALIZER': {
+                'pickle': 'django_redis.serializers.pickle.PickleSerializer',
+                'orjson': 'core.apps.common.clients.cache_codecs.OrjsonCacheSerializer',
+            }[CACHE_SERIALIZER],
+            'COMPRESSOR': 'core.apps.common.clients.cache_codecs.ThresholdCompressor',
+            'COMPRESS_ALGORITHM': CACHE_COMPRESSOR,
+            'COMPRESS_MIN_LENGTH': CACHE_COMPRESS_MIN_LENGTH,
+        },
     },
 }
 
+# In-process cache layer in front of Redis, see TieredCacheProvider
+CACHE_LOCAL_ENABLED = os.environ.get('CACHE_LOCAL_ENABLED') == 'True'
+CACHE_LOCAL_MAX_ENTRIES = int(os.environ.get('CACHE_LOCAL_MAX_ENTRIES', 10000))
+CACHE_LOCAL_TIMEOUT = int(os.environ.get('CACHE_LOCAL_TIMEOUT', 5))
+
+# Prometheus metrics of use case and repository calls, see core.apps.common.instrumentation
+INSTRUMENTATION_ENABLED = os.environ.get('INSTRUMENTATION_ENABLED', 'True') == 'True'
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -277,6 +300,11 @@ AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 AWS_STORAGE_BUCKET_NAME = os.environ.get('AWS_STORAGE_BUCKET_NAME')
 AWS_S3_REGION_NAME = os.environ.get('AWS_S3_REGION_NAME')
+# Points S3 clients to an S3-compatible storage like MinIO for local development
+AWS_S3_ENDPOINT_URL = os.environ.get('AWS_S3_ENDPOINT_URL') or None
+
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_S3_MAX_POOL_CONNECTIONS', 50))
+AWS_S3_MAX_ATTEMPTS = int(os.environ.get('AWS_S3_MAX_ATTEMPTS', 3))
 
 AWS_S3_VIDEO_BUCKET_PREFIX = os.environ.get('AWS_S3_VIDEO_BUCKET_PREFIX')
 AWS_S3_AVATAR_BUCKET_PREFIX = os.environ.get('AWS_S3_AVATAR_BUCKET_PREFIX')
@@ -284,6 +312,8 @@ AWS_S3_AVATAR_BUCKET_PREFIX = os.environ.get('AWS_S3_AVATAR_BUCKET_PREFIX')
 AWS_CLOUDFRONT_DOMAIN = os.environ.get('AWS_CLOUDFRONT_DOMAIN')
 AWS_CLOUDFRONT_KEY_ID = os.environ.get('AWS_CLOUDFRONT_KEY_ID')
 AWS_CLOUDFRONT_KEY = os.environ.get('AWS_CLOUDFRONT_KEY').replace('\\n', '\n').encode('ascii').strip()
+# Domain of HLS signed cookies, e.g. '.example.com' for API and CloudFront on subdomains of one domain
+AWS_CLOUDFRONT_COOKIE_DOMAIN = os.environ.get('AWS_CLOUDFRONT_COOKIE_DOMAIN') or None
 
 
 # Celery
@@ -308,8 +338,18 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TASK_QUEUES = (
     Queue('media-queue'),
     Queue('email-queue'),
+    # CPU-bound ffmpeg transcoding runs on its own workers, so it doesn't delay short S3 tasks
+    Queue('transcoding-queue'),
 )
 
+CELERY_BEAT_SCHEDULE = {
+    'reap-abandoned-video-uploads': {
+        'task': 'core.apps.videos.tasks.reap_abandoned_video_uploads_task',
+        'schedule': crontab(minute=15),
+        'options': {'queue': 'media-queue'},
+    },
+}
+
 
 # SMTP & Email
 
@@ -382,6 +422,27 @@ V2_VISIBLE_GOOGLE_RECAPTCHA_PRIVATE_KEY = os.environ.get('V2_VISIBLE_GOOGLE_RECA
 V2_INVISIBLE_GOOGLE_RECAPTCHA_PRIVATE_KEY = os.environ.get('V2_INVISIBLE_GOOGLE_RECAPTCHA_PRIVATE_KEY')
 
 
+# Comments
+
+COMMENTS_THREADED_MODE = os.environ.get('COMMENTS_THREADED_MODE') == 'True'
+
+
+# Abandoned video uploads
+
+VIDEO_UPLOAD_REAPER_STALE_AFTER_HOURS = int(os.environ.get('VIDEO_UPLOAD_REAPER_STALE_AFTER_HOURS', 24))
+VIDEO_UPLOAD_REAPER_BATCH_SIZE = int(os.environ.get('VIDEO_UPLOAD_REAPER_BATCH_SIZE', 100))
+VIDEO_UPLOAD_REAPER_BATCH_INTERVAL = int(os.environ.get('VIDEO_UPLOAD_REAPER_BATCH_INTERVAL', 10))
+VIDEO_UPLOAD_REAPER_MAX_ABORTS = int(os.environ.get('VIDEO_UPLOAD_REAPER_MAX_ABORTS', 10000))
+
+
+# Video transcoding
+
+VIDEO_TRANSCODING_ENABLED = os.environ.get('VIDEO_TRANSCODING_ENABLED') == 'True'
+VIDEO_TRANSCODING_THREADS = int(os.environ.get('VIDEO_TRANSCODING_THREADS', 0))
+VIDEO_TRANSCODING_TIMEOUT = int(os.environ.get('VIDEO_TRANSCODING_TIMEOUT', 2 * 60 * 60))
+VIDEO_TRANSCODING_UPLOAD_WORKERS = int(os.environ.get('VIDEO_TRANSCODING_UPLOAD_WORKERS', 8))
+
+
 # Stripe
 
 STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY')
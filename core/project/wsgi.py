@@ -8,9 +8,41 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 """
 
 import os
+from importlib import import_module
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f'core.project.settings.{os.environ.get("DJANGO_SETTINGS_FILE")}')
 
 application = get_wsgi_application()
+
+# Modules the code imports lazily to keep celery and management commands fast to start,
+# the web process imports them with the app so preloaded workers don't import them per worker
+PRELOADED_MODULES = (
+    'stripe',
+    'boto3.session',
+    'botocore.config',
+    'botocore.signers',
+)
+
+
+def _load_app() -> None:
+    """Import views, lazily imported modules and build the container before
+    the first request.
+
+    With 'preload_app' it's done once in the gunicorn master, so forked
+    workers start ready. Shared clients reset their connections and locks
+    in forked workers.
+
+    """
+
+    from core.project.containers import get_container
+
+    import_module(settings.ROOT_URLCONF)
+    for name in PRELOADED_MODULES:
+        import_module(name)
+    get_container()
+
+
+_load_app()
@@ -72,3 +72,64 @@ def test_channel_about_data_retrieved_correctly(
     assert response.data.get('total_views') == expected_views, 'incorrect views'
     assert response.data.get('total_videos') == channel.videos.count(), 'incorrect videos'
     assert response.data.get('total_subs') == channel.followers.count(), 'incorrect subs'
+
+
+@pytest.mark.django_db
+def test_channel_subscribers_returned_from_cached_body(client: APIClient, jwt_and_channel):
+    """Test that the subscribers list has been rendered once and returned with
+    the same body and ETag from the cache."""
+
+    jwt, channel = jwt_and_channel
+    SubscriptionItemModelFactory.create_batch(size=3, subscribed_to=channel)
+    client.credentials(HTTP_AUTHORIZATION=jwt)
+
+    first_response = client.get('/v1/channel/subscribers/')
+    second_response = client.get('/v1/channel/subscribers/')
+
+    assert first_response.status_code == 200
+    assert first_response['Content-Type'] == 'application/json'
+    assert len(first_response.json()['results']) == 3
+    assert second_response.content == first_response.content
+    assert second_response['ETag'] == first_response['ETag']
+
+
+@pytest.mark.django_db
+def test_channel_about_cache_invalidated_after_subscription(
+    client: APIClient,
+    channel: Channel,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the cached about page has been deleted after the channel got
+    a new subscriber."""
+
+    url = f'/v1/channels/{channel.slug}/about'
+
+    assert client.get(url).data.get('total_subs') == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        SubscriptionItemModelFactory.create(subscribed_to=channel)
+
+    assert client.get(url).data.get('total_subs') == 1
+
+
+@pytest.mark.django_db
+def test_channel_about_cache_invalidated_after_subscription_committed(
+    client: APIClient,
+    channel: Channel,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the cached about page has been deleted only after the
+    transaction of the new subscription was committed."""
+
+    url = f'/v1/channels/{channel.slug}/about'
+    client.get(url)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        SubscriptionItemModelFactory.create(subscribed_to=channel)
+
+    assert client.get(url).data.get('total_subs') == 0
+
+    for callback in callbacks:
+        callback()
+
+    assert client.get(url).data.get('total_subs') == 1
@@ -96,3 +96,131 @@ def test_video_search(client: APIClient):
 
     assert response.status_code == 200
     assert len(response.data.get('results')) == 2
+
+
+@pytest.mark.django_db
+def test_video_not_modified(client: APIClient, video: Video):
+    """Test that 304 has been returned for a matching If-None-Match header."""
+
+    url = f'/v1/videos/{video.video_id}/'
+    etag = client.get(url).headers['ETag']
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+@pytest.mark.django_db
+def test_video_modified_after_view(client: APIClient, jwt: str, video: Video, django_capture_on_commit_callbacks):
+    """Test that the ETag of a video has changed after a view has been
+    created."""
+
+    url = f'/v1/videos/{video.video_id}/'
+    etag = client.get(url).headers['ETag']
+
+    client.credentials(HTTP_AUTHORIZATION=jwt)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(f'/v1/videos/{video.video_id}/view/')
+    client.credentials()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_videos_list_modified_after_view(
+    client: APIClient,
+    jwt: str,
+    video: Video,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the ETag of a video listing showing the video has changed
+    after a view has been created, as the listing shows views count."""
+
+    data = {'search': video.name}
+    etag = client.get('/v1/videos/', data).headers['ETag']
+
+    client.credentials(HTTP_AUTHORIZATION=jwt)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(f'/v1/videos/{video.video_id}/view/')
+    client.credentials()
+
+    response = client.get('/v1/videos/', data, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_videos_list_not_modified_after_other_video_view(
+    client: APIClient,
+    jwt: str,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the ETag of a video listing has not changed after a view of
+    a video not shown in the listing has been created."""
+
+    VideoModelFactory.create(name='listed')
+    other_video = VideoModelFactory.create(name='other')
+
+    data = {'search': 'listed'}
+    etag = client.get('/v1/videos/', data).headers['ETag']
+
+    client.credentials(HTTP_AUTHORIZATION=jwt)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(f'/v1/videos/{other_video.video_id}/view/')
+    client.credentials()
+
+    response = client.get('/v1/videos/', data, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_video_modified_after_author_updated(client: APIClient, video: Video, django_capture_on_commit_callbacks):
+    """Test that the ETag of a video has changed after its author channel
+    has been updated."""
+
+    url = f'/v1/videos/{video.video_id}/'
+    etag = client.get(url).headers['ETag']
+
+    with django_capture_on_commit_callbacks(execute=True):
+        video.author.name = 'New channel name'
+        video.author.save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_video_modified_after_comment_thread_deleted(
+    client: APIClient,
+    jwt_and_channel: tuple,
+    video: Video,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the ETag of a video has changed after a comment thread has
+    been deleted, as its comments count has changed."""
+
+    jwt, channel = jwt_and_channel
+    comment = VideoCommentModelFactory(author=channel, video=video)
+
+    url = f'/v1/videos/{video.video_id}/'
+    etag = client.get(url).headers['ETag']
+
+    client.credentials(HTTP_AUTHORIZATION=jwt)
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_response = client.delete(f'/v1/videos-comments/{comment.pk}/')
+    client.credentials()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert delete_response.status_code == 204
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.json()['comments_count'] == 0
@@ -1,6 +1,10 @@
+from collections.abc import Callable
+
 import punq
 import pytest
 import stripe
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from django.core.cache import cache
 from punq import Container
 from pytest_django.fixtures import SettingsWrapper
@@ -8,6 +12,11 @@ from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.apps.channels.models import Channel
+from core.apps.common.clients.boto_client import BotoClient
+from core.apps.common.providers.files import (
+    BaseBotoFileProvider,
+    BaseCeleryFileProvider,
+)
 from core.apps.common.providers.senders import BaseSenderProvider
 from core.apps.common.services.encoding import BaseEncodingService
 from core.apps.payments.enums import StripeSubscriptionStatusesEnum
@@ -20,10 +29,7 @@ from core.apps.posts.models import (
 from core.apps.users.models import CustomUser
 from core.apps.users.services.codes import BaseCodeService
 from core.apps.videos.models import Video
-from core.project.containers import (
-    _initialize_container,
-    get_container,
-)
+from core.project.containers import _initialize_container
 from core.tests.factories.channels import (
     ChannelModelFactory,
     UserModelFactory,
@@ -33,6 +39,10 @@ from core.tests.factories.posts import (
     PostModelFactory,
 )
 from core.tests.factories.videos import VideoModelFactory
+from core.tests.mocks.common.providers.files import (
+    DummyBotoFileProvider,
+    DummyCeleryFileProvider,
+)
 from core.tests.mocks.common.providers.senders import DummySenderProvider
 from core.tests.mocks.payments.stripe import DummyStripeProvider
 
@@ -69,7 +79,14 @@ def disable_silk_middleware(settings: SettingsWrapper):
 
 @pytest.fixture
 def container() -> Container:
-    return get_container()
+    """Services are registered as singletons, so a registration overridden
+    after the service has been resolved is ignored.
+
+    For this reason, every test gets a new container instead of the
+    cached one returned by 'get_container'.
+
+    """
+    return _initialize_container()
 
 
 @pytest.fixture
@@ -91,6 +108,20 @@ def mock_container() -> Container:
     return container
 
 
+@pytest.fixture
+def dummy_boto_provider(mock_container: punq.Container) -> DummyBotoFileProvider:
+    provider = DummyBotoFileProvider(boto_client=BotoClient())
+    mock_container.register(BaseBotoFileProvider, instance=provider)
+    return provider
+
+
+@pytest.fixture
+def dummy_celery_provider(mock_container: punq.Container) -> DummyCeleryFileProvider:
+    provider = DummyCeleryFileProvider()
+    mock_container.register(BaseCeleryFileProvider, instance=provider)
+    return provider
+
+
 @pytest.fixture
 def client() -> APIClient:
     return APIClient()
@@ -147,6 +178,33 @@ def post_comment() -> PostCommentItem:
     return PostCommentModelFactory()
 
 
+def _generate_private_key_pem() -> bytes:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+@pytest.fixture
+def cloudfront_settings(settings: SettingsWrapper) -> SettingsWrapper:
+    """Set CloudFront settings with a generated RSA key, so urls can be signed
+    locally."""
+
+    settings.AWS_CLOUDFRONT_DOMAIN = 'test.cloudfront.net'
+    settings.AWS_CLOUDFRONT_KEY_ID = 'TEST_KEY_ID'
+    settings.AWS_CLOUDFRONT_KEY = _generate_private_key_pem()
+    return settings
+
+
+@pytest.fixture
+def private_key_pem_factory() -> Callable[[], bytes]:
+    """Returns a function generating a new RSA private key in PEM format on
+    every call, e.g. to rotate the CloudFront key."""
+
+    return _generate_private_key_pem
+
+
 @pytest.fixture
 def code_service(container: punq.Container) -> BaseCodeService:
     return container.resolve(BaseCodeService)
@@ -0,0 +1,92 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from botocore.exceptions import ClientError
+
+from core.apps.common.adapters.boto_file_provider import (
+    BotoCloudfrontFileProvider,
+    BotoFileProvider,
+)
+from core.apps.common.providers.files import BaseCeleryFileProvider
+
+
+@dataclass
+class DummyBotoFileProvider(BotoCloudfrontFileProvider):
+    """Signs urls locally, answers every HEAD request as if the object does
+    not exist in S3 and keeps multipart upload parts in memory."""
+
+    head_object_calls: int = 0
+    list_parts_calls: int = 0
+    uploaded_parts: dict[int, str] = field(default_factory=dict)
+    completed_parts: list[dict] | None = None
+    multipart_uploads: list[dict] = field(default_factory=list)
+    uploaded_files: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def head_object(self, key: str) -> None:
+        self.head_object_calls += 1
+        raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+
+    def list_parts(self, key: str, upload_id: str, max_parts: int | None = None) -> list[dict]:
+        self.list_parts_calls += 1
+        return [{'PartNumber': number, 'ETag': etag} for number, etag in sorted(self.uploaded_parts.items())]
+
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list) -> dict:
+        if any(self.uploaded_parts.get(part['PartNumber']) != part['ETag'] for part in parts):
+            raise ClientError({'Error': {'Code': 'InvalidPart', 'Message': 'Invalid part'}}, 'CompleteMultipartUpload')
+
+        self.completed_parts = parts
+        return {'Key': key}
+
+    def list_multipart_uploads(self, prefix: str) -> list[dict]:
+        return [upload for upload in self.multipart_uploads if upload['Key'].startswith(prefix)]
+
+    def download_file(self, key: str, path: str) -> None:
+        with open(path, 'wb') as file:
+            file.write(b'')
+
+    def upload_file(self, path: str, key: str, content_type: str) -> None:
+        with open(path, 'rb') as file:
+            self.uploaded_files.append((key, content_type, file.read().decode()))
+
+    def list_object_keys(self, prefix: str) -> list[str]:
+        return [key for key, _, _ in self.uploaded_files if key.startswith(prefix)]
+
+    def delete_objects(self, objects: list[dict]) -> dict:
+        keys = {obj['Key'] for obj in objects}
+        self.uploaded_files = [file for file in self.uploaded_files if file[0] not in keys]
+        return {'Deleted': objects}
+
+
+@dataclass
+class DummyS3FileProvider(BotoFileProvider):
+    """Signs S3 urls locally, so the provider without prefix signatures is
+    used without AWS credentials."""
+
+    signed_keys: list[str] = field(default_factory=list)
+
+    def generate_download_urls(self, keys: list[str], expires_in: int) -> dict[str, str]:
+        self.signed_keys.extend(keys)
+        return {key: f'https://bucket.s3.amazonaws.com/{key}?X-Amz-Expires={expires_in}' for key in keys}
+
+
+@dataclass
+class DummyCeleryFileProvider(BaseCeleryFileProvider):
+    """Records tasks instead of sending them to the broker."""
+
+    deleted_keys: list[str] = field(default_factory=list)
+    deleted_prefixes: list[str] = field(default_factory=list)
+    aborted_uploads: list[tuple[str, str, int | None]] = field(default_factory=list)
+
+    def delete_object_by_key(self, key: str, cache_key: str | None = None) -> None:
+        self.deleted_keys.append(key)
+
+    def delete_objects(self, objects: list[dict], cache_keys: list | None) -> None:
+        self.deleted_keys.extend(obj['Key'] for obj in objects)
+
+    def abort_multipart_upload(self, key: str, upload_id: str, countdown: int | None = None) -> None:
+        self.aborted_uploads.append((key, upload_id, countdown))
+
+    def delete_objects_by_prefixes(self, prefixes: list[str]) -> None:
+        self.deleted_prefixes.extend(prefixes)
@@ -1,3 +1,9 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+
+from core.apps.common.constants import CACHE_KEYS
 from core.apps.common.services.cache import BaseCacheService
 
 
@@ -23,3 +29,103 @@ def test_cache_delete_data(cache_service: BaseCacheService):
     cache_service.delete(key=key)
 
     assert cache_service.get(key=key) is None
+
+
+def test_value_computed_once_and_cached(cache_service: BaseCacheService):
+    """Test that the value has been computed on a miss and returned from the
+    cache afterwards."""
+
+    cache_service.delete(key='test_key')
+    calls = []
+
+    for _ in range(3):
+        value = cache_service.get_or_compute(key='test_key', compute=lambda: calls.append(1) or 'test_data', timeout=10)
+
+    assert value == 'test_data'
+    assert len(calls) == 1
+
+
+def test_concurrent_misses_computed_once(cache_service: BaseCacheService):
+    """Test that concurrent requests for a missing value have waited for a
+    single computation."""
+
+    cache_service.delete(key='test_key')
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        time.sleep(0.2)
+        return 'test_data'
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(
+            executor.map(lambda _: cache_service.get_or_compute(key='test_key', compute=compute, timeout=10), range(8))
+        )
+
+    assert values == ['test_data'] * 8
+    assert len(calls) == 1
+
+
+def test_stale_value_returned_while_recomputed(cache_service: BaseCacheService):
+    """Test that the stale value has been returned while another process
+    holds the compute lock."""
+
+    # Expired a second ago, but kept for stale reads
+    cache_service.set(key='test_key', data=('stale_data', 0.0, time.time() - 1), timeout=10)
+    lock = cache_service.cache_provider.acquire_lock(CACHE_KEYS['compute_lock'] + 'test_key', timeout=10)
+
+    try:
+        value = cache_service.get_or_compute(key='test_key', compute=lambda: 'fresh_data', timeout=10, stale_timeout=10)
+    finally:
+        cache_service.cache_provider.release_lock(lock)
+
+    assert value == 'stale_data'
+    assert cache_service.get_or_compute(key='test_key', compute=lambda: 'fresh_data', timeout=10) == 'fresh_data'
+
+
+def test_only_missing_values_computed(cache_service: BaseCacheService):
+    """Test that only missing values have been computed in one batch."""
+
+    cache_service.delete(key='test_key_2')
+    cache_service.get_or_compute(key='test_key_1', compute=lambda: 'cached_data', timeout=10)
+    batches = []
+
+    def compute(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        return dict.fromkeys(keys, 'computed_data')
+
+    values = cache_service.get_many_or_compute(keys=['test_key_1', 'test_key_2'], compute=compute, timeout=10)
+
+    assert values == {'test_key_1': 'cached_data', 'test_key_2': 'computed_data'}
+    assert batches == [['test_key_2']]
+
+
+def test_pipeline_results_returned_in_order(cache_service: BaseCacheService):
+    """Test that queued commands have been executed on exit and their results
+    have been returned in order."""
+
+    cache_service.delete(key='test_counter')
+
+    with cache_service.pipeline() as pipeline:
+        pipeline.set('test_key', {'data': 'test_data'}, 10)
+        pipeline.set('test_counter', 1, 10)
+        pipeline.incr('test_counter', 2)
+        pipeline.get('test_key')
+        pipeline.incr('test_missing_counter')
+        pipeline.delete('test_key')
+
+    assert pipeline.results == [True, True, 3, {'data': 'test_data'}, None, True]
+    assert cache_service.get(key='test_key') is None
+
+
+def test_set_many_with_per_key_timeouts(cache_service: BaseCacheService):
+    """Test that every key has been set with its own timeout."""
+
+    cache_service.set_many(
+        data={'test_key_1': 'test_data', 'test_key_2': 'test_data'},
+        timeout=10,
+        timeouts={'test_key_2': 100},
+    )
+
+    assert 0 < cache.ttl('test_key_1') <= 10
+    assert 10 < cache.ttl('test_key_2') <= 100
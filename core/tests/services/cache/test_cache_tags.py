@@ -0,0 +1,42 @@
+from django.core.cache import cache
+
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.services.cache import BaseCacheService
+
+
+def test_tagged_keys_invalidated(cache_service: BaseCacheService):
+    """Test that all keys registered in a tag have been deleted with the tag
+    registry and other keys have been kept."""
+
+    cache_service.set_many({'test_key_1': 1, 'test_key_2': 2, 'test_key_3': 3}, timeout=10)
+    cache_service.add_tags(key='test_key_1', tags=['channel:1'], timeout=10)
+    cache_service.add_tags(key='test_key_2', tags=['channel:1', 'channel_subs:1'], timeout=10)
+    cache_service.add_tags(key='test_key_3', tags=['channel:2'], timeout=10)
+
+    assert cache_service.invalidate_tags(tags=['channel:1']) == ['test_key_1', 'test_key_2']
+    assert cache_service.get_many(['test_key_1', 'test_key_2', 'test_key_3']) == {'test_key_3': 3}
+    assert cache_service.invalidate_tags(tags=['channel:1']) == []
+    assert cache_service.invalidate_tags(tags=['channel_subs:1']) == []
+
+
+def test_tag_registry_outlives_its_keys(cache_service: BaseCacheService):
+    """Test that the tag registry timeout has been extended to the timeout of
+    its longest living key."""
+
+    cache_service.add_tags(key='test_key_1', tags=['channel:1'], timeout=100)
+    cache_service.add_tags(key='test_key_2', tags=['channel:1'], timeout=10)
+
+    assert cache.ttl(CACHE_KEYS['cache_tag'] + 'channel:1') > 10
+
+
+def test_computed_value_invalidated_by_tag(cache_service: BaseCacheService):
+    """Test that a value computed with tags has been computed again after the
+    tag has been invalidated."""
+
+    calls = []
+
+    cache_service.get_or_compute(key='test_key', compute=lambda: calls.append(1), timeout=10, tags=['channel:1'])
+    cache_service.invalidate_tags(tags=['channel:1'])
+    cache_service.get_or_compute(key='test_key', compute=lambda: calls.append(1), timeout=10, tags=['channel:1'])
+
+    assert len(calls) == 2
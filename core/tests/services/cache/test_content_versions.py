@@ -0,0 +1,42 @@
+import punq
+import pytest
+
+from core.apps.common.services.content_versions import BaseContentVersionService
+
+
+@pytest.fixture
+def content_version_service(container: punq.Container) -> BaseContentVersionService:
+    return container.resolve(BaseContentVersionService)
+
+
+def test_etag_stable_until_bumped(
+    content_version_service: BaseContentVersionService,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the ETag of a scope has not changed between reads and has
+    changed after the scope has been bumped."""
+
+    etag = content_version_service.get_etag(scopes=['video:test_id', 'channel:test_id'], variant='test_url')
+
+    assert content_version_service.get_etag(scopes=['video:test_id', 'channel:test_id'], variant='test_url') == etag
+    assert content_version_service.get_etag(scopes=['video:test_id', 'channel:test_id'], variant='other_url') != etag
+
+    with django_capture_on_commit_callbacks(execute=True):
+        content_version_service.bump(scopes=['channel:test_id'])
+
+    assert content_version_service.get_etag(scopes=['video:test_id', 'channel:test_id'], variant='test_url') != etag
+
+
+def test_etag_not_changed_by_other_scope(
+    content_version_service: BaseContentVersionService,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the ETag has not changed after an unrelated scope has been
+    bumped."""
+
+    etag = content_version_service.get_etag(scopes=['video:test_id'], variant='test_url')
+
+    with django_capture_on_commit_callbacks(execute=True):
+        content_version_service.bump(scopes=['video:other_id'])
+
+    assert content_version_service.get_etag(scopes=['video:test_id'], variant='test_url') == etag
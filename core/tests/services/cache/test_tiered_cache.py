@@ -0,0 +1,46 @@
+import pytest
+
+from core.apps.common.clients.local_cache import local_cache
+from core.apps.common.providers.cache import TieredCacheProvider
+
+
+@pytest.fixture
+def tiered_cache_provider(settings) -> TieredCacheProvider:
+    settings.CACHE_LOCAL_MAX_ENTRIES = 100
+    settings.CACHE_LOCAL_TIMEOUT = 5
+
+    local_cache.clear()
+    yield TieredCacheProvider()
+    local_cache.clear()
+
+
+def test_value_served_from_local_cache(tiered_cache_provider: TieredCacheProvider):
+    """Test that a value has been served from the process after it was
+    deleted from Redis behind the provider."""
+
+    tiered_cache_provider.set('test_key', {'data': 'test_data'}, timeout=10)
+    # Deleted from Redis only, the local value is kept until it expires
+    super(TieredCacheProvider, tiered_cache_provider).delete('test_key')
+
+    assert tiered_cache_provider.get('test_key') == {'data': 'test_data'}
+
+
+def test_returned_value_mutation_not_cached(tiered_cache_provider: TieredCacheProvider):
+    """Test that mutating a returned value has not changed the cached
+    value."""
+
+    tiered_cache_provider.set('test_key', {'data': 'test_data'}, timeout=10)
+
+    tiered_cache_provider.get('test_key')['data'] = 'changed'
+
+    assert tiered_cache_provider.get('test_key') == {'data': 'test_data'}
+
+
+def test_deleted_value_not_served_from_local_cache(tiered_cache_provider: TieredCacheProvider):
+    """Test that the value has been deleted from both layers."""
+
+    tiered_cache_provider.set('test_key', 'test_data', timeout=10)
+
+    tiered_cache_provider.delete('test_key')
+
+    assert tiered_cache_provider.get('test_key') is None
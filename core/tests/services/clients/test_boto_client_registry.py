@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from core.apps.common.clients.registry import BotoClientRegistry
+
+
+def test_client_created_once_per_process():
+    """Test that the same client is returned to all threads."""
+
+    registry = BotoClientRegistry()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: registry.get_client('s3'), range(32)))
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_client_configured_with_pool_and_retries(settings):
+    """Test that the client has been created with the connection pool and
+    retries from the settings."""
+
+    settings.AWS_S3_MAX_POOL_CONNECTIONS = 25
+    settings.AWS_S3_MAX_ATTEMPTS = 4
+
+    config = BotoClientRegistry().get_client('s3').meta.config
+
+    assert config.max_pool_connections == 25
+    assert config.retries == {'total_max_attempts': 4, 'mode': 'standard'}
+    assert config.tcp_keepalive is True
+
+
+def test_client_recreated_after_reset():
+    """Test that a new client has been created after the registry was reset,
+    as it happens in a forked worker process."""
+
+    registry = BotoClientRegistry()
+    client = registry.get_client('s3')
+
+    registry.reset()
+
+    assert registry.get_client('s3') is not client
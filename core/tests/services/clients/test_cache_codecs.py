@@ -0,0 +1,114 @@
+import pickle
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django_redis.exceptions import CompressorError
+
+from core.apps.common.clients.cache_codecs import (
+    OrjsonCacheSerializer,
+    ThresholdCompressor,
+)
+from core.apps.common.services.cache import BaseCacheService
+
+
+@pytest.fixture
+def orjson_cache(settings):
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': 'redis://redis:6379/8',
+            'OPTIONS': {
+                'SERIALIZER': 'core.apps.common.clients.cache_codecs.OrjsonCacheSerializer',
+                'COMPRESSOR': 'core.apps.common.clients.cache_codecs.ThresholdCompressor',
+                'COMPRESS_ALGORITHM': 'zlib',
+                'COMPRESS_MIN_LENGTH': 64,
+            },
+        },
+    }
+    cache.clear()
+
+
+def test_json_values_serialized_with_orjson():
+    """Test that response data has been serialized to JSON and read back."""
+
+    serializer = OrjsonCacheSerializer(options={})
+    data = OrderedDict([('next', None), ('results', [OrderedDict([('pk', 'test_pk'), ('likes_count', 1)])])])
+
+    payload = serializer.dumps(data)
+
+    assert payload.startswith(b'{')
+    assert serializer.loads(payload) == {'next': None, 'results': [{'pk': 'test_pk', 'likes_count': 1}]}
+
+
+@pytest.mark.parametrize('value', [{'created_at': datetime(2025, 1, 1)}, {1, 2}, b'test'])
+def test_unsupported_values_pickled(value):
+    """Test that values orjson can't serialize without changing their type
+    have been pickled."""
+
+    serializer = OrjsonCacheSerializer(options={})
+
+    assert serializer.loads(serializer.dumps(value)) == value
+
+
+def test_legacy_pickled_value_read():
+    """Test that a value pickled before the serializer has been enabled has
+    been read."""
+
+    assert OrjsonCacheSerializer(options={}).loads(pickle.dumps({'tier': 'free'}, -1)) == {'tier': 'free'}
+
+
+def test_values_compressed_over_threshold():
+    """Test that only values longer than the threshold have been
+    compressed."""
+
+    compressor = ThresholdCompressor(options={'COMPRESS_ALGORITHM': 'zlib', 'COMPRESS_MIN_LENGTH': 64})
+    long_value = b'{"text":"' + b'a' * 100 + b'"}'
+
+    assert compressor.compress(b'"short"') == b'"short"'
+    assert compressor.compress(long_value) == zlib.compress(long_value)
+
+
+def test_compressed_value_read_after_compression_disabled():
+    """Test that compressed values have been decompressed and uncompressed
+    values have been passed through with compression disabled."""
+
+    compressor = ThresholdCompressor(options={'COMPRESS_ALGORITHM': 'none'})
+    value = b'{"text":"' + b'a' * 100 + b'"}'
+
+    assert compressor.decompress(zlib.compress(value)) == value
+    with pytest.raises(CompressorError):
+        compressor.decompress(value)
+
+
+def test_unknown_compression_algorithm_rejected():
+    """Test that an unknown compression algorithm has been rejected."""
+
+    with pytest.raises(ImproperlyConfigured):
+        ThresholdCompressor(options={'COMPRESS_ALGORITHM': 'brotli'})
+
+
+def test_computed_value_cached_with_orjson(orjson_cache, cache_service: BaseCacheService):
+    """Test that a computed value has been cached with the orjson serializer
+    and returned from the cache afterwards."""
+
+    calls = []
+    data = {'results': [{'sub_slug': f'subscriber-{number}'} for number in range(10)]}
+
+    for _ in range(2):
+        value = cache_service.get_or_compute(key='test_key', compute=lambda: calls.append(1) or data, timeout=10)
+
+    assert value == data
+    assert len(calls) == 1
+
+
+def test_counter_incremented_with_orjson(orjson_cache):
+    """Test that integer counters have been incremented with the orjson
+    serializer."""
+
+    cache.set('test_counter', 1)
+
+    assert cache.incr('test_counter') == 2
@@ -0,0 +1,88 @@
+import base64
+from collections.abc import Callable
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+import orjson
+
+from core.apps.common.clients.cloudfront_signer import CloudfrontUrlSigner
+
+
+def test_urls_signed_in_batch(cloudfront_settings):
+    """Test that all keys were signed with the same expiration date."""
+
+    signer = CloudfrontUrlSigner()
+    keys = [f'videos/test_{number}.mp4' for number in range(5)]
+
+    urls = signer.sign_many(keys=keys, expires=signer.get_expiration_date(expires_in=60))
+
+    assert list(urls) == keys
+
+    for key, url in urls.items():
+        parsed_url = urlparse(url)
+        query = parse_qs(parsed_url.query)
+
+        assert parsed_url.netloc == 'test.cloudfront.net'
+        assert parsed_url.path == f'/{key}'
+        assert query['Key-Pair-Id'] == ['TEST_KEY_ID']
+        assert query['Signature']
+
+    assert len({parse_qs(urlparse(url).query)['Expires'][0] for url in urls.values()}) == 1
+
+
+def test_signer_built_once_and_rebuilt_after_key_rotation(
+    cloudfront_settings,
+    private_key_pem_factory: Callable[[], bytes],
+):
+    """Test that the signer is reused between calls and rebuilt after the key
+    was changed in settings."""
+
+    signer = CloudfrontUrlSigner()
+    expires = signer.get_expiration_date(expires_in=60)
+
+    signer.sign(key='test.mp4', expires=expires)
+    cached_signer = signer._get_signer()
+    assert signer._get_signer() is cached_signer
+
+    cloudfront_settings.AWS_CLOUDFRONT_KEY_ID = 'ROTATED_KEY_ID'
+    cloudfront_settings.AWS_CLOUDFRONT_KEY = private_key_pem_factory()
+    url = signer.sign(key='test.mp4', expires=expires)
+
+    assert signer._get_signer() is not cached_signer
+    assert parse_qs(urlparse(url).query)['Key-Pair-Id'] == ['ROTATED_KEY_ID']
+
+
+def test_prefix_signature_shared_by_keys_under_prefix(cloudfront_settings):
+    """Test that a wildcard custom policy has been signed for the prefix and
+    reused in urls of all keys under it."""
+
+    signer = CloudfrontUrlSigner()
+    signed_query = signer.sign_prefix(prefix='videos/test_id/', expires=signer.get_expiration_date(expires_in=60))
+
+    query = parse_qs(signed_query)
+    policy = orjson.loads(base64.b64decode(query['Policy'][0].translate(str.maketrans('-_~', '+=/'))))
+
+    assert policy['Statement'][0]['Resource'] == 'https://test.cloudfront.net/videos/test_id/*'
+    assert query['Key-Pair-Id'] == ['TEST_KEY_ID']
+
+    for key in ['videos/test_id/master.m3u8', 'videos/test_id/720p/segment_0.ts']:
+        assert signer.build_signed_url(key=key, signed_query=signed_query) == (
+            f'https://test.cloudfront.net/{key}?{signed_query}'
+        )
+
+
+def test_prefix_signed_cookies_built_from_signed_query(cloudfront_settings):
+    """Test that signed cookies contain the policy, signature and key pair id
+    of the prefix signature."""
+
+    signer = CloudfrontUrlSigner()
+    signed_query = signer.sign_prefix(prefix='videos/test_id/', expires=signer.get_expiration_date(expires_in=60))
+    query = parse_qs(signed_query)
+
+    assert signer.build_signed_cookies(signed_query=signed_query) == {
+        'CloudFront-Policy': query['Policy'][0],
+        'CloudFront-Signature': query['Signature'][0],
+        'CloudFront-Key-Pair-Id': 'TEST_KEY_ID',
+    }
@@ -0,0 +1,69 @@
+import time
+
+import orjson
+
+from core.apps.common.clients.local_cache import (
+    CacheInvalidationListener,
+    LocalCache,
+)
+
+
+def test_least_recently_used_value_evicted(settings):
+    """Test that the least recently used value has been evicted when the
+    cache is full."""
+
+    settings.CACHE_LOCAL_MAX_ENTRIES = 2
+    local_cache = LocalCache()
+
+    local_cache.set_many({'first': 1, 'second': 2}, timeout=10)
+    local_cache.get('first')
+    local_cache.set_many({'third': 3}, timeout=10)
+
+    assert local_cache.get('first') == 1
+    assert local_cache.get('second') is None
+    assert local_cache.get('third') == 3
+
+
+def test_expired_value_not_returned(settings, monkeypatch):
+    """Test that a value has not been returned after its timeout."""
+
+    settings.CACHE_LOCAL_MAX_ENTRIES = 10
+    local_cache = LocalCache()
+    now = time.monotonic()
+
+    local_cache.set_many({'key': 'value'}, timeout=5)
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 6)
+
+    assert local_cache.get('key') is None
+
+
+def test_value_read_before_invalidation_not_stored(settings):
+    """Test that a value read from Redis before an invalidation has not been
+    stored after it."""
+
+    settings.CACHE_LOCAL_MAX_ENTRIES = 10
+    local_cache = LocalCache()
+
+    generation = local_cache.generation
+    local_cache.delete_keys(['key'])
+    local_cache.set_many({'key': 'stale'}, timeout=10, generation=generation)
+
+    assert local_cache.get('key') is None
+
+
+def test_published_invalidation_applied(settings):
+    """Test that keys and patterns published by another process have been
+    deleted from the local cache."""
+
+    settings.CACHE_LOCAL_MAX_ENTRIES = 10
+    local_cache = LocalCache()
+    listener = CacheInvalidationListener(local_cache=local_cache)
+
+    local_cache.set_many({'channel:retrieve:1': 1, 'channel:subs:1:page': 2, 'other': 3}, timeout=10)
+
+    listener.handle_message(orjson.dumps({'keys': ['channel:retrieve:1'], 'pattern': None}))
+    listener.handle_message(orjson.dumps({'keys': [], 'pattern': 'channel:subs:1*'}))
+
+    assert local_cache.get('channel:retrieve:1') is None
+    assert local_cache.get('channel:subs:1:page') is None
+    assert local_cache.get('other') == 3
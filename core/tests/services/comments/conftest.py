@@ -1,6 +1,7 @@
 import punq
 import pytest
 
+from core.apps.posts.services.comments import BasePostCommentService
 from core.apps.videos.models import (
     VideoComment,
     VideoCommentLikeItem,
@@ -17,6 +18,11 @@ def comment_service(container: punq.Container) -> BaseVideoCommentService:
     return container.resolve(BaseVideoCommentService)
 
 
+@pytest.fixture
+def post_comment_service(container: punq.Container) -> BasePostCommentService:
+    return container.resolve(BasePostCommentService)
+
+
 @pytest.fixture
 def comment() -> VideoComment:
     return VideoCommentModelFactory()
@@ -0,0 +1,83 @@
+import pytest
+
+from core.apps.posts.converters.comments import (
+    data_to_post_comment_entity,
+    post_comment_to_entity,
+)
+from core.apps.posts.models import (
+    PostCommentItem,
+    PostCommentLikeItem,
+)
+from core.apps.posts.services.comments import BasePostCommentService
+from core.tests.factories.posts import (
+    PostCommentLikeModelFactory,
+    PostCommentModelFactory,
+)
+
+
+def _create_thread(
+    post_comment_service: BasePostCommentService,
+    comment: PostCommentItem,
+    depth: int,
+) -> list[int]:
+    """Create a chain of replies 'depth' levels deep under the comment and
+    return their ids."""
+
+    reply_ids, reply_comment_id = [], comment.pk
+
+    for _ in range(depth):
+        reply = post_comment_service.create_comment(
+            data_to_post_comment_entity(
+                {
+                    'text': 'test_reply',
+                    'author_id': comment.author_id,
+                    'post_id': comment.post_id,
+                    'reply_comment_id': reply_comment_id,
+                },
+            ),
+        )
+        reply_ids.append(reply.id)
+        reply_comment_id = reply.id
+
+    return reply_ids
+
+
+@pytest.mark.django_db
+def test_post_comment_thread_deleted(post_comment: PostCommentItem, post_comment_service: BasePostCommentService):
+    """Test that the comment has been deleted together with all replies in its
+    thread and their likes."""
+
+    reply_ids = _create_thread(post_comment_service=post_comment_service, comment=post_comment, depth=3)
+    PostCommentLikeModelFactory(comment_id=reply_ids[-1])
+    PostCommentLikeModelFactory(comment=post_comment)
+    other_comment = PostCommentModelFactory(post=post_comment.post)
+
+    deleted = post_comment_service.delete_comment_thread(comment=post_comment_to_entity(post_comment))
+
+    assert deleted == len(reply_ids) + 1
+    assert not PostCommentItem.objects.filter(pk__in=[post_comment.pk, *reply_ids]).exists()
+    assert not PostCommentLikeItem.objects.filter(comment_id__in=[post_comment.pk, *reply_ids]).exists()
+    assert PostCommentItem.objects.filter(pk=other_comment.pk).exists()
+
+
+@pytest.mark.django_db
+def test_post_comment_reply_thread_deleted(
+    post_comment: PostCommentItem,
+    post_comment_service: BasePostCommentService,
+):
+    """Test that only the reply and its own replies have been deleted if the
+    reply is deleted."""
+
+    first_reply_id, *nested_reply_ids = _create_thread(
+        post_comment_service=post_comment_service,
+        comment=post_comment,
+        depth=3,
+    )
+
+    deleted = post_comment_service.delete_comment_thread(
+        comment=post_comment_to_entity(PostCommentItem.objects.get(pk=nested_reply_ids[0])),
+    )
+
+    assert deleted == len(nested_reply_ids)
+    assert PostCommentItem.objects.filter(pk__in=[post_comment.pk, first_reply_id]).count() == 2
+    assert not PostCommentItem.objects.filter(pk__in=nested_reply_ids).exists()
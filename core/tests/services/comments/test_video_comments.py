@@ -14,7 +14,10 @@ from core.apps.videos.models import (
     VideoCommentLikeItem,
 )
 from core.apps.videos.services.comments import BaseVideoCommentService
-from core.tests.factories.video_comments import VideoCommentModelFactory
+from core.tests.factories.video_comments import (
+    VideoCommentLikeFactoryItem,
+    VideoCommentModelFactory,
+)
 
 
 @pytest.mark.django_db
@@ -177,3 +180,71 @@ def test_like_deleted(comment_service: BaseVideoCommentService, like: VideoComme
     )
 
     assert not VideoCommentLikeItem.objects.filter(author=like.author, comment=like.comment).exists()
+
+
+def _create_thread(comment_service: BaseVideoCommentService, comment: VideoComment, depth: int) -> list[int]:
+    """Create a chain of replies 'depth' levels deep under the comment and
+    return their ids."""
+
+    reply_ids, reply_comment_id = [], comment.pk
+
+    for _ in range(depth):
+        reply = comment_service.create_comment(
+            data_to_video_comment_entity(
+                {
+                    'text': 'test_reply',
+                    'author_id': comment.author_id,
+                    'video_id': comment.video_id,
+                    'reply_comment_id': reply_comment_id,
+                },
+            ),
+        )
+        reply_ids.append(reply.id)
+        reply_comment_id = reply.id
+
+    return reply_ids
+
+
+@pytest.mark.django_db
+def test_reply_path_built_from_ancestors(comment: VideoComment, comment_service: BaseVideoCommentService):
+    """Test that the reply's 'path' contains ids of all its ancestors."""
+
+    first_reply_id, second_reply_id = _create_thread(comment_service=comment_service, comment=comment, depth=2)
+
+    assert VideoComment.objects.get(pk=comment.pk).path == ''
+    assert VideoComment.objects.get(pk=first_reply_id).path == f'{comment.pk:019d}.'
+    assert VideoComment.objects.get(pk=second_reply_id).path == f'{comment.pk:019d}.{first_reply_id:019d}.'
+
+
+@pytest.mark.django_db
+def test_thread_replies_retrieved_in_threaded_mode(
+    settings,
+    comment: VideoComment,
+    comment_service: BaseVideoCommentService,
+):
+    """Test that replies on any depth were retrieved in the threaded mode."""
+
+    settings.COMMENTS_THREADED_MODE = True
+    reply_ids = _create_thread(comment_service=comment_service, comment=comment, depth=4)
+    VideoCommentModelFactory.create_batch(size=3, video=comment.video)
+
+    qs = comment_service.get_replies_by_comment_id(comment_id=comment.pk)
+
+    assert sorted(qs.values_list('pk', flat=True)) == reply_ids
+
+
+@pytest.mark.django_db
+def test_comment_thread_deleted(comment: VideoComment, comment_service: BaseVideoCommentService):
+    """Test that the comment has been deleted together with all replies in its
+    thread and their likes."""
+
+    reply_ids = _create_thread(comment_service=comment_service, comment=comment, depth=3)
+    VideoCommentLikeFactoryItem(comment_id=reply_ids[-1])
+    other_comment = VideoCommentModelFactory(video=comment.video)
+
+    deleted = comment_service.delete_comment_thread(comment=video_comment_to_entity(comment))
+
+    assert deleted == len(reply_ids) + 1
+    assert not VideoComment.objects.filter(pk__in=[comment.pk, *reply_ids]).exists()
+    assert not VideoCommentLikeItem.objects.filter(comment_id__in=reply_ids).exists()
+    assert VideoComment.objects.filter(pk=other_comment.pk).exists()
@@ -0,0 +1,219 @@
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+import punq
+import pytest
+from django.core.cache import cache
+
+from core.apps.common.clients.boto_client import BotoClient
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.common.exceptions.exceptions import (
+    MultipartUploadPartsMissingError,
+    S3FileWithKeyNotExistError,
+)
+from core.apps.common.providers.files import BaseBotoFileProvider
+from core.apps.common.providers.objects_index import BaseS3ObjectsIndexProvider
+from core.apps.common.providers.uploads import BaseMultipartUploadStateProvider
+from core.apps.common.services.files import BaseS3FileService
+from core.tests.mocks.common.providers.files import (
+    DummyBotoFileProvider,
+    DummyS3FileProvider,
+)
+
+
+@pytest.fixture
+def s3_file_service(container: punq.Container) -> BaseS3FileService:
+    return container.resolve(BaseS3FileService)
+
+
+def test_prefix_download_urls_share_cached_signature(cloudfront_settings, s3_file_service: BaseS3FileService):
+    """Test that the prefix signature has been cached and reused for new keys
+    under the prefix."""
+
+    urls = s3_file_service.generate_prefix_download_urls(
+        prefix='videos/test_id/',
+        keys=['videos/test_id/master.m3u8'],
+        expires_in=3600,
+    )
+    signature, _, _ = cache.get(CACHE_KEYS['s3_prefix_signature'] + 'videos/test_id/')
+
+    assert urls == {'videos/test_id/master.m3u8': f'https://test.cloudfront.net/videos/test_id/master.m3u8?{signature}'}
+
+    urls = s3_file_service.generate_prefix_download_urls(
+        prefix='videos/test_id/',
+        keys=['videos/test_id/720p/segment_0.ts'],
+        expires_in=3600,
+    )
+
+    assert urls['videos/test_id/720p/segment_0.ts'].endswith(f'?{signature}')
+
+
+def test_prefix_signed_cookies_share_cached_signature(cloudfront_settings, s3_file_service: BaseS3FileService):
+    """Test that signed cookies have been built from the cached signature of
+    the prefix urls."""
+
+    url = s3_file_service.generate_prefix_download_urls(
+        prefix='videos/test_id/',
+        keys=['videos/test_id/master.m3u8'],
+        expires_in=3600,
+    )['videos/test_id/master.m3u8']
+
+    cookies = s3_file_service.generate_prefix_signed_cookies(prefix='videos/test_id/', expires_in=3600)
+
+    assert cookies == {f'CloudFront-{name}': values[0] for name, values in parse_qs(urlparse(url).query).items()}
+
+
+def test_prefix_download_urls_signed_per_key_without_prefix_signatures(mock_container: punq.Container):
+    """Test that every key has been signed on its own if the provider can't
+    sign a prefix."""
+
+    provider = DummyS3FileProvider(boto_client=BotoClient())
+    mock_container.register(BaseBotoFileProvider, instance=provider)
+    keys = ['videos/test_id/master.m3u8', 'videos/test_id/720p/index.m3u8']
+
+    s3_file_service = mock_container.resolve(BaseS3FileService)
+
+    urls = s3_file_service.generate_prefix_download_urls(prefix='videos/test_id/', keys=keys, expires_in=3600)
+    cookies = s3_file_service.generate_prefix_signed_cookies(prefix='videos/test_id/', expires_in=3600)
+
+    assert urls == {key: f'https://bucket.s3.amazonaws.com/{key}?X-Amz-Expires=3600' for key in keys}
+    assert provider.signed_keys == keys
+    assert cache.get(CACHE_KEYS['s3_prefix_signature'] + 'videos/test_id/') is None
+    assert cookies is None
+
+
+def test_download_url_generated_without_head_request_for_indexed_object(
+    cloudfront_settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that the object from the existence index has not been checked in
+    S3."""
+
+    mock_container.resolve(BaseS3ObjectsIndexProvider).add(keys=['videos/test.mp4'])
+
+    url = mock_container.resolve(BaseS3FileService).generate_download_url(
+        key='videos/test.mp4',
+        expires_in=3600,
+        cache_key=CACHE_KEYS['s3_video_url'] + 'videos/test.mp4',
+    )
+
+    assert url.startswith('https://test.cloudfront.net/videos/test.mp4?')
+    assert dummy_boto_provider.head_object_calls == 0
+
+
+def test_download_url_not_generated_for_not_indexed_missing_object(
+    cloudfront_settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that the object missing in the existence index has been checked in
+    S3 and an error has been raised."""
+
+    mock_container.resolve(BaseS3ObjectsIndexProvider).remove(keys=['videos/test.mp4'])
+
+    with pytest.raises(S3FileWithKeyNotExistError):
+        mock_container.resolve(BaseS3FileService).generate_download_url(
+            key='videos/test.mp4',
+            expires_in=3600,
+            cache_key=CACHE_KEYS['s3_video_url'] + 'videos/test.mp4',
+        )
+
+    assert dummy_boto_provider.head_object_calls == 1
+
+
+def test_missing_upload_parts_synced_from_s3_once(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that uploaded parts have been listed in S3 only while some of them
+    were missing in the cached parts."""
+
+    files_service = mock_container.resolve(BaseS3FileService)
+    mock_container.resolve(BaseMultipartUploadStateProvider).delete(upload_id='test_upload_id')
+    dummy_boto_provider.uploaded_parts = {1: '"etag_1"', 3: '"etag_3"'}
+
+    missing_parts = files_service.get_missing_upload_parts(key='test.mp4', upload_id='test_upload_id', parts_count=3)
+
+    assert missing_parts == [2]
+    assert dummy_boto_provider.list_parts_calls == 1
+
+    mock_container.resolve(BaseMultipartUploadStateProvider).add_parts(
+        upload_id='test_upload_id',
+        parts={2: '"etag_2"'},
+    )
+
+    assert files_service.get_missing_upload_parts(key='test.mp4', upload_id='test_upload_id', parts_count=3) == []
+    assert dummy_boto_provider.list_parts_calls == 1
+
+
+def test_multipart_upload_completed_from_listed_parts(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that the upload has been completed with parts listed in S3 and
+    the cached parts have been deleted."""
+
+    files_service = mock_container.resolve(BaseS3FileService)
+    upload_state_provider = mock_container.resolve(BaseMultipartUploadStateProvider)
+    upload_state_provider.delete(upload_id='test_upload_id')
+    dummy_boto_provider.uploaded_parts = {1: '"etag_1"'}
+
+    with pytest.raises(MultipartUploadPartsMissingError) as error:
+        files_service.complete_multipart_upload(key='test.mp4', upload_id='test_upload_id', parts_count=2)
+
+    assert error.value.missing_parts == [2]
+
+    dummy_boto_provider.uploaded_parts[2] = '"etag_2"'
+    files_service.complete_multipart_upload(key='test.mp4', upload_id='test_upload_id', parts_count=2)
+
+    assert dummy_boto_provider.completed_parts == [
+        {'PartNumber': 1, 'ETag': '"etag_1"'},
+        {'PartNumber': 2, 'ETag': '"etag_2"'},
+    ]
+    assert upload_state_provider.get_parts(upload_id='test_upload_id') == {}
+
+
+def test_multipart_upload_completed_with_not_contiguous_part_numbers(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that the upload has been completed with passed part numbers and
+    ETags reported by S3 although the part numbers have gaps."""
+
+    files_service = mock_container.resolve(BaseS3FileService)
+    mock_container.resolve(BaseMultipartUploadStateProvider).delete(upload_id='test_upload_id')
+    dummy_boto_provider.uploaded_parts = {1: '"etag_1"', 3: '"etag_3"', 7: '"etag_7"'}
+
+    files_service.complete_multipart_upload(key='test.mp4', upload_id='test_upload_id', part_numbers=[7, 1, 3])
+
+    assert dummy_boto_provider.completed_parts == [
+        {'PartNumber': 1, 'ETag': '"etag_1"'},
+        {'PartNumber': 3, 'ETag': '"etag_3"'},
+        {'PartNumber': 7, 'ETag': '"etag_7"'},
+    ]
+
+
+def test_multipart_upload_completed_after_outdated_etag_listed_again(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that parts have been listed in S3 once more and the upload has
+    been completed if a cached ETag was outdated by a part uploaded again."""
+
+    files_service = mock_container.resolve(BaseS3FileService)
+    upload_state_provider = mock_container.resolve(BaseMultipartUploadStateProvider)
+    upload_state_provider.delete(upload_id='test_upload_id')
+    upload_state_provider.add_parts(upload_id='test_upload_id', parts={1: '"etag_1"', 2: '"outdated_etag_2"'})
+    dummy_boto_provider.uploaded_parts = {1: '"etag_1"', 2: '"etag_2"'}
+
+    files_service.complete_multipart_upload(key='test.mp4', upload_id='test_upload_id', parts_count=2)
+
+    assert dummy_boto_provider.list_parts_calls == 1
+    assert dummy_boto_provider.completed_parts == [
+        {'PartNumber': 1, 'ETag': '"etag_1"'},
+        {'PartNumber': 2, 'ETag': '"etag_2"'},
+    ]
+    assert upload_state_provider.get_parts(upload_id='test_upload_id') == {}
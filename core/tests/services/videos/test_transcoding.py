@@ -0,0 +1,296 @@
+import os
+import shutil
+import subprocess
+from collections.abc import Callable
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import punq
+import pytest
+
+from core.apps.common.tasks import delete_s3_prefixes_task
+from core.apps.videos.exceptions.upload import VideoTranscodingError
+from core.apps.videos.models import (
+    Video,
+    VideoRendition,
+)
+from core.apps.videos.providers.transcoding import (
+    BaseVideoTranscoderProvider,
+    BaseVideoTranscodingTasksProvider,
+    FFmpegVideoTranscoderProvider,
+)
+from core.apps.videos.services.transcoding import (
+    BaseVideoTranscodingService,
+    get_hls_prefix,
+    select_hls_renditions,
+)
+from core.apps.videos.signals import video_pre_delete
+from core.tests.factories.videos import VideoModelFactory
+from core.tests.mocks.common.providers.files import (
+    DummyBotoFileProvider,
+    DummyCeleryFileProvider,
+)
+
+
+@dataclass
+class DummyVideoTranscoderProvider(BaseVideoTranscoderProvider):
+    """Writes a playlist with a single segment for every rendition instead of
+    running ffmpeg."""
+
+    width: int = 1280
+    height: int = 720
+    has_audio: bool = True
+    error: Exception | None = None
+    on_transcode: Callable[[], None] | None = None
+    transcoded_renditions: list[dict] = field(default_factory=list)
+
+    def probe(self, path: str) -> dict:
+        return {'width': self.width, 'height': self.height, 'has_audio': self.has_audio}
+
+    def transcode_to_hls(self, source_path: str, output_dir: str, renditions: list[dict], has_audio: bool) -> None:
+        if self.error:
+            raise self.error
+        if self.on_transcode:
+            self.on_transcode()
+
+        self.transcoded_renditions = renditions
+
+        for rendition in renditions:
+            os.makedirs(os.path.join(output_dir, rendition['name']))
+
+            with open(os.path.join(output_dir, rendition['name'], 'segment_0000.ts'), 'w') as segment:
+                segment.write(rendition['name'])
+            with open(os.path.join(output_dir, rendition['name'], 'index.m3u8'), 'w') as playlist:
+                playlist.write('#EXTM3U\nsegment_0000.ts\n')
+
+
+@dataclass
+class DummyVideoTranscodingTasksProvider(BaseVideoTranscodingTasksProvider):
+    video_ids: list[str] = field(default_factory=list)
+
+    def transcode_video(self, video_id: str) -> None:
+        self.video_ids.append(video_id)
+
+
+@pytest.fixture
+def dummy_transcoder_provider(mock_container: punq.Container) -> DummyVideoTranscoderProvider:
+    provider = DummyVideoTranscoderProvider()
+    mock_container.register(BaseVideoTranscoderProvider, instance=provider)
+    return provider
+
+
+@pytest.fixture
+def dummy_tasks_provider(mock_container: punq.Container) -> DummyVideoTranscodingTasksProvider:
+    provider = DummyVideoTranscodingTasksProvider()
+    mock_container.register(BaseVideoTranscodingTasksProvider, instance=provider)
+    return provider
+
+
+@pytest.mark.parametrize(
+    'width, height, expected_renditions',
+    [
+        (1920, 1080, [(426, 240), (640, 360), (854, 480), (1280, 720), (1920, 1080)]),
+        (1280, 720, [(426, 240), (640, 360), (854, 480), (1280, 720)]),
+        (720, 1280, [(136, 240), (202, 360), (270, 480), (406, 720), (608, 1080)]),
+        (320, 180, [(426, 240)]),
+    ],
+)
+def test_hls_renditions_not_higher_than_source(width: int, height: int, expected_renditions: list[tuple[int, int]]):
+    """Test that renditions higher than the source have been skipped and
+    widths have kept the source aspect ratio."""
+
+    renditions = select_hls_renditions(width=width, height=height)
+
+    assert [(rendition['width'], rendition['height']) for rendition in renditions] == expected_renditions
+
+
+def test_hls_command_transcodes_all_renditions_in_single_run(settings):
+    """Test that the ffmpeg command decodes the source once and maps every
+    rendition into its own HLS variant."""
+
+    settings.VIDEO_TRANSCODING_THREADS = 0
+    renditions = select_hls_renditions(width=1280, height=720)
+
+    command = FFmpegVideoTranscoderProvider.build_hls_command(
+        source_path='/tmp/source.mp4',
+        output_dir='/tmp/hls',
+        renditions=renditions,
+        has_audio=False,
+    )
+
+    assert command.count('-i') == 1
+    assert command[command.index('-filter_complex') + 1].startswith('[0:v]split=4')
+    assert command[command.index('-var_stream_map') + 1] == 'v:0,name:240p v:1,name:360p v:2,name:480p v:3,name:720p'
+    assert command[-1] == '/tmp/hls/%v/index.m3u8'
+    assert 'a:0' not in command
+
+
+@pytest.mark.django_db
+def test_video_transcoded_and_uploaded(
+    settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_transcoder_provider: DummyVideoTranscoderProvider,
+):
+    """Test that renditions have been uploaded with the master playlist last
+    and saved for the video."""
+
+    settings.AWS_S3_VIDEO_BUCKET_PREFIX = 'videos/'
+    settings.VIDEO_TRANSCODING_UPLOAD_WORKERS = 4
+    video = VideoModelFactory(s3_key='videos/test.mp4')
+
+    renditions = mock_container.resolve(BaseVideoTranscodingService).transcode(video_id=video.video_id)
+
+    prefix = f'videos/hls/{video.video_id}/'
+    keys = [key for key, _, _ in dummy_boto_provider.uploaded_files]
+
+    assert [rendition.name for rendition in renditions] == ['240p', '360p', '480p', '720p']
+    assert len(keys) == 9
+    assert keys[-1] == prefix + 'master.m3u8'
+    assert set(keys[:4]) == {f'{prefix}{rendition.name}/segment_0000.ts' for rendition in renditions}
+
+    _, content_type, master_playlist = dummy_boto_provider.uploaded_files[-1]
+    assert content_type == 'application/vnd.apple.mpegurl'
+    assert '#EXT-X-STREAM-INF:BANDWIDTH=2928000,RESOLUTION=1280x720\n720p/index.m3u8' in master_playlist
+
+    assert list(
+        VideoRendition.objects.filter(video=video).values_list('name', 'playlist_key'),
+    ) == [(rendition.name, f'{prefix}{rendition.name}/index.m3u8') for rendition in renditions]
+
+
+@pytest.mark.django_db
+def test_video_transcoding_error_raised_on_ffmpeg_failure(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_transcoder_provider: DummyVideoTranscoderProvider,
+):
+    """Test that an ffmpeg failure has been raised as a transcoding error
+    and nothing has been uploaded."""
+
+    dummy_transcoder_provider.error = subprocess.CalledProcessError(1, 'ffmpeg', stderr=b'Invalid data')
+    video = VideoModelFactory(s3_key='videos/test.mp4')
+
+    with pytest.raises(VideoTranscodingError):
+        mock_container.resolve(BaseVideoTranscodingService).transcode(video_id=video.video_id)
+
+    assert dummy_boto_provider.uploaded_files == []
+    assert not VideoRendition.objects.filter(video=video).exists()
+
+
+@pytest.mark.django_db
+def test_hls_files_deleted_if_video_deleted_during_transcoding(
+    settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_celery_provider: DummyCeleryFileProvider,
+    dummy_transcoder_provider: DummyVideoTranscoderProvider,
+):
+    """Test that no renditions have been saved and the uploaded HLS prefix
+    has been deleted if the video was deleted during transcoding."""
+
+    settings.AWS_S3_VIDEO_BUCKET_PREFIX = 'videos/'
+    video = VideoModelFactory(s3_key='videos/test.mp4')
+    dummy_transcoder_provider.on_transcode = lambda: Video.objects.filter(pk=video.pk).delete()
+
+    renditions = mock_container.resolve(BaseVideoTranscodingService).transcode(video_id=video.video_id)
+
+    assert renditions == []
+    assert not VideoRendition.objects.filter(video_id=video.video_id).exists()
+    assert dummy_celery_provider.deleted_prefixes == [f'videos/hls/{video.video_id}/']
+
+
+@pytest.mark.django_db
+def test_hls_files_deleted_with_video(
+    monkeypatch,
+    mock_container: punq.Container,
+    dummy_celery_provider: DummyCeleryFileProvider,
+):
+    """Test that the HLS prefix has been deleted together with the original
+    video file."""
+
+    monkeypatch.setattr('core.apps.videos.signals.get_container', lambda: mock_container)
+    video = VideoModelFactory(s3_key='videos/test.mp4')
+
+    video_pre_delete.send(sender=Video, instance=video)
+
+    assert dummy_celery_provider.deleted_keys == ['videos/test.mp4']
+    assert dummy_celery_provider.deleted_prefixes == [get_hls_prefix(video_id=video.video_id)]
+
+
+@pytest.mark.django_db
+def test_objects_deleted_by_prefixes(
+    monkeypatch,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+):
+    """Test that all objects under the prefixes and only them have been
+    deleted."""
+
+    monkeypatch.setattr('core.apps.common.tasks.get_container', lambda: mock_container)
+    dummy_boto_provider.uploaded_files = [
+        ('videos/hls/first/master.m3u8', '', ''),
+        ('videos/hls/first/720p/segment_0000.ts', '', ''),
+        ('videos/hls/second/master.m3u8', '', ''),
+        ('videos/hls/third/master.m3u8', '', ''),
+    ]
+
+    delete_s3_prefixes_task(prefixes=['videos/hls/first/', 'videos/hls/second/'])
+
+    assert dummy_boto_provider.uploaded_files == [('videos/hls/third/master.m3u8', '', '')]
+
+
+@pytest.mark.parametrize('enabled, expected_scheduled', [(True, 1), (False, 0)])
+def test_transcoding_scheduled_only_when_enabled(
+    settings,
+    mock_container: punq.Container,
+    dummy_tasks_provider: DummyVideoTranscodingTasksProvider,
+    enabled: bool,
+    expected_scheduled: int,
+):
+    """Test that transcoding has been scheduled only when enabled in
+    settings."""
+
+    settings.VIDEO_TRANSCODING_ENABLED = enabled
+
+    mock_container.resolve(BaseVideoTranscodingService).schedule_transcoding(video_id='test_video_id')
+
+    assert len(dummy_tasks_provider.video_ids) == expected_scheduled
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg is not installed')
+def test_ffmpeg_transcodes_video_into_hls(settings, tmp_path):
+    """Test that ffmpeg has written a playlist with segments for every
+    rendition."""
+
+    settings.VIDEO_TRANSCODING_THREADS = 0
+    settings.VIDEO_TRANSCODING_TIMEOUT = 120
+    source_path = str(tmp_path / 'source.mp4')
+
+    command = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'testsrc=duration=8:size=640x360:rate=25',
+        '-f', 'lavfi', '-i', 'sine=duration=8',
+        '-shortest', source_path,
+    ]  # fmt: skip
+    subprocess.run(command, check=True)
+
+    provider = FFmpegVideoTranscoderProvider()
+    probe = provider.probe(path=source_path)
+    renditions = select_hls_renditions(width=probe['width'], height=probe['height'])
+
+    provider.transcode_to_hls(
+        source_path=source_path,
+        output_dir=str(tmp_path / 'hls'),
+        renditions=renditions,
+        has_audio=probe['has_audio'],
+    )
+
+    assert probe == {'width': 640, 'height': 360, 'has_audio': True}
+
+    for rendition in renditions:
+        rendition_dir = tmp_path / 'hls' / rendition['name']
+
+        assert (rendition_dir / 'index.m3u8').read_text().startswith('#EXTM3U')
+        assert list(rendition_dir.glob('segment_*.ts'))
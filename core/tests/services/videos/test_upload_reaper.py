@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+import punq
+import pytest
+from django.utils import timezone
+
+from core.apps.videos.models import Video
+from core.apps.videos.services.upload_reaper import BaseVideoUploadReaperService
+from core.tests.factories.videos import VideoModelFactory
+from core.tests.mocks.common.providers.files import (
+    DummyBotoFileProvider,
+    DummyCeleryFileProvider,
+)
+
+
+@pytest.fixture
+def reaper_settings(settings):
+    settings.AWS_S3_VIDEO_BUCKET_PREFIX = 'videos/'
+    settings.VIDEO_UPLOAD_REAPER_STALE_AFTER_HOURS = 24
+    settings.VIDEO_UPLOAD_REAPER_BATCH_SIZE = 2
+    settings.VIDEO_UPLOAD_REAPER_BATCH_INTERVAL = 10
+    settings.VIDEO_UPLOAD_REAPER_MAX_ABORTS = 100
+    return settings
+
+
+def _create_uploading_video(upload_id: str, hours_ago: int) -> Video:
+    video = VideoModelFactory(upload_id=upload_id, upload_status=Video.UploadStatus.UPLOADING)
+    Video.objects.filter(pk=video.pk).update(created_at=timezone.now() - timedelta(hours=hours_ago))
+    return video
+
+
+def _s3_upload(upload_id: str, hours_ago: int) -> dict:
+    return {
+        'Key': f'videos/{upload_id}.mp4',
+        'UploadId': upload_id,
+        'Initiated': timezone.now() - timedelta(hours=hours_ago),
+    }
+
+
+@pytest.mark.django_db
+def test_abandoned_uploads_aborted_and_videos_deleted(
+    reaper_settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_celery_provider: DummyCeleryFileProvider,
+):
+    """Test that stale uploads have been aborted in batches, stale uploading
+    videos have been deleted and fresh or uploaded videos have been kept."""
+
+    stale_videos = [_create_uploading_video(upload_id=f'stale_{number}', hours_ago=48) for number in range(3)]
+    fresh_video = _create_uploading_video(upload_id='fresh', hours_ago=1)
+    uploaded_video = VideoModelFactory(s3_key='videos/uploaded.mp4')
+    Video.objects.filter(pk=uploaded_video.pk).update(created_at=timezone.now() - timedelta(hours=48))
+
+    dummy_boto_provider.multipart_uploads = [
+        _s3_upload(upload_id='stale_0', hours_ago=48),
+        _s3_upload(upload_id='stale_1', hours_ago=48),
+        _s3_upload(upload_id='orphaned', hours_ago=48),
+        _s3_upload(upload_id='fresh', hours_ago=1),
+    ]
+
+    metrics = mock_container.resolve(BaseVideoUploadReaperService).reap()
+
+    assert not Video.objects.filter(pk__in=[video.pk for video in stale_videos]).exists()
+    assert Video.objects.filter(pk__in=[fresh_video.pk, uploaded_video.pk]).count() == 2
+
+    aborted = {upload_id: countdown for _, upload_id, countdown in dummy_celery_provider.aborted_uploads}
+    assert set(aborted) == {'stale_0', 'stale_1', 'orphaned'}
+    # The orphaned upload is aborted after uploads of stale videos
+    assert aborted['orphaned'] > max(aborted['stale_0'], aborted['stale_1'])
+
+    assert metrics.videos_checked == 3
+    assert metrics.videos_deleted == 3
+    assert metrics.uploads_aborted == 3
+    assert metrics.uploads_skipped == 0
+
+
+@pytest.mark.django_db
+def test_videos_kept_when_aborts_limit_reached(
+    reaper_settings,
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_celery_provider: DummyCeleryFileProvider,
+):
+    """Test that videos with uploads over the per-run limit have been kept for
+    the next run."""
+
+    reaper_settings.VIDEO_UPLOAD_REAPER_MAX_ABORTS = 1
+
+    for number in range(2):
+        _create_uploading_video(upload_id=f'stale_{number}', hours_ago=48)
+
+    dummy_boto_provider.multipart_uploads = [
+        _s3_upload(upload_id=f'stale_{number}', hours_ago=48) for number in range(2)
+    ]
+
+    metrics = mock_container.resolve(BaseVideoUploadReaperService).reap()
+
+    assert len(dummy_celery_provider.aborted_uploads) == 1
+    assert Video.objects.filter(upload_status=Video.UploadStatus.UPLOADING).count() == 1
+    assert metrics.uploads_aborted == 1
+    assert metrics.uploads_skipped == 1
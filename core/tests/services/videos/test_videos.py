@@ -1,4 +1,8 @@
 import pytest
+from django.db import (
+    IntegrityError,
+    transaction,
+)
 
 from core.apps.channels.models import Channel
 from core.apps.videos.converters.videos import (
@@ -118,3 +122,18 @@ def test_video_deleted_by_id(video_service: BaseVideoService):
     video_service.delete_video_by_id(video_id=video.video_id)
 
     assert not Video.objects.filter(video_id=video.video_id).exists()
+
+
+@pytest.mark.django_db
+def test_video_s3_key_and_upload_id_unique():
+    """Test that videos cannot share 's3_key' or 'upload_id', but many videos
+    can have none of them."""
+
+    VideoModelFactory.create_batch(2, s3_key=None, upload_id=None)
+    VideoModelFactory.create(s3_key='videos/test.mp4', upload_id='test_upload_id')
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        VideoModelFactory.create(s3_key='videos/test.mp4')
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        VideoModelFactory.create(upload_id='test_upload_id')
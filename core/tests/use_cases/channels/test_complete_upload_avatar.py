@@ -0,0 +1,32 @@
+import punq
+import pytest
+
+from core.apps.channels.models import Channel
+from core.apps.channels.use_cases.avatar_upload.complete_upload_avatar import CompleteUploadAvatarUseCase
+from core.apps.users.converters.users import user_to_entity
+from core.tests.mocks.common.providers.files import (
+    DummyBotoFileProvider,
+    DummyCeleryFileProvider,
+)
+
+
+@pytest.mark.django_db
+def test_replaced_avatar_deleted(
+    mock_container: punq.Container,
+    dummy_boto_provider: DummyBotoFileProvider,
+    dummy_celery_provider: DummyCeleryFileProvider,
+    channel: Channel,
+    monkeypatch,
+):
+    """Test that the previous avatar has been deleted from S3 after a new
+    avatar was uploaded."""
+
+    monkeypatch.setattr(dummy_boto_provider, 'head_object', lambda key: None)
+    Channel.objects.filter(pk=channel.pk).update(avatar_s3_key='avatars/old.png')
+
+    use_case: CompleteUploadAvatarUseCase = mock_container.resolve(CompleteUploadAvatarUseCase)
+    use_case.execute(key='avatars/new.png', user=user_to_entity(channel.user))
+
+    channel.refresh_from_db()
+    assert channel.avatar_s3_key == 'avatars/new.png'
+    assert dummy_celery_provider.deleted_keys == ['avatars/old.png']
@@ -2,10 +2,11 @@ import punq
 import pytest
 
 from core.apps.posts.models import PostLikeItem
+from core.apps.posts.services.posts import BasePostsCountService
 from core.apps.posts.use_cases.posts.create_post import PostCreateUseCase
 from core.apps.posts.use_cases.posts.create_post_like import PostLikeCreateUseCase
 from core.apps.posts.use_cases.posts.delete_post_like import PostLikeDeleteUseCase
-from core.apps.posts.use_cases.posts.get_channel_posts import GetChannelPostsUseCase
+from core.apps.posts.use_cases.posts.get_channel_posts_timeline import GetChannelPostsTimelineUseCase
 from core.tests.factories.posts import PostLikeModelFactory
 
 
@@ -15,8 +16,8 @@ def create_post_use_case(container: punq.Container) -> PostCreateUseCase:
 
 
 @pytest.fixture
-def channel_posts_use_case(container: punq.Container) -> GetChannelPostsUseCase:
-    return container.resolve(GetChannelPostsUseCase)
+def channel_posts_timeline_use_case(container: punq.Container) -> GetChannelPostsTimelineUseCase:
+    return container.resolve(GetChannelPostsTimelineUseCase)
 
 
 @pytest.fixture
@@ -29,6 +30,11 @@ def post_like_delete_use_case(container: punq.Container) -> PostLikeDeleteUseCas
     return container.resolve(PostLikeDeleteUseCase)
 
 
+@pytest.fixture
+def posts_count_service(container: punq.Container) -> BasePostsCountService:
+    return container.resolve(BasePostsCountService)
+
+
 @pytest.fixture
 def post_like() -> PostLikeItem:
     return PostLikeModelFactory()
@@ -0,0 +1,249 @@
+import punq
+import pytest
+from django.core.management import call_command
+from django.db import (
+    IntegrityError,
+    transaction,
+)
+
+from core.apps.channels.exceptions.channels import ChannelWithSlugNotFoundError
+from core.apps.channels.models import Channel
+from core.apps.posts.models import Post
+from core.apps.posts.providers.timeline import BasePostTimelineProvider
+from core.apps.posts.use_cases.posts.create_post_like import PostLikeCreateUseCase
+from core.apps.posts.use_cases.posts.get_channel_posts_timeline import GetChannelPostsTimelineUseCase
+from core.apps.users.converters.users import user_to_entity
+from core.tests.factories.channels import ChannelModelFactory
+from core.tests.factories.posts import (
+    PostCommentModelFactory,
+    PostLikeModelFactory,
+    PostModelFactory,
+)
+
+
+def _get_all_pages(use_case: GetChannelPostsTimelineUseCase, slug: str, page_size: int) -> list[dict]:
+    posts, cursor = [], None
+
+    while True:
+        _, page, cursor = use_case.execute(slug=slug, cursor=cursor, page_size=page_size)
+        posts.extend(page)
+
+        if cursor is None:
+            return posts
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_channel_not_found_error(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+):
+    """Test that an error 'ChannelWithSlugNotFoundError' has been raised."""
+
+    with pytest.raises(ChannelWithSlugNotFoundError):
+        channel_posts_timeline_use_case.execute(slug='not_existing_slug', cursor=None, page_size=10)
+
+
+@pytest.mark.parametrize('expected_posts, page_size', [(0, 10), (3, 10), (10, 10), (25, 7)])
+@pytest.mark.django_db
+def test_channel_posts_timeline_retrieved_in_order(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+    expected_posts: int,
+    page_size: int,
+):
+    """Test that all channel's posts were retrieved page by page from the
+    newest to the oldest."""
+
+    PostModelFactory.create_batch(size=expected_posts, author=channel)
+    PostModelFactory.create_batch(size=3)
+
+    expected_ids = [
+        str(pk) for pk in Post.objects.filter(author=channel).order_by('-created_at').values_list('pk', flat=True)
+    ]
+
+    # The first run builds the timeline from the database and the second one reads it from the cache
+    for _ in range(2):
+        posts = _get_all_pages(channel_posts_timeline_use_case, slug=channel.slug, page_size=page_size)
+        assert [post['post_id'] for post in posts] == expected_ids
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_posts_with_same_created_at_retrieved_once(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+):
+    """Test that posts created at the same time were neither skipped nor
+    repeated between pages."""
+
+    posts = PostModelFactory.create_batch(size=5, author=channel)
+    Post.objects.filter(author=channel).update(created_at=posts[0].created_at)
+
+    expected_ids = sorted((str(post.pk) for post in posts), reverse=True)
+
+    # The first run builds the timeline from the database and the second one reads it from the cache
+    for _ in range(2):
+        retrieved = _get_all_pages(channel_posts_timeline_use_case, slug=channel.slug, page_size=2)
+        assert [post['post_id'] for post in retrieved] == expected_ids
+
+
+@pytest.mark.parametrize('page_size', [1, 3, 10])
+@pytest.mark.django_db
+def test_channel_posts_timeline_retrieved_after_cached_posts(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+    page_size: int,
+    monkeypatch,
+):
+    """Test that posts older than the cached ones were retrieved from the
+    database without duplicates."""
+
+    monkeypatch.setattr('core.apps.posts.services.timeline.POSTS_TIMELINE_MAX_SIZE', 4)
+    PostModelFactory.create_batch(size=9, author=channel)
+    PostModelFactory.create_batch(size=3)
+
+    expected_ids = [
+        str(pk)
+        for pk in Post.objects.filter(author=channel).order_by('-created_at', '-pk').values_list('pk', flat=True)
+    ]
+
+    # The first run builds the timeline from the database and the second one reads it from the cache
+    for _ in range(2):
+        posts = _get_all_pages(channel_posts_timeline_use_case, slug=channel.slug, page_size=page_size)
+        assert [post['post_id'] for post in posts] == expected_ids
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_posts_with_same_created_at_retrieved_once_after_cached_posts(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+    monkeypatch,
+):
+    """Test that posts created at the same time were neither skipped nor
+    repeated between the cached posts and the posts read from the
+    database."""
+
+    monkeypatch.setattr('core.apps.posts.services.timeline.POSTS_TIMELINE_MAX_SIZE', 3)
+    posts = PostModelFactory.create_batch(size=5, author=channel)
+    Post.objects.filter(author=channel).update(created_at=posts[0].created_at)
+
+    expected_ids = sorted((str(post.pk) for post in posts), reverse=True)
+
+    for _ in range(2):
+        retrieved = _get_all_pages(channel_posts_timeline_use_case, slug=channel.slug, page_size=2)
+        assert [post['post_id'] for post in retrieved] == expected_ids
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_counters_retrieved(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+):
+    """Test that 'likes_count' and 'comments_count' of the posts have been
+    retrieved correctly."""
+
+    expected_counts = {}
+    for number, post in enumerate(PostModelFactory.create_batch(size=5, author=channel), start=1):
+        PostLikeModelFactory.create_batch(size=number, post=post, is_like=True)
+        PostCommentModelFactory.create_batch(size=number * 2, post=post)
+        expected_counts[str(post.pk)] = (number, number * 2)
+
+    # Factories bypass use cases, so counters are fixed by the drift-repair command
+    call_command('recalculate_posts_counters', batch_size=2)
+
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    assert {post['post_id']: (post['likes_count'], post['comments_count']) for post in posts} == expected_counts
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_updated_after_post_created_and_deleted(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+    django_capture_on_commit_callbacks,
+):
+    """Test that created and deleted posts are reflected in the cached
+    timeline."""
+
+    PostModelFactory.create_batch(size=3, author=channel)
+    channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new_post = PostModelFactory(author=channel)
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    assert len(posts) == 4
+    assert posts[0]['post_id'] == str(new_post.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new_post.delete()
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    assert len(posts) == 3
+    assert str(new_post.pk) not in [post['post_id'] for post in posts]
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_likes_count_updated(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    post_like_create_use_case: PostLikeCreateUseCase,
+    post: Post,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the cached 'likes_count' has been updated after the like was
+    created."""
+
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=post.author.slug, cursor=None, page_size=10)
+    assert posts[0]['likes_count'] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post_like_create_use_case.execute(
+            user=user_to_entity(ChannelModelFactory().user),
+            post_id=post.pk,
+            is_like=True,
+        )
+
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=post.author.slug, cursor=None, page_size=10)
+    assert posts[0]['likes_count'] == 1
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_rolled_back_post_not_added(
+    channel_posts_timeline_use_case: GetChannelPostsTimelineUseCase,
+    channel: Channel,
+    django_capture_on_commit_callbacks,
+):
+    """Test that a post whose transaction was rolled back has not been added
+    to the cached timeline."""
+
+    PostModelFactory(author=channel)
+    channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    with django_capture_on_commit_callbacks(execute=True), pytest.raises(IntegrityError):
+        with transaction.atomic():
+            PostModelFactory(author=channel)
+            raise IntegrityError
+
+    _, posts, _ = channel_posts_timeline_use_case.execute(slug=channel.slug, cursor=None, page_size=10)
+
+    assert len(posts) == 1
+
+
+@pytest.mark.django_db
+def test_channel_posts_timeline_rebuild_keeps_posts_changed_during_rebuild(
+    container: punq.Container,
+    channel: Channel,
+):
+    """Test that posts added and removed after the database was read by the
+    rebuild have been applied to the filled timeline."""
+
+    timeline_provider: BasePostTimelineProvider = container.resolve(BasePostTimelineProvider)
+    timeline_provider.start_rebuild(author_id=channel.pk)
+
+    timeline_provider.add_post(author_id=channel.pk, post_id='added', score=3, data={'post_id': 'added'})
+    timeline_provider.remove_post(author_id=channel.pk, post_id='removed')
+    timeline_provider.fill_timeline(author_id=channel.pk, items=[('removed', 2), ('read', 1)], truncated=False)
+
+    exists, truncated, items = timeline_provider.get_page(author_id=channel.pk, cursor=None, limit=10)
+
+    assert exists
+    assert not truncated
+    assert items == [('added', 3), ('read', 1)]
@@ -1,11 +1,17 @@
 import pytest
+from django.core.cache import cache
 
 from core.apps.channels.exceptions.channels import ChannelNotFoundError
 from core.apps.channels.models import Channel
+from core.apps.payments.enums import StripeSubscriptionAllTiersEnum
+from core.apps.posts.constants import POSTS_LIMITS_BY_SUBSCRIPTION_TIER
+from core.apps.posts.exceptions import PostSubscriptionTierLimitError
 from core.apps.posts.models import Post
+from core.apps.posts.services.posts import BasePostsCountService
 from core.apps.posts.use_cases.posts.create_post import PostCreateUseCase
 from core.apps.users.converters.users import user_to_entity
 from core.apps.users.models import CustomUser
+from core.tests.factories.posts import PostModelFactory
 
 
 @pytest.mark.django_db
@@ -39,3 +45,65 @@ def test_create_post(create_post_use_case: PostCreateUseCase, channel: Channel):
     assert created_post.author_id == channel.pk
     assert created_post.created_at == retrieved_post.created_at
     assert created_post.pk == retrieved_post.pk
+
+
+@pytest.mark.django_db
+def test_create_post_subscription_tier_limit_error(create_post_use_case: PostCreateUseCase, channel: Channel):
+    """Test that an error has been raised when the posts limit of the FREE
+    tier is reached."""
+
+    PostModelFactory.create_batch(
+        size=POSTS_LIMITS_BY_SUBSCRIPTION_TIER[StripeSubscriptionAllTiersEnum.FREE], author=channel
+    )
+
+    with pytest.raises(PostSubscriptionTierLimitError):
+        create_post_use_case.execute(
+            user=user_to_entity(channel.user),
+            text='test text',
+        )
+
+
+@pytest.mark.django_db
+def test_create_post_posts_counter_updated(
+    create_post_use_case: PostCreateUseCase,
+    posts_count_service: BasePostsCountService,
+    channel: Channel,
+    django_capture_on_commit_callbacks,
+):
+    """Test that the cached channel's posts counter has been updated after
+    posts were created and deleted."""
+
+    for expected_posts_count in range(1, 4):
+        with django_capture_on_commit_callbacks(execute=True):
+            create_post_use_case.execute(user=user_to_entity(channel.user), text='test text')
+        assert cache.get(posts_count_service.get_cache_key(author_id=channel.pk)) == expected_posts_count
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Post.objects.filter(author=channel).first().delete()
+    assert cache.get(posts_count_service.get_cache_key(author_id=channel.pk)) == 2
+
+
+@pytest.mark.django_db
+def test_posts_counter_deleted_after_post_created_during_count(
+    posts_count_service: BasePostsCountService,
+    channel: Channel,
+    monkeypatch,
+):
+    """Test that the cached posts counter has been deleted if a post was
+    created between the count and the caching, so it is calculated again."""
+
+    post_repository = posts_count_service.post_repository
+    get_posts_count = post_repository.get_posts_count_by_author_id
+    created_posts = []
+
+    def get_posts_count_and_create_post(author_id: int) -> int:
+        posts_count = get_posts_count(author_id=author_id)
+
+        if not created_posts:
+            created_posts.append(PostModelFactory(author=channel))
+        return posts_count
+
+    monkeypatch.setattr(post_repository, 'get_posts_count_by_author_id', get_posts_count_and_create_post)
+
+    assert posts_count_service.get_posts_count(author_id=channel.pk) == 1
+    assert cache.get(posts_count_service.get_cache_key(author_id=channel.pk)) is None
@@ -124,3 +124,23 @@ def test_post_create_like_duplicates(
     )
 
     assert PostLikeItem.objects.filter(channel=channel, post=post, is_like=is_like).count() == 1
+
+
+@pytest.mark.django_db
+def test_post_create_like_likes_count_updated(
+    post_like_create_use_case: PostLikeCreateUseCase,
+    channel: Channel,
+    post: Post,
+):
+    """Test that 'likes_count' has been changed only when the like was created
+    or the reaction was switched."""
+
+    for is_like, expected_likes_count in [(True, 1), (True, 1), (False, 0), (False, 0), (True, 1)]:
+        post_like_create_use_case.execute(
+            user=user_to_entity(channel.user),
+            post_id=post.pk,
+            is_like=is_like,
+        )
+
+        post.refresh_from_db()
+        assert post.likes_count == expected_likes_count
@@ -11,6 +11,7 @@ from core.apps.posts.models import (
     Post,
     PostLikeItem,
 )
+from core.apps.posts.use_cases.posts.create_post_like import PostLikeCreateUseCase
 from core.apps.posts.use_cases.posts.delete_post_like import PostLikeDeleteUseCase
 from core.apps.users.converters.users import user_to_entity
 from core.apps.users.models import CustomUser
@@ -82,3 +83,41 @@ def test_post_delete_like_deleted(
     )
 
     assert not PostLikeItem.objects.filter(channel=channel, post=post, is_like=expected_like).exists()
+
+
+@pytest.mark.parametrize('is_like', [True, False])
+@pytest.mark.django_db
+def test_post_delete_like_likes_count_updated(
+    post_like_create_use_case: PostLikeCreateUseCase,
+    post_like_delete_use_case: PostLikeDeleteUseCase,
+    channel: Channel,
+    post: Post,
+    is_like: bool,
+):
+    """Test that 'likes_count' has been decreased only when the like was
+    deleted."""
+
+    post_like_create_use_case.execute(user=user_to_entity(channel.user), post_id=post.pk, is_like=is_like)
+    post_like_delete_use_case.execute(user=user_to_entity(channel.user), post_id=post.pk)
+
+    post.refresh_from_db()
+    assert post.likes_count == 0
+
+
+@pytest.mark.django_db
+def test_post_delete_like_drifted_likes_count_recalculated(
+    post_like_delete_use_case: PostLikeDeleteUseCase,
+    channel: Channel,
+    post: Post,
+):
+    """Test that 'likes_count' has been recalculated instead of decreased
+    below zero when it has drifted from the number of likes."""
+
+    PostLikeModelFactory.create(channel=channel, post=post, is_like=True)
+    PostLikeModelFactory.create_batch(size=2, post=post, is_like=True)
+    Post.objects.filter(pk=post.pk).update(likes_count=0)
+
+    post_like_delete_use_case.execute(user=user_to_entity(channel.user), post_id=post.pk)
+
+    post.refresh_from_db()
+    assert post.likes_count == 2
@@ -56,6 +56,9 @@ def test_create_post_comment_created(
     assert created_comment.is_updated is False
     assert PostCommentItem.objects.filter(post=post, author=channel, text=expected_text, reply_level=0).exists()
 
+    post.refresh_from_db()
+    assert post.comments_count == 1
+
 
 @pytest.mark.parametrize('expected_text', ['Test reply comment', 'Test reply comment 2'])
 @pytest.mark.django_db
@@ -0,0 +1,59 @@
+import punq
+import pytest
+from django.core.cache import cache
+
+from core.apps.channels.models import Channel
+from core.apps.common.constants import CACHE_KEYS
+from core.apps.users.converters.users import user_to_entity
+from core.apps.videos.models import Video
+from core.apps.videos.use_cases.videos_upload.download_videos_urls import GenerateUrlsForVideosDownloadUseCase
+from core.tests.factories.videos import VideoModelFactory
+
+
+@pytest.fixture
+def download_videos_urls_use_case(container: punq.Container) -> GenerateUrlsForVideosDownloadUseCase:
+    return container.resolve(GenerateUrlsForVideosDownloadUseCase)
+
+
+@pytest.mark.django_db
+def test_download_urls_generated_and_cached(
+    cloudfront_settings,
+    download_videos_urls_use_case: GenerateUrlsForVideosDownloadUseCase,
+    channel: Channel,
+):
+    """Test that urls were generated for all existing videos and cached."""
+
+    keys = [f'videos/test_{number}.mp4' for number in range(5)]
+
+    for key in keys:
+        VideoModelFactory(s3_key=key)
+
+    result = download_videos_urls_use_case.execute(user=user_to_entity(channel.user), keys=[*keys, 'not_existing'])
+
+    assert set(result['urls']) == set(keys)
+    assert cache.get_many([CACHE_KEYS['s3_video_url'] + key for key in keys]) == {
+        CACHE_KEYS['s3_video_url'] + key: url for key, url in result['urls'].items()
+    }
+
+    # The second call reads all urls from the cache
+    assert download_videos_urls_use_case.execute(user=user_to_entity(channel.user), keys=keys) == result
+
+
+@pytest.mark.django_db
+def test_download_urls_skip_private_videos_of_other_channels(
+    cloudfront_settings,
+    download_videos_urls_use_case: GenerateUrlsForVideosDownloadUseCase,
+    channel: Channel,
+):
+    """Test that urls for private videos were generated only for their
+    author."""
+
+    own_video = VideoModelFactory(s3_key='videos/own.mp4', author=channel, status=Video.VideoStatus.PRIVATE)
+    other_video = VideoModelFactory(s3_key='videos/other.mp4', status=Video.VideoStatus.PRIVATE)
+
+    result = download_videos_urls_use_case.execute(
+        user=user_to_entity(channel.user),
+        keys=[own_video.s3_key, other_video.s3_key],
+    )
+
+    assert list(result['urls']) == [own_video.s3_key]
@@ -0,0 +1,95 @@
+from urllib.parse import (
+    parse_qs,
+    urlparse,
+)
+
+import punq
+import pytest
+
+from core.apps.channels.models import Channel
+from core.apps.common.clients.registry import boto_client_registry
+from core.apps.users.converters.users import user_to_entity
+from core.apps.videos.constants import (
+    MAX_UPLOAD_PART_URLS_EXPIRES_IN,
+    UPLOAD_PART_URL_EXPIRES_IN,
+)
+from core.apps.videos.exceptions.videos import VideoAuthorNotMatchError
+from core.apps.videos.use_cases.videos_upload.upload_video_urls import GenerateUrlsForVideoPartsUploadUseCase
+from core.tests.factories.videos import VideoModelFactory
+
+
+@pytest.fixture
+def upload_video_urls_use_case(container: punq.Container) -> GenerateUrlsForVideoPartsUploadUseCase:
+    return container.resolve(GenerateUrlsForVideoPartsUploadUseCase)
+
+
+@pytest.fixture
+def s3_settings(settings):
+    settings.AWS_ACCESS_KEY_ID = 'test_access_key'
+    settings.AWS_SECRET_ACCESS_KEY = 'test_secret_key'
+    settings.AWS_S3_REGION_NAME = 'us-east-1'
+    settings.AWS_STORAGE_BUCKET_NAME = 'test-bucket'
+
+    # Clients are built with credentials from settings
+    boto_client_registry.reset()
+    yield settings
+    boto_client_registry.reset()
+
+
+@pytest.mark.parametrize(
+    'parts_count, expected_expires_in',
+    [(1, UPLOAD_PART_URL_EXPIRES_IN), (3, UPLOAD_PART_URL_EXPIRES_IN + 60), (10_000, MAX_UPLOAD_PART_URLS_EXPIRES_IN)],
+)
+def test_upload_urls_expiration_scales_with_parts_count(parts_count: int, expected_expires_in: int):
+    """Test that urls expiration grows with the number of parts and is
+    capped."""
+
+    assert GenerateUrlsForVideoPartsUploadUseCase._get_expires_in(parts_count=parts_count) == expected_expires_in
+
+
+@pytest.mark.django_db
+def test_upload_urls_generated_for_parts_range(
+    s3_settings,
+    upload_video_urls_use_case: GenerateUrlsForVideoPartsUploadUseCase,
+    channel: Channel,
+):
+    """Test that an upload url was generated for every part in the range."""
+
+    video = VideoModelFactory(author=channel, upload_id='test_upload_id')
+
+    result = upload_video_urls_use_case.execute(
+        user=user_to_entity(channel.user),
+        key='videos/test.mp4',
+        upload_id=video.upload_id,
+        first_part_number=3,
+        last_part_number=7,
+    )
+
+    assert result['expires_in'] == UPLOAD_PART_URL_EXPIRES_IN + 4 * 30
+    assert [item['part_number'] for item in result['upload_urls']] == [3, 4, 5, 6, 7]
+
+    for item in result['upload_urls']:
+        query = parse_qs(urlparse(item['upload_url']).query)
+
+        assert query['partNumber'] == [str(item['part_number'])]
+        assert query['uploadId'] == [video.upload_id]
+
+
+@pytest.mark.django_db
+def test_upload_urls_not_generated_for_other_author(
+    upload_video_urls_use_case: GenerateUrlsForVideoPartsUploadUseCase,
+    channel: Channel,
+):
+    """Test that an error has been raised when the video belongs to another
+    channel."""
+
+    video = VideoModelFactory(upload_id='test_upload_id')
+
+    with pytest.raises(VideoAuthorNotMatchError):
+        upload_video_urls_use_case.execute(
+            user=user_to_entity(channel.user),
+            key='videos/test.mp4',
+            upload_id=video.upload_id,
+            first_part_number=1,
+            last_part_number=2,
+        )
@@ -0,0 +1,80 @@
+import pytest
+from prometheus_client import REGISTRY
+from pytest_django.fixtures import SettingsWrapper
+
+from core.apps.channels.models import Channel
+from core.apps.common.instrumentation import instrument
+from core.apps.common.providers.cache import RedisCacheProvider
+
+
+def get_sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_call_queries_and_cache_lookups_observed(settings: SettingsWrapper):
+    settings.INSTRUMENTATION_ENABLED = True
+
+    @instrument
+    class InstrumentedRepository:
+        def count_channels(self) -> int:
+            cache_provider = RedisCacheProvider()
+            cache_provider.set('instrumented', 1)
+            cache_provider.get_many(['instrumented', 'missing'])
+
+            return Channel.objects.count() + Channel.objects.filter(pk=1).count()
+
+    site = 'InstrumentedRepository.count_channels'
+
+    InstrumentedRepository().count_channels()
+
+    assert get_sample('app_call_duration_seconds_count', site=site) == 1
+    assert get_sample('app_call_db_queries_sum', site=site) == 2
+    assert get_sample('app_call_db_duration_seconds_sum', site=site) > 0
+    assert get_sample('app_call_cache_lookups_total', site=site, result='hit') == 1
+    assert get_sample('app_call_cache_lookups_total', site=site, result='miss') == 1
+
+
+@pytest.mark.django_db
+def test_nested_call_queries_included_in_outer_call(settings: SettingsWrapper):
+    settings.INSTRUMENTATION_ENABLED = True
+
+    @instrument
+    class NestedRepository:
+        def count_channels(self) -> int:
+            return Channel.objects.count()
+
+    @instrument
+    class OuterUseCase:
+        def execute(self) -> int:
+            return NestedRepository().count_channels() + Channel.objects.count()
+
+    OuterUseCase().execute()
+
+    assert get_sample('app_call_db_queries_sum', site='NestedRepository.count_channels') == 1
+    assert get_sample('app_call_db_queries_sum', site='OuterUseCase.execute') == 2
+
+
+def test_call_observed_when_exception_raised(settings: SettingsWrapper):
+    settings.INSTRUMENTATION_ENABLED = True
+
+    @instrument
+    class FailingUseCase:
+        def execute(self) -> None:
+            raise ValueError
+
+    with pytest.raises(ValueError):
+        FailingUseCase().execute()
+
+    assert get_sample('app_call_duration_seconds_count', site='FailingUseCase.execute') == 1
+
+
+def test_class_not_wrapped_when_disabled(settings: SettingsWrapper):
+    settings.INSTRUMENTATION_ENABLED = False
+
+    class DisabledUseCase:
+        def execute(self) -> None: ...
+
+    execute = DisabledUseCase.execute
+
+    assert instrument(DisabledUseCase).execute is execute
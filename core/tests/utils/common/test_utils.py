@@ -1,9 +1,13 @@
+import sys
 from urllib.parse import urlencode
 
 import pytest
 from pytest_django.fixtures import SettingsWrapper
 
-from core.apps.common.utils import build_frontend_url
+from core.apps.common.utils import (
+    build_frontend_url,
+    lazy_import,
+)
 
 
 @pytest.mark.django_db
@@ -54,3 +58,16 @@ def test_url_created_with_query_params(
     result = build_frontend_url(uri=expected_uri, query_params=expected_params)
 
     assert result == expected_url + '?' + urlencode(expected_params)
+
+
+def test_lazy_module_imported_on_attribute_access(monkeypatch: pytest.MonkeyPatch):
+    """Test that the module has been imported on the first access to its
+    attributes, not on 'lazy_import'."""
+
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+
+    colorsys = lazy_import('colorsys')
+
+    assert 'colorsys' not in sys.modules
+    assert colorsys.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+    assert 'colorsys' in sys.modules
@@ -6,3 +6,5 @@ threads = 10
 accesslog = '-'
 errorlog = '-'
 worker_class = 'gthread'
+# The app is imported once in the master and forked workers start ready to serve requests
+preload_app = True